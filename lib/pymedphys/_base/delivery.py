@@ -34,6 +34,19 @@ DeliveryNamedTuple = namedtuple(
 )
 
 
+def _merge_fields(separate) -> Dict[str, "np.ndarray"]:
+    collection = {
+        field: np.concatenate([delivery_data[i] for delivery_data in separate], axis=0)
+        for i, field in enumerate(DeliveryNamedTuple._fields)
+    }
+
+    mu = np.concatenate([[0], np.diff(collection["monitor_units"])])
+    mu[mu < 0] = 0
+    collection["monitor_units"] = np.cumsum(mu)
+
+    return collection
+
+
 class DeliveryBase(DeliveryNamedTuple):
     @property
     def mu(self):
@@ -41,34 +54,18 @@ class DeliveryBase(DeliveryNamedTuple):
 
     @classmethod
     def combine(cls, *args):
-        first = cls(*args[0])
-
         if len(args) == 1:
-            return first
+            return cls(*args[0])
 
-        return first.merge(*args[1::])
+        # The arguments are concatenated before being converted into a
+        # delivery so that arrays only need to be converted to tuples once.
+        return cls(**_merge_fields(args))
 
     def merge(self: DeliveryGeneric, *args: DeliveryGeneric) -> DeliveryGeneric:
         cls = type(self)
         separate: List[DeliveryGeneric] = [self] + [*args]
-        collection: Dict[str, Tuple] = {}
-
-        for delivery_data in separate:
-            for field in delivery_data._fields:  # pylint: disable=no-member
-                try:
-                    collection[field] = np.concatenate(
-                        [collection[field], getattr(delivery_data, field)], axis=0
-                    )
-                except KeyError:
-                    collection[field] = getattr(delivery_data, field)
-
-        mu = np.concatenate([[0], np.diff(collection["monitor_units"])])
-        mu[mu < 0] = 0
-        collection["monitor_units"] = np.cumsum(mu)
-
-        merged = cls(**collection)
 
-        return merged
+        return cls(**_merge_fields(separate))
 
     def __new__(cls, *args, **kwargs):
         new_args = (to_tuple(arg) for arg in args)
@@ -160,7 +157,7 @@ class DeliveryBase(DeliveryNamedTuple):
 
         try:
             assert np.all(np.sum(masks, axis=0) == 1), (
-                "Not all beams were captured by the gantry tolerance of " " {}".format(
+                "Not all beams were captured by the gantry tolerance of  {}".format(
                     gantry_tol
                 )
             )
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+import concurrent.futures
+import contextlib
+import itertools
 import logging
 import os
 import pprint
@@ -22,9 +25,16 @@ from os.path import dirname, isdir, isfile
 
 from pymedphys._imports import pydicom
 
-from pymedphys._dicom.anonymise import core
+from pymedphys._dicom.anonymise import core, deferred
 from pymedphys._dicom.utilities import remove_file
 
+# Element values at least this large are deferred when
+# ``defer_pixel_data`` is set. Passed to ``pydicom.dcmread``.
+DEFER_SIZE = "256 KB"
+
+# The number of files handed to each worker process at a time.
+ANONYMISE_DIRECTORY_CHUNKSIZE = 16
+
 
 def anonymise_dataset(  # pylint: disable = inconsistent-return-statements
     ds,
@@ -137,7 +147,7 @@ def anonymise_dataset(  # pylint: disable = inconsistent-return-statements
                 raise AssertionError("Could not delete all unwanted, unknown tags.")
 
     if delete_private_tags:
-        ds_anon.remove_private_tags()
+        core.remove_private_tags(ds_anon)
 
     keywords_to_anonymise = core.filter_identifying_keywords(
         keywords_to_leave_unchanged, identifying_keywords=identifying_keywords
@@ -165,6 +175,7 @@ def anonymise_file(
     delete_unknown_tags=None,
     replacement_strategy=None,
     identifying_keywords=None,
+    defer_pixel_data=False,
 ):
     r"""A simple tool to anonymise a DICOM file.
 
@@ -224,6 +235,16 @@ def anonymise_file(
     identifying_keywords: ``list``, optional
         If left as None, the default values for/list of identifying keywords are used
 
+    defer_pixel_data : ``bool``, optional
+        If ``True``, only the elements prior to the pixel data are read
+        and anonymised. The pixel data element is then copied byte for
+        byte from the original file into the anonymised file, without
+        being read into Python. Should the pixel data not be the final
+        element of the file, element values larger than ``DEFER_SIZE``
+        are instead deferred and only read once the anonymised file is
+        written. Either way the anonymised file is identical to that
+        created when ``False``. Defaults to ``False``.
+
     Returns
     -------
     ``str``
@@ -231,7 +252,13 @@ def anonymise_file(
     """
     dicom_filepath = str(dicom_filepath)
 
-    ds = pydicom.dcmread(dicom_filepath, force=True)
+    pixel_data_extent = None
+    if defer_pixel_data:
+        ds, pixel_data_extent = deferred.read_header(dicom_filepath)
+        if pixel_data_extent is None:
+            ds = pydicom.dcmread(dicom_filepath, force=True, defer_size=DEFER_SIZE)
+    else:
+        ds = pydicom.dcmread(dicom_filepath, force=True)
 
     anonymise_dataset(
         ds=ds,
@@ -260,7 +287,12 @@ def anonymise_file(
 
     print(f"{dicom_filepath} --> {dicom_anon_filepath}")
 
-    ds.save_as(dicom_anon_filepath)
+    if pixel_data_extent is None:
+        ds.save_as(dicom_anon_filepath)
+    else:
+        deferred.write_with_copied_pixel_data(
+            ds, dicom_filepath, pixel_data_extent, dicom_anon_filepath
+        )
 
     if delete_original_file:
         remove_file(dicom_filepath)
@@ -280,6 +312,10 @@ def anonymise_directory(
     replacement_strategy=None,
     identifying_keywords=None,
     fail_fast=True,
+    n_workers=1,
+    defer_pixel_data=False,
+    initializer=None,
+    initargs=(),
 ):
     r"""A simple tool to anonymise all DICOM files in a directory and
     its subdirectories.
@@ -346,6 +382,28 @@ def anonymise_directory(
         after completing translation and deleting original files (if specified)
         will raise an error to indicate not all files could be translated.
 
+    n_workers : ``int``, optional
+        The number of processes across which the files are anonymised.
+        Defaults to ``1``, anonymising the files within the current
+        process. Any ``replacement_strategy`` needs to be picklable
+        when ``n_workers`` is greater than one. When failing fast, the
+        files being anonymised concurrently with the failing file may
+        still complete.
+
+    defer_pixel_data : ``bool``, optional
+        Passed to ``anonymise_file()``. If ``True``, pixel data is
+        copied through to each anonymised file without being read into
+        Python. Defaults to ``False``.
+
+    initializer : ``callable``, optional
+        Called with ``initargs`` at the start of each worker process
+        when ``n_workers`` is greater than one. For example, used by
+        pseudonymisation to share the pseudonyms already calculated
+        with each worker.
+
+    initargs : ``tuple``, optional
+        The arguments passed to ``initializer``.
+
     Returns
     -------
     ``list`` of anonymised file paths
@@ -358,28 +416,59 @@ def anonymise_directory(
     anon_filepaths = []
     errors = []
 
+    file_options = {
+        "delete_original_file": delete_original_files,
+        "anonymise_filename": anonymise_filenames,
+        "replace_values": replace_values,
+        "keywords_to_leave_unchanged": keywords_to_leave_unchanged,
+        "delete_private_tags": delete_private_tags,
+        "delete_unknown_tags": delete_unknown_tags,
+        "replacement_strategy": replacement_strategy,
+        "identifying_keywords": identifying_keywords,
+        "defer_pixel_data": defer_pixel_data,
+    }
+
+    output_filepaths = []
     for dicom_filepath in dicom_filepaths:
         if output_dirpath is not None:
             relative_path = os.path.relpath(dicom_filepath, start=dicom_dirpath)
-            output_filepath = os.path.join(output_dirpath, relative_path)
+            output_filepaths.append(os.path.join(output_dirpath, relative_path))
         else:
-            output_filepath = None
-        try:
-            dicom_anon_filepath = anonymise_file(
-                dicom_filepath,
-                output_filepath=output_filepath,
-                delete_original_file=delete_original_files,
-                anonymise_filename=anonymise_filenames,
-                replace_values=replace_values,
-                keywords_to_leave_unchanged=keywords_to_leave_unchanged,
-                delete_private_tags=delete_private_tags,
-                delete_unknown_tags=delete_unknown_tags,
-                replacement_strategy=replacement_strategy,
-                identifying_keywords=identifying_keywords,
+            output_filepaths.append(None)
+
+    with contextlib.ExitStack() as stack:
+        if n_workers > 1:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(
+                    max_workers=n_workers, initializer=initializer, initargs=initargs
+                )
             )
-            successful_filepaths.append(dicom_filepath)
-            anon_filepaths.append(dicom_anon_filepath)
-        except (AttributeError, LookupError, TypeError, OSError, ValueError) as error:
+            # Should fail_fast raise, the files that are yet to be
+            # anonymised are cancelled rather than waited upon.
+            stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+            results = executor.map(
+                _anonymise_file_or_return_error,
+                dicom_filepaths,
+                output_filepaths,
+                itertools.repeat(file_options),
+                chunksize=ANONYMISE_DIRECTORY_CHUNKSIZE,
+            )
+        else:
+            results = map(
+                _anonymise_file_or_return_error,
+                dicom_filepaths,
+                output_filepaths,
+                itertools.repeat(file_options),
+            )
+
+        for dicom_filepath, (dicom_anon_filepath, error) in zip(
+            dicom_filepaths, results
+        ):
+            if error is None:
+                successful_filepaths.append(dicom_filepath)
+                anon_filepaths.append(dicom_anon_filepath)
+                continue
+
             errors.append(error)
             failing_filepaths.append(dicom_filepath)
             logging.warning("Unable to anonymise %s", dicom_filepath)
@@ -401,6 +490,28 @@ def anonymise_directory(
     return anon_filepaths
 
 
+def _anonymise_file_or_return_error(dicom_filepath, output_filepath, file_options):
+    """Anonymise a single file of a directory, returning rather than
+    raising the anticipated errors so that the directory's remaining
+    files can continue to be anonymised when not failing fast.
+    """
+    try:
+        dicom_anon_filepath = anonymise_file(
+            dicom_filepath, output_filepath=output_filepath, **file_options
+        )
+    except (
+        AttributeError,
+        LookupError,
+        TypeError,
+        OSError,
+        ValueError,
+        EOFError,
+    ) as error:
+        return None, error
+
+    return dicom_anon_filepath, None
+
+
 def anonymise_cli(args):
     if args.delete_unknown_tags:
         handle_unknown_tags = True
@@ -429,6 +540,7 @@ def anonymise_cli(args):
             delete_private_tags=not args.keep_private_tags,
             delete_unknown_tags=handle_unknown_tags,
             replacement_strategy=replacement_strategy,
+            defer_pixel_data=args.defer_pixel_data,
         )
 
     elif isdir(args.input_path):
@@ -442,6 +554,8 @@ def anonymise_cli(args):
             delete_private_tags=not args.keep_private_tags,
             delete_unknown_tags=handle_unknown_tags,
             replacement_strategy=replacement_strategy,
+            n_workers=args.n_workers,
+            defer_pixel_data=args.defer_pixel_data,
         )
 
     else:
@@ -70,15 +70,24 @@ def filter_identifying_keywords(keywords_to_leave_unchanged, identifying_keyword
 def non_private_tags_in_dicom_dataset(ds):
     """Return all non-private tags from a DICOM dataset."""
 
-    non_private_tags = []
+    # Iterating over the tags, rather than the elements, avoids
+    # converting every raw element and reading any deferred values.
+    return [
+        tag
+        for tag in ds.keys()
+        if not tag.is_private
+        # Ignore retired Group Length elements
+        and not (tag.element == 0 and tag.group > 6)
+    ]
 
-    for elem in ds:
-        if not elem.tag.is_private and not (
-            # Ignore retired Group Length elements
-            elem.tag.element == 0 and elem.tag.group > 6
-        ):
-            non_private_tags.append(elem.tag)
-    return non_private_tags
+
+def _is_in_dict_baseline(tag):
+    try:
+        get_baseline_dict_entry(tag)
+    except NotInBaselineError:
+        return False
+
+    return True
 
 
 def unknown_tags_in_dicom_dataset(ds):
@@ -86,23 +95,53 @@ def unknown_tags_in_dicom_dataset(ds):
     exist in the PyMedPhys copy of the DICOM dictionary.
     """
 
-    non_private_tags_in_dataset = np.array(non_private_tags_in_dicom_dataset(ds))
+    return [
+        tag
+        for tag in non_private_tags_in_dicom_dataset(ds)
+        if not _is_in_dict_baseline(tag)
+    ]
 
-    are_non_private_tags_in_dict_baseline = []
-    for tag in non_private_tags_in_dataset:
-        try:
-            get_baseline_dict_entry(tag)
-            are_non_private_tags_in_dict_baseline.append(True)
-        except NotInBaselineError:
-            are_non_private_tags_in_dict_baseline.append(False)
-
-    unknown_tags = list(
-        non_private_tags_in_dataset[
-            np.invert(np.array(are_non_private_tags_in_dict_baseline, dtype=bool))
-        ]
-    )
 
-    return unknown_tags
+def remove_private_tags(ds):
+    """Remove all private elements from a DICOM dataset, including
+    those within sequences.
+
+    Equivalent to ``pydicom.Dataset.remove_private_tags`` except that
+    the values of the elements that are kept are never accessed. This
+    allows deferred values, such as pixel data, to remain unread.
+    """
+    for tag in list(ds.keys()):
+        if tag.is_private:
+            del ds[tag]
+        elif _is_sequence(ds, tag):
+            for seq_item in ds[tag].value:
+                remove_private_tags(seq_item)
+
+
+def _is_sequence(ds, tag):
+    elem = ds.get_item(tag, keep_deferred=True)
+    vr = elem.VR
+
+    # Raw elements read with an implicit VR transfer syntax have no VR
+    # until they are converted.
+    if vr is None:
+        if pydicom.datadict.dictionary_has_tag(tag):
+            vr = pydicom.datadict.dictionary_VR(tag)
+        else:
+            vr = ds[tag].VR
+
+    return vr == "SQ"
+
+
+@functools.lru_cache(maxsize=16)
+def _get_tag_to_keyword_map(keywords_to_anonymise):
+    tag_to_keyword_map = {}
+    for keyword in keywords_to_anonymise:
+        tag = pydicom.datadict.tag_for_keyword(keyword)
+        if tag is not None:
+            tag_to_keyword_map[pydicom.tag.Tag(tag)] = keyword
+
+    return tag_to_keyword_map
 
 
 def anonymise_tags(
@@ -115,42 +154,53 @@ def anonymise_tags(
             "to eliminate values rather than replace them.  Adhering to directive to eliminate values"
         )
 
-    for keyword in keywords_to_anonymise:
-        if hasattr(ds_anon, keyword):
-            if replace_values:
-                if ds_anon[keyword].value in ("", None, []):
-                    logging.debug(
-                        "%s has value of empty list, None or empty string, no need to modify to anonymise",
-                        keyword,
-                    )
-                    continue
-                replacement_value = get_anonymous_replacement_value(
-                    keyword,
-                    current_value=ds_anon[keyword].value,
-                    replacement_strategy=replacement_strategy,
-                )
-            else:
-                if get_baseline_keyword_vr_dict()[keyword] in ("OB", "OW"):
-                    replacement_value = (0).to_bytes(2, "little")
-                else:
-                    replacement_value = ""
-            setattr(ds_anon, keyword, replacement_value)
-
-    remaining_seq_only_list = [
-        x for x in ds_anon if (x.VR == "SQ" and x.name not in keywords_to_anonymise)
-    ]
-    for seq in remaining_seq_only_list:
-        for seq_item in seq.value:
-            anonymise_tags(
-                seq_item,
-                keywords_to_anonymise,
-                replace_values,
-                replacement_strategy=replacement_strategy,
-            )
+    tag_to_keyword_map = _get_tag_to_keyword_map(tuple(keywords_to_anonymise))
+    _anonymise_elements(
+        ds_anon, tag_to_keyword_map, replace_values, replacement_strategy
+    )
 
     return ds_anon
 
 
+def _anonymise_elements(
+    ds_anon, tag_to_keyword_map, replace_values, replacement_strategy
+):
+    """Walk the dataset once, anonymising the elements whose tags are
+    within ``tag_to_keyword_map`` and recursing into every sequence.
+    """
+    for tag in list(ds_anon.keys()):
+        keyword = tag_to_keyword_map.get(tag)
+        if keyword is not None:
+            _anonymise_element(ds_anon, keyword, replace_values, replacement_strategy)
+
+        if _is_sequence(ds_anon, tag):
+            for seq_item in ds_anon[tag].value:
+                _anonymise_elements(
+                    seq_item, tag_to_keyword_map, replace_values, replacement_strategy
+                )
+
+
+def _anonymise_element(ds_anon, keyword, replace_values, replacement_strategy):
+    if replace_values:
+        if ds_anon[keyword].value in ("", None, []):
+            logging.debug(
+                "%s has value of empty list, None or empty string, no need to modify to anonymise",
+                keyword,
+            )
+            return
+        replacement_value = get_anonymous_replacement_value(
+            keyword,
+            current_value=ds_anon[keyword].value,
+            replacement_strategy=replacement_strategy,
+        )
+    else:
+        if get_baseline_keyword_vr_dict()[keyword] in ("OB", "OW"):
+            replacement_value = (0).to_bytes(2, "little")
+        else:
+            replacement_value = ""
+    setattr(ds_anon, keyword, replacement_value)
+
+
 def get_anonymous_replacement_value(
     keyword, current_value=None, replacement_strategy=None
 ):
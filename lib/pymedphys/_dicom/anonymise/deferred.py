@@ -0,0 +1,210 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Anonymisation that never reads pixel data into Python objects.
+
+Only the header, everything before the pixel data element, is read and
+anonymised. The pixel data element is then copied byte for byte from
+the original file into the anonymised file.
+"""
+
+import contextlib
+import os
+import struct
+import sys
+from typing import NamedTuple, Optional, Tuple
+
+from pymedphys._imports import pydicom
+
+PIXEL_DATA_TAGS = (0x7FE00008, 0x7FE00009, 0x7FE00010)
+
+ITEM_TAG = 0xFFFEE000
+SEQUENCE_DELIMITER_TAG = 0xFFFEE0DD
+UNDEFINED_LENGTH = 0xFFFFFFFF
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Explicit VR elements with these VRs have a two byte reserved field
+# followed by a four byte length, all others have a two byte length.
+_EXPLICIT_VR_LONG_LENGTH = {b"OB", b"OD", b"OF", b"OL", b"OV", b"OW", b"UN"}
+
+
+class PixelDataExtent(NamedTuple):
+    """The location of the pixel data element within a DICOM file."""
+
+    offset: int
+    length: int
+
+
+def read_header(
+    dicom_filepath, force=True
+) -> Tuple["pydicom.Dataset", Optional[PixelDataExtent]]:
+    """Read everything within a DICOM file prior to its pixel data.
+
+    Returns
+    -------
+    ds : pydicom.Dataset
+        The dataset, without its pixel data.
+    extent : PixelDataExtent or None
+        The location of the complete pixel data element, including its
+        tag and length, within the file. ``None`` if the pixel data is
+        not the final element of the file, or the file is big endian or
+        deflated, in which case the file cannot be anonymised by copying
+        the pixel data through.
+    """
+    with open(dicom_filepath, "rb") as fp:
+        ds = pydicom.dcmread(fp, force=force, stop_before_pixels=True)
+
+        # A deflated dataset is read from an inflated copy of the file, so
+        # positions within it are not positions within the file.
+        transfer_syntax_uid = getattr(ds.file_meta, "TransferSyntaxUID", None)
+        if transfer_syntax_uid == pydicom.uid.DeflatedExplicitVRLittleEndian:
+            return ds, None
+
+        offset = fp.tell()
+        file_size = os.fstat(fp.fileno()).st_size
+
+        # No pixel data, there is nothing to copy
+        if offset == file_size:
+            return ds, PixelDataExtent(offset=offset, length=0)
+
+        is_implicit_vr, is_little_endian = ds.original_encoding
+        if not is_little_endian:
+            return ds, None
+
+        end = _element_end(fp, offset, is_implicit_vr)
+
+    if end != file_size:
+        return ds, None
+
+    return ds, PixelDataExtent(offset=offset, length=end - offset)
+
+
+def _element_end(fp, offset, is_implicit_vr):
+    fp.seek(offset)
+    group, element = struct.unpack("<HH", fp.read(4))
+    if (group << 16 | element) not in PIXEL_DATA_TAGS:
+        return None
+
+    if is_implicit_vr:
+        (length,) = struct.unpack("<L", fp.read(4))
+    else:
+        vr = fp.read(2)
+        if vr in _EXPLICIT_VR_LONG_LENGTH:
+            (length,) = struct.unpack("<2xL", fp.read(6))
+        else:
+            (length,) = struct.unpack("<H", fp.read(2))
+
+    if length != UNDEFINED_LENGTH:
+        return fp.tell() + length
+
+    # Encapsulated pixel data, step over each of the items until the
+    # sequence delimiter is found.
+    while True:
+        header = fp.read(8)
+        if len(header) < 8:
+            return None
+
+        group, element, length = struct.unpack("<HHL", header)
+        tag = group << 16 | element
+
+        if tag == SEQUENCE_DELIMITER_TAG:
+            return fp.tell()
+
+        if tag != ITEM_TAG or length == UNDEFINED_LENGTH:
+            return None
+
+        fp.seek(length, os.SEEK_CUR)
+
+
+def copy_file_range(src_fp, dst_fp, offset, count):
+    """Copy ``count`` bytes from ``offset`` within ``src_fp`` to the
+    current position of ``dst_fp``.
+
+    ``os.sendfile`` is used where it supports file to file copies,
+    which avoids the bytes passing through Python at all. Otherwise a
+    buffered copy is used.
+    """
+    dst_fp.flush()
+
+    if sys.platform.startswith("linux"):
+        start = os.lseek(dst_fp.fileno(), 0, os.SEEK_CUR)
+        try:
+            _sendfile(src_fp, dst_fp, offset, count)
+            dst_fp.seek(start + count)
+            return
+        except OSError:
+            # For example, a file system that does not support
+            # sendfile. Continue from wherever sendfile got to.
+            copied = os.lseek(dst_fp.fileno(), 0, os.SEEK_CUR) - start
+            dst_fp.seek(start + copied)
+            offset += copied
+            count -= copied
+
+    src_fp.seek(offset)
+    remaining = count
+    while remaining > 0:
+        chunk = src_fp.read(min(COPY_BUFFER_SIZE, remaining))
+        if not chunk:
+            raise EOFError("Unexpected end of file while copying pixel data")
+        dst_fp.write(chunk)
+        remaining -= len(chunk)
+
+
+def _sendfile(src_fp, dst_fp, offset, count):
+    src_fd = src_fp.fileno()
+    dst_fd = dst_fp.fileno()
+
+    while count > 0:
+        sent = os.sendfile(dst_fd, src_fd, offset, count)
+        if sent == 0:
+            raise EOFError("Unexpected end of file while copying pixel data")
+        offset += sent
+        count -= sent
+
+
+def write_with_copied_pixel_data(ds, dicom_filepath, extent, output_filepath):
+    """Write a header only dataset, as returned by ``read_header``,
+    followed by the original pixel data element copied from
+    ``dicom_filepath``.
+    """
+    if os.path.abspath(dicom_filepath) == os.path.abspath(output_filepath):
+        # Opening the output would truncate the pixel data before it
+        # could be copied.
+        with open(dicom_filepath, "rb") as src_fp:
+            src_fp.seek(extent.offset)
+            pixel_data_element = src_fp.read(extent.length)
+
+        if len(pixel_data_element) != extent.length:
+            raise EOFError("Unexpected end of file while copying pixel data")
+
+        with open(output_filepath, "wb") as dst_fp:
+            ds.save_as(dst_fp)
+            dst_fp.write(pixel_data_element)
+
+        return
+
+    try:
+        with (
+            open(dicom_filepath, "rb") as src_fp,
+            open(output_filepath, "wb") as dst_fp,
+        ):
+            ds.save_as(dst_fp)
+            copy_file_range(src_fp, dst_fp, extent.offset, extent.length)
+    except (OSError, EOFError):
+        # Rather than leave behind an anonymised file missing some of its
+        # pixel data.
+        with contextlib.suppress(OSError):
+            os.remove(output_filepath)
+        raise
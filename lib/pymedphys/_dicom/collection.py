@@ -19,6 +19,7 @@ from packaging import version
 from pymedphys._imports import pydicom
 
 from . import anonymise, coords, create
+from . import index as _index
 
 # pylint: disable=W0201
 
@@ -149,4 +150,102 @@ class DicomStudy:
 
 
 class DicomCollection:
-    """A DicomCollection can hold an arbitrary number of DicomStudy objects."""
+    """A DicomCollection can hold an arbitrary number of DicomStudy objects.
+
+    The DICOM files within a directory are found via a persistent SQLite
+    index of their headers. Creating, or updating, the collection only
+    reads the headers of files which are new or have been modified since
+    the index was last updated, and pixel data is only read on demand.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        The directory, including its subdirectories, of DICOM files.
+    index_path : str or pathlib.Path, optional
+        Where to store the index. Defaults to a file, specific to
+        ``directory``, within the PyMedPhys config directory.
+    pattern : str, optional
+        Only files whose names match this glob style pattern are
+        included, by default ``"*.dcm"``.
+    update : bool, optional
+        Whether to bring the index up to date with the files on disk
+        upon creation, by default True.
+    n_workers : int, optional
+        The number of processes across which headers are read when
+        updating the index, by default 1.
+
+    Examples
+    --------
+    >>> collection = DicomCollection("path/to/export")  # doctest: +SKIP
+    >>> plan = collection.latest("RTPLAN", patient_id="123456")  # doctest: +SKIP
+    >>> plan_dataset = plan.read()  # doctest: +SKIP
+    >>> ct_slices = collection.series(ct_series_uid)  # doctest: +SKIP
+    >>> first_slice = ct_slices[0].pixel_array  # doctest: +SKIP
+    """
+
+    def __init__(
+        self, directory, index_path=None, pattern="*.dcm", update=True, n_workers=1
+    ):
+        if index_path is None:
+            index_path = _index.default_index_path(directory)
+
+        self.index = _index.DicomIndex(directory, index_path, pattern=pattern)
+
+        if update:
+            self.update(n_workers=n_workers)
+
+    @property
+    def directory(self):
+        return self.index.directory
+
+    def update(self, n_workers=1):
+        """Read the headers of new or modified files into the index.
+
+        Returns
+        -------
+        (int, int)
+            The number of files that were (re)indexed and the number
+            that were removed from the index.
+        """
+        return self.index.update(n_workers=n_workers)
+
+    def files(self, order_by=None, **criteria):
+        """Find the DICOM files whose headers match ``criteria``.
+
+        See ``pymedphys._dicom.index.DicomIndex.query``.
+        """
+        return self.index.query(order_by=order_by, **criteria)
+
+    def latest(self, modality, **criteria):
+        """The most recently created DICOM file of a given modality, or
+        ``None`` if there are none.
+
+        For example, ``collection.latest("RTPLAN", patient_id="123456")``.
+        """
+        files = self.index.query(
+            order_by=[
+                "-instance_creation_date",
+                "-instance_creation_time",
+                "-series_date",
+                "-study_date",
+                "-mtime_ns",
+            ],
+            modality=modality,
+            **criteria,
+        )
+        if not files:
+            return None
+
+        return files[0]
+
+    def series(self, series_instance_uid):
+        """The files of a series, ordered by slice position and then
+        instance number.
+        """
+        return self.index.query(
+            order_by=["slice_position", "instance_number"],
+            series_instance_uid=series_instance_uid,
+        )
+
+    def close(self):
+        self.index.close()
@@ -15,6 +15,7 @@
 
 import logging
 import pathlib
+import queue
 import signal
 import sys
 import tempfile
@@ -23,6 +24,7 @@ import uuid
 from pymedphys._imports import pydicom, pynetdicom
 
 from pymedphys._dicom.connect.base import DicomConnectBase
+from pymedphys._dicom.connect.storage import RawDatasetStorage
 from pymedphys._dicom.constants.core import DICOM_SOP_CLASS_NAMES_MODE_PREFIXES
 
 
@@ -38,7 +40,15 @@ def hierarchical_dicom_storage_directory(
 class DicomListener(DicomConnectBase):
     """Class which provides SCP functionality to listen for incoming DICOM objects"""
 
-    def __init__(self, storage_directory=None, on_released_callback=None, **kwargs):
+    def __init__(
+        self,
+        storage_directory=None,
+        on_released_callback=None,
+        raw_storage=False,
+        on_series_complete=None,
+        series_complete_delay=1.0,
+        **kwargs,
+    ):
         """Create and instance of a DICOM Listener
 
         Parameters
@@ -49,6 +59,19 @@ class DicomListener(DicomConnectBase):
         on_released_callback : function, optional
             Called when an association is released, the directory in which the incoming
             data was stored is returned, by default None
+        raw_storage : bool, optional
+            Write each incoming DICOM object exactly as it was received, without
+            decoding it, by default False. Series completion is only tracked
+            with raw storage, see
+            ``pymedphys._dicom.connect.storage.RawDatasetStorage``.
+        on_series_complete : function, optional
+            Called with a ``SeriesCompleteEvent`` once all of the objects of a
+            series have been stored, by default None. Completed series are also
+            placed upon the ``completed_series`` queue.
+        series_complete_delay : float, optional
+            The number of seconds without any further objects for a series,
+            after its associations have closed, before it is considered complete,
+            by default 1.0
         """
         super().__init__(**kwargs)
 
@@ -69,6 +92,14 @@ class DicomListener(DicomConnectBase):
         # The application entity
         self.ae = None
 
+        self.raw_storage = raw_storage
+        self.storage_options = {
+            "on_series_complete": on_series_complete,
+            "series_complete_delay": series_complete_delay,
+        }
+        self.storage = None
+        self.completed_series = queue.Queue()
+
         logging.debug("Will store files received in: %s", self.storage_directory)
 
     def start(self):
@@ -76,6 +107,10 @@ class DicomListener(DicomConnectBase):
 
         # Initialise the Application Entity
         self.ae = pynetdicom.AE(ae_title=self.ae_title)
+        if self.raw_storage:
+            # Allow senders to use PDUs of any size, fewer and larger PDUs
+            # are much quicker to reassemble than the default 16 KB ones.
+            self.ae.maximum_pdu_size = 0
 
         # pynetdicom 2.0 changed attributes for Verification/C-ECHO in pynetdicom.sop_classes
         # The Verification SOP Class UID is a single well known constant
@@ -97,6 +132,14 @@ class DicomListener(DicomConnectBase):
             (pynetdicom.evt.EVT_RELEASED, self.on_association_released),
         ]
 
+        if self.raw_storage:
+            self.storage = RawDatasetStorage(
+                self.storage_directory,
+                completed_series=self.completed_series,
+                **self.storage_options,
+            )
+            handlers.append((pynetdicom.evt.EVT_CONN_CLOSE, self.on_connection_closed))
+
         # Start listening for incoming association requests
         self.ae.start_server((self.host, self.port), evt_handlers=handlers, block=False)
 
@@ -106,6 +149,10 @@ class DicomListener(DicomConnectBase):
         if self.ae:
             self.ae.shutdown()
 
+        if self.storage:
+            self.storage.shutdown()
+            self.storage = None
+
     def on_c_echo(self, _):
         """Respond to a C-ECHO service request."""
         logging.debug("C-ECHO!")
@@ -118,7 +165,13 @@ class DicomListener(DicomConnectBase):
         if self.on_released_callback:
             self.on_released_callback(self.association_directory)
 
+    def on_connection_closed(self, event):
+        self.storage.association_closed(event)
+
     def on_c_store(self, event):
+        if self.storage:
+            return self.on_raw_c_store(event)
+
         dataset = event.dataset
 
         try:
@@ -193,6 +246,26 @@ class DicomListener(DicomConnectBase):
 
         return status_ds
 
+    def on_raw_c_store(self, event):
+        status_ds = pydicom.Dataset()
+
+        try:
+            self.association_directory = self.storage.store(event)
+            status_ds.Status = 0x0000  # Success
+        except (AttributeError, KeyError, ValueError) as e:
+            logging.error("Unable to determine where to store DICOM object: %s", e)
+            status_ds.ErrorComment = "Missing the identifiers required for storage"
+            status_ds.Status = 0xC000  # Failed - Cannot understand
+        except OSError:
+            logging.error(
+                "Directory may not exist or you may not have write permission"
+            )
+
+            status_ds.ErrorComment = "SCP internal error - Unable to write file"
+            status_ds.Status = 0xA700  # Failed - Out of Resources - IOError
+
+        return status_ds
+
 
 def listen_cli(args):
     """Start a DICOM listener from the command line interface"""
@@ -203,6 +276,7 @@ def listen_cli(args):
         port=args.port,
         ae_title=args.aetitle,
         storage_directory=args.storage_directory,
+        raw_storage=args.raw_storage,
     )
 
     logging.info("Starting DICOM listener")
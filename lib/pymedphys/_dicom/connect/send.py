@@ -13,13 +13,124 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
 import logging
+import os
 import pathlib
+import queue
+import threading
+import time
+from typing import List, NamedTuple, Optional
 
 from pymedphys._imports import pydicom, pynetdicom
 
 from pymedphys._dicom.connect.base import DicomConnectBase
 
+_chunked_lock = threading.Lock()
+_chunked_senders = 0
+_chunked_previous = False
+
+
+class SendResult(NamedTuple):
+    """The outcome of sending a single DICOM object."""
+
+    dcm_file: "str | pathlib.Path | pydicom.Dataset"
+    sop_instance_uid: str
+    status: Optional["pydicom.Dataset"]
+    latency: float
+    n_bytes: int
+
+
+class SendReport(NamedTuple):
+    """The outcome of sending many DICOM objects.
+
+    ``status`` is ``None`` for any object which could not be sent.
+    ``n_bytes`` is the size on disk of the objects sent from file, objects
+    sent as in memory datasets are not counted.
+    """
+
+    results: List[SendResult]
+    duration: float
+
+    @property
+    def n_bytes(self):
+        return sum(result.n_bytes for result in self.results if result.status)
+
+    @property
+    def throughput(self):
+        """Bytes sent per second."""
+        if self.duration == 0:
+            return 0.0
+
+        return self.n_bytes / self.duration
+
+
+class _Header(NamedTuple):
+    dcm_file: "str | pathlib.Path | pydicom.Dataset"
+    sop_class_uid: str
+    sop_instance_uid: str
+    transfer_syntax_uid: Optional[str]
+    n_bytes: int
+
+
+def _read_header(dcm_file):
+    """Determine what is needed to negotiate the sending of ``dcm_file``
+    without reading any more of it than necessary.
+    """
+    if not isinstance(dcm_file, (pydicom.Dataset, pathlib.Path, str)):
+        raise TypeError("dcm_files must be  str, pathlib.Path or pydicom.Dataset")
+
+    if isinstance(dcm_file, pydicom.Dataset):
+        file_meta = getattr(dcm_file, "file_meta", pydicom.Dataset())
+        return _Header(
+            dcm_file,
+            dcm_file.SOPClassUID,
+            dcm_file.SOPInstanceUID,
+            file_meta.get("TransferSyntaxUID", None),
+            0,
+        )
+
+    n_bytes = os.path.getsize(dcm_file)
+    try:
+        file_meta = pydicom.filereader.read_file_meta_info(dcm_file)
+        return _Header(
+            dcm_file,
+            file_meta.MediaStorageSOPClassUID,
+            file_meta.MediaStorageSOPInstanceUID,
+            file_meta.TransferSyntaxUID,
+            n_bytes,
+        )
+    except (pydicom.errors.InvalidDicomError, AttributeError):
+        # Without file meta information the dataset itself has to be
+        # read, it will then be re-encoded when sent.
+        ds = pydicom.dcmread(dcm_file, stop_before_pixels=True)
+        return _Header(dcm_file, ds.SOPClassUID, ds.SOPInstanceUID, None, n_bytes)
+
+
+@contextlib.contextmanager
+def _send_datasets_from_file():
+    """Have pynetdicom stream datasets given as file paths straight from
+    disk rather than decoding and re-encoding them.
+
+    This is a pynetdicom wide setting, so it is reference counted across
+    the senders that are running concurrently.
+    """
+    global _chunked_senders, _chunked_previous  # pylint: disable = global-statement
+
+    with _chunked_lock:
+        if _chunked_senders == 0:
+            _chunked_previous = pynetdicom._config.STORE_SEND_CHUNKED_DATASET
+        _chunked_senders += 1
+        pynetdicom._config.STORE_SEND_CHUNKED_DATASET = True
+
+    try:
+        yield
+    finally:
+        with _chunked_lock:
+            _chunked_senders -= 1
+            if _chunked_senders == 0:
+                pynetdicom._config.STORE_SEND_CHUNKED_DATASET = _chunked_previous
+
 
 class DicomSender(DicomConnectBase):
     """Class which provides SCU functionality to send DICOM objects"""
@@ -52,18 +163,27 @@ class DicomSender(DicomConnectBase):
 
         return result is not None
 
-    def send(self, dcm_files):
+    def send(self, dcm_files, n_associations=1, original_transfer_syntax=False):
         """Send each DICOM object to the configured DICOM location
 
         Parameters
         ----------
         dcm_files : list
             list of str, pathlib.Path or pydicom.Dataset to send
+        n_associations : int, optional
+            The number of associations across which to concurrently send
+            the DICOM objects, by default 1
+        original_transfer_syntax : bool, optional
+            Send the DICOM objects in the transfer syntax within which
+            they are stored, see ``send_with_report``, by default False
 
         Returns
         -------
         list
-            List containing status objects for each DICOM file sent
+            The status of the C-STORE of each of the dcm_files, in order. The
+            status of any object which could not be sent is an empty
+            ``pydicom.Dataset``, as returned by ``send_c_store`` when no
+            response is received.
 
         Raises
         ------
@@ -71,36 +191,193 @@ class DicomSender(DicomConnectBase):
             Raised if any of the dcm_files are not of type str, pathlib.Path or
             pydicom.Dataset
         """
-        transfer_syntax = [pydicom.uid.ImplicitVRLittleEndian]
+        report = self.send_with_report(
+            dcm_files,
+            n_associations=n_associations,
+            original_transfer_syntax=original_transfer_syntax,
+        )
+
+        return [
+            pydicom.Dataset() if result.status is None else result.status
+            for result in report.results
+        ]
+
+    def send_with_report(
+        self, dcm_files, n_associations=4, original_transfer_syntax=False
+    ) -> SendReport:
+        """Send DICOM objects across several concurrent associations,
+        reporting upon the latency of each along with the overall
+        throughput.
+
+        Only the file meta information of each file is read up front,
+        to negotiate presentation contexts for the SOP classes actually
+        being sent. Each file is then read only when it is sent.
 
-        ae = pynetdicom.AE()
+        Parameters
+        ----------
+        dcm_files : list
+            list of str, pathlib.Path or pydicom.Dataset to send
+        n_associations : int, optional
+            The number of associations across which to concurrently send
+            the DICOM objects, by default 4. Each association takes the
+            next unsent object as soon as its previous C-STORE completes.
+        original_transfer_syntax : bool, optional
+            If True, files are offered in the transfer syntax within
+            which they are stored and, when the peer accepts it, are
+            streamed from disk without being decoded. Implicit VR Little
+            Endian is also offered as a fallback. If False, by default,
+            all objects are sent as Implicit VR Little Endian.
 
-        for context in pynetdicom.StoragePresentationContexts:
-            ae.add_requested_context(context.abstract_syntax, transfer_syntax)
+        Returns
+        -------
+        SendReport
+            The result of each C-STORE, in the order of ``dcm_files``,
+            and the total time taken.
 
-        assoc = ae.associate(self.host, self.port, ae_title=self.ae_title)
+        Raises
+        ------
+        TypeError
+            Raised if any of the dcm_files are not of type str, pathlib.Path or
+            pydicom.Dataset
+        """
+        start = time.perf_counter()
 
-        statuses = []
-        if assoc.is_established:
-            for dataset in dcm_files:
-                if not isinstance(dataset, (pydicom.Dataset, pathlib.Path, str)):
-                    raise TypeError(
-                        "dcm_files must be  str, pathlib.Path or pydicom.Dataset"
-                    )
-
-                if not isinstance(dataset, pydicom.Dataset):
-                    dataset = pydicom.dcmread(dataset)
-
-                logging.debug(
-                    "Sending DICOM object with SOPInstanceUID: %s",
-                    dataset.SOPInstanceUID,
+        headers = [_read_header(dcm_file) for dcm_file in dcm_files]
+        if not headers:
+            return SendReport([], 0.0)
+
+        ae = pynetdicom.AE()
+        for sop_class_uid, transfer_syntaxes in _requested_contexts(
+            headers, original_transfer_syntax
+        ):
+            ae.add_requested_context(sop_class_uid, transfer_syntaxes)
+
+        unsent = queue.SimpleQueue()
+        for index, header in enumerate(headers):
+            unsent.put((index, header))
+
+        results: List[Optional[SendResult]] = [None] * len(headers)
+        n_associations = max(1, min(n_associations, len(headers)))
+
+        with contextlib.ExitStack() as stack:
+            if original_transfer_syntax:
+                stack.enter_context(_send_datasets_from_file())
+
+            threads = [
+                threading.Thread(
+                    target=self._send_from_queue,
+                    args=(ae, unsent, results, original_transfer_syntax),
+                )
+                for _ in range(n_associations)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        for index, header in enumerate(headers):
+            if results[index] is None:
+                results[index] = SendResult(
+                    header.dcm_file, header.sop_instance_uid, None, 0.0, 0
                 )
 
-                statuses.append(assoc.send_c_store(dataset))
+        return SendReport(results, time.perf_counter() - start)
 
-            assoc.release()
+    def _send_from_queue(self, ae, unsent, results, original_transfer_syntax):
+        assoc = ae.associate(self.host, self.port, ae_title=self.ae_title)
+        if not assoc.is_established:
+            logging.error("Unable to establish an association with the DICOM host")
+            return
 
-        return statuses
+        msg_id = 0
+        try:
+            while assoc.is_established:
+                try:
+                    index, header = unsent.get_nowait()
+                except queue.Empty:
+                    break
+
+                msg_id = msg_id % 65535 + 1
+                results[index] = _send_c_store(
+                    assoc, header, msg_id, original_transfer_syntax
+                )
+        finally:
+            if assoc.is_established:
+                assoc.release()
+
+
+def _requested_contexts(headers, original_transfer_syntax):
+    implicit = pydicom.uid.ImplicitVRLittleEndian
+
+    transfer_syntaxes = {}
+    for header in headers:
+        sop_class_transfer_syntaxes = transfer_syntaxes.setdefault(
+            header.sop_class_uid, [implicit]
+        )
+        if (
+            original_transfer_syntax
+            and header.transfer_syntax_uid is not None
+            and header.transfer_syntax_uid not in sop_class_transfer_syntaxes
+        ):
+            sop_class_transfer_syntaxes.append(header.transfer_syntax_uid)
+
+    # Each transfer syntax is requested within its own presentation
+    # context so that the peer can accept all of them rather than only
+    # the one it prefers.
+    for sop_class_uid, sop_class_transfer_syntaxes in transfer_syntaxes.items():
+        for transfer_syntax in sop_class_transfer_syntaxes:
+            yield sop_class_uid, [transfer_syntax]
+
+
+def _has_accepted_context(assoc, sop_class_uid, transfer_syntax_uid):
+    return any(
+        context.abstract_syntax == sop_class_uid
+        and context.transfer_syntax[0] == transfer_syntax_uid
+        for context in assoc.accepted_contexts
+    )
+
+
+def _send_c_store(assoc, header, msg_id, original_transfer_syntax):
+    logging.debug(
+        "Sending DICOM object with SOPInstanceUID: %s", header.sop_instance_uid
+    )
+
+    start = time.perf_counter()
+    dataset = header.dcm_file
+    try:
+        if not isinstance(dataset, pydicom.Dataset) and not (
+            original_transfer_syntax
+            and header.transfer_syntax_uid is not None
+            and _has_accepted_context(
+                assoc, header.sop_class_uid, header.transfer_syntax_uid
+            )
+        ):
+            dataset = pydicom.dcmread(dataset)
+
+        status = assoc.send_c_store(dataset, msg_id=msg_id)
+    except (
+        AttributeError,
+        ValueError,
+        OSError,
+        pydicom.errors.InvalidDicomError,
+    ) as e:
+        if isinstance(header.dcm_file, pydicom.Dataset):
+            logging.error(
+                "Unable to send DICOM object with SOPInstanceUID %s: %s",
+                header.sop_instance_uid,
+                e,
+            )
+        else:
+            logging.error("Unable to send DICOM file %s: %s", header.dcm_file, e)
+        status = None
+
+    return SendResult(
+        header.dcm_file,
+        header.sop_instance_uid,
+        status,
+        time.perf_counter() - start,
+        header.n_bytes,
+    )
 
 
 def send_cli(args):
@@ -119,7 +396,7 @@ def send_cli(args):
     for dcm_file in args.dcmfiles:
         dcm_file_path = pathlib.Path(dcm_file)
         try:
-            pydicom.dcmread(dcm_file_path)
+            pydicom.dcmread(dcm_file_path, stop_before_pixels=True)
         except pydicom.errors.InvalidDicomError:
             logging.error("Invalid DICOM file provided: %s", dcm_file)
             return
@@ -127,4 +404,25 @@ def send_cli(args):
         dcm_file_paths.append(dcm_file_path)
 
     # Send the files
-    dicom_sender.send(dcm_file_paths)
+    report = dicom_sender.send_with_report(
+        dcm_file_paths,
+        n_associations=args.n_associations,
+        original_transfer_syntax=args.original_transfer_syntax,
+    )
+
+    for result in report.results:
+        logging.debug(
+            "%s sent in %.3f s with status: %s",
+            result.dcm_file,
+            result.latency,
+            None if result.status is None else result.status.get("Status", None),
+        )
+
+    n_sent = sum(result.status is not None for result in report.results)
+    logging.info(
+        "Sent %d of %d files in %.2f s (%.1f MB/s)",
+        n_sent,
+        len(report.results),
+        report.duration,
+        report.throughput / 1e6,
+    )
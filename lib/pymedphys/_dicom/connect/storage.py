@@ -0,0 +1,271 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Storage of received DICOM objects exactly as they were sent.
+
+The encoded dataset of each C-STORE request is written to disk by the
+thread handling its association, only decoding the handful of elements
+which determine where the object is stored. The C-STORE response is
+sent once the object has been written, so that it reports whether the
+object was stored. Each association is handled by its own thread, so
+objects sent over concurrent associations are written concurrently.
+Series are tracked as they arrive so that a "series complete" event can
+be raised once every association that contributed to a series has
+closed and all of its files have been written.
+"""
+
+import logging
+import pathlib
+import queue
+import threading
+import uuid
+from typing import Callable, List, NamedTuple, Optional
+
+from pymedphys._imports import pydicom, pynetdicom
+
+from pymedphys._dicom.constants.core import DICOM_SOP_CLASS_NAMES_MODE_PREFIXES
+
+# The elements required to name and place a received object, read from
+# the start of each dataset without decoding the remainder.
+LAST_IDENTIFYING_TAG = 0x0020000E
+
+
+class SeriesCompleteEvent(NamedTuple):
+    """A series for which all received objects have been stored."""
+
+    patient_id: str
+    study_instance_uid: str
+    series_instance_uid: str
+    directory: pathlib.Path
+    filepaths: List[pathlib.Path]
+    failed: List[pathlib.Path]
+
+
+class _SeriesState:
+    def __init__(self, directory):
+        self.directory = directory
+        self.filepaths = []
+        self.failed = []
+        self.pending = 0
+        self.associations = set()
+        self.timer = None
+
+
+def _read_identifiers(event):
+    transfer_syntax = event.context.transfer_syntax
+    if transfer_syntax.is_deflated:
+        return event.dataset
+
+    stream = event.request.DataSet
+    stream.seek(0)
+
+    return pydicom.filereader.read_dataset(
+        stream,
+        transfer_syntax.is_implicit_VR,
+        transfer_syntax.is_little_endian,
+        stop_when=lambda tag, vr, length: tag > LAST_IDENTIFYING_TAG,
+    )
+
+
+class RawDatasetStorage:
+    """Write received DICOM objects without decoding or re-encoding them.
+
+    Parameters
+    ----------
+    storage_directory : pathlib.Path or str
+        Objects are stored within PatientID/StudyInstanceUID/SeriesInstanceUID
+        subdirectories of this directory.
+    on_series_complete : callable, optional
+        Called, from a background thread, with a ``SeriesCompleteEvent`` for
+        each completed series.
+    series_complete_delay : float, optional
+        The number of seconds to wait, after the last contributing
+        association has closed and its files have been written, before
+        declaring a series complete, by default 1.0. A new object for the
+        series arriving within this time restarts the wait.
+    completed_series : queue.Queue, optional
+        The queue upon which each ``SeriesCompleteEvent`` is placed, by
+        default a new queue.
+    """
+
+    def __init__(
+        self,
+        storage_directory,
+        on_series_complete: Optional[Callable[[SeriesCompleteEvent], None]] = None,
+        series_complete_delay=1.0,
+        completed_series=None,
+    ):
+        self.storage_directory = pathlib.Path(storage_directory)
+        self.on_series_complete = on_series_complete
+        self.series_complete_delay = series_complete_delay
+
+        # Each completed series is also placed upon this queue, for
+        # consumers that would rather poll than be called back.
+        if completed_series is None:
+            completed_series = queue.Queue()
+        self.completed_series: "queue.Queue[SeriesCompleteEvent]" = completed_series
+
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def store(self, event):
+        """Write the dataset of a C-STORE event to disk.
+
+        Called from the thread handling the event's association, returning
+        once the dataset has been written.
+
+        Returns
+        -------
+        pathlib.Path
+            The directory of the series to which the dataset belongs.
+
+        Raises
+        ------
+        OSError
+            If the dataset could not be written.
+        """
+        ds = _read_identifiers(event)
+        series_key = (ds.PatientID, ds.StudyInstanceUID, ds.SeriesInstanceUID)
+        series_dir = self.storage_directory.joinpath(*series_key)
+
+        try:
+            mode_prefix = DICOM_SOP_CLASS_NAMES_MODE_PREFIXES[ds.SOPClassUID.name]
+        except KeyError:
+            mode_prefix = "UN"
+        filepath = series_dir.joinpath(f"{mode_prefix}.{ds.SOPInstanceUID}.dcm")
+
+        encoded_file_meta = pynetdicom.dsutils.encode_file_meta(event.file_meta)
+        encoded_dataset = event.encoded_dataset(include_meta=False)
+
+        with self._lock:
+            state = self._series.get(series_key)
+            if state is None:
+                state = _SeriesState(series_dir)
+                self._series[series_key] = state
+
+            state.pending += 1
+            state.associations.add(event.assoc)
+            if state.timer is not None:
+                state.timer.cancel()
+                state.timer = None
+
+        self._write(series_key, filepath, encoded_file_meta, encoded_dataset)
+
+        return series_dir
+
+    def association_closed(self, event):
+        """Record that an association will deliver no further objects."""
+        with self._lock:
+            for series_key, state in list(self._series.items()):
+                if event.assoc in state.associations:
+                    state.associations.discard(event.assoc)
+                    self._maybe_complete(series_key, state)
+
+    def shutdown(self):
+        """Abandon any incomplete series."""
+        with self._lock:
+            for state in self._series.values():
+                if state.timer is not None:
+                    state.timer.cancel()
+
+    def _write(self, series_key, filepath, encoded_file_meta, encoded_dataset):
+        error = None
+        try:
+            filepath = _write_encoded_file(filepath, encoded_file_meta, encoded_dataset)
+            logging.info("DICOM object received: %s", filepath)
+        except OSError as e:
+            logging.error("Could not write file to specified directory:")
+            logging.error("    %s", filepath)
+            error = e
+
+        with self._lock:
+            state = self._series[series_key]
+            state.pending -= 1
+            if error is not None:
+                state.failed.append(filepath)
+            else:
+                state.filepaths.append(filepath)
+
+            self._maybe_complete(series_key, state)
+
+        if error is not None:
+            raise error
+
+    def _maybe_complete(self, series_key, state):
+        if state.pending > 0 or state.associations or state.timer is not None:
+            return
+
+        state.timer = threading.Timer(
+            self.series_complete_delay, self._complete, args=(series_key, state)
+        )
+        state.timer.daemon = True
+        state.timer.start()
+
+    def _complete(self, series_key, state):
+        with self._lock:
+            # A new object may have arrived, cancelling this timer, after
+            # it fired but before the lock was obtained.
+            if (
+                self._series.get(series_key) is not state
+                or state.timer is not threading.current_thread()
+            ):
+                return
+
+            del self._series[series_key]
+
+        event = SeriesCompleteEvent(
+            *series_key,
+            directory=state.directory,
+            filepaths=sorted(state.filepaths),
+            failed=state.failed,
+        )
+        self.completed_series.put(event)
+
+        if self.on_series_complete is not None:
+            self.on_series_complete(event)
+
+
+def _write_encoded_file(filepath, encoded_file_meta, encoded_dataset):
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    preamble = b"\0" * 128 + b"DICM" + encoded_file_meta
+
+    try:
+        with open(filepath, "xb") as f:
+            f.write(preamble)
+            f.write(encoded_dataset)
+
+        return filepath
+    except FileExistsError:
+        pass
+
+    # The same object received again is not rewritten, a differing object
+    # with the same SOP Instance UID is stored within the "orphan"
+    # subdirectory.
+    _, offset = pynetdicom.dsutils.split_dataset(filepath)
+    with open(filepath, "rb") as f:
+        f.seek(offset)
+        if f.read() == encoded_dataset:
+            return filepath
+
+    orphan_filepath = filepath.parent.joinpath("orphan", str(uuid.uuid4()))
+    orphan_filepath.parent.mkdir(exist_ok=True)
+    logging.warning(
+        "DICOM file exists, storing in orphan directory: %s", orphan_filepath.name
+    )
+
+    with open(orphan_filepath, "wb") as f:
+        f.write(preamble)
+        f.write(encoded_dataset)
+
+    return orphan_filepath
@@ -14,9 +14,10 @@
 
 import collections
 import copy
-from typing import Deque, List
+from typing import Deque, List, Tuple
 
-from pymedphys._imports import pydicom  # pylint: disable = unused-import
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom
 
 from pymedphys._dicom import orientation
 from pymedphys._dicom import sorting as _sorting
@@ -54,6 +55,55 @@ def extend(
     return sorted_ct_series
 
 
+def extend_volume(
+    volume: "np.ndarray",
+    axes: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    number_of_slices: int,
+) -> Tuple["np.ndarray", Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Duplicates the first and last slices of a CT volume.
+
+    This is the equivalent of ``extend`` for a volume, and its axes, as
+    returned by ``pymedphys._dicom.ct.volume.ct_volume``. Only the new
+    volume is allocated, no datasets are copied.
+
+    Parameters
+    ----------
+    volume : numpy.ndarray
+        The CT volume, indexed by slice, row and then column.
+    axes : (x, y, z)
+        The axes of the CT volume, where ``z`` is the slice axis.
+    number_of_slices : int
+        The number of slices to add onto both ends of the volume.
+
+    Returns
+    -------
+    volume : numpy.ndarray
+        The extended CT volume.
+    (x, y, z) : tuple of numpy.ndarray
+        The axes of the extended CT volume.
+    """
+    x, y, z = axes
+    z = np.asarray(z, dtype=float)
+    if len(z) < 2:
+        raise ValueError("At least two slices are required to extend a CT volume")
+
+    steps = np.arange(1, number_of_slices + 1)
+    new_z = np.concatenate(
+        [
+            z[0] - (z[1] - z[0]) * steps[::-1],
+            z,
+            z[-1] + (z[-1] - z[-2]) * steps,
+        ]
+    )
+
+    extended = np.empty((len(new_z),) + volume.shape[1:], dtype=volume.dtype)
+    extended[:number_of_slices] = volume[0]
+    extended[number_of_slices : number_of_slices + len(z)] = volume
+    extended[number_of_slices + len(z) :] = volume[-1]
+
+    return extended, (x, y, new_z)
+
+
 def _extend_datasets(
     dicom_datasets,
     index_to_copy,
@@ -85,12 +135,12 @@ def _copy_slices_and_append(dicom_datasets, index_to_copy, number_of_slices):
         dicom_datasets, index_to_copy, number_of_slices
     )
 
-    dataset_to_copy = copy.deepcopy(dicom_datasets[index_to_copy])
+    dataset_to_copy = _copy_dataset(dicom_datasets[index_to_copy])
 
     append = getattr(dicom_datasets, append_method)
 
     for a_slice_location in new_slice_locations:
-        new_slice = copy.deepcopy(dataset_to_copy)
+        new_slice = _copy_dataset(dataset_to_copy)
 
         new_slice.SliceLocation = str(a_slice_location)
 
@@ -103,6 +153,23 @@ def _copy_slices_and_append(dicom_datasets, index_to_copy, number_of_slices):
         append(new_slice)
 
 
+def _copy_dataset(ds):
+    """Deep copy the elements, and file meta information, of a dataset
+    without copying any pixel array that has been decoded from it. The
+    encoded pixel data is immutable bytes, and so is shared between the
+    copies rather than duplicated.
+    """
+    copied = pydicom.Dataset()
+    for elem in ds:
+        copied.add(copy.deepcopy(elem))
+
+    for attribute in ("preamble", "file_meta"):
+        if hasattr(ds, attribute):
+            setattr(copied, attribute, copy.deepcopy(getattr(ds, attribute)))
+
+    return copied
+
+
 def _refresh_instance_numbers(dicom_datasets):
     for i, dicom_dataset in enumerate(dicom_datasets):
         dicom_dataset.InstanceNumber = str(i)
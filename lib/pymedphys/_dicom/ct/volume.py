@@ -0,0 +1,193 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Assembly of a CT series into a single three dimensional volume."""
+
+import concurrent.futures
+import contextlib
+from typing import Sequence, Tuple
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom
+
+from pymedphys._dicom import sorting as _sorting
+from pymedphys._dicom.compat import ensure_transfer_syntax
+from pymedphys._dicom.coords import xyz_axes_from_dataset
+
+# The only elements needed to sort the series and determine its
+# geometry, read from each file without its pixel data.
+HEADER_KEYWORDS = (
+    "ImagePositionPatient",
+    "ImageOrientationPatient",
+    "PixelSpacing",
+    "Rows",
+    "Columns",
+)
+
+
+def _read_header(path):
+    return pydicom.dcmread(
+        path, stop_before_pixels=True, specific_tags=list(HEADER_KEYWORDS)
+    )
+
+
+def _check_geometry_is_consistent(headers):
+    reference = headers[0]
+    for header in headers[1:]:
+        for keyword in ("ImageOrientationPatient", "PixelSpacing", "Rows", "Columns"):
+            if header[keyword].value != reference[keyword].value:
+                raise ValueError(
+                    f"The {keyword} of each slice within the CT series must be "
+                    "the same."
+                )
+
+
+def _geometry_dataset(first_header, displacements):
+    """A dataset describing the volume in the same way as an RT Dose
+    dataset describes its dose grid, so that its axes can be determined
+    by ``xyz_axes_from_dataset``.
+    """
+    ds = pydicom.Dataset()
+    for keyword in HEADER_KEYWORDS:
+        setattr(ds, keyword, first_header[keyword].value)
+
+    ds.GridFrameOffsetVector = list(displacements - displacements[0])
+
+    return ds
+
+
+def _decode_slice(path, volume, index, rescale):
+    ds = ensure_transfer_syntax(pydicom.dcmread(path))
+    pixels = ds.pixel_array
+
+    if rescale:
+        slope = float(ds.get("RescaleSlope", 1))
+        intercept = float(ds.get("RescaleIntercept", 0))
+        if slope != 1 or intercept != 0:
+            pixels = pixels * slope + intercept
+            if np.issubdtype(volume.dtype, np.integer):
+                pixels = np.round(pixels)
+
+    if np.issubdtype(volume.dtype, np.integer) and not np.can_cast(
+        pixels.dtype, volume.dtype
+    ):
+        limits = np.iinfo(volume.dtype)
+        if pixels.size and (pixels.min() < limits.min or pixels.max() > limits.max):
+            raise ValueError(
+                f"The values of {path} range from {pixels.min()} to "
+                f"{pixels.max()}, which don't fit within the volume's "
+                f"{volume.dtype} dtype. Provide a wider dtype."
+            )
+
+    volume[index] = pixels
+
+
+def ct_volume(
+    series_paths: Sequence[str],
+    memmap_path=None,
+    n_workers=1,
+    rescale=True,
+    dtype="int16",
+    coord_system="DICOM",
+) -> Tuple["np.ndarray", Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Assemble the slices of a CT series into a single volume.
+
+    The slices are sorted using only their headers, after which each
+    slice's pixel data is decoded directly into its place within a
+    preallocated volume.
+
+    Parameters
+    ----------
+    series_paths : sequence of str or pathlib.Path
+        The file paths of the slices of a single CT series, in any order.
+    memmap_path : str or pathlib.Path, optional
+        If provided, the volume is a ``numpy.memmap`` backed by a newly
+        created file at this path, so that series larger than the
+        available memory can be assembled.
+    n_workers : int, optional
+        The number of threads across which slices are decoded, by
+        default 1.
+    rescale : bool, optional
+        Whether to apply each slice's ``RescaleSlope`` and
+        ``RescaleIntercept``, giving Hounsfield units, by default True.
+    dtype : str or numpy.dtype, optional
+        The data type of the volume, by default ``"int16"``. A
+        ``ValueError`` is raised should any slice's values not fit within
+        an integer dtype, for example unsigned 16 bit values above 32767
+        without ``rescale``.
+    coord_system : str, optional
+        The coordinate system of the returned axes, see
+        ``pymedphys._dicom.coords.xyz_axes_from_dataset``. By default
+        ``"DICOM"``.
+
+    Returns
+    -------
+    volume : numpy.ndarray
+        The CT volume, indexed by slice, row and then column, in the same
+        manner as the pixel array of an RT Dose dataset.
+    (x, y, z) : tuple of numpy.ndarray
+        The axes of the volume, as returned by ``xyz_axes_from_dataset``.
+    """
+    series_paths = list(series_paths)
+    if not series_paths:
+        raise ValueError("At least one CT slice is required.")
+
+    headers = [_read_header(path) for path in series_paths]
+    _check_geometry_is_consistent(headers)
+
+    displacements = np.array([_sorting.stack_displacement(ds) for ds in headers])
+    order = np.argsort(displacements, kind="stable")
+
+    first_header = headers[order[0]]
+    shape = (len(series_paths), int(first_header.Rows), int(first_header.Columns))
+
+    if memmap_path is None:
+        volume = np.empty(shape, dtype=dtype)
+    else:
+        volume = np.memmap(memmap_path, dtype=dtype, mode="w+", shape=shape)
+
+    sorted_paths = [series_paths[i] for i in order]
+    indices = range(len(sorted_paths))
+
+    with contextlib.ExitStack() as stack:
+        if n_workers > 1:
+            executor = stack.enter_context(
+                concurrent.futures.ThreadPoolExecutor(max_workers=n_workers)
+            )
+            stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+            results = executor.map(
+                _decode_slice,
+                sorted_paths,
+                [volume] * len(sorted_paths),
+                indices,
+                [rescale] * len(sorted_paths),
+            )
+        else:
+            results = (
+                _decode_slice(path, volume, index, rescale)
+                for path, index in zip(sorted_paths, indices)
+            )
+
+        # Consume the results so that any decoding errors are raised
+        for _ in results:
+            pass
+
+    if memmap_path is not None:
+        volume.flush()
+
+    axes = xyz_axes_from_dataset(
+        _geometry_dataset(first_header, displacements[order]), coord_system
+    )
+
+    return volume, axes
@@ -14,7 +14,6 @@
 
 import os
 import textwrap
-from copy import deepcopy
 from typing import Union, cast
 
 from pymedphys._imports import numpy as np
@@ -161,13 +160,35 @@ class DeliveryDicom(DeliveryBase):
             rtplan_dataset, fraction_group_number
         )
 
+        # Each beam is kept as arrays, rather than as a Delivery, so that
+        # the beams are only converted to tuples once, after combining.
         delivery_data_by_beam_sequence = []
         for beam, meterset in zip(beam_sequence, metersets):
             delivery_data_by_beam_sequence.append(cls._from_dicom_beam(beam, meterset))
 
         return cls.combine(*delivery_data_by_beam_sequence)
 
-    def to_dicom(self, dicom_template, fraction_group_number=None):
+    def to_dicom(self, dicom_template, fraction_group_number=None, output=None):
+        """Create an RT Plan from this delivery, using ``dicom_template``
+        for everything other than the control points.
+
+        Parameters
+        ----------
+        dicom_template : pydicom.Dataset
+            An RT Plan with one static beam for each gantry angle within
+            the delivery. The template itself is left unmodified.
+        fraction_group_number : int, optional
+            The fraction group of the template to use. Only required if
+            the template has more than one fraction group.
+        output : str, pathlib.Path or file-like, optional
+            If provided, the created RT Plan is also written directly to
+            this path or writeable binary file object.
+
+        Returns
+        -------
+        pydicom.Dataset
+            The created RT Plan.
+        """
         filtered = self._filter_cps()
         if fraction_group_number is None:
             fraction_group_number = self._fraction_group_number(dicom_template)
@@ -198,7 +219,11 @@ class DeliveryDicom(DeliveryBase):
                 )
             )
 
-        return _pmp_rtplan.merge_beam_sequences(single_beam_dicoms)
+        created_dicom = _pmp_rtplan.merge_beam_sequences(single_beam_dicoms)
+        if output is not None:
+            pydicom.dcmwrite(output, created_dicom)
+
+        return created_dicom
 
     @classmethod
     def _load_all_fraction_groups_from_file(cls, filepath):
@@ -252,41 +277,20 @@ class DeliveryDicom(DeliveryBase):
 
         num_leaves = len(leaf_widths)
 
-        control_points = beam.ControlPointSequence
-
-        beam_limiting_device_position_sequences = (
-            _pmp_rtplan.get_cp_attribute_leaning_on_prior(
-                control_points, "BeamLimitingDevicePositionSequence"
-            )
+        control_point_arrays = _pmp_rtplan.get_control_point_arrays(
+            beam.ControlPointSequence, {"MLCX": 2 * num_leaves, "ASYMY": 2}
         )
 
-        dicom_mlcs = _pmp_rtplan.get_leaf_jaw_positions_for_type(
-            beam_limiting_device_position_sequences, "MLCX"
+        dicom_mlcs = control_point_arrays.leaf_jaw_positions["MLCX"]
+        mlcs = np.stack(
+            [dicom_mlcs[:, num_leaves:][:, ::-1], -dicom_mlcs[:, :num_leaves][:, ::-1]],
+            axis=-1,
         )
 
-        mlcs = [
-            np.array(
-                [-np.array(mlc[0:num_leaves][::-1]), np.array(mlc[num_leaves::][::-1])][
-                    ::-1
-                ]
-            ).T
-            for mlc in dicom_mlcs
-        ]
-
-        dicom_jaw = _pmp_rtplan.get_leaf_jaw_positions_for_type(
-            beam_limiting_device_position_sequences, "ASYMY"
-        )
+        dicom_jaw = control_point_arrays.leaf_jaw_positions["ASYMY"]
+        jaw = np.stack([dicom_jaw[:, 1], -dicom_jaw[:, 0]], axis=-1)
 
-        jaw = np.array(dicom_jaw)
-
-        second_col = deepcopy(jaw[:, 1])
-
-        jaw[:, 1] = jaw[:, 0]
-        jaw[:, 0] = second_col
-
-        jaw[:, 1] = -jaw[:, 1]
-
-        final_mu_weight = np.array(beam.FinalCumulativeMetersetWeight)
+        final_mu_weight = beam.FinalCumulativeMetersetWeight
 
         if final_mu_weight is None:
             raise ValueError("FinalCumulativeMetersetWeight should not be None")
@@ -294,37 +298,27 @@ class DeliveryDicom(DeliveryBase):
         # https://dicom.innolitics.com/ciods/rt-plan/rt-beams/300a00b0/300a0111/300a0134
         # http://dicom.nema.org/medical/dicom/current/output/chtml/part03/sect_C.8.8.14.html#sect_C.8.8.14.1
 
-        cumulative_meterset_weight = [
-            control_point.CumulativeMetersetWeight for control_point in control_points
-        ]
+        cumulative_meterset_weight = control_point_arrays.cumulative_meterset_weight
 
-        for weight in cumulative_meterset_weight:
-            if weight is None:
-                raise ValueError(
-                    "Cumulative Meterset weight not set within DICOM RT plan file. "
-                    "This may be due to the plan being exported from a planning system "
-                    "without the dose being calculated."
-                )
+        if np.any(np.isnan(cumulative_meterset_weight)):
+            raise ValueError(
+                "Cumulative Meterset weight not set within DICOM RT plan file. "
+                "This may be due to the plan being exported from a planning system "
+                "without the dose being calculated."
+            )
 
-        mu = [
-            meterset * np.array(weight) / final_mu_weight
-            for control_point, weight in zip(control_points, cumulative_meterset_weight)
-        ]
+        mu = float(meterset) * cumulative_meterset_weight / float(final_mu_weight)
 
-        gantry_angles = convert_IEC_angle_to_bipolar(
-            _pmp_rtplan.get_cp_attribute_leaning_on_prior(control_points, "GantryAngle")
-        )
+        gantry_angles = convert_IEC_angle_to_bipolar(control_point_arrays.gantry_angle)
 
         collimator_angles = convert_IEC_angle_to_bipolar(
-            _pmp_rtplan.get_cp_attribute_leaning_on_prior(
-                control_points, "BeamLimitingDeviceAngle"
-            )
+            control_point_arrays.beam_limiting_device_angle
         )
 
-        return cls(mu, gantry_angles, collimator_angles, mlcs, jaw)
+        return mu, gantry_angles, collimator_angles, mlcs, jaw
 
     def _to_dicom_beam(self, dicom_template, beam_index, fraction_index):
-        created_dicom = deepcopy(dicom_template)
+        created_dicom = _pmp_rtplan.copy_template_for_beam(dicom_template, beam_index)
         data_converted = self._coordinate_convert()
 
         beam = created_dicom.BeamSequence[beam_index]
@@ -342,8 +336,6 @@ class DeliveryDicom(DeliveryBase):
         )
         _pmp_rtplan.replace_beam_sequence(created_dicom, all_control_points, beam_index)
 
-        _pmp_rtplan.restore_trailing_zeros(created_dicom)
-
         return created_dicom
 
     def _matches_fraction_group(
@@ -29,14 +29,11 @@ def jaw_dd2dcm(jaw):
 
 
 def mlc_dd2dcm(mlc):
-    mlc = np.array(mlc, copy=False)
+    mlc = np.asarray(mlc)
 
-    dicom_mlc_format = []
-    for control_point in mlc:
-        concatenated = np.hstack([-control_point[-1::-1, 1], control_point[-1::-1, 0]])
-        dicom_mlc_format.append(concatenated.astype(str).tolist())
+    concatenated = np.concatenate([-mlc[:, -1::-1, 1], mlc[:, -1::-1, 0]], axis=1)
 
-    return dicom_mlc_format
+    return concatenated.astype(str).tolist()
 
 
 def angle_dd2dcm(angle):
@@ -15,20 +15,32 @@
 """A DICOM RT Dose toolbox"""
 
 import copy
-from typing import Sequence
+import os
+from typing import BinaryIO, Sequence, Union
 
-from pymedphys._imports import matplotlib, plt, pydicom, scipy
+from pymedphys._imports import plt, pydicom
 from pymedphys._imports import numpy as np
 
+from pymedphys import interpolate as pmp_interp
+
 from . import orientation
 from .compat import ensure_transfer_syntax
 from .coords import coords_in_datasets_are_equal, xyz_axes_from_dataset
 from .header import patient_ids_in_datasets_are_equal
 from .rtplan import get_surface_entry_point_with_fallback, require_gantries_be_zero
 from .structure import pull_structure
+from .structure.rasterise import rasterise_structure
 
 # pylint: disable=C0103
 
+PIXEL_DATA = 0x7FE00010
+
+# The transfer syntaxes whose pixel data may be memory mapped as is
+UNCOMPRESSED_LITTLE_ENDIAN = (
+    "1.2.840.10008.1.2",  # Implicit VR Little Endian
+    "1.2.840.10008.1.2.1",  # Explicit VR Little Endian
+)
+
 
 def zyx_and_dose_from_dataset(dataset):
     x, y, z = xyz_axes_from_dataset(dataset)
@@ -56,17 +68,13 @@ def dicom_dose_interpolate(interp_coords, dicom_dose_dataset):
         An RT DICOM Dose object
     """
 
-    interp_z = np.array(interp_coords[0], copy=False)[:, None, None]
-    interp_y = np.array(interp_coords[1], copy=False)[None, :, None]
-    interp_x = np.array(interp_coords[2], copy=False)[None, None, :]
-
-    coords, dicom_dose_dataset = zyx_and_dose_from_dataset(dicom_dose_dataset)
-    interpolation = scipy.interpolate.RegularGridInterpolator(
-        coords, dicom_dose_dataset
-    )
+    coords, dose = zyx_and_dose_from_dataset(dicom_dose_dataset)
+    coords, dose = _ascending(coords, dose)
 
     try:
-        result = interpolation((interp_z, interp_y, interp_x))
+        result = pmp_interp.interp(
+            coords, dose, axes_interp=interp_coords, keep_dims=True
+        )
     except ValueError:
         print(f"coords: {coords}")
         raise
@@ -181,19 +189,21 @@ def get_dose_grid_structure_mask(
     structure_name: str,
     structure_dataset: "pydicom.Dataset",
     dose_dataset: "pydicom.Dataset",
+    interpolation: str = "linear",
+    supersample: int = 1,
 ):
     """Determines the 3D boolean mask defining whether or not a grid
     point is inside or outside of a defined structure.
 
-    In its current implementation the dose grid and the planes upon
-    which the structures are defined need to be aligned. This is due to
-    the implementation only stepping through each structure plane and
-    undergoing a 2D mask on the respective dose grid. In order to
-    undergo a mask when the contours and dose grids do not align
-    inter-slice contour interpolation would be required.
+    Each contour plane is rasterised with a compiled even-odd scanline
+    fill, so any number of contours may be defined on a single plane
+    and contours lying within other contours define holes.
 
-    For now, having two contours for the same structure name on a single
-    slice is also not supported.
+    The dose grid planes do not need to align with the structure
+    planes. Dose planes lying between two structure planes are
+    determined by interpolating between those structure planes, dose
+    planes beyond the first or last structure plane are outside of the
+    structure.
 
     Parameters
     ----------
@@ -205,73 +215,38 @@ def get_dose_grid_structure_mask(
     dose_dataset : pydicom.Dataset
         An RT Dose DICOM object from which the grid mask coordinates are
         determined.
+    interpolation : str, optional
+        Either ``"linear"`` (default), shape based interpolation
+        between the adjacent structure planes, or ``"nearest"``, the
+        nearest structure plane.
+    supersample : int, optional
+        When greater than one, each dose voxel is divided into
+        ``supersample`` steps along each axis and the returned mask
+        contains the fraction of each voxel within the structure
+        instead of a boolean.
 
     Raises
     ------
     ValueError
-        If an unsupported contour is provided or the dose grid does not
-        align with the structure planes.
+        If a contour does not lie on a single z plane.
 
     """
     x_dose, y_dose, z_dose = xyz_axes_from_dataset(dose_dataset)
 
-    xx, yy = np.meshgrid(x_dose, y_dose)
-    points = np.swapaxes(np.vstack([xx.ravel(), yy.ravel()]), 0, 1)
-
     x_structure, y_structure, z_structure = pull_structure(
         structure_name, structure_dataset
     )
 
-    structure_z_list = []
-    for item in z_structure:
-        unique_item = np.unique(item)
-        if len(unique_item) != 1:
-            raise ValueError("Only one z value per contour supported")
-        structure_z_list.append(unique_item[0])
-
-    structure_z_values = np.sort(structure_z_list)
-    unique_structure_z_values = np.unique(structure_z_values)
-
-    if np.any(structure_z_values != unique_structure_z_values):
-        raise ValueError("Only one contour per slice is currently supported")
-
-    sorted_dose_z = np.sort(z_dose)
-
-    first_dose_index = np.where(sorted_dose_z == structure_z_values[0])[0][0]
-    for i, z_val in enumerate(structure_z_values):
-        dose_index = first_dose_index + i
-        if structure_z_values[i] != sorted_dose_z[dose_index]:
-            raise ValueError(
-                "Only contours where both, there are no gaps in the "
-                "z-axis of the contours, and the contour axis and dose "
-                "axis, are aligned are supported."
-            )
-
-    mask_yxz = np.zeros((len(y_dose), len(x_dose), len(z_dose)), dtype=bool)
-
-    for structure_index, z_val in enumerate(structure_z_values):
-        dose_index = int(np.where(z_dose == z_val)[0])
-
-        if z_structure[structure_index][0] != z_dose[dose_index]:
-            raise ValueError("Structure and dose indices do not align")
-
-        structure_polygon = matplotlib.path.Path(
-            [
-                (x_structure[structure_index][i], y_structure[structure_index][i])
-                for i in range(len(x_structure[structure_index]))
-            ]
-        )
-
-        # This logical "or" here is actually in place for the case where
-        # there may be multiple contours on the one slice. That's not
-        # going to be used at the moment however, as that case is not
-        # yet supported in the logic above.
-        mask_yxz[:, :, dose_index] = mask_yxz[:, :, dose_index] | (
-            structure_polygon.contains_points(points).reshape(len(y_dose), len(x_dose))
-        )
-
-    mask_xyz = np.swapaxes(mask_yxz, 0, 1)
-    mask_zyx = np.swapaxes(mask_xyz, 0, 2)
+    mask_zyx = rasterise_structure(
+        x_structure,
+        y_structure,
+        z_structure,
+        x_dose,
+        y_dose,
+        z_dose,
+        interpolation=interpolation,
+        supersample=supersample,
+    )
 
     return mask_zyx
 
@@ -305,6 +280,57 @@ def create_dvh(structure, structure_dataset, dose_dataset):
     plt.ylabel("Relative Volume (%)")
 
 
+def _summed_dose_type(datasets):
+    """Check that the doses within ``datasets`` may be summed, returning
+    the DoseType of their sum.
+    """
+    if not all(ds.Modality == "RTDOSE" for ds in datasets):
+        raise ValueError("`datasets` must only contain DICOM RT Dose datasets.")
+
+    if not patient_ids_in_datasets_are_equal(datasets):
+        raise ValueError("Patient ID must match for all datasets")
+
+    if not all(ds.DoseSummationType == "PLAN" for ds in datasets):
+        raise ValueError(
+            "Only DICOM RT Doses whose DoseSummationTypes are 'PLAN' are supported"
+        )
+
+    if not all(ds.DoseUnits == datasets[0].DoseUnits for ds in datasets):
+        raise ValueError(
+            "All DICOM RT Doses must have the same units ('GY or 'RELATIVE')"
+        )
+
+    if not all(ds.DoseType in ("PHYSICAL", "EFFECTIVE") for ds in datasets):
+        raise ValueError(
+            "Only DICOM RT Doses whose DoseTypes are 'PHYSICAL' or "
+            "'EFFECTIVE' are supported"
+        )
+
+    if any(ds.DoseType == "EFFECTIVE" for ds in datasets):
+        return "EFFECTIVE"
+
+    return "PHYSICAL"
+
+
+def _summed_dose_dataset(template, doses_summed, dose_type):
+    ds_summed = copy.deepcopy(template)
+
+    ds_summed.BitsAllocated = 32
+    ds_summed.BitsStored = 32
+    ds_summed.HighBit = 31
+    ds_summed.PixelRepresentation = 0
+    ds_summed.DoseSummationType = "MULTI_PLAN"
+    ds_summed.DoseComment = "Summed Dose"
+    ds_summed.DoseType = dose_type
+
+    ds_summed.DoseGridScaling = np.max(doses_summed) / (2 ** int(ds_summed.HighBit))
+
+    pixel_array_summed = (doses_summed / ds_summed.DoseGridScaling).astype(np.uint32)
+    ds_summed.add_new(PIXEL_DATA, "OW", pixel_array_summed.tobytes())
+
+    return ds_summed
+
+
 def sum_doses_in_datasets(
     datasets: Sequence["pydicom.dataset.Dataset"],
 ) -> "pydicom.dataset.Dataset":
@@ -326,49 +352,205 @@ def sum_doses_in_datasets(
     for ds in datasets:
         ensure_transfer_syntax(ds)
 
-    if not all(ds.Modality == "RTDOSE" for ds in datasets):
-        raise ValueError("`datasets` must only contain DICOM RT Dose datasets.")
+    dose_type = _summed_dose_type(datasets)
 
-    if not patient_ids_in_datasets_are_equal(datasets):
-        raise ValueError("Patient ID must match for all datasets")
+    if not coords_in_datasets_are_equal(datasets):
+        raise ValueError("All dose grids must have perfectly coincident coordinates")
 
-    if not all(ds.DoseSummationType == "PLAN" for ds in datasets):
+    doses_summed = np.zeros(datasets[0].pixel_array.shape, dtype=np.float32)
+    for ds in datasets:
+        doses_summed += dose_from_dataset(ds)
+
+    return _summed_dose_dataset(datasets[0], doses_summed, dose_type)
+
+
+def _read_dose_header(file):
+    if hasattr(file, "seek"):
+        file.seek(0)
+
+    return ensure_transfer_syntax(pydicom.dcmread(file, stop_before_pixels=True))
+
+
+def _grid_shape(ds):
+    return (int(ds.get("NumberOfFrames", 1)), int(ds.Rows), int(ds.Columns))
+
+
+def _zyx_axes(ds):
+    x, y, z = xyz_axes_from_dataset(ds)
+
+    return z, y, x
+
+
+def _grids_are_coincident(ds_a, ds_b):
+    if _grid_shape(ds_a) != _grid_shape(ds_b):
+        return False
+
+    return all(
+        a.shape == b.shape and np.allclose(a, b)
+        for a, b in zip(_zyx_axes(ds_a), _zyx_axes(ds_b))
+    )
+
+
+def _memmap_pixel_data(filepath, header):
+    """Memory map the stored pixel values of an uncompressed, little
+    endian, RT Dose file, returning None if they cannot be mapped.
+    """
+    if header.file_meta.TransferSyntaxUID not in UNCOMPRESSED_LITTLE_ENDIAN:
+        return None
+
+    bits_allocated = int(header.BitsAllocated)
+    if int(header.get("SamplesPerPixel", 1)) != 1 or bits_allocated not in (16, 32):
+        return None
+
+    signed = int(header.get("PixelRepresentation", 0)) == 1
+    dtype = np.dtype(f"<{'i' if signed else 'u'}{bits_allocated // 8}")
+    shape = _grid_shape(header)
+
+    # Deferring every element leaves the Pixel Data unread, with its
+    # position within the file recorded instead
+    ds = pydicom.dcmread(filepath, defer_size=0)
+    pixel_data = ds.get_item(PIXEL_DATA, keep_deferred=True)
+
+    if (
+        not isinstance(pixel_data, pydicom.dataelem.RawDataElement)
+        or pixel_data.value is not None
+        or pixel_data.length != np.prod(shape) * dtype.itemsize
+    ):
+        return None
+
+    return np.memmap(
+        filepath, dtype=dtype, mode="r", offset=pixel_data.value_tell, shape=shape
+    )
+
+
+def _stored_dose_frames(file, header, memmap):
+    """The stored pixel values of an RT Dose file, indexed by frame,
+    row and then column.
+    """
+    if memmap and isinstance(file, (str, os.PathLike)):
+        frames = _memmap_pixel_data(file, header)
+        if frames is not None:
+            return frames
+
+    if hasattr(file, "seek"):
+        file.seek(0)
+
+    ds = ensure_transfer_syntax(pydicom.dcmread(file))
+
+    return ds.pixel_array.reshape(_grid_shape(header))
+
+
+def _ascending(axes, values):
+    """Flip any descending axes, along with the corresponding dimension
+    of ``values``, so that they may be interpolated across.
+    """
+    ascending_axes = []
+    for dim, axis in enumerate(axes):
+        if axis.size > 1 and axis[0] > axis[-1]:
+            axis = axis[::-1]
+            values = np.flip(values, axis=dim)
+
+        ascending_axes.append(axis)
+
+    return tuple(ascending_axes), values
+
+
+def sum_doses_in_files(
+    files: Sequence[Union[str, "os.PathLike", BinaryIO]],
+    resample: bool = False,
+    dtype="float64",
+    memmap: bool = True,
+) -> "pydicom.dataset.Dataset":
+    """Sum the doses of any number of DICOM RT Dose files, reading only
+    one dose at a time.
+
+    The headers of all files are checked before any dose is read. Each
+    dose is then added, one frame at a time, into a single running sum,
+    so that only the running sum and one dose grid need to be held in
+    memory.
+
+    Parameters
+    ----------
+    files : sequence of str, pathlib.Path or binary file objects
+        The DICOM RT Dose files whose doses are to be summed. The first
+        file is used as the template for the summed dataset.
+    resample : bool, optional
+        If True, doses whose grids do not coincide with the grid of the
+        first file are linearly interpolated onto that grid using
+        ``pymedphys.interpolate``, with dose outside of their grid taken
+        as zero. If False (default), all dose grids must coincide.
+    dtype : str or numpy.dtype, optional
+        The data type of the running sum, by default ``"float64"``.
+        ``"float32"`` halves its memory.
+    memmap : bool, optional
+        If True (default), the pixel data of uncompressed files given
+        by path are memory mapped rather than read into memory.
+
+    Returns
+    -------
+    pydicom.dataset.Dataset
+        A new DICOM RT Dose dataset whose dose is the sum of all doses
+        within `files`
+    """
+    files = list(files)
+    if not files:
+        raise ValueError("At least one DICOM RT Dose file is required.")
+
+    headers = [_read_dose_header(file) for file in files]
+    dose_type = _summed_dose_type(headers)
+
+    reference = headers[0]
+    coincident = [_grids_are_coincident(reference, header) for header in headers]
+
+    if not resample and not all(coincident):
         raise ValueError(
-            "Only DICOM RT Doses whose DoseSummationTypes are 'PLAN' are supported"
+            "All dose grids must have perfectly coincident coordinates, "
+            "otherwise use `resample=True`"
         )
 
-    if not all(ds.DoseUnits == datasets[0].DoseUnits for ds in datasets):
+    if resample and not all(
+        header.ImageOrientationPatient == reference.ImageOrientationPatient
+        for header in headers
+    ):
         raise ValueError(
-            "All DICOM RT Doses must have the same units ('GY or 'RELATIVE')"
+            "Only dose grids with the same ImageOrientationPatient can be "
+            "resampled onto one another"
         )
 
-    if not coords_in_datasets_are_equal(datasets):
-        raise ValueError("All dose grids must have perfectly coincident coordinates")
+    doses_summed = np.zeros(_grid_shape(reference), dtype=dtype)
+    reference_axes = _zyx_axes(reference)
 
-    ds_summed = copy.deepcopy(datasets[0])
+    for file, header, is_coincident in zip(files, headers, coincident):
+        frames = _stored_dose_frames(file, header, memmap)
+        scaling = float(header.DoseGridScaling)
 
-    ds_summed.BitsAllocated = 32
-    ds_summed.BitsStored = 32
-    ds_summed.HighBit = 31
-    ds_summed.DoseSummationType = "MULTI_PLAN"
-    ds_summed.DoseComment = "Summed Dose"
+        if is_coincident:
+            for frame_summed, frame in zip(doses_summed, frames):
+                frame_summed += frame * scaling
+        else:
+            axes, dose = _ascending(
+                _zyx_axes(header), np.asarray(frames, dtype=np.float64) * scaling
+            )
+            doses_summed += pmp_interp.interp(
+                axes,
+                dose,
+                axes_interp=reference_axes,
+                keep_dims=True,
+                bounds_error=False,
+                extrap_fill_value=0.0,
+            )
 
-    if not all(ds.DoseType in ("PHYSICAL", "EFFECTIVE") for ds in datasets):
-        raise ValueError(
-            "Only DICOM RT Doses whose DoseTypes are 'PHYSICAL' or "
-            "'EFFECTIVE' are supported"
-        )
-    if any(ds.DoseType == "EFFECTIVE" for ds in datasets):
-        ds_summed.DoseType = "EFFECTIVE"
-    else:
-        ds_summed.DoseType = "PHYSICAL"
+        del frames
 
-    doses = np.array([dose_from_dataset(ds) for ds in datasets])
-    doses_summed = np.sum(doses, axis=0, dtype=np.float32)
+    return _summed_dose_dataset(reference, doses_summed, dose_type)
 
-    ds_summed.DoseGridScaling = np.max(doses_summed) / (2 ** int(ds_summed.HighBit))
 
-    pixel_array_summed = (doses_summed / ds_summed.DoseGridScaling).astype(np.uint32)
-    ds_summed.PixelData = pixel_array_summed.tobytes()
+def sum_doses_cli(args):
+    ds_summed = sum_doses_in_files(
+        args.input_files,
+        resample=args.resample,
+        dtype="float32" if args.float32 else "float64",
+        memmap=not args.no_memmap,
+    )
 
-    return ds_summed
+    pydicom.dcmwrite(args.output_file, ds_summed)
@@ -0,0 +1,309 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dose volume histograms for many structures at once."""
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Optional, Sequence
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom  # pylint: disable=unused-import
+
+from .coords import xyz_axes_from_dataset
+from .dose import dose_from_dataset
+from .structure import (
+    get_roi_contour_sequence_by_name,
+    list_structures,
+    pull_coords_from_contour_sequence,
+)
+from .structure.rasterise import rasterise_structure
+
+# The total size of the bit packed masks kept between calls
+MASK_CACHE_BYTES = 256 * 2**20
+
+DVHTable = namedtuple(
+    "DVHTable",
+    [
+        "structures",
+        "dose",
+        "differential",
+        "cumulative",
+        "volume",
+        "mean",
+        "minimum",
+        "maximum",
+        "dose_at_volume",
+        "volume_at_dose",
+    ],
+)
+DVHTable.__doc__ = """The DVHs and DVH metrics of a set of structures.
+
+Each of the arrays has the structures along its first axis.
+
+Attributes
+----------
+structures : list of str
+    The structure names, in the order of the arrays' first axis.
+dose : np.ndarray
+    The dose (Gy) at the lower edge of each of the histogram bins.
+differential : np.ndarray
+    The volume (cc) of each structure within each dose bin.
+cumulative : np.ndarray
+    The volume (cc) of each structure receiving at least ``dose``.
+volume : np.ndarray
+    The total volume (cc) of each structure.
+mean, minimum, maximum : np.ndarray
+    The mean, minimum and maximum dose (Gy) within each structure.
+dose_at_volume : np.ndarray
+    The dose (Gy) covering each of the requested percentage volumes,
+    Dx, with shape ``(len(structures), len(dose_at_volume))``.
+volume_at_dose : np.ndarray
+    The percentage volume receiving at least each of the requested
+    doses, Vx, with shape
+    ``(len(structures), len(volume_at_dose))``.
+"""
+
+# Rasterised masks are kept, bit packed, between calls so that
+# repeated DVH calculations for the same structure set upon the same
+# dose grid (for example, when comparing plans) skip the rasterisation.
+# Partial volume masks, of a float per voxel, are recalculated instead.
+_mask_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_mask_cache_lock = threading.Lock()
+
+
+def _dose_grid_geometry(dose_dataset):
+    return (
+        tuple(float(item) for item in dose_dataset.ImagePositionPatient),
+        tuple(float(item) for item in dose_dataset.ImageOrientationPatient),
+        tuple(float(item) for item in dose_dataset.PixelSpacing),
+        int(dose_dataset.Rows),
+        int(dose_dataset.Columns),
+        tuple(float(item) for item in dose_dataset.GridFrameOffsetVector),
+    )
+
+
+def _mask_cache_key(structure_dataset, roi_contour_sequence, geometry, options):
+    sop_instance_uid = structure_dataset.get("SOPInstanceUID", None)
+    if sop_instance_uid is None:
+        return None
+
+    return (
+        str(sop_instance_uid),
+        int(roi_contour_sequence.ReferencedROINumber),
+        geometry,
+        options,
+    )
+
+
+def _structure_mask(structure_dataset, structure_name, axes, geometry, options):
+    """Either retrieve a structure's mask from the cache or rasterise
+    it onto the dose grid.
+    """
+    x_dose, y_dose, z_dose = axes
+    shape = (len(z_dose), len(y_dose), len(x_dose))
+    interpolation, supersample = options
+
+    roi_contour_sequence = get_roi_contour_sequence_by_name(
+        structure_name, structure_dataset
+    )
+    key = None
+    if supersample == 1:
+        key = _mask_cache_key(
+            structure_dataset, roi_contour_sequence, geometry, options
+        )
+
+    if key is not None:
+        with _mask_cache_lock:
+            cached = _mask_cache.get(key)
+            if cached is not None:
+                _mask_cache.move_to_end(key)
+
+        if cached is not None:
+            return np.unpackbits(cached, count=int(np.prod(shape))).reshape(shape) == 1
+
+    contour_sequence = roi_contour_sequence.get("ContourSequence", [])
+    x_structure, y_structure, z_structure = pull_coords_from_contour_sequence(
+        contour_sequence
+    )
+
+    mask = rasterise_structure(
+        x_structure,
+        y_structure,
+        z_structure,
+        x_dose,
+        y_dose,
+        z_dose,
+        interpolation=interpolation,
+        supersample=supersample,
+    )
+
+    if key is not None:
+        packed = np.packbits(mask, axis=None)
+        with _mask_cache_lock:
+            _mask_cache[key] = packed
+
+            cache_bytes = sum(item.nbytes for item in _mask_cache.values())
+            while cache_bytes > MASK_CACHE_BYTES:
+                _, evicted = _mask_cache.popitem(last=False)
+                cache_bytes -= evicted.nbytes
+
+    return mask
+
+
+def _voxel_volumes(axes):
+    """The volume (cc) of each voxel, allowing for non-uniform
+    GridFrameOffsetVector spacing.
+    """
+    spacings = []
+    for axis in axes:
+        axis = np.asarray(axis, dtype=np.float64)
+        if axis.size == 1:
+            raise ValueError(
+                "Voxel volumes require at least two grid points along each axis"
+            )
+
+        spacings.append(np.abs(np.gradient(axis)))
+
+    x_spacing, y_spacing, z_spacing = spacings
+
+    return (
+        z_spacing[:, None, None] * y_spacing[None, :, None] * x_spacing[None, None, :]
+    ) / 1000
+
+
+def dvh_table(
+    structure_dataset: "pydicom.Dataset",
+    dose_dataset: "pydicom.Dataset",
+    structures: Optional[Sequence[str]] = None,
+    bin_width: float = 0.01,
+    dose_at_volume: Sequence[float] = (98, 95, 50, 2),
+    volume_at_dose: Sequence[float] = (),
+    interpolation: str = "linear",
+    supersample: int = 1,
+) -> DVHTable:
+    """Calculate the DVHs of many structures upon a DICOM dose grid.
+
+    The dose is decoded once and each structure is rasterised once
+    onto the dose grid. Masks are cached, keyed by the structure set's
+    SOPInstanceUID, the ROI number and the dose grid geometry, so that
+    subsequent calls for the same structures and dose grid do not
+    rasterise the structures again. Up to ``MASK_CACHE_BYTES`` of bit
+    packed masks are kept. Partial volume masks, with ``supersample``
+    greater than one, are not cached.
+
+    Parameters
+    ----------
+    structure_dataset : pydicom.Dataset
+        An RT Structure DICOM object containing the structures.
+    dose_dataset : pydicom.Dataset
+        An RT Dose DICOM object.
+    structures : sequence of str, optional
+        The names of the structures to include. Defaults to all of the
+        structures within ``structure_dataset``.
+    bin_width : float, optional
+        The width (Gy) of the histogram bins.
+    dose_at_volume : sequence of float, optional
+        The percentage volumes at which to report Dx.
+    volume_at_dose : sequence of float, optional
+        The doses (Gy) at which to report Vx.
+    interpolation, supersample : optional
+        Passed through to the structure rasterisation. See
+        ``get_dose_grid_structure_mask``.
+
+    Returns
+    -------
+    DVHTable
+        A named tuple of the DVHs and metrics. Dx and Vx are
+        calculated from the voxel doses directly, not
+        from the binned histograms.
+    """
+    if bin_width <= 0:
+        raise ValueError("bin_width must be positive")
+
+    if structures is None:
+        structures = list_structures(structure_dataset)
+    structures = list(structures)
+
+    axes = xyz_axes_from_dataset(dose_dataset)
+    dose = dose_from_dataset(dose_dataset).reshape(
+        tuple(len(axis) for axis in reversed(axes))
+    )
+    geometry = _dose_grid_geometry(dose_dataset)
+    options = (interpolation, supersample)
+
+    voxel_volumes = _voxel_volumes(axes)
+
+    num_bins = int(np.floor(dose.max() / bin_width)) + 1
+    bin_indices = np.clip(np.floor(dose / bin_width).astype(np.int64), 0, None)
+
+    num_structures = len(structures)
+    differential = np.zeros((num_structures, num_bins))
+    volume = np.zeros(num_structures)
+    mean = np.full(num_structures, np.nan)
+    minimum = np.full(num_structures, np.nan)
+    maximum = np.full(num_structures, np.nan)
+    dose_at_volume_results = np.full((num_structures, len(dose_at_volume)), np.nan)
+    volume_at_dose_results = np.full((num_structures, len(volume_at_dose)), np.nan)
+
+    for i, structure_name in enumerate(structures):
+        mask = _structure_mask(
+            structure_dataset, structure_name, axes, geometry, options
+        )
+
+        within = np.nonzero(mask)
+        weights = voxel_volumes[within]
+        if supersample != 1:
+            weights = weights * mask[within]
+
+        structure_dose = dose[within]
+        differential[i, :] = np.bincount(
+            bin_indices[within], weights=weights, minlength=num_bins
+        )
+
+        volume[i] = weights.sum()
+        if volume[i] == 0:
+            continue
+
+        mean[i] = np.sum(structure_dose * weights) / volume[i]
+        minimum[i] = structure_dose.min()
+        maximum[i] = structure_dose.max()
+
+        hottest_first = np.argsort(structure_dose)[::-1]
+        cumulative_volume = np.cumsum(weights[hottest_first])
+        dose_at_volume_results[i, :] = np.interp(
+            np.asarray(dose_at_volume, dtype=np.float64) / 100 * volume[i],
+            cumulative_volume,
+            structure_dose[hottest_first],
+        )
+
+        for j, dose_value in enumerate(volume_at_dose):
+            volume_at_dose_results[i, j] = (
+                np.sum(weights[structure_dose >= dose_value]) / volume[i] * 100
+            )
+
+    cumulative = np.cumsum(differential[:, ::-1], axis=1)[:, ::-1]
+
+    return DVHTable(
+        structures=structures,
+        dose=np.arange(num_bins) * bin_width,
+        differential=differential,
+        cumulative=cumulative,
+        volume=volume,
+        mean=mean,
+        minimum=minimum,
+        maximum=maximum,
+        dose_at_volume=dose_at_volume_results,
+        volume_at_dose=volume_at_dose_results,
+    )
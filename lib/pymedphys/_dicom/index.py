@@ -0,0 +1,385 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A persistent SQLite index of the headers of a directory of DICOM files.
+
+Only the elements listed within ``INDEXED_KEYWORDS`` are read from each
+file, and the pixel data is never read. Each file's modification time
+and size are recorded so that updating the index only reads the headers
+of files that are new or have changed since the index was last updated.
+"""
+
+import concurrent.futures
+import contextlib
+import fnmatch
+import hashlib
+import logging
+import os
+import pathlib
+import sqlite3
+import struct
+from typing import NamedTuple, Optional
+
+from pymedphys._imports import pydicom
+
+from pymedphys._config import get_config_dir
+from pymedphys._dicom import sorting as _sorting
+
+INDEX_SCHEMA_VERSION = 2
+INDEX_UPDATE_BATCH_SIZE = 1000
+INDEX_CHUNKSIZE = 64
+
+# Column name, DICOM keyword and SQLite type of each indexed element.
+INDEXED_ELEMENTS = (
+    ("patient_id", "PatientID", "TEXT"),
+    ("patient_name", "PatientName", "TEXT"),
+    ("study_instance_uid", "StudyInstanceUID", "TEXT"),
+    ("series_instance_uid", "SeriesInstanceUID", "TEXT"),
+    ("sop_instance_uid", "SOPInstanceUID", "TEXT"),
+    ("sop_class_uid", "SOPClassUID", "TEXT"),
+    ("modality", "Modality", "TEXT"),
+    ("frame_of_reference_uid", "FrameOfReferenceUID", "TEXT"),
+    ("study_date", "StudyDate", "TEXT"),
+    ("series_date", "SeriesDate", "TEXT"),
+    ("instance_creation_date", "InstanceCreationDate", "TEXT"),
+    ("instance_creation_time", "InstanceCreationTime", "TEXT"),
+    ("series_description", "SeriesDescription", "TEXT"),
+    ("rt_plan_label", "RTPlanLabel", "TEXT"),
+    ("instance_number", "InstanceNumber", "INTEGER"),
+    ("slice_position", "ImagePositionPatient", "REAL"),
+)
+
+INDEXED_KEYWORDS = tuple(keyword for _, keyword, _ in INDEXED_ELEMENTS)
+
+# Read alongside the indexed elements, to determine the slice position.
+_READ_KEYWORDS = INDEXED_KEYWORDS + ("ImageOrientationPatient",)
+
+_COLUMNS = ("path", "mtime_ns", "size", "is_dicom") + tuple(
+    column for column, _, _ in INDEXED_ELEMENTS
+)
+_QUERYABLE_COLUMNS = frozenset(column for column, _, _ in INDEXED_ELEMENTS) | {"path"}
+
+
+class IndexedFile(NamedTuple):
+    """The indexed header elements of a single DICOM file.
+
+    ``path`` is the absolute path to the file. ``slice_position`` is the
+    projection of ``ImagePositionPatient`` onto the normal of the image
+    plane, so that slices sort in order whether they are axial, coronal
+    or sagittal. Without ``ImageOrientationPatient`` it is the z component
+    of ``ImagePositionPatient``. Elements missing from the file are
+    ``None``.
+    """
+
+    path: pathlib.Path
+    mtime_ns: int
+    size: int
+    is_dicom: bool
+    patient_id: Optional[str]
+    patient_name: Optional[str]
+    study_instance_uid: Optional[str]
+    series_instance_uid: Optional[str]
+    sop_instance_uid: Optional[str]
+    sop_class_uid: Optional[str]
+    modality: Optional[str]
+    frame_of_reference_uid: Optional[str]
+    study_date: Optional[str]
+    series_date: Optional[str]
+    instance_creation_date: Optional[str]
+    instance_creation_time: Optional[str]
+    series_description: Optional[str]
+    rt_plan_label: Optional[str]
+    instance_number: Optional[int]
+    slice_position: Optional[float]
+
+    def read(self, stop_before_pixels=True):
+        """Read the file's dataset, by default without its pixel data."""
+        return pydicom.dcmread(
+            self.path, force=True, stop_before_pixels=stop_before_pixels
+        )
+
+    @property
+    def pixel_array(self):
+        """Read the file and decode its pixel data."""
+        return self.read(stop_before_pixels=False).pixel_array
+
+
+def _element_value(ds, keyword):
+    value = ds.get(keyword, None)
+    if value is None or value == "":
+        return None
+
+    if keyword == "ImagePositionPatient":
+        if ds.get("ImageOrientationPatient", None):
+            return float(_sorting.stack_displacement(ds))
+
+        return float(value[2])
+
+    if keyword == "InstanceNumber":
+        return int(value)
+
+    return str(value)
+
+
+def read_index_row(path):
+    """Read ``is_dicom`` followed by the indexed elements of a single file.
+
+    Files which can't be read as DICOM are still indexed, with
+    ``is_dicom`` set to false, so that they aren't read again until they
+    are modified.
+    """
+    try:
+        ds = pydicom.dcmread(
+            path,
+            force=True,
+            stop_before_pixels=True,
+            specific_tags=list(_READ_KEYWORDS),
+        )
+        values = tuple(_element_value(ds, keyword) for keyword in INDEXED_KEYWORDS)
+        is_dicom = "SOPClassUID" in ds
+    except (
+        pydicom.errors.InvalidDicomError,
+        OSError,
+        ValueError,
+        TypeError,
+        IndexError,
+        struct.error,
+    ) as e:
+        logging.debug("Unable to index %s: %s", path, e)
+        values = (None,) * len(INDEXED_KEYWORDS)
+        is_dicom = False
+
+    return (is_dicom,) + values
+
+
+def default_index_path(directory):
+    """The index file for ``directory`` within the PyMedPhys config
+    directory, so that directories that are read only can be indexed.
+    """
+    resolved = str(pathlib.Path(directory).resolve())
+    digest = hashlib.sha256(resolved.encode()).hexdigest()[:16]
+
+    return get_config_dir().joinpath("dicom_index", f"{digest}.sqlite")
+
+
+def _scan_directory(directory, pattern):
+    """Yield the relative path, modification time and size of each file
+    within ``directory`` whose name matches ``pattern``.
+    """
+    stack = [""]
+    while stack:
+        relative_dir = stack.pop()
+        try:
+            entries = os.scandir(os.path.join(directory, relative_dir))
+        except OSError as e:
+            logging.warning("Unable to scan %s: %s", relative_dir, e)
+            continue
+
+        with entries:
+            for entry in entries:
+                relative_path = os.path.join(relative_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(relative_path)
+                elif fnmatch.fnmatch(entry.name, pattern):
+                    stat = entry.stat()
+                    yield relative_path, stat.st_mtime_ns, stat.st_size
+
+
+class DicomIndex:
+    """A persistent index of the DICOM files within a directory.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        The directory, including its subdirectories, to be indexed.
+    index_path : str or pathlib.Path
+        The SQLite database file within which the index is stored. The
+        index is created if it does not exist.
+    pattern : str, optional
+        Only files whose names match this glob style pattern are
+        indexed, by default ``"*.dcm"``.
+    """
+
+    def __init__(self, directory, index_path, pattern="*.dcm"):
+        self.directory = pathlib.Path(directory).resolve()
+        self.index_path = pathlib.Path(index_path)
+        self.pattern = pattern
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            str(self.index_path), check_same_thread=False
+        )
+        self._create_schema()
+
+    def _create_schema(self):
+        (version,) = self._connection.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_SCHEMA_VERSION:
+            self._connection.execute("DROP TABLE IF EXISTS files")
+
+        columns = ", ".join(
+            [
+                "path TEXT PRIMARY KEY",
+                "mtime_ns INTEGER NOT NULL",
+                "size INTEGER NOT NULL",
+                "is_dicom INTEGER NOT NULL",
+            ]
+            + [f"{column} {sql_type}" for column, _, sql_type in INDEXED_ELEMENTS]
+        )
+        self._connection.execute(f"CREATE TABLE IF NOT EXISTS files ({columns})")
+
+        for column in ("patient_id", "study_instance_uid", "series_instance_uid"):
+            self._connection.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_files_{column} ON files ({column})"
+            )
+
+        self._connection.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
+
+    def update(self, n_workers=1):
+        """Bring the index up to date with the files on disk.
+
+        Only the headers of new or modified files are read. Files that
+        no longer exist are removed from the index.
+
+        Parameters
+        ----------
+        n_workers : int, optional
+            The number of processes across which the headers are read,
+            by default 1.
+
+        Returns
+        -------
+        (int, int)
+            The number of files that were (re)indexed and the number
+            that were removed from the index.
+        """
+        indexed = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in self._connection.execute(
+                "SELECT path, mtime_ns, size FROM files"
+            )
+        }
+
+        to_read = []
+        for relative_path, mtime_ns, size in _scan_directory(
+            self.directory, self.pattern
+        ):
+            if indexed.pop(relative_path, None) != (mtime_ns, size):
+                to_read.append((relative_path, mtime_ns, size))
+
+        removed = list(indexed)
+        self._connection.executemany(
+            "DELETE FROM files WHERE path = ?", [(path,) for path in removed]
+        )
+
+        absolute_paths = [
+            os.path.join(self.directory, relative_path)
+            for relative_path, _, _ in to_read
+        ]
+
+        with contextlib.ExitStack() as stack:
+            if n_workers > 1:
+                executor = stack.enter_context(
+                    concurrent.futures.ProcessPoolExecutor(max_workers=n_workers)
+                )
+                stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+                rows = executor.map(
+                    read_index_row, absolute_paths, chunksize=INDEX_CHUNKSIZE
+                )
+            else:
+                rows = map(read_index_row, absolute_paths)
+
+            batch = []
+            for file_stat, row in zip(to_read, rows):
+                batch.append(file_stat + row)
+                if len(batch) >= INDEX_UPDATE_BATCH_SIZE:
+                    self._insert(batch)
+                    batch = []
+
+            self._insert(batch)
+
+        self._connection.commit()
+
+        return len(to_read), len(removed)
+
+    def _insert(self, rows):
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        self._connection.executemany(
+            f"INSERT OR REPLACE INTO files ({', '.join(_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            rows,
+        )
+
+    def query(self, order_by=None, **criteria):
+        """Find the indexed DICOM files whose elements match ``criteria``.
+
+        Parameters
+        ----------
+        order_by : str or sequence of str, optional
+            Column(s) to order the results by. Prefix a column with ``-``
+            to order it descending.
+        **criteria
+            Column name and value pairs, for example
+            ``modality="RTPLAN", patient_id="123456"``. A value which is a
+            list or tuple matches any of its items.
+
+        Returns
+        -------
+        list of IndexedFile
+        """
+        clauses = ["is_dicom = 1"]
+        parameters = []
+        for column, value in criteria.items():
+            _check_column(column)
+            if isinstance(value, (list, tuple)):
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                parameters += list(value)
+            else:
+                clauses.append(f"{column} = ?")
+                parameters.append(value)
+
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM files WHERE {' AND '.join(clauses)}"
+
+        if order_by is not None:
+            if isinstance(order_by, str):
+                order_by = [order_by]
+
+            ordering = []
+            for column in order_by:
+                descending = column.startswith("-")
+                column = column.lstrip("-")
+                _check_column(column)
+                ordering.append(f"{column} {'DESC' if descending else 'ASC'}")
+
+            sql += f" ORDER BY {', '.join(ordering)}"
+
+        return [
+            IndexedFile(
+                self.directory.joinpath(path), mtime_ns, size, bool(is_dicom), *values
+            )
+            for path, mtime_ns, size, is_dicom, *values in self._connection.execute(
+                sql, parameters
+            )
+        ]
+
+
+def _check_column(column):
+    if column not in _QUERYABLE_COLUMNS and column not in ("mtime_ns", "size"):
+        raise ValueError(
+            f"Unable to query by {column}, it must be one of "
+            f"{sorted(_QUERYABLE_COLUMNS)}"
+        )
@@ -3,6 +3,7 @@
 from .adjust import convert_to_one_fraction_group
 from .build import (
     build_control_points,
+    copy_template_for_beam,
     merge_beam_sequences,
     replace_beam_sequence,
     replace_fraction_group,
@@ -10,6 +11,7 @@ from .build import (
 )
 from .core import (
     get_beam_indices_of_fraction_group,
+    get_control_point_arrays,
     get_cp_attribute_leaning_on_prior,
     get_fraction_group_beam_sequence_and_meterset,
     get_fraction_group_index,
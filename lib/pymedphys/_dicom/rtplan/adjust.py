@@ -22,7 +22,10 @@ from .core import (
 
 
 def convert_to_one_fraction_group(dicom_dataset, fraction_group_number):
-    created_dicom = deepcopy(dicom_dataset)
+    # The beam sequence is replaced below, so it is shared rather than
+    # copied.
+    beam_sequence = dicom_dataset.BeamSequence
+    created_dicom = deepcopy(dicom_dataset, {id(beam_sequence): beam_sequence})
 
     beam_sequence, _ = get_fraction_group_beam_sequence_and_meterset(
         dicom_dataset, fraction_group_number
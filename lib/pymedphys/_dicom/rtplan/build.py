@@ -12,47 +12,164 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from copy import deepcopy
+import copy
+import warnings
 
 from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom
+
+CONTROL_POINT_INDEX = 0x300A0112
+BEAM_LIMITING_DEVICE_POSITION_SEQUENCE = 0x300A011A
+LEAF_JAW_POSITIONS = 0x300A011C
+GANTRY_ANGLE = 0x300A011E
+GANTRY_ROTATION_DIRECTION = 0x300A011F
+BEAM_LIMITING_DEVICE_ANGLE = 0x300A0120
+BEAM_LIMITING_DEVICE_ROTATION_DIRECTION = 0x300A0121
+CUMULATIVE_METERSET_WEIGHT = 0x300A0134
+
+# The maximum length of a single Decimal String value
+DS_MAX_LENGTH = 16
+
+
+def _element(tag, VR, value):
+    # The values are formatted here, within build_control_points, so the
+    # per value validation that pydicom would otherwise undertake is
+    # skipped.
+    return pydicom.DataElement(tag, VR, value, validation_mode=pydicom.config.IGNORE)
+
+
+def _leaf_jaw_positions(values):
+    """Convert leaf jaw positions, formatted as strings for the whole
+    beam, into floats for each control point.
+
+    The floats are written in their shortest round trip form, which is
+    the same as the given strings, so they are stored within the element
+    as is, skipping pydicom's conversion of each value into a DSfloat.
+    """
+    strings = np.asarray(values).astype(str)
+    if strings.size and np.max(np.char.str_len(strings)) > DS_MAX_LENGTH:
+        warnings.warn(
+            "Values longer than 16 characters were written into the Leaf/Jaw "
+            "Positions of the RT Plan"
+        )
+
+    return strings.astype(float).tolist()
 
 
-def add_data_to_control_point(template, data, i):
-    cp = deepcopy(template)
-    cp.ControlPointIndex = str(i)
+def _leaf_jaw_positions_element(positions):
+    return pydicom.DataElement(
+        LEAF_JAW_POSITIONS,
+        "DS",
+        pydicom.multival.MultiValue(float, positions),
+        already_converted=True,
+    )
 
-    cp.GantryAngle = data["gantry_angle"][i]
-    cp.GantryRotationDirection = data["gantry_movement"][i]
 
-    cp.BeamLimitingDeviceAngle = data["collimator_angle"][i]
-    cp.BeamLimitingDeviceRotationDirection = data["collimator_movement"][i]
+def _shallow_copy(dataset):
+    """A new dataset containing copies of the elements of ``dataset``.
 
-    collimation = cp.BeamLimitingDevicePositionSequence
-    collimation[0].LeafJawPositions = data["jaw"][i]
-    collimation[1].LeafJawPositions = data["mlc"][i]
+    The values of the elements, including those of any sequences, are
+    shared with ``dataset`` rather than copied.
+    """
+    copied = pydicom.Dataset()
+    for element in dataset:
+        copied.add(copy.copy(element))
 
-    cp.CumulativeMetersetWeight = np.around(
-        data["monitor_units"][i] / data["monitor_units"][-1], decimals=6
-    )
+    copied.is_undefined_length_sequence_item = dataset.is_undefined_length_sequence_item
 
-    return cp
+    return copied
 
 
 def build_control_points(initial_cp_template, subsequent_cp_template, data):
+    """Build the control points of a beam from the converted delivery
+    ``data`` (see ``DeliveryDicom._coordinate_convert``).
+
+    Each template is cloned once. Every control point then receives its
+    own Control Point Index, gantry and collimator angles and rotation
+    directions, cumulative meterset weight and Beam Limiting Device
+    Position Sequence, filled from arrays formatted for the whole beam at
+    once. Any other sequences within the templates, such as the
+    Referenced Dose Reference Sequence, are shared between the control
+    points rather than copied for each of them.
+    """
     number_of_control_points = len(data["monitor_units"])
 
+    templates = [
+        copy.deepcopy(initial_cp_template),
+        copy.deepcopy(subsequent_cp_template),
+    ]
+
+    monitor_units = np.asarray(data["monitor_units"], dtype=float)
+    cumulative_meterset_weight = [
+        "{:.6f}".format(weight)
+        for weight in np.around(monitor_units / monitor_units[-1], decimals=6)
+    ]
+
+    columns = {
+        (GANTRY_ANGLE, "DS"): data["gantry_angle"],
+        (GANTRY_ROTATION_DIRECTION, "CS"): list(data["gantry_movement"]),
+        (BEAM_LIMITING_DEVICE_ANGLE, "DS"): data["collimator_angle"],
+        (BEAM_LIMITING_DEVICE_ROTATION_DIRECTION, "CS"): list(
+            data["collimator_movement"]
+        ),
+        (CUMULATIVE_METERSET_WEIGHT, "DS"): cumulative_meterset_weight,
+    }
+    leaf_jaw_positions = [
+        _leaf_jaw_positions(data["jaw"]),
+        _leaf_jaw_positions(data["mlc"]),
+    ]
+
     cps = []
     for i in range(number_of_control_points):
-        if i == 0:
-            template = initial_cp_template
-        else:
-            template = subsequent_cp_template
+        template = templates[0] if i == 0 else templates[1]
+        cp = _shallow_copy(template)
+
+        cp.add(_element(CONTROL_POINT_INDEX, "IS", str(i)))
+        for (tag, VR), values in columns.items():
+            cp.add(_element(tag, VR, values[i]))
+
+        collimation = pydicom.Sequence(
+            [
+                _shallow_copy(item)
+                for item in template[BEAM_LIMITING_DEVICE_POSITION_SEQUENCE].value
+            ]
+        )
+        for item, positions in zip(collimation, leaf_jaw_positions):
+            item.add(_leaf_jaw_positions_element(positions[i]))
 
-        cps.append(add_data_to_control_point(template, data, i))
+        collimation_element = _element(
+            BEAM_LIMITING_DEVICE_POSITION_SEQUENCE, "SQ", collimation
+        )
+        collimation_element.is_undefined_length = template[
+            BEAM_LIMITING_DEVICE_POSITION_SEQUENCE
+        ].is_undefined_length
+        cp.add(collimation_element)
+
+        cps.append(cp)
 
     return cps
 
 
+def copy_template_for_beam(dicom_template, beam_index):
+    """Deep copy an RT Plan template ready for the beam at ``beam_index``
+    to be replaced by ``replace_fraction_group`` and
+    ``replace_beam_sequence``.
+
+    The parts of the template which are about to be discarded, the other
+    beams and the control points of the beam being replaced, are shared
+    with the template rather than copied.
+    """
+    memo = {}
+    for i, beam in enumerate(dicom_template.BeamSequence):
+        if i == beam_index:
+            control_points = beam.ControlPointSequence
+            memo[id(control_points)] = control_points
+        else:
+            memo[id(beam)] = beam
+
+    return copy.deepcopy(dicom_template, memo)
+
+
 def replace_fraction_group(
     created_dicom, beam_meterset, beam_index, fraction_group_index
 ):
@@ -15,10 +15,29 @@
 
 from collections import namedtuple
 
+from pymedphys._imports import numpy as np
+
 from pymedphys._utilities.transforms import convert_IEC_angle_to_bipolar
 
 Point = namedtuple("Point", ("x", "y", "z"))
 
+ControlPointArrays = namedtuple(
+    "ControlPointArrays",
+    (
+        "cumulative_meterset_weight",
+        "gantry_angle",
+        "beam_limiting_device_angle",
+        "leaf_jaw_positions",
+    ),
+)
+
+# Tags of the control point elements read by ``get_control_point_arrays``
+CUMULATIVE_METERSET_WEIGHT = 0x300A0134
+GANTRY_ANGLE = 0x300A011E
+BEAM_LIMITING_DEVICE_ANGLE = 0x300A0120
+BEAM_LIMITING_DEVICE_POSITION_SEQUENCE = 0x300A011A
+LEAF_JAW_POSITIONS = 0x300A011C
+
 
 class DICOMEntryMissing(ValueError):
     pass
@@ -178,6 +197,130 @@ def get_cp_attribute_leaning_on_prior(control_point_sequence, attribute):
     return results
 
 
+def _decimal_string_values(dataset, tag):
+    """The values of a DS element as a float array, or None if the
+    element is missing or empty.
+
+    Elements which have not yet been converted from the bytes read from
+    file are parsed directly by numpy, skipping pydicom's conversion and
+    validation of each individual value.
+    """
+    element = dataset.get_item(tag)
+    if element is None:
+        return None
+
+    value = element.value
+    if isinstance(value, bytes):
+        value = value.strip(b" \0")
+        if not value:
+            return None
+
+        return np.array(value.split(b"\\"), dtype=float)
+
+    if value is None or value == "":
+        return None
+
+    return np.array(value, dtype=float, ndmin=1)
+
+
+def get_control_point_arrays(control_point_sequence, leaf_jaw_sizes):
+    """Collect the control point attributes needed to describe a
+    delivery into arrays, within a single traversal of the sequence.
+
+    As with ``get_cp_attribute_leaning_on_prior``, control points which
+    don't record a gantry angle, collimator angle or beam limiting
+    device positions take those of the prior control point.
+
+    Parameters
+    ----------
+    control_point_sequence : pydicom.Sequence
+        The ``ControlPointSequence`` of a single beam.
+    leaf_jaw_sizes : dict
+        The number of ``LeafJawPositions`` of each
+        ``RTBeamLimitingDeviceType`` to be collected, for example
+        ``{"MLCX": 120, "ASYMY": 2}``.
+
+    Returns
+    -------
+    ControlPointArrays
+        The cumulative meterset weight, gantry angle and beam limiting
+        device angle of each control point, along with a dictionary of
+        the leaf jaw positions of each beam limiting device type, each of
+        shape (number of control points, size). Missing cumulative
+        meterset weights are NaN.
+    """
+    number_of_control_points = len(control_point_sequence)
+
+    cumulative_meterset_weight = np.empty(number_of_control_points)
+    gantry_angle = np.empty(number_of_control_points)
+    beam_limiting_device_angle = np.empty(number_of_control_points)
+    leaf_jaw_positions = {
+        device_type: np.empty((number_of_control_points, size))
+        for device_type, size in leaf_jaw_sizes.items()
+    }
+
+    current_gantry_angle = None
+    current_beam_limiting_device_angle = None
+    current_positions = None
+
+    for i, control_point in enumerate(control_point_sequence):
+        weight = _decimal_string_values(control_point, CUMULATIVE_METERSET_WEIGHT)
+        cumulative_meterset_weight[i] = np.nan if weight is None else weight[0]
+
+        value = _decimal_string_values(control_point, GANTRY_ANGLE)
+        if value is not None:
+            current_gantry_angle = value[0]
+        elif current_gantry_angle is None:
+            raise AttributeError("GantryAngle is missing from the first control point")
+        gantry_angle[i] = current_gantry_angle
+
+        value = _decimal_string_values(control_point, BEAM_LIMITING_DEVICE_ANGLE)
+        if value is not None:
+            current_beam_limiting_device_angle = value[0]
+        elif current_beam_limiting_device_angle is None:
+            raise AttributeError(
+                "BeamLimitingDeviceAngle is missing from the first control point"
+            )
+        beam_limiting_device_angle[i] = current_beam_limiting_device_angle
+
+        if BEAM_LIMITING_DEVICE_POSITION_SEQUENCE in control_point:
+            current_positions = {}
+            for item in control_point[BEAM_LIMITING_DEVICE_POSITION_SEQUENCE].value:
+                device_type = item.RTBeamLimitingDeviceType
+                if device_type not in leaf_jaw_positions:
+                    continue
+
+                if device_type in current_positions:
+                    raise ValueError(
+                        "Expected exactly one item per control point for a given "
+                        "collimator"
+                    )
+
+                current_positions[device_type] = _decimal_string_values(
+                    item, LEAF_JAW_POSITIONS
+                )
+
+            if len(current_positions) != len(leaf_jaw_positions):
+                raise ValueError(
+                    "Expected exactly one item per control point for a given collimator"
+                )
+        elif current_positions is None:
+            raise AttributeError(
+                "BeamLimitingDevicePositionSequence is missing from the first "
+                "control point"
+            )
+
+        for device_type, positions in current_positions.items():
+            leaf_jaw_positions[device_type][i] = positions
+
+    return ControlPointArrays(
+        cumulative_meterset_weight,
+        gantry_angle,
+        beam_limiting_device_angle,
+        leaf_jaw_positions,
+    )
+
+
 def get_gantry_angles_from_dicom(dicom_dataset):
     beam_gantry_angles = []
 
@@ -0,0 +1,381 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Rasterisation of planar structure contours onto regular grids."""
+
+from functools import cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pymedphys._imports import numba as nb, numpy as np, scipy
+
+Z_TOLERANCE = 1e-3  # mm
+
+
+@cache
+def _get_even_odd_fill():
+    @nb.njit(parallel=True, cache=True)
+    def _even_odd_fill(vertices_x, vertices_y, starts, x_axis, x_order, y_axis):
+        mask = np.zeros((y_axis.size, x_axis.size), dtype=np.bool_)
+        num_polygons = starts.size - 1
+
+        # pylint: disable=not-an-iterable
+        for j in nb.prange(y_axis.size):
+            y = y_axis[j]
+            crossings = np.empty(vertices_x.size, dtype=np.float64)
+            num_crossings = 0
+
+            for p in range(num_polygons):
+                start = starts[p]
+                num_vertices = starts[p + 1] - start
+
+                for k in range(num_vertices):
+                    i0 = start + k
+                    i1 = start + (k + 1) % num_vertices
+
+                    y0 = vertices_y[i0]
+                    y1 = vertices_y[i1]
+
+                    # Half open so that a scanline passing exactly
+                    # through a vertex counts that vertex only once.
+                    if (y0 <= y) != (y1 <= y):
+                        x0 = vertices_x[i0]
+                        x1 = vertices_x[i1]
+                        crossings[num_crossings] = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+                        num_crossings += 1
+
+            if num_crossings == 0:
+                continue
+
+            crossings = np.sort(crossings[:num_crossings])
+
+            # Sweep along the scanline in order of increasing x, the
+            # parity of the crossings passed determines inside/outside.
+            passed = 0
+            for i in range(x_order.size):
+                index = x_order[i]
+                x = x_axis[index]
+                while passed < num_crossings and crossings[passed] <= x:
+                    passed += 1
+
+                if passed == num_crossings:
+                    break
+
+                mask[j, index] = passed % 2 == 1
+
+        return mask
+
+    return _even_odd_fill
+
+
+def rasterise_polygons(
+    polygons: Sequence[Tuple["np.ndarray", "np.ndarray"]],
+    x_axis: "np.ndarray",
+    y_axis: "np.ndarray",
+) -> "np.ndarray":
+    """Determine which points of a 2D grid are within a set of polygons.
+
+    The even-odd rule is used, so a polygon lying within another
+    polygon on the same plane defines a hole.
+
+    Parameters
+    ----------
+    polygons : sequence of (x, y) tuples
+        The vertices of each of the polygons. Polygons are implicitly
+        closed, the first vertex does not need to be repeated.
+    x_axis : np.ndarray
+        The x coordinates of the grid columns. Does not need to be
+        sorted.
+    y_axis : np.ndarray
+        The y coordinates of the grid rows.
+
+    Returns
+    -------
+    mask : np.ndarray
+        A boolean array of shape ``(len(y_axis), len(x_axis))``.
+    """
+    x_axis = np.asarray(x_axis, dtype=np.float64)
+    y_axis = np.asarray(y_axis, dtype=np.float64)
+
+    if len(polygons) == 0:
+        return np.zeros((y_axis.size, x_axis.size), dtype=bool)
+
+    vertices_x = np.concatenate([np.asarray(x, dtype=np.float64) for x, _ in polygons])
+    vertices_y = np.concatenate([np.asarray(y, dtype=np.float64) for _, y in polygons])
+    starts = np.cumsum([0] + [len(x) for x, _ in polygons]).astype(np.int64)
+
+    _even_odd_fill = _get_even_odd_fill()
+
+    return _even_odd_fill(
+        vertices_x, vertices_y, starts, x_axis, np.argsort(x_axis), y_axis
+    )
+
+
+def group_contours_by_plane(
+    x_contours: Sequence["np.ndarray"],
+    y_contours: Sequence["np.ndarray"],
+    z_contours: Sequence["np.ndarray"],
+    z_tolerance: float = Z_TOLERANCE,
+) -> Dict[float, List[Tuple["np.ndarray", "np.ndarray"]]]:
+    """Group planar contours, as returned by ``pull_structure``, by
+    their z position.
+
+    Returns
+    -------
+    planes : dict
+        A mapping from the z position of each plane, in increasing
+        order, to the list of (x, y) polygons upon that plane.
+
+    Raises
+    ------
+    ValueError
+        If a contour does not lie on a single z plane.
+    """
+    contour_z_values = []
+    for z in z_contours:
+        z = np.asarray(z, dtype=np.float64)
+        if np.ptp(z) > z_tolerance:
+            raise ValueError("Only one z value per contour supported")
+        contour_z_values.append(z[0])
+
+    order = np.argsort(contour_z_values, kind="stable")
+
+    planes: Dict[float, List[Tuple["np.ndarray", "np.ndarray"]]] = {}
+    plane_z = None
+    for index in order:
+        z = contour_z_values[index]
+        if plane_z is None or z - plane_z > z_tolerance:
+            plane_z = z
+            planes[plane_z] = []
+
+        planes[plane_z].append((x_contours[index], y_contours[index]))
+
+    return planes
+
+
+def _supersampled_axis(axis, supersample):
+    if supersample == 1:
+        return axis
+
+    if axis.size == 1:
+        spacing = np.zeros(1)
+    else:
+        spacing = np.abs(np.gradient(axis))
+
+    offsets = (np.arange(supersample) + 0.5) / supersample - 0.5
+
+    return (axis[:, None] + offsets[None, :] * spacing[:, None]).ravel()
+
+
+def _signed_distance(mask, sampling):
+    distance_transform_edt = scipy.ndimage.distance_transform_edt
+
+    return distance_transform_edt(~mask, sampling=sampling) - distance_transform_edt(
+        mask, sampling=sampling
+    )
+
+
+class _PlaneInterpolator:
+    """Provides the structure's cross-section at an arbitrary z.
+
+    Contour planes are rasterised lazily and cached, so that the
+    dose planes lying between the same pair of contour planes share
+    the work.
+    """
+
+    def __init__(self, planes, x_axis, y_axis, interpolation, z_tolerance, max_gap):
+        if interpolation not in ("linear", "nearest"):
+            raise ValueError("Expected interpolation to be 'linear' or 'nearest'")
+
+        self.planes = planes
+        self.plane_z = np.array(list(planes.keys()), dtype=np.float64)
+        self.x_axis = x_axis
+        self.y_axis = y_axis
+        self.interpolation = interpolation
+        self.z_tolerance = z_tolerance
+        self.max_gap = np.inf if max_gap is None else max_gap
+
+        self.sampling = (
+            _typical_spacing(y_axis),
+            _typical_spacing(x_axis),
+        )
+
+        self._masks = {}
+        self._distances = {}
+
+    def empty(self):
+        return np.zeros((self.y_axis.size, self.x_axis.size), dtype=bool)
+
+    def mask(self, plane_index):
+        try:
+            return self._masks[plane_index]
+        except KeyError:
+            pass
+
+        z = self.plane_z[plane_index]
+        mask = rasterise_polygons(self.planes[z], self.x_axis, self.y_axis)
+        self._masks[plane_index] = mask
+
+        return mask
+
+    def distance(self, plane_index):
+        try:
+            return self._distances[plane_index]
+        except KeyError:
+            pass
+
+        distance = _signed_distance(self.mask(plane_index), self.sampling)
+        self._distances[plane_index] = distance
+
+        return distance
+
+    def __call__(self, z):
+        plane_z = self.plane_z
+
+        if z < plane_z[0] - self.z_tolerance or z > plane_z[-1] + self.z_tolerance:
+            return self.empty()
+
+        upper = int(np.searchsorted(plane_z, z))
+        for plane_index in (upper - 1, upper):
+            if (
+                0 <= plane_index < plane_z.size
+                and abs(plane_z[plane_index] - z) <= self.z_tolerance
+            ):
+                return self.mask(plane_index)
+
+        lower = upper - 1
+        gap = plane_z[upper] - plane_z[lower]
+        weight = (z - plane_z[lower]) / gap
+
+        if gap > self.max_gap:
+            return self.empty()
+
+        nearest = lower if weight < 0.5 else upper
+        if self.interpolation == "nearest":
+            return self.mask(nearest)
+
+        lower_mask = self.mask(lower)
+        upper_mask = self.mask(upper)
+
+        # A distance transform is undefined for an empty plane, which
+        # can occur for contours smaller than the grid spacing.
+        if not lower_mask.any() or not upper_mask.any():
+            return self.mask(nearest)
+
+        # Shape based interpolation, the boundary is taken as the zero
+        # crossing of the linearly interpolated signed distance maps.
+        distance = (1 - weight) * self.distance(lower) + weight * self.distance(upper)
+
+        return distance <= 0
+
+
+def _typical_spacing(axis):
+    if axis.size < 2:
+        return 1.0
+
+    return float(np.median(np.abs(np.diff(axis))))
+
+
+def rasterise_structure(
+    x_contours: Sequence["np.ndarray"],
+    y_contours: Sequence["np.ndarray"],
+    z_contours: Sequence["np.ndarray"],
+    x_axis: "np.ndarray",
+    y_axis: "np.ndarray",
+    z_axis: "np.ndarray",
+    interpolation: str = "linear",
+    supersample: int = 1,
+    z_tolerance: float = Z_TOLERANCE,
+    max_gap: Optional[float] = None,
+) -> "np.ndarray":
+    """Rasterise a structure's planar contours onto a 3D regular grid.
+
+    Parameters
+    ----------
+    x_contours, y_contours, z_contours : sequence of np.ndarray
+        The coordinates of each contour, as returned by
+        ``pull_structure``. Any number of contours may lie on each
+        plane, holes are defined by the even-odd rule.
+    x_axis, y_axis, z_axis : np.ndarray
+        The axes of the grid. The grid planes do not need to align
+        with the contour planes.
+    interpolation : str, optional
+        How grid planes that lie between two contour planes are
+        determined. Either ``"linear"``, shape based interpolation of
+        the signed distance to each contour plane's boundary, or
+        ``"nearest"``, the nearest contour plane. Grid planes outside
+        of the contour planes are always outside of the structure.
+    supersample : int, optional
+        When greater than one each voxel is divided into
+        ``supersample`` steps along each axis and the fraction of
+        those sub-voxels within the structure is returned.
+    z_tolerance : float, optional
+        The distance within which a grid plane and a contour plane
+        are considered to be coincident.
+    max_gap : float, optional
+        Consecutive contour planes further apart than this distance are
+        treated as a gap within the structure, for example between two
+        separate lesions under the one ROI, and the grid planes between
+        them are outside of the structure. By default every gap is
+        interpolated across.
+
+    Returns
+    -------
+    mask : np.ndarray
+        An array of shape ``(len(z_axis), len(y_axis), len(x_axis))``.
+        Boolean when ``supersample`` is one, otherwise the partial
+        volume fraction of each voxel within the structure.
+    """
+    if supersample < 1:
+        raise ValueError("supersample must be a positive integer")
+
+    x_axis = np.asarray(x_axis, dtype=np.float64)
+    y_axis = np.asarray(y_axis, dtype=np.float64)
+    z_axis = np.asarray(z_axis, dtype=np.float64)
+
+    shape = (z_axis.size, y_axis.size, x_axis.size)
+    planes = group_contours_by_plane(x_contours, y_contours, z_contours, z_tolerance)
+
+    if supersample == 1:
+        mask = np.zeros(shape, dtype=bool)
+    else:
+        mask = np.zeros(shape, dtype=np.float64)
+
+    if not planes:
+        return mask
+
+    plane_at = _PlaneInterpolator(
+        planes,
+        _supersampled_axis(x_axis, supersample),
+        _supersampled_axis(y_axis, supersample),
+        interpolation,
+        z_tolerance,
+        max_gap,
+    )
+
+    if supersample == 1:
+        for i, z in enumerate(z_axis):
+            mask[i, :, :] = plane_at(z)
+
+        return mask
+
+    sub_shape = (y_axis.size, supersample, x_axis.size, supersample)
+    z_fine = _supersampled_axis(z_axis, supersample).reshape(z_axis.size, supersample)
+
+    for i, sub_planes in enumerate(z_fine):
+        for z in sub_planes:
+            mask[i, :, :] += plane_at(z).reshape(sub_shape).mean(axis=(1, 3))
+
+        mask[i, :, :] /= supersample
+
+    return mask
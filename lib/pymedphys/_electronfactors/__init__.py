@@ -20,6 +20,7 @@ from .core import (
     convert2_ratio_perim_area,
     create_transformed_mesh,
     parameterise_insert,
+    parameterise_inserts,
     spline_model,
     spline_model_with_deformability,
     visual_alignment_of_equivalent_ellipse,
@@ -20,6 +20,9 @@ import warnings
 from pymedphys._imports import numpy as np
 from pymedphys._imports import scipy, shapely
 
+# The precision, in cm, of the radius of an insert's largest bounded circle
+DEFAULT_CIRCLE_PRECISION = 0.001
+
 
 def spline_model(
     width_test, ratio_perim_area_test, width_data, ratio_perim_area_data, factor_data
@@ -147,11 +150,89 @@ def _single_calculate_deformability(x_test, y_test, x_data, y_data, z_data):
     return deformability
 
 
+def _polynomial_basis(x, y):
+    """Return the polynomial basis of a spline of orders two in x and one
+    in y which has no interior knots."""
+    return np.stack([np.ones_like(x), x, x**2, y, x * y, x**2 * y], axis=-1)
+
+
+def _batched_calculate_deformability(x_test, y_test, x_data, y_data, z_data):
+    """Return the result of the deformability test for all test points at
+    once, or ``None`` if the splines of the test are not polynomials.
+
+    With the default smoothing factor the smoothing spline is the least
+    squares polynomial whenever that polynomial fits the data within the
+    smoothing condition. Its fit is then linear in the data, and the
+    outlier of the deformability test, placed upon the model, leaves the
+    remaining fit unchanged. The deformability at a test point is
+    therefore the leverage that point has upon the polynomial fit of the
+    data with that point appended, which is calculated here for all test
+    points from a single QR decomposition of the data's basis.
+
+    Parameters
+    ----------
+    x_test : np.ndarray
+        The x coordinates of the points to test
+    y_test : np.ndarray
+        The y coordinates of the points to test
+    x_data : np.ndarray
+        The x coordinates of the model data to test
+    y_data : np.ndarray
+        The y coordinates of the model data to test
+    z_data : np.ndarray
+        The z coordinates of the model data to test
+
+    Returns
+    -------
+    deformability : np.ndarray or None
+        The deformability of each test point, or ``None`` when the
+        smoothing spline of the data has interior knots.
+
+    """
+    x_data = np.asarray(x_data, dtype=float)
+    y_data = np.asarray(y_data, dtype=float)
+    z_data = np.asarray(z_data, dtype=float)
+
+    # Centre and scale the coordinates to condition the basis, the fit
+    # and its leverage do not depend upon this.
+    x_centre, x_scale = np.mean(x_data), np.std(x_data)
+    y_centre, y_scale = np.mean(y_data), np.std(y_data)
+    if x_scale == 0 or y_scale == 0:
+        return None
+
+    basis = _polynomial_basis(
+        (x_data - x_centre) / x_scale, (y_data - y_centre) / y_scale
+    )
+    if np.linalg.matrix_rank(basis) < basis.shape[1]:
+        return None
+
+    q, r = np.linalg.qr(basis)
+    coefficients = scipy.linalg.solve_triangular(r, q.T @ z_data)
+    residual = np.sum((basis @ coefficients - z_data) ** 2)
+
+    # The smoothing factor is the number of data points, when the
+    # polynomial doesn't meet it the spline has interior knots.
+    if not residual < len(z_data):
+        return None
+
+    test_basis = _polynomial_basis(
+        (np.ravel(x_test) - x_centre) / x_scale,
+        (np.ravel(y_test) - y_centre) / y_scale,
+    )
+    leverage_without_point = np.sum(
+        scipy.linalg.solve_triangular(r, test_basis.T, trans="T") ** 2, axis=0
+    )
+
+    return leverage_without_point / (1 + leverage_without_point)
+
+
 def calculate_deformability(x_test, y_test, x_data, y_data, z_data):
     """Return the result of the deformability test.
 
-    This function takes an array of test points and loops over
-    ``_single_calculate_deformability``.
+    When the smoothing splines of the test are polynomials, as is the case
+    for typical insert factor data, all test points are tested at once by
+    ``_batched_calculate_deformability``. Otherwise this function takes an
+    array of test points and loops over ``_single_calculate_deformability``.
 
     The deformability test applies a shift to the spline to determine whether
     or not sufficient information for modelling is available. For further
@@ -183,6 +264,12 @@ def calculate_deformability(x_test, y_test, x_data, y_data, z_data):
     """
     dim = np.shape(x_test)
 
+    deformability = _batched_calculate_deformability(
+        x_test, y_test, x_data, y_data, z_data
+    )
+    if deformability is not None:
+        return np.reshape(deformability, dim)[()]
+
     if np.size(dim) == 0:
         deformability = _single_calculate_deformability(
             x_test, y_test, x_data, y_data, z_data
@@ -320,43 +407,43 @@ def shapely_insert(x, y):
     return shapely.geometry.Polygon(np.transpose((x, y)))
 
 
-def search_for_centre_of_largest_bounded_circle(x, y, callback=None):
-    """Find the centre of the largest bounded circle within the insert."""
-    insert = shapely_insert(x, y)
-    boundary = insert.boundary
-    centroid = insert.centroid
+def search_for_centre_of_largest_bounded_circle(
+    x, y, callback=None, precision=DEFAULT_CIRCLE_PRECISION
+):
+    """Find the centre of the largest bounded circle within the insert.
 
-    furthest_distance = np.hypot(
-        np.diff(insert.bounds[::2]), np.diff(insert.bounds[1::2])
-    )
+    The centre is the insert's pole of inaccessibility, found by the
+    quadtree search of ``shapely.ops.polylabel``. The search is
+    deterministic, and the radius of the circle it finds is within
+    ``precision`` of the radius of the largest bounded circle.
 
-    def minimising_function(optimiser_input):
-        x, y = optimiser_input
-        point = shapely.geometry.Point(x, y)
+    Parameters
+    ----------
+    x : np.ndarray
+        The x coordinates of the insert's boundary
+    y : np.ndarray
+        The y coordinates of the insert's boundary
+    callback : callable, optional
+        Called as ``callback(circle_centre, -radius, True)`` once the
+        centre has been found, matching the minima callback of the
+        ``scipy.optimize.basinhopping`` search this replaced.
+    precision : float, optional
+        The precision of the circle's radius, in the units of the
+        coordinates.
 
-        if insert.contains(point):
-            edge_distance = point.distance(boundary)
-        else:
-            edge_distance = -point.distance(boundary)
+    Returns
+    -------
+    circle_centre : np.ndarray
+        The x and y coordinates of the centre of the circle.
 
-        return -edge_distance
+    """
+    insert = shapely_insert(x, y)
+    centre = shapely.ops.polylabel(insert, tolerance=precision)
 
-    x0 = np.squeeze(centroid.coords)
-    niter = 200
-    T = furthest_distance / 3
-    stepsize = furthest_distance / 2
-    niter_success = 50
-    output = scipy.optimize.basinhopping(
-        minimising_function,
-        x0,
-        niter=niter,
-        T=T,
-        stepsize=stepsize,
-        niter_success=niter_success,
-        callback=callback,
-    )
+    circle_centre = np.squeeze(centre.coords)
 
-    circle_centre = output.x
+    if callback is not None:
+        callback(circle_centre, -centre.distance(insert.boundary), True)
 
     return circle_centre
 
@@ -391,6 +478,51 @@ def parameterise_insert(x, y, callback=None):
     return width, length, circle_centre
 
 
+def parameterise_inserts(x, y, precision=DEFAULT_CIRCLE_PRECISION):
+    """Return the parameterisation of each of a collection of inserts.
+
+    Parameters
+    ----------
+    x : sequence of np.ndarray
+        The x coordinates of each insert's boundary
+    y : sequence of np.ndarray
+        The y coordinates of each insert's boundary
+    precision : float, optional
+        The precision of the largest bounded circle of each insert, in the
+        units of the coordinates.
+
+    Returns
+    -------
+    width : np.ndarray
+        The equivalent ellipse width of each insert.
+    length : np.ndarray
+        The equivalent ellipse length of each insert.
+    circle_centre : np.ndarray
+        The centre of the largest bounded circle of each insert, of shape
+        ``(number_of_inserts, 2)``.
+
+    """
+    width = []
+    length = []
+    circle_centre = []
+
+    for insert_x, insert_y in zip(x, y):
+        centre = search_for_centre_of_largest_bounded_circle(
+            insert_x, insert_y, precision=precision
+        )
+        insert_width = calculate_width(insert_x, insert_y, centre)
+
+        width.append(insert_width)
+        length.append(calculate_length(insert_x, insert_y, insert_width))
+        circle_centre.append(centre)
+
+    return (
+        np.array(width),
+        np.array(length),
+        np.reshape(circle_centre, (-1, 2)),
+    )
+
+
 def visual_alignment_of_equivalent_ellipse(x, y, width, length, callback):
     """Visually align the equivalent ellipse to the insert."""
     insert = shapely_insert(x, y)
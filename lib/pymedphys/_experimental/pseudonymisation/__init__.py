@@ -11,10 +11,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import functools
+import itertools
 import json
 import logging
 import pathlib
+from glob import glob
 from os.path import abspath, dirname, isdir, isfile
 from os.path import join as pjoin
 
@@ -25,6 +28,7 @@ from pymedphys._dicom.anonymise import (
     get_baseline_keyword_vr_dict,
     get_default_identifying_keywords,
 )
+from pymedphys._dicom.anonymise import api as anon_api
 from pymedphys._dicom.anonymise import strategy as anon_strategy
 from pymedphys._imports import pydicom
 
@@ -103,7 +107,7 @@ def anonymise_with_pseudo_cli(args):
         )
 
     elif isdir(args.input_path):
-        anonymise_directory(
+        pseudonymise_directory(
             dicom_dirpath=args.input_path,
             output_dirpath=args.output_path,
             delete_original_files=args.delete_original_files,
@@ -114,6 +118,7 @@ def anonymise_with_pseudo_cli(args):
             delete_unknown_tags=handle_unknown_tags,
             replacement_strategy=replacement_strategy,
             identifying_keywords=identifying_keywords_for_pseudo,
+            n_workers=args.n_workers,
         )
 
     else:
@@ -140,7 +145,109 @@ def is_valid_strategy_for_keywords(
     return True
 
 
-def pseudonymise(dicom_input, output_path=None):
+def _identifying_uids_in_file(dicom_filepath, uid_keywords):
+    try:
+        ds = pydicom.dcmread(dicom_filepath, force=True, stop_before_pixels=True)
+        return {
+            elem.value
+            for elem in ds.iterall()
+            if elem.keyword in uid_keywords
+            and isinstance(elem.value, str)
+            and elem.value != ""
+        }
+    except (AttributeError, LookupError, TypeError, OSError, ValueError):
+        # Any file that can't be read will be reported upon during its
+        # pseudonymisation.
+        return set()
+
+
+def pseudonymise_directory(
+    dicom_dirpath,
+    identifying_keywords=None,
+    keywords_to_leave_unchanged=(),
+    replacement_strategy=None,
+    n_workers=1,
+    **kwargs,
+):
+    """Pseudonymise all DICOM files within a directory and its
+    subdirectories.
+
+    When ``n_workers`` is greater than one the pepper and epoch jitter are
+    read, or created, within this process and shared with each of the
+    worker processes. The headers of the files are also first scanned for
+    their identifying UIDs. Each distinct UID is then pseudonymised once,
+    within this process, and the resulting map is shared with each of the
+    worker processes. Otherwise, the pseudonyms are cached as the files are
+    pseudonymised.
+
+    Parameters
+    ----------
+    dicom_dirpath : ``str`` or ``pathlib.Path``
+        The directory containing the DICOM files to pseudonymise.
+    identifying_keywords : ``list``, optional
+        Defaults to ``get_default_pseudonymisation_keywords()``.
+    keywords_to_leave_unchanged : ``sequence``, optional
+        Keywords to exclude from pseudonymisation.
+    replacement_strategy : ``dict``, optional
+        Defaults to ``strategy.pseudonymisation_dispatch``.
+    n_workers : ``int``, optional
+        The number of processes across which the files are
+        pseudonymised. Defaults to ``1``.
+    **kwargs
+        Passed on to ``anonymise_directory()``.
+
+    Returns
+    -------
+    ``list`` of pseudonymised file paths
+    """
+    if identifying_keywords is None:
+        identifying_keywords = get_default_pseudonymisation_keywords()
+
+    if replacement_strategy is None:
+        replacement_strategy = strategy.pseudonymisation_dispatch
+
+    cached_pseudonyms = None
+    if n_workers > 1 and "UI" in replacement_strategy:
+        baseline_keyword_vr_dict = get_baseline_keyword_vr_dict()
+        uid_keywords = frozenset(
+            keyword
+            for keyword in identifying_keywords
+            if baseline_keyword_vr_dict.get(keyword) == "UI"
+            and keyword not in keywords_to_leave_unchanged
+        )
+        dicom_filepaths = glob(str(dicom_dirpath) + "/**/*.dcm", recursive=True)
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=n_workers) as executor:
+            identifying_uids = set().union(
+                *executor.map(
+                    _identifying_uids_in_file,
+                    dicom_filepaths,
+                    itertools.repeat(uid_keywords),
+                    chunksize=anon_api.ANONYMISE_DIRECTORY_CHUNKSIZE,
+                )
+            )
+
+        pseudonymise_uid = replacement_strategy["UI"]
+        for uid in identifying_uids:
+            pseudonymise_uid(uid)
+
+        cached_pseudonyms = strategy.get_cached_pseudonyms()
+
+    if n_workers > 1:
+        kwargs["initializer"] = strategy.initialise_worker
+        kwargs["initargs"] = (*strategy.get_secrets(), cached_pseudonyms)
+
+    return anonymise_directory(
+        dicom_dirpath,
+        identifying_keywords=identifying_keywords,
+        keywords_to_leave_unchanged=keywords_to_leave_unchanged,
+        replacement_strategy=replacement_strategy,
+        n_workers=n_workers,
+        **kwargs,
+    )
+
+
+def pseudonymise(dicom_input, output_path=None, n_workers=1):
     """Convenient API to pseudonymisation.
     Elements whose tags are not in the pydicom dictionary will be deleted
     PatientSex will not be modified/pseudonymised
@@ -153,6 +260,9 @@ def pseudonymise(dicom_input, output_path=None):
     output_path : ``str | pathlib.Path``, optional
         If the input is a file or a path, the directory to place the
         pseudonymised files, by default None
+    n_workers : ``int``, optional
+        If the input is a directory, the number of processes across
+        which its files are pseudonymised, by default 1
 
     Returns
     -------
@@ -182,13 +292,14 @@ def pseudonymise(dicom_input, output_path=None):
         return pseudo_ds
 
     if pathlib.Path().joinpath(dicom_input).is_dir():
-        pseudonymised_file_list = anonymise_directory(
+        pseudonymised_file_list = pseudonymise_directory(
             dicom_input,
             output_dirpath=output_path,
             keywords_to_leave_unchanged=keywords_to_leave_unchanged,
             delete_unknown_tags=True,
             replacement_strategy=replacement_strategy,
             identifying_keywords=identifying_keywords_for_pseudo,
+            n_workers=n_workers,
         )
         return pseudonymised_file_list
 
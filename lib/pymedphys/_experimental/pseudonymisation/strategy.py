@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+import collections
 import datetime
 import functools
 import hashlib
@@ -32,6 +33,93 @@ DEFAULT_EARLIEST_STUDY_DATE = "20040415"
 DICOM_DATE_FORMAT_STR = "%Y%m%d"
 DICOM_DATETIME_FORMAT_STR = "%Y%m%d%H%M%S.%f"
 
+PSEUDONYM_CACHE_SIZE = 2**17
+
+_pseudonym_cache: "collections.OrderedDict[tuple, str]" = collections.OrderedDict()
+
+# The pepper and epoch jitter of a parent process, set within its worker
+# processes, take precedence over the configuration.
+_inherited_secrets = {}
+
+
+def _memoise_pseudonym(func):
+    """Remember the pseudonyms produced by ``func``.
+
+    The same UIDs, names and dates recur across every file of a series,
+    so each distinct value only needs to be hashed once. The cache is
+    bounded to ``PSEUDONYM_CACHE_SIZE`` entries, the least recently used
+    are discarded first. The value's type forms part of the key as
+    values that compare equal, such as ``1`` and ``1.0``, can still
+    have differing string representations.
+    """
+
+    @functools.wraps(func)
+    def wrapper(value, *args, **kwargs):
+        key = (func.__name__, type(value), value, args, tuple(kwargs.items()))
+        try:
+            pseudonym = _pseudonym_cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values, such as multi-valued elements
+            return func(value, *args, **kwargs)
+        else:
+            _pseudonym_cache.move_to_end(key)
+            return pseudonym
+
+        pseudonym = func(value, *args, **kwargs)
+        _pseudonym_cache[key] = pseudonym
+        while len(_pseudonym_cache) > PSEUDONYM_CACHE_SIZE:
+            _pseudonym_cache.popitem(last=False)
+
+        return pseudonym
+
+    return wrapper
+
+
+def get_cached_pseudonyms():
+    """A picklable snapshot of the pseudonyms cached within this process.
+
+    Passing the snapshot to ``update_cached_pseudonyms`` within another
+    process, for example as a worker process initializer, means those
+    values are not hashed again by that process.
+    """
+    return dict(_pseudonym_cache)
+
+
+def update_cached_pseudonyms(cached_pseudonyms):
+    """Add pseudonyms from ``get_cached_pseudonyms`` to this process's cache."""
+    _pseudonym_cache.update(cached_pseudonyms)
+    while len(_pseudonym_cache) > PSEUDONYM_CACHE_SIZE:
+        _pseudonym_cache.popitem(last=False)
+
+
+def clear_cached_pseudonyms():
+    _pseudonym_cache.clear()
+
+
+def get_secrets():
+    """The pepper and epoch jitter with which this process pseudonymises.
+
+    These are read from, or when absent created within, the pymedphys
+    configuration. Passing them to ``initialise_worker`` means a worker
+    process pseudonymises with the same values, rather than each worker
+    creating its own should the configuration not yet hold them.
+    """
+    return _get_pepper(), _get_epoch_jitter()
+
+
+def initialise_worker(pepper, epoch_jitter, cached_pseudonyms=None):
+    """Pseudonymise, within a worker process, with the ``get_secrets`` and
+    optionally the ``get_cached_pseudonyms`` of its parent process."""
+    _inherited_secrets["pepper"] = pepper
+    _inherited_secrets["epoch_jitter"] = epoch_jitter
+    _get_pepper.cache_clear()
+    _get_epoch_jitter.cache_clear()
+
+    if cached_pseudonyms is not None:
+        update_cached_pseudonyms(cached_pseudonyms)
+
 
 @functools.lru_cache()
 def _get_pepper():
@@ -51,6 +139,9 @@ def _get_pepper():
     Bytes representing the pepper (which were stored as ASCII)
 
     """
+    if "pepper" in _inherited_secrets:
+        return _inherited_secrets["pepper"]
+
     pepper = b"mynotveryprotectivepeppertest"
 
     _config = None
@@ -93,6 +184,9 @@ def _get_epoch_jitter():
     -------
         a value from 0 to 1000
     """
+    if "epoch_jitter" in _inherited_secrets:
+        return _inherited_secrets["epoch_jitter"]
+
     epoch_jitter = 0
     _config = None
     try:
@@ -148,6 +242,7 @@ def get_pseudonymous_replacement_value(keyword, value):
     return replacement_value
 
 
+@_memoise_pseudonym
 def _pseudonymise_plaintext(value):
     """
     Appropriate for DICOM VR that are unstructured text, e.g. SH, AE, LO
@@ -256,6 +351,7 @@ def _add_tzinfo(d: datetime.datetime, tz: datetime.timezone) -> datetime.datetim
     return datetime.datetime.combine(d.date(), d.time(), tz)
 
 
+@_memoise_pseudonym
 def _pseudonymise_DA(
     value, format_str=DICOM_DATE_FORMAT_STR, earliest_study=DEFAULT_EARLIEST_STUDY_DATE
 ):
@@ -366,6 +462,7 @@ def _pseudonymise_OB_or_OW(value):
     return _pseudonymise_unchanged(value)
 
 
+@_memoise_pseudonym
 def _pseudonymise_PN(
     value, max_component_length=64, strip_name_prefix=True, strip_name_suffix=True
 ):
@@ -454,6 +551,7 @@ def _pseudonymise_TM(value):
     return _pseudonymise_unchanged(value)
 
 
+@_memoise_pseudonym
 def _pseudonymise_UI(value):
     encoded_value = value.encode("ASCII")
     my_hash_func = hashlib.new("sha3_256")
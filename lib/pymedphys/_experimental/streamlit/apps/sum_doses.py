@@ -19,7 +19,7 @@ from typing import BinaryIO, List, Sequence
 from pymedphys._imports import pydicom
 from pymedphys._imports import streamlit as st
 
-from pymedphys._dicom.dose import sum_doses_in_datasets
+from pymedphys._dicom.dose import sum_doses_in_files
 from pymedphys._dicom.utilities import pretty_patient_name
 from pymedphys._streamlit import categories
 
@@ -39,6 +39,10 @@ def main():
             ["dcm"],
             accept_multiple_files=True,
         )
+        resample = st.checkbox(
+            "Resample doses whose grids don't coincide with the grid of "
+            "the first file onto that grid"
+        )
 
     if not files:
         st.stop()
@@ -70,7 +74,9 @@ def main():
         st.write("---")
         st.write("Summing doses...")
 
-        ds_summed = sum_doses_in_datasets(datasets)
+        # The uploaded files are summed one dose at a time, rather than
+        # holding every dose grid in memory at once
+        ds_summed = sum_doses_in_files(files, resample=resample)
         _save_dataset_to_downloads_dir(ds_summed)
 
         st.write("Done!")
@@ -102,7 +108,7 @@ def _load_and_check_files_valid(
 
 def _load_dicom_file(fh: BinaryIO):
     try:
-        ds = pydicom.dcmread(fh)
+        ds = pydicom.dcmread(fh, stop_before_pixels=True)
     except pydicom.errors.InvalidDicomError as e:
         raise ValueError(f"'{fh.name}' is not a valid DICOM file") from e
 
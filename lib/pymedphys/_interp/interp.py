@@ -13,7 +13,7 @@
 # limitations under the License.
 
 from functools import cache
-from typing import Sequence
+from typing import Iterable, Iterator, Sequence
 
 from pymedphys._imports import numba as nb, numpy as np, plt, scipy
 
@@ -79,44 +79,65 @@ def plot_interp_comparison_heatmap(
 def __check_inputs(
     axes_known: Sequence["np.ndarray"],
     values: "np.ndarray",
-    points_interp: "np.ndarray",
+    points_interp: "np.ndarray | None" = None,
     bounds_error=False,
+    axes_interp: Sequence["np.ndarray"] | None = None,
 ) -> tuple[tuple["np.ndarray", ...], "np.ndarray"]:
-    if not 1 <= len(axes_known) == points_interp.shape[-1] <= 3:
+    if axes_interp is None:
+        coords_interp = [points_interp[:, i] for i in range(points_interp.shape[-1])]
+        name_interp = "points_interp"
+    else:
+        coords_interp = [np.asarray(axis) for axis in axes_interp]
+        name_interp = "axes_interp"
+
+    if not 1 <= len(axes_known) == len(coords_interp) <= 3:
         raise ValueError(
-            f"axes_known (len {len(axes_known)}) and points_interp (len {points_interp.shape[-1]}) must have the same length; either 1, 2, or 3"
+            f"axes_known (len {len(axes_known)}) and {name_interp} (len {len(coords_interp)}) must have the same length; either 1, 2, or 3"
         )
 
-    for i, axis_known in enumerate(axes_known):
-        if not axis_known.ndim == points_interp[i].ndim == 1:
+    for i, (axis_known, coord_interp) in enumerate(zip(axes_known, coords_interp)):
+        if not axis_known.ndim == coord_interp.ndim == 1:
             raise ValueError(
-                f"axes_known[{i}] (shape {[{axis_known.shape}]}) and interp_structure[{i}] (shape {[{points_interp[i].shape}]}) must be 1D arrays"
+                f"axes_known[{i}] (shape {[{axis_known.shape}]}) and interp_structure[{i}] (shape {[{coord_interp.shape}]}) must be 1D arrays"
             )
         if not axis_known.size == values.shape[i]:
             raise ValueError(
                 f"axes_known[{i}] (size {axis_known.size}) must match the size of the corresponding dimension of values ({values.shape[i]})"
             )
-        if bounds_error and (
-            points_interp[:, i].min() < axis_known.min()
-            or points_interp[:, i].max() > axis_known.max()
+        if (
+            bounds_error
+            and coord_interp.size > 0
+            and (
+                coord_interp.min() < axis_known.min()
+                or coord_interp.max() > axis_known.max()
+            )
         ):
             raise ValueError(
-                f"""points_interp[:, {i}] must be within the range of axes_known[{i}]\n
-                ({points_interp[:, i].min()}, {points_interp[:, i].max()}) vs. ({axis_known.min()}, {axis_known.max()})"""
+                f"""{name_interp}[{i}] must be within the range of axes_known[{i}]\n
+                ({coord_interp.min()}, {coord_interp.max()}) vs. ({axis_known.min()}, {axis_known.max()})"""
             )
 
     axes_known = tuple(np.array(axis, dtype=np.float64) for axis in axes_known)
-    values = np.array(values, dtype=np.float64)
+    values = np.asarray(values, dtype=_values_dtype(values))
 
     return axes_known, values
 
 
+def _values_dtype(values):
+    """Keep single precision values, and their interpolated values, in
+    single precision, halving the memory they use. All other values are
+    interpolated in double precision."""
+    if np.asarray(values).dtype == np.float32:
+        return np.float32
+
+    return np.float64
+
+
 @cache
 def _get_interp_linear_1d():
     @nb.njit(parallel=True, fastmath=True, cache=True)
     def _interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=np.nan):
-        values_interp = np.zeros(points_interp.shape[0], dtype=np.float64)
-        diff = axis_known[1] - axis_known[0]
+        values_interp = np.zeros(points_interp.shape[0], dtype=values.dtype)
 
         # pylint: disable=not-an-iterable
         for i in nb.prange(points_interp.shape[0]):
@@ -134,7 +155,8 @@ def _get_interp_linear_1d():
             if x1_idx >= axis_known.size:
                 x1_idx = axis_known.size - 1
 
-            wx = (xpi - axis_known[x0_idx]) / diff
+            dx = axis_known[x1_idx] - axis_known[x0_idx]
+            wx = (xpi - axis_known[x0_idx]) / dx if dx > 0 else 0.0
 
             values_interp[i] = values[x0_idx] * (1 - wx) + values[x1_idx] * wx
 
@@ -149,7 +171,7 @@ def interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=None):
         extrap_fill_value = np.nan
     return _interp_linear_1d(
         axis_known=axis_known,
-        values=values,
+        values=np.asarray(values, dtype=_values_dtype(values)),
         points_interp=points_interp,
         extrap_fill_value=extrap_fill_value,
     )
@@ -159,10 +181,7 @@ def interp_linear_1d(axis_known, values, points_interp, extrap_fill_value=None):
 def _get_interp_linear_2d():
     @nb.njit(parallel=True, fastmath=True, cache=True)
     def _interp_linear_2d(axes_known, values, points_interp, extrap_fill_value=np.nan):
-        values_interp = np.zeros((points_interp.shape[0]), dtype=np.float64)
-        diffs = np.zeros(2)
-        for i, axis in enumerate(axes_known):
-            diffs[i] = axis[1] - axis[0]
+        values_interp = np.zeros((points_interp.shape[0]), dtype=values.dtype)
         x, y = axes_known
 
         # pylint: disable=not-an-iterable
@@ -193,8 +212,11 @@ def _get_interp_linear_2d():
             c10 = values[x1_idx, y0_idx]
             c11 = values[x1_idx, y1_idx]
 
-            wx = (xpi - x[x0_idx]) / diffs[0]
-            wy = (ypi - y[y0_idx]) / diffs[1]
+            # The spacing of each axis may vary
+            dx = x[x1_idx] - x[x0_idx]
+            dy = y[y1_idx] - y[y0_idx]
+            wx = (xpi - x[x0_idx]) / dx if dx > 0 else 0.0
+            wy = (ypi - y[y0_idx]) / dy if dy > 0 else 0.0
 
             c0 = c00 * (1 - wx) + c10 * wx
             c1 = c01 * (1 - wx) + c11 * wx
@@ -212,7 +234,7 @@ def interp_linear_2d(axes_known, values, points_interp, extrap_fill_value=None):
         extrap_fill_value = np.nan
     return _interp_linear_2d(
         axes_known=axes_known,
-        values=values,
+        values=np.asarray(values, dtype=_values_dtype(values)),
         points_interp=points_interp,
         extrap_fill_value=extrap_fill_value,
     )
@@ -227,13 +249,9 @@ def _get_interp_linear_3d():
 
         values_interp = np.zeros(
             points_interp.shape[0],
-            dtype=np.float64,
+            dtype=values.dtype,
         )
 
-        diffs = np.zeros(3)
-        for i, axis in enumerate(axes_known):
-            diffs[i] = axis[1] - axis[0]
-
         # pylint: disable=not-an-iterable
         for i in nb.prange(points_interp.shape[0]):
             xpi, ypi, zpi = (
@@ -271,10 +289,13 @@ def _get_interp_linear_3d():
             if z1_idx >= z.size:
                 z1_idx = z.size - 1
 
-            # Compute interpolation weights
-            wx = (xpi - x[x0_idx]) / diffs[0]
-            wy = (ypi - y[y0_idx]) / diffs[1]
-            wz = (zpi - z[z0_idx]) / diffs[2]
+            # Compute interpolation weights, the spacing of each axis may vary
+            dx = x[x1_idx] - x[x0_idx]
+            dy = y[y1_idx] - y[y0_idx]
+            dz = z[z1_idx] - z[z0_idx]
+            wx = (xpi - x[x0_idx]) / dx if dx > 0 else 0.0
+            wy = (ypi - y[y0_idx]) / dy if dy > 0 else 0.0
+            wz = (zpi - z[z0_idx]) / dz if dz > 0 else 0.0
 
             # Extract values values at corner points
             c000 = values[x0_idx, y0_idx, z0_idx]
@@ -308,12 +329,108 @@ def interp_linear_3d(axes_known, values, points_interp, extrap_fill_value=None):
         extrap_fill_value = np.nan
     return _interp_linear_3d(
         axes_known=axes_known,
-        values=values,
+        values=np.asarray(values, dtype=_values_dtype(values)),
         points_interp=points_interp,
         extrap_fill_value=extrap_fill_value,
     )
 
 
+@cache
+def _get_interp_linear_axis():
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _interp_linear_axis(values, indices_lower, indices_upper, weights):
+        before, _, after = values.shape
+        size_interp = weights.size
+        values_interp = np.empty((before, size_interp, after), dtype=values.dtype)
+
+        # pylint: disable=not-an-iterable
+        for n in nb.prange(before * size_interp):
+            b = n // size_interp
+            i = n % size_interp
+            i0 = indices_lower[i]
+            i1 = indices_upper[i]
+            w = weights[i]
+
+            for a in range(after):
+                values_interp[b, i, a] = (
+                    values[b, i0, a] * (1 - w) + values[b, i1, a] * w
+                )
+
+        return values_interp
+
+    return _interp_linear_axis
+
+
+def _axis_lookup(axis_known, axis_interp):
+    """Return the indices of the known points either side of each
+    interpolation coordinate, the weight of the upper of these, and
+    whether the coordinate is within the known axis."""
+    indices_upper = np.minimum(
+        np.searchsorted(axis_known, axis_interp), axis_known.size - 1
+    )
+    indices_lower = np.maximum(indices_upper - 1, 0)
+
+    spacing = axis_known[indices_upper] - axis_known[indices_lower]
+    weights = np.divide(
+        axis_interp - axis_known[indices_lower],
+        spacing,
+        out=np.zeros_like(axis_interp),
+        where=spacing > 0,
+    )
+    within = (axis_known[0] <= axis_interp) & (axis_interp <= axis_known[-1])
+
+    return indices_lower, indices_upper, weights, within
+
+
+def interp_linear_grid(axes_known, values, axes_interp, extrap_fill_value=None):
+    """Interpolate values onto the grid defined by ``axes_interp``.
+
+    Linear interpolation between regular grids is separable. The indices
+    and weights along each axis are found once per coordinate of that
+    axis, and applied as one pass of 1D interpolation along each axis in
+    turn. The passes that shrink the grid the most are made first.
+
+    Returns
+    -------
+    np.ndarray
+        The interpolated values, of shape ``[axis.size for axis in axes_interp]``.
+    """
+    if extrap_fill_value is None:
+        extrap_fill_value = np.nan
+
+    axes_known = [np.asarray(axis, dtype=np.float64) for axis in axes_known]
+    axes_interp = [np.asarray(axis, dtype=np.float64) for axis in axes_interp]
+    lookups = [
+        _axis_lookup(axis_known, axis_interp)
+        for axis_known, axis_interp in zip(axes_known, axes_interp)
+    ]
+
+    _interp_linear_axis = _get_interp_linear_axis()
+    values_interp = np.asarray(values, dtype=_values_dtype(values))
+
+    pass_order = sorted(
+        range(len(axes_known)),
+        key=lambda dim: axes_interp[dim].size / axes_known[dim].size,
+    )
+    for dim in pass_order:
+        indices_lower, indices_upper, weights, _ = lookups[dim]
+        shape = values_interp.shape
+        values_interp = _interp_linear_axis(
+            values_interp.reshape(
+                int(np.prod(shape[:dim])), shape[dim], int(np.prod(shape[dim + 1 :]))
+            ),
+            indices_lower,
+            indices_upper,
+            weights,
+        ).reshape(shape[:dim] + (weights.size,) + shape[dim + 1 :])
+
+    for dim, (_, _, _, within) in enumerate(lookups):
+        if not np.all(within):
+            values_interp[(slice(None),) * dim + (~within,)] = extrap_fill_value
+
+    return values_interp
+
+
 def interp_linear_scipy(
     axes_known,
     values,
@@ -342,7 +459,7 @@ def interp_linear_scipy(
 
     if keep_dims:
         if axes_interp is not None:
-            return f(points_interp).reshape(axis.size for axis in axes_interp)
+            return f(points_interp).reshape(tuple(axis.size for axis in axes_interp))
         else:
             raise ValueError(
                 "If `keep_dims` is True, `axes_interp` must be specified to determine the shape of the output"
@@ -351,6 +468,34 @@ def interp_linear_scipy(
         return f(points_interp)
 
 
+def _check_axes_known(axes_known):
+    axes_known_diffs = [np.diff(axis) for axis in axes_known]
+
+    # Handle ascending vs. descending vs. bad order.
+    for i, diff in enumerate(axes_known_diffs):
+        if not np.all(diff > 0):
+            raise ValueError(
+                f"axes_known[{i}] is not monotonically ascending or descending"
+            )
+
+
+def _interp_points(axes_known, values, points_interp, extrap_fill_value):
+    if len(axes_known) == 1:
+        return interp_linear_1d(axes_known[0], values, points_interp, extrap_fill_value)
+    if len(axes_known) == 2:
+        return interp_linear_2d(axes_known, values, points_interp, extrap_fill_value)
+
+    return interp_linear_3d(axes_known, values, points_interp, extrap_fill_value)
+
+
+def _chunk_slices(size, chunk_size):
+    if chunk_size is None:
+        chunk_size = max(size, 1)
+
+    for start in range(0, size, chunk_size):
+        yield slice(start, min(start + chunk_size, size))
+
+
 # pylint: disable=invalid-name
 def interp(
     axes_known: Sequence["np.ndarray"],
@@ -361,6 +506,8 @@ def interp(
     bounds_error=True,
     extrap_fill_value=None,
     skip_checks=False,
+    chunk_size: int | None = None,
+    out: "np.ndarray | None" = None,
 ) -> "np.ndarray":
     """
     Perform fast linear interpolation on 1D, 2D, or 3D data.
@@ -374,9 +521,9 @@ def interp(
         a tuple of the lengths of the axes in `axes_known` in the same order.
     axes_interp : Sequence[np.ndarray], optional
         The coordinate vectors or axis coordinates for which to interpolate values.
-        These axes will be expanded to flattened meshgrids and interpolation will occur
-        for each point in these grids. Either `axes_interp` or `points_interp` must be
-        provided, but not both.
+        Interpolation will occur for each point of the grid these axes define,
+        iterating over the axes directly rather than over a meshgrid of the points.
+        Either `axes_interp` or `points_interp` must be provided, but not both.
     points_interp : np.ndarray, optional
         The exact coordinates of the points where interpolation is desired.
         Shape should be (n, d) where n is the number of points and d is the number of
@@ -394,11 +541,21 @@ def interp(
     skip_checks : bool, optional
         If True, skip input validation checks. Skipping these checks can produce a
         significant improve in performance for some applications. Default is False.
+    chunk_size : int, optional
+        If given, interpolate at most this many points at a time. Points of
+        `points_interp` are interpolated `chunk_size` rows at a time, and grids of
+        `axes_interp` in slabs along their first axis of at most `chunk_size` points.
+        Together with `out`, this bounds the memory used to that of a chunk. Default
+        is None, which interpolates all points at once.
+    out : np.ndarray, optional
+        A C contiguous array, such as a `np.memmap`, in which to place the
+        interpolated values. Its shape must be that of the returned values.
 
     Returns
     -------
     np.ndarray
-        The interpolated values. If `keep_dims` is True and `axes_interp` is provided,
+        The interpolated values, of dtype float32 if `values` is float32 and float64
+        otherwise. If `keep_dims` is True and `axes_interp` is provided,
         the output will have the same shape as defined by `axes_interp`.
         Otherwise, it will be a 1D array.
 
@@ -407,7 +564,7 @@ def interp(
     ValueError
         If neither or both of `axes_interp` and `points_interp` are provided.
         If `keep_dims` is True but `axes_interp` is not provided.
-        If the input axes are not monotonically increasing or evenly spaced.
+        If the input axes are not monotonically increasing.
 
     Notes
     -----
@@ -415,70 +572,141 @@ def interp(
     It supports both grid-based interpolation (using `axes_interp`) and
     point-based interpolation (using `points_interp`).
 
-    The input axes must be monotonically increasing and evenly spaced.
+    Grid-based interpolation is separated into one pass of 1D interpolation along
+    each axis, with the indices and weights along each axis found once.
+
+    The input axes must be monotonically increasing, but need not be evenly spaced.
+
+    Values of dtype float32 are read, and interpolated into, float32 arrays, halving
+    the memory they use. All other values are converted to float64.
+
+    See Also
+    --------
+    interp_chunks : Interpolate an iterable of chunks of points.
     """
     if axes_interp is not None and points_interp is None:
-        mgrids = np.meshgrid(*axes_interp, indexing="ij")
-        points_interp = np.column_stack([mgrid.ravel() for mgrid in mgrids])
+        shape = tuple(np.size(axis) for axis in axes_interp)
     elif axes_interp is None and points_interp is not None:
         if keep_dims:
             raise ValueError(
                 "If `keep_dims` is True, `axes_interp` must be specified to determine the shape of the output"
             )
+        shape = (points_interp.shape[0],)
     else:
         raise ValueError(
             "Exactly one of either `axes_interp` or `points_interp` must be specified"
         )
     if not skip_checks:
         axes_known, values = __check_inputs(
-            axes_known, values, points_interp, bounds_error
+            axes_known, values, points_interp, bounds_error, axes_interp=axes_interp
         )
+        _check_axes_known(axes_known)
 
-        axes_known_diffs = [np.diff(axis) for axis in axes_known]
+    # The kernels interpolate into arrays of the dtype of the values, so
+    # these are cast even when the checks are skipped.
+    values = np.asarray(values, dtype=_values_dtype(values))
 
-        # Handle ascending vs. descending vs. bad order.
-        for i, diff in enumerate(axes_known_diffs):
-            if not np.all(diff > 0):
-                raise ValueError(
-                    f"axes_known[{i}] is not monotonically ascending or descending"
-                )
-            if not np.allclose(diff, diff[0]):
-                raise ValueError(f"axis_known[{i}] must be evenly spaced")
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError(f"chunk_size must be a positive integer, not {chunk_size}")
 
     if extrap_fill_value is None:
         extrap_fill_value = np.nan
 
-    if len(axes_known) == 1:
-        # keep_dims has no effect for 1D interpolation
-        result: np.ndarray = interp_linear_1d(
-            axes_known[0],
-            values,
-            points_interp,
-            extrap_fill_value,
-        )
-        return result
+    # keep_dims has no effect for 1D interpolation
+    if not keep_dims and len(shape) > 1:
+        shape = (int(np.prod(shape)),)
 
-    elif len(axes_known) == 2:
-        values_interp = interp_linear_2d(
-            axes_known,
-            values,
-            points_interp,
-            extrap_fill_value,
+    if out is None:
+        values_interp = np.empty(shape, dtype=_values_dtype(values))
+    elif out.shape != shape or not out.flags.c_contiguous:
+        raise ValueError(
+            f"out (shape {out.shape}) must be a C contiguous array of shape {shape}"
         )
     else:
-        values_interp = interp_linear_3d(
+        values_interp = out
+
+    if axes_interp is None:
+        for chunk in _chunk_slices(shape[0], chunk_size):
+            values_interp[chunk] = _interp_points(
+                axes_known, values, points_interp[chunk], extrap_fill_value
+            )
+
+        return values_interp
+
+    grid_shape = tuple(np.size(axis) for axis in axes_interp)
+    grid_interp = values_interp.reshape(grid_shape)
+
+    slab_size = int(np.prod(grid_shape[1:]))
+    if chunk_size is not None:
+        chunk_size = max(chunk_size // max(slab_size, 1), 1)
+
+    for chunk in _chunk_slices(grid_shape[0], chunk_size):
+        grid_interp[chunk] = interp_linear_grid(
             axes_known,
             values,
-            points_interp,
+            (axes_interp[0][chunk], *axes_interp[1:]),
             extrap_fill_value,
         )
 
-    if keep_dims:
-        if axes_interp is None:
-            raise ValueError(
-                "If `keep_dims` is True, `axes_interp` must be specified to determine the shape of the output"
-            )
-        values_interp = values_interp.reshape([axis.size for axis in axes_interp])
-
     final_result: np.ndarray = values_interp
     return final_result
+
+
+def interp_chunks(
+    axes_known: Sequence["np.ndarray"],
+    values: "np.ndarray",
+    points_interp_chunks: Iterable["np.ndarray"],
+    bounds_error=True,
+    extrap_fill_value=None,
+    skip_checks=False,
+) -> Iterator["np.ndarray"]:
+    """
+    Lazily interpolate each of an iterable of chunks of points.
+
+    Only the chunk of points being interpolated, and its interpolated values, need
+    be held in memory. The points may therefore be generated, or read from disk,
+    chunk by chunk.
+
+    Parameters
+    ----------
+    axes_known : Sequence[np.ndarray]
+        The coordinate vectors or axis coordinates of the known data points.
+    values : np.ndarray
+        The known values at the points defined by `axes_known`.
+    points_interp_chunks : Iterable[np.ndarray]
+        The chunks of points where interpolation is desired, each of shape (n, d).
+    bounds_error : bool, optional
+        If True, raise an error when interpolation is attempted outside the bounds of
+        the input data. Default is True.
+    extrap_fill_value : float, optional
+        The value to use for points outside the bounds of the input data when
+        `bounds_error` is False. Default is None, which results in using np.nan.
+    skip_checks : bool, optional
+        If True, skip input validation checks. Default is False.
+
+    Yields
+    ------
+    np.ndarray
+        The interpolated values of each chunk of points.
+    """
+    axes_checked = skip_checks
+
+    for points_interp in points_interp_chunks:
+        points_interp = np.asarray(points_interp)
+
+        if not axes_checked:
+            axes_known, values = __check_inputs(
+                axes_known, values, points_interp, bounds_error
+            )
+            _check_axes_known(axes_known)
+            axes_checked = True
+        elif not skip_checks:
+            __check_inputs(axes_known, values, points_interp, bounds_error)
+
+        yield interp(
+            axes_known,
+            values,
+            points_interp=points_interp,
+            extrap_fill_value=extrap_fill_value,
+            skip_checks=True,
+        )
@@ -0,0 +1,141 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compile the numba interpolation kernels ahead of their first use, into
+numba's on disk cache, so that later processes load rather than compile
+them.
+"""
+
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Sequence
+
+from pymedphys._imports import numba as nb, numpy as np
+
+from .interp import (
+    _get_interp_linear_1d,
+    _get_interp_linear_2d,
+    _get_interp_linear_3d,
+    _get_interp_linear_axis,
+    interp,
+)
+
+KERNEL_FACTORIES = (
+    _get_interp_linear_1d,
+    _get_interp_linear_2d,
+    _get_interp_linear_3d,
+    _get_interp_linear_axis,
+)
+DEFAULT_DTYPES = ("float64", "float32")
+DEFAULT_N_DIMS = (1, 2, 3)
+
+
+def set_cache_dir(cache_dir: str | pathlib.Path):
+    """Cache the compiled interpolation kernels within ``cache_dir``.
+
+    Equivalent to setting the ``NUMBA_CACHE_DIR`` environment variable
+    before numba is imported, which is also passed on to subprocesses.
+    Kernels already created are recreated, so that they too cache within
+    ``cache_dir``.
+    """
+    cache_dir = pathlib.Path(cache_dir).resolve()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    os.environ["NUMBA_CACHE_DIR"] = str(cache_dir)
+    nb.core.config.reload_config()
+
+    for factory in KERNEL_FACTORIES:
+        factory.cache_clear()
+
+
+def warmup(
+    cache_dir: str | pathlib.Path | None = None,
+    dtypes: Sequence[str] = DEFAULT_DTYPES,
+    n_dims: Sequence[int] = DEFAULT_N_DIMS,
+) -> float:
+    """Compile the interpolation kernels of :func:`interp` for the given
+    dtypes of values and numbers of dimensions.
+
+    The kernels are otherwise compiled on their first call, costing the
+    first interpolation of each process several seconds. Compiled kernels
+    are cached by numba, so a warmup in one process, such as at deploy
+    time, saves this in every later process that shares its cache.
+
+    Parameters
+    ----------
+    cache_dir : str or pathlib.Path, optional
+        The directory in which to cache the compiled kernels. Default is
+        None, which uses ``NUMBA_CACHE_DIR`` if set, and otherwise the
+        ``__pycache__`` directory next to the source, or a user wide
+        cache directory when that isn't writable.
+    dtypes : Sequence[str], optional
+        The dtypes of the values for which to compile the kernels. Default
+        is float64 and float32.
+    n_dims : Sequence[int], optional
+        The numbers of dimensions for which to compile the kernels.
+        Default is 1, 2 and 3.
+
+    Returns
+    -------
+    float
+        The time, in seconds, taken to compile, or load from the cache,
+        the kernels.
+    """
+    if cache_dir is not None:
+        set_cache_dir(cache_dir)
+
+    # Import numba, and create the kernels, before starting the clock, as
+    # a warm cache saves neither.
+    for factory in KERNEL_FACTORIES:
+        factory()
+
+    start = time.perf_counter()
+    for dtype in dtypes:
+        for n in n_dims:
+            axes_known = tuple(np.linspace(0, 1, 3) for _ in range(n))
+            values = np.zeros((3,) * n, dtype=dtype)
+
+            interp(
+                axes_known, values, axes_interp=tuple(axis[:2] for axis in axes_known)
+            )
+            interp(axes_known, values, points_interp=np.zeros((1, n)))
+
+    return time.perf_counter() - start
+
+
+def warmup_cli(args):
+    cold = warmup(cache_dir=args.cache_dir, dtypes=args.dtype, n_dims=args.n_dims)
+
+    # A new process, sharing the cache, loads the kernels as any later
+    # process would.
+    code = (
+        "from pymedphys._interp.warmup import warmup; "
+        f"print(warmup(dtypes={list(args.dtype)!r}, n_dims={list(args.n_dims)!r}))"
+    )
+    warm = float(
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout.split()[-1]
+    )
+
+    print(
+        f"Interpolation kernels cached within "
+        f"{os.environ.get('NUMBA_CACHE_DIR') or 'the default numba cache'}\n"
+        f"  this process: {cold:.2f} s\n"
+        f"  a later process: {warm:.2f} s\n"
+        f"  cold start time saved: {cold - warm:.2f} s"
+    )
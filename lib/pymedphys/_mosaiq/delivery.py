@@ -16,7 +16,7 @@
 """Uses Mosaiq SQL to extract patient delivery details."""
 
 import functools
-import struct
+from typing import Sequence
 
 from pymedphys._imports import attr
 from pymedphys._imports import numpy as np
@@ -25,7 +25,7 @@ from pymedphys._imports import pandas as pd
 from pymedphys._base.delivery import DeliveryBase
 from pymedphys._utilities.transforms import convert_IEC_angle_to_bipolar
 
-from . import api, constants
+from . import api, constants, helpers
 
 
 @functools.lru_cache()
@@ -219,18 +219,12 @@ def decode_msq_mlc(raw_bytes):
             "There should be an even number of bytes within an MLC record."
         )
 
-    mlc_pos = (
-        np.array(
-            [
-                [
-                    struct.unpack("<h", control_point[2 * i : 2 * i + 2])
-                    for i in range(len(control_point) // 2)
-                ]
-                for control_point in raw_bytes
-            ]
-        )
-        / 100
+    # Each control point is a packed array of little-endian int16 leaf
+    # positions, so decode them all at once from a single joined buffer.
+    leaf_positions = np.frombuffer(b"".join(raw_bytes), dtype="<i2").reshape(
+        len(raw_bytes), length // 2, 1
     )
+    mlc_pos = leaf_positions / 100
 
     return mlc_pos
 
@@ -249,6 +243,17 @@ def collimation_to_bipolar_mm(mlc_a, mlc_b, coll_y1, coll_y2):
     return mlc, jaw
 
 
+TXFIELDPOINT_COLUMNS = [
+    "Index",
+    "A_Leaf_Set",
+    "B_Leaf_Set",
+    "Gantry_Ang",
+    "Coll_Ang",
+    "Coll_Y1",
+    "Coll_Y2",
+]
+
+
 def _raw_delivery_data_sql(connection, field_id):
     txfield_results = api.execute(
         connection,
@@ -313,25 +318,115 @@ def delivery_data_sql(connection, field_id):
         raise ValueError("No TxFieldPoints were returned.")
 
     txfieldpoint_results = pd.DataFrame(
-        data=raw_txfieldpoint_results,
-        columns=[
-            "Index",
-            "A_Leaf_Set",
-            "B_Leaf_Set",
-            "Gantry_Ang",
-            "Coll_Ang",
-            "Coll_Y1",
-            "Coll_Y2",
-        ],
+        data=raw_txfieldpoint_results, columns=TXFIELDPOINT_COLUMNS
     )
 
     return meterset, txfieldpoint_results
 
 
+def _raw_delivery_data_sql_many(connection, field_ids):
+    results = []
+
+    for placeholders, parameters in helpers.in_clause_batches(field_ids, "field_id"):
+        results += api.execute(
+            connection,
+            f"""
+            SELECT
+                TxField.FLD_ID,
+                TxField.Meterset,
+                TxFieldPoint.[Index],
+                TxFieldPoint.A_Leaf_Set,
+                TxFieldPoint.B_Leaf_Set,
+                TxFieldPoint.Gantry_Ang,
+                TxFieldPoint.Coll_Ang,
+                TxFieldPoint.Coll_Y1,
+                TxFieldPoint.Coll_Y2
+            FROM TxField
+            INNER JOIN
+                TxFieldPoint ON TxFieldPoint.FLD_ID = TxField.FLD_ID
+            WHERE
+                TxField.FLD_ID IN ({placeholders})
+            ORDER BY
+                TxField.FLD_ID,
+                TxFieldPoint.Point
+            """,
+            parameters,
+        )
+
+    return results
+
+
+def delivery_data_sql_many(connection, field_ids: Sequence[int]):
+    """Get the treatment delivery data from Mosaiq for many SQL field_ids
+
+    All of the field IDs are retrieved within a single query (split into
+    batches for very large requests) rather than two queries per field.
+
+    Args:
+        connection: A connection pointing to the Mosaiq SQL server
+        field_ids: The Mosaiq SQL field IDs
+
+    Returns:
+        delivery_data: A dictionary mapping each field ID to a tuple of
+            its meterset and its TxFieldPoint results, matching the
+            return values of ``delivery_data_sql``.
+    """
+    raw_results = _raw_delivery_data_sql_many(connection, field_ids)
+
+    table = pd.DataFrame(
+        data=raw_results, columns=["FLD_ID", "Meterset"] + TXFIELDPOINT_COLUMNS
+    )
+    grouped = dict(tuple(table.groupby("FLD_ID", sort=False)))
+
+    delivery_data = {}
+    for field_id in field_ids:
+        try:
+            field_table = grouped[field_id]
+        except KeyError as e:
+            raise ValueError(
+                f"No TxFieldPoints were returned for field ID {field_id}."
+            ) from e
+
+        meterset = field_table["Meterset"].to_numpy(dtype=float)[:1]
+        txfieldpoint_results = field_table[TXFIELDPOINT_COLUMNS].reset_index(drop=True)
+
+        delivery_data[field_id] = (meterset, txfieldpoint_results)
+
+    return delivery_data
+
+
 class DeliveryMosaiq(DeliveryBase):
     @classmethod
     def from_mosaiq(cls, connection, field_id):
         total_mu, tx_field_points = delivery_data_sql(connection, field_id)
+
+        return cls._from_mosaiq_tx_field_points(total_mu, tx_field_points)
+
+    @classmethod
+    def from_mosaiq_many(cls, connection, field_ids):
+        """Load the deliveries for many Mosaiq fields at once.
+
+        Equivalent to calling ``from_mosaiq`` for each field ID, however
+        the Mosaiq SQL server is queried only once for all of the fields.
+
+        Args:
+            connection: A connection pointing to the Mosaiq SQL server
+            field_ids: The Mosaiq SQL field IDs
+
+        Returns:
+            deliveries: A list of deliveries, in the same order as the
+                provided field IDs.
+        """
+        field_ids = list(field_ids)
+        delivery_data = delivery_data_sql_many(connection, field_ids)
+
+        return [
+            cls._from_mosaiq_tx_field_points(*delivery_data[field_id])
+            for field_id in field_ids
+        ]
+
+    @classmethod
+    def _from_mosaiq_tx_field_points(cls, total_mu, tx_field_points):
         tx_field_points_index = tx_field_points["Index"].to_numpy(dtype=float)
 
         if np.shape(tx_field_points_index) == ():
@@ -342,10 +437,12 @@ class DeliveryMosaiq(DeliveryBase):
 
         monitor_units = np.cumsum(mu_per_control_point).tolist()
 
-        raw_mlc_a = tx_field_points["A_Leaf_Set"].to_numpy(dtype=bytes)
+        # Keep the leaf sets as Python bytes, converting them to a numpy
+        # bytes array would strip any trailing null bytes.
+        raw_mlc_a = tx_field_points["A_Leaf_Set"].tolist()
         mlc_a = np.squeeze(decode_msq_mlc(raw_mlc_a)).T
 
-        raw_mlc_b = tx_field_points["B_Leaf_Set"].to_numpy(dtype=bytes)
+        raw_mlc_b = tx_field_points["B_Leaf_Set"].tolist()
         mlc_b = np.squeeze(decode_msq_mlc(raw_mlc_b)).T
 
         msq_gantry_angle = tx_field_points["Gantry_Ang"].to_numpy(dtype=float)
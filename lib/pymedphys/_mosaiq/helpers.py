@@ -20,6 +20,28 @@ import pymedphys._utilities.patient
 
 from . import api, constants
 
+# MSSQL limits a single query to 2100 parameters, so requests for many
+# values are split into batches that each comfortably fit within that limit.
+MAX_PARAMETERS_PER_QUERY = 1000
+
+
+def in_clause_batches(values, name="value", batch_size=MAX_PARAMETERS_PER_QUERY):
+    """Split values into batches of SQL ``IN (...)`` placeholders.
+
+    Yields tuples of ``(placeholders, parameters)`` where
+    ``placeholders`` is of the form ``"%(value_0)s, %(value_1)s"`` and
+    ``parameters`` is the matching dictionary to pass to
+    ``api.execute``.
+    """
+    values = list(values)
+
+    for start in range(0, len(values), batch_size):
+        batch = values[start : start + batch_size]
+        parameters = {f"{name}_{i}": value for i, value in enumerate(batch)}
+        placeholders = ", ".join(f"%({key})s" for key in parameters)
+
+        yield placeholders, parameters
+
 
 def get_treatment_times(connection, field_id):
     treatment_time_results = api.execute(
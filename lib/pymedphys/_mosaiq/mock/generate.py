@@ -46,6 +46,7 @@ def dataframe_to_sql(
     dtype=None,
     database=utilities.TEST_DB_NAME,
     if_exists="replace",
+    connection=None,
 ):
     """using a pd.DataFrame, populate a table in the configured database
 
@@ -58,8 +59,14 @@ def dataframe_to_sql(
         the column name to be used for the primary key, which is the df index
     dtype (dict or None):
         optional dictionary of sqlalchemy types for the columns
+    connection (SQLiteConnection or None):
+        optional in-process stand-in database to populate instead of the
+        MSSQL test database, in which case dtype and database are ignored
 
     """
+    if connection is not None:
+        connection.dataframe_to_sql(df, tablename, index_label, if_exists=if_exists)
+        return
 
     connection_str = (
         f"mssql+pymssql://{utilities.SA_USER}:{utilities.SA_PASSWORD}@"
@@ -106,9 +113,15 @@ def create_test_db(database=utilities.TEST_DB_NAME):
             )
 
 
-def create_mock_patients():
+def create_mock_patients(connection=None):
     """create some mock patients and populate the Patient and Ident tables
 
+    Parameters
+    ----------
+    connection : SQLiteConnection, optional
+        an in-process stand-in database to populate instead of the
+        MSSQL test database, by default None
+
     Returns
     -------
     DataFrame
@@ -134,18 +147,20 @@ def create_mock_patients():
         patient_ident_df.drop(columns=["IDA"]),
         "Patient",
         index_label="Pat_Id1",
+        connection=connection,
     )
     dataframe_to_sql(
         patient_ident_df.drop(columns=["First_Name", "Last_Name"]),
         "Ident",
         index_label="Pat_Id1",
+        connection=connection,
     )
 
     # return the combined dataframe, if need to be used for follow-on processing
     return patient_ident_df
 
 
-def create_mock_treatment_sites(patient_ident_df=None):
+def create_mock_treatment_sites(patient_ident_df=None, connection=None):
     """create mock treatment sites for the patient dataframe passed in
         or call create_mock_patients if None is passed
 
@@ -154,6 +169,9 @@ def create_mock_treatment_sites(patient_ident_df=None):
     patient_ident_df : DataFrame, optional
         the patient + ident dataframe returned by create_mock_patients
         None to call create_mock_patients first
+    connection : SQLiteConnection, optional
+        an in-process stand-in database to populate instead of the
+        MSSQL test database, by default None
 
     Returns
     -------
@@ -162,7 +180,7 @@ def create_mock_treatment_sites(patient_ident_df=None):
     """
 
     if patient_ident_df is None:
-        patient_ident_df = create_mock_patients()
+        patient_ident_df = create_mock_patients(connection=connection)
 
     # set up site to have same rows as patient_ident
     site_df = patient_ident_df.drop(columns=["First_Name", "Last_Name", "IDA"])
@@ -181,12 +199,12 @@ def create_mock_treatment_sites(patient_ident_df=None):
     site_df["Technique"] = "3-fld"
 
     # now use SQLAlchemy to populate the two tables
-    dataframe_to_sql(site_df, "Site", index_label="SIT_ID")
+    dataframe_to_sql(site_df, "Site", index_label="SIT_ID", connection=connection)
 
     return site_df
 
 
-def create_mock_treatment_fields(site_df=None):
+def create_mock_treatment_fields(site_df=None, connection=None):
     """create mock treatment sites for the site dataframe passed in
     or call create_mock_treatment_sites if None is passed
 
@@ -195,6 +213,9 @@ def create_mock_treatment_fields(site_df=None):
     site_df : DataFrame, optional
         the site dataframe that has been used to create the table
         or None to call create_mock_treatment_sites first
+    connection : SQLiteConnection, optional
+        an in-process stand-in database to populate instead of the
+        MSSQL test database, by default None
 
     Returns
     -------
@@ -203,7 +224,7 @@ def create_mock_treatment_fields(site_df=None):
     """
 
     if site_df is None:
-        site_df = create_mock_treatment_sites()
+        site_df = create_mock_treatment_sites(connection=connection)
 
     # populate a list of tx_fields, 3 for each site
     tx_fields = []
@@ -264,6 +285,7 @@ def create_mock_treatment_fields(site_df=None):
         dtype={
             "RowVers": sqlalchemy.types.BINARY(length=8),
         },
+        connection=connection,
     )
 
     txfieldpoints = []
@@ -350,12 +372,13 @@ def create_mock_treatment_fields(site_df=None):
             "Coll_Y2": sqlalchemy.types.Numeric(precision=4, scale=1),
             "RowVers": sqlalchemy.types.BINARY(length=8),
         },
+        connection=connection,
     )
 
     return txfield_df
 
 
-def create_mock_treatment_sessions(site_df=None, txfield_df=None):
+def create_mock_treatment_sessions(site_df=None, txfield_df=None, connection=None):
     """for a given site and set of tx fields, generate treatment session data
     (Dose_Hst and Offset) for randomly chosen treatment interval
 
@@ -365,13 +388,16 @@ def create_mock_treatment_sessions(site_df=None, txfield_df=None):
         the dataframe containing the Sites to be populated, by default None
     txfield_df : Pandas.DataFrame, optional
         the dataframe with the tx fields for the treatment sessions, by default None
+    connection : SQLiteConnection, optional
+        an in-process stand-in database to populate instead of the
+        MSSQL test database, by default None
     """
 
     if site_df is None:
-        site_df = create_mock_treatment_sites()
+        site_df = create_mock_treatment_sites(connection=connection)
 
     if txfield_df is None:
-        txfield_df = create_mock_treatment_fields(site_df)
+        txfield_df = create_mock_treatment_fields(site_df, connection=connection)
 
     # lists to store the offsets and dose_hst records
     offset_recs, dose_hst_recs = [], []
@@ -394,7 +420,9 @@ def create_mock_treatment_sessions(site_df=None, txfield_df=None):
         offset_count = 0
         for n in range(fractions):
             # determine the session date for the current workday
-            session_date_str = f"2021-W{session_workday//5+1}-{session_workday%5+1}"
+            session_date_str = (
+                f"2021-W{session_workday // 5 + 1}-{session_workday % 5 + 1}"
+            )
             session_date = datetime.strptime(session_date_str, "%Y-W%W-%w")
 
             # and add the appointment time
@@ -459,6 +487,7 @@ def create_mock_treatment_sessions(site_df=None, txfield_df=None):
             "FLD_ID": sqlalchemy.types.Integer(),
             "Tx_DtTm": sqlalchemy.types.DateTime(),
         },
+        connection=connection,
     )
 
     offset_df = pd.DataFrame(
@@ -489,4 +518,234 @@ def create_mock_treatment_sessions(site_df=None, txfield_df=None):
             "Lateral_Offset": sqlalchemy.types.Numeric(precision=6, scale=1),
             "Version": sqlalchemy.types.Integer(),
         },
+        connection=connection,
+    )
+
+
+def create_mock_department(
+    connection=None,
+    number_of_patients=200,
+    fields_per_site=4,
+    control_points_per_field=180,
+    fractions=25,
+    number_of_machines=4,
+    number_of_leaf_pairs=80,
+    seed=0,
+):
+    """create a synthetic department sized dataset, intended for benchmarking
+
+    Each patient is given a single VMAT site that is treated daily on
+    one of the mock machines. The Patient, Ident, Staff, Site, TxField,
+    TxFieldPoint, Dose_Hst, TrackTreatment and Offset tables are
+    populated.
+
+    Parameters
+    ----------
+    connection : SQLiteConnection, optional
+        an in-process stand-in database to populate instead of the
+        MSSQL test database, by default None
+    number_of_patients : int, optional
+        by default 200
+    fields_per_site : int, optional
+        by default 4
+    control_points_per_field : int, optional
+        by default 180
+    fractions : int, optional
+        by default 25
+    number_of_machines : int, optional
+        by default 4
+    number_of_leaf_pairs : int, optional
+        by default 80
+    seed : int, optional
+        the seed for the random number generator, by default 0
+
+    Returns
+    -------
+    dict
+        a dictionary mapping each table name to the dataframe that was
+        used to populate that table
+    """
+    rng = np.random.default_rng(seed)
+
+    patient_index = np.arange(number_of_patients)
+    pat_id1 = patient_index + 10001
+    sit_set_id = patient_index + 1
+    machine_id = patient_index % number_of_machines + 1
+
+    patient_df = pd.DataFrame(
+        {
+            "First_Name": [f"Patient{i}" for i in patient_index],
+            "Last_Name": "MOCK",
+        },
+        index=pat_id1,
+    )
+    ident_df = pd.DataFrame(
+        {"IDA": [f"MR{9000 + i}" for i in patient_index]}, index=pat_id1
+    )
+
+    staff_df = pd.DataFrame(
+        {
+            "Last_Name": [f"LINAC{i}" for i in range(1, number_of_machines + 1)],
+            "Type": "Location",
+        },
+        index=np.arange(1, number_of_machines + 1),
+    )
+
+    site_df = pd.DataFrame(
+        {
+            "Site_Name": "rx1",
+            "Pat_ID1": pat_id1,
+            "SIT_SET_ID": sit_set_id,
+            "Fractions": fractions,
+            "Notes": "daily",
+            "Technique": "vmat",
+        },
+        index=sit_set_id,
+    )
+
+    field_site_index = np.repeat(patient_index, fields_per_site)
+    field_number = np.tile(np.arange(1, fields_per_site + 1), number_of_patients)
+    number_of_fields = len(field_site_index)
+    fld_id = np.arange(1, number_of_fields + 1)
+
+    txfield_df = pd.DataFrame(
+        {
+            "Field_Label": [f"1-{i}" for i in field_number],
+            "Field_Name": [f"ARC{i}" for i in field_number],
+            "Version": 0,
+            "Meterset": rng.uniform(100, 600, number_of_fields).round(1),
+            "Type_Enum": 13,  # VMAT
+            "Pat_ID1": pat_id1[field_site_index],
+            "SIT_SET_ID": sit_set_id[field_site_index],
+            "Machine_ID_Staff_ID": machine_id[field_site_index],
+        },
+        index=fld_id,
+    )
+
+    # alternate between clockwise and counter-clockwise arcs
+    bipolar_gantry = np.linspace(-179, 179, control_points_per_field)
+    clockwise_gantry = np.mod(bipolar_gantry, 360)
+    counter_clockwise_gantry = clockwise_gantry[::-1]
+    gantry = np.where(
+        (field_number % 2 == 1)[:, None], clockwise_gantry, counter_clockwise_gantry
+    ).ravel()
+
+    number_of_points = number_of_fields * control_points_per_field
+    leaf_centres = rng.integers(-500, 500, (number_of_points, number_of_leaf_pairs))
+    leaf_gaps = rng.integers(0, 400, (number_of_points, number_of_leaf_pairs))
+    a_leaf_set = (leaf_centres + leaf_gaps // 2).astype("<i2")
+    b_leaf_set = (leaf_gaps // 2 - leaf_centres).astype("<i2")
+
+    txfieldpoint_df = pd.DataFrame(
+        {
+            "FLD_ID": np.repeat(fld_id, control_points_per_field),
+            "Point": np.tile(np.arange(control_points_per_field), number_of_fields),
+            "Index": np.tile(
+                np.linspace(0, 100, control_points_per_field), number_of_fields
+            ),
+            "A_Leaf_Set": [row.tobytes() for row in a_leaf_set],
+            "B_Leaf_Set": [row.tobytes() for row in b_leaf_set],
+            "Gantry_Ang": gantry,
+            "Coll_Ang": 10.0,
+            "Coll_Y1": 5.0,
+            "Coll_Y2": 5.0,
+        },
+        index=np.arange(1, number_of_points + 1),
     )
+
+    # each patient is treated on consecutive days at an appointment slot
+    # on their machine, starting on one of the first twenty days
+    first_day = datetime(2021, 3, 1)
+    start_day = rng.integers(0, 20, number_of_patients)
+    appointment_slot = patient_index // number_of_machines
+    appointment_time = timedelta(hours=8) + appointment_slot * timedelta(minutes=15)
+
+    dose_hst_recs, track_treatment_recs, offset_recs = [], [], []
+    for i in patient_index:
+        site_fld_ids = fld_id[field_site_index == i]
+        for fraction in range(fractions):
+            session_time = (
+                first_day + timedelta(days=int(start_day[i]) + fraction)
+            ) + appointment_time[i]
+
+            # portal image offset acquired just prior to treatment
+            offset_recs.append(
+                (
+                    sit_set_id[i],
+                    session_time - timedelta(minutes=2),
+                    2,  # Offset_State: 1=Active, 2=Complete
+                    3,  # Offset_Type: 2=Localization, 3=Portal, 4=ThirdParty
+                    *rng.normal(0, 0.3, 3).round(1),
+                )
+            )
+
+            for field_id in site_fld_ids:
+                beam_start = session_time
+                session_time += timedelta(minutes=2)
+                dose_hst_recs.append(
+                    (pat_id1[i], sit_set_id[i], field_id, session_time)
+                )
+                track_treatment_recs.append(
+                    (
+                        pat_id1[i],
+                        field_id,
+                        sit_set_id[i],
+                        machine_id[i],
+                        beam_start,
+                        session_time,
+                        False,  # WasQAMode
+                        True,  # WasBeamComplete
+                    )
+                )
+
+    dose_hst_df = pd.DataFrame(
+        dose_hst_recs, columns=["Pat_ID1", "SIT_ID", "FLD_ID", "Tx_DtTm"]
+    )
+    dose_hst_df.index += 1
+
+    track_treatment_df = pd.DataFrame(
+        track_treatment_recs,
+        columns=[
+            "Pat_ID1",
+            "FLD_ID",
+            "SIT_ID",
+            "Machine_ID_Staff_ID",
+            "Create_DtTm",
+            "Edit_DtTm",
+            "WasQAMode",
+            "WasBeamComplete",
+        ],
+    )
+    track_treatment_df.index += 1
+
+    offset_df = pd.DataFrame(
+        offset_recs,
+        columns=[
+            "SIT_SET_ID",
+            "Study_DtTm",
+            "Offset_State",
+            "Offset_Type",
+            "Superior_Offset",
+            "Anterior_Offset",
+            "Lateral_Offset",
+        ],
+    )
+    offset_df["Version"] = 0
+    offset_df.index += 1
+
+    tables = {
+        "Patient": (patient_df, "Pat_ID1"),
+        "Ident": (ident_df, "Pat_ID1"),
+        "Staff": (staff_df, "Staff_ID"),
+        "Site": (site_df, "SIT_ID"),
+        "TxField": (txfield_df, "FLD_ID"),
+        "TxFieldPoint": (txfieldpoint_df, "TFP_ID"),
+        "Dose_Hst": (dose_hst_df, "DHS_ID"),
+        "TrackTreatment": (track_treatment_df, "TTX_ID"),
+        "Offset": (offset_df, "OFF_ID"),
+    }
+
+    for tablename, (df, index_label) in tables.items():
+        dataframe_to_sql(df, tablename, index_label=index_label, connection=connection)
+
+    return {tablename: df for tablename, (df, _) in tables.items()}
@@ -0,0 +1,166 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""An in-process SQLite stand-in for the Mosaiq MSSQL test database.
+
+This allows the Mosaiq code paths to be exercised, and benchmarked,
+without a running MSSQL server. Only the subset of T-SQL that is used
+within ``pymedphys._mosaiq`` is translated.
+"""
+
+import re
+import sqlite3
+from datetime import datetime, timedelta
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+
+from ..connect import Connection, Cursor
+
+_PARAMETER = re.compile(r"%\((\w+)\)[sd]")
+_DATEADD = re.compile(r"DATEADD\(\s*(\w+)\s*,", re.IGNORECASE)
+_SET_OPTION = re.compile(r"^\s*SET\s+\w+\s+\S+\s*$", re.IGNORECASE | re.MULTILINE)
+_ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}T")
+_KEY_COLUMN = re.compile(r"_ID\d?$", re.IGNORECASE)
+_STORED_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d{1,6})?$")
+
+
+# Datetimes are stored as ISO 8601 text so that they sort, and compare
+# against query parameters, the same way as they would within MSSQL.
+# They are converted by this module, rather than by adapters and
+# converters registered with sqlite3, as those apply to every sqlite3
+# connection within the process.
+def _datetime_to_str(value: datetime) -> str:
+    return value.isoformat(sep=" ")
+
+
+def _datetimes_to_str(df: "pd.DataFrame") -> "pd.DataFrame":
+    def _convert(value):
+        if value is pd.NaT:
+            return None
+        if isinstance(value, datetime):
+            return _datetime_to_str(value)
+
+        return value
+
+    converted = {
+        column: df[column].map(_convert).astype(object)
+        for column in df.columns
+        if pd.api.types.is_datetime64_any_dtype(df[column])
+        or (
+            df[column].dtype == object
+            and df[column].map(lambda value: isinstance(value, datetime)).any()
+        )
+    }
+
+    return df.assign(**converted)
+
+
+def _convert_result(value):
+    if isinstance(value, str) and _STORED_DATETIME.match(value):
+        return datetime.fromisoformat(value)
+
+    return value
+
+
+def _dateadd(unit: str, number: float, date: str) -> str:
+    shifted = datetime.fromisoformat(str(date)) + timedelta(**{f"{unit}s": number})
+
+    return _datetime_to_str(shifted)
+
+
+def translate_query(query: str) -> str:
+    """Translate a pymssql T-SQL query into its SQLite equivalent."""
+    query = _SET_OPTION.sub("", query)
+    query = _PARAMETER.sub(r":\1", query)
+    query = _DATEADD.sub(r"DATEADD('\1',", query)
+
+    return query
+
+
+def _adapt_parameter(value):
+    if isinstance(value, datetime):
+        return _datetime_to_str(value)
+
+    if isinstance(value, np.datetime64):
+        value = str(value)
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    # MSSQL accepts both "T" and " " separated ISO datetimes, normalise
+    # to the form that the datetimes are stored in.
+    if isinstance(value, str) and _ISO_DATETIME.match(value):
+        return value.replace("T", " ", 1)
+
+    return value
+
+
+class SQLiteConnection(Connection):
+    """A Mosaiq DB Connection object backed by an SQLite database.
+
+    Can be used anywhere a ``pymedphys.mosaiq.Connection`` is expected.
+    """
+
+    def __init__(  # pylint: disable = super-init-not-called
+        self, database: str = ":memory:"
+    ):
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._connection.create_function("DATEADD", 3, _dateadd, deterministic=True)
+
+    def cursor(self) -> "SQLiteCursor":
+        return SQLiteCursor(self._connection)
+
+    def dataframe_to_sql(
+        self, df: "pd.DataFrame", tablename, index_label, if_exists="replace"
+    ):
+        """Populate a table within this database from a pd.DataFrame.
+
+        Similar to Mosaiq itself, each of the ID columns is indexed so
+        that joins and lookups by ID do not require a full table scan.
+        """
+        _datetimes_to_str(df).to_sql(
+            tablename,
+            con=self._connection,
+            if_exists=if_exists,
+            index=True,
+            index_label=index_label,
+        )
+
+        for column in df.columns:
+            if _KEY_COLUMN.search(column):
+                self._connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS "ix_{tablename}_{column}" '
+                    f'ON "{tablename}" ("{column}")'
+                )
+
+        self._connection.commit()
+
+
+class SQLiteCursor(Cursor):
+    """A Mosaiq DB Cursor object backed by an SQLite database."""
+
+    def execute(self, query: str, parameters: dict | None = None):
+        if parameters is None:
+            parameters = {}
+
+        parameters = {key: _adapt_parameter(value) for key, value in parameters.items()}
+        self._cursor.execute(translate_query(query), parameters)
+
+    def fetchall(self) -> list[tuple]:
+        return [
+            tuple(_convert_result(value) for value in row)
+            for row in self._cursor.fetchall()
+        ]
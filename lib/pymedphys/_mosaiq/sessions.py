@@ -16,12 +16,11 @@
 """Uses Mosaiq SQL to extract patient sessions and offsets."""
 
 from datetime import datetime, timedelta
-from typing import Iterator, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pymedphys._imports import numpy as np
-from pymedphys._imports import sklearn
 
-from . import api
+from . import api, helpers
 from .connect import Connection
 
 
@@ -30,8 +29,10 @@ def cluster_sessions(
 ) -> Iterator[Tuple[int, datetime, datetime]]:
     """Clusters a list of datetime objects representing tx beam delivery times
 
-    Uses the scikit-learn hierarchical clustering algorithm
-    (AgglomerativeClustering) to cluster the dose_hst datetimes
+    Equivalent to single linkage hierarchical clustering of the dose_hst
+    datetimes. As the datetimes are sorted and one dimensional this
+    reduces to splitting the sequence wherever the gap between
+    consecutive datetimes is at least ``interval``.
 
     Parameters
     ----------
@@ -66,42 +67,25 @@ def cluster_sessions(
     datetime.datetime(2019, 12, 19, 10, 0),
     datetime.datetime(2019, 12, 19, 12, 0))]
     """
+    if len(tx_datetimes) == 0:
+        return
+
     # turn the datetimes in to timestamps (seconds in the epoch)
-    timestamps = [[tx_datetime.timestamp()] for tx_datetime in tx_datetimes]
+    timestamps = np.array([tx_datetime.timestamp() for tx_datetime in tx_datetimes])
 
-    # set up the cluster algorithm
-    cluster_algo = sklearn.cluster.AgglomerativeClustering(
-        n_clusters=None, distance_threshold=interval.seconds, linkage="single"
-    )
+    # a new session starts after every gap of at least the interval
+    session_boundaries = np.flatnonzero(np.diff(timestamps) >= interval.seconds)
+    session_starts = np.concatenate([[0], session_boundaries + 1])
+    session_ends = np.concatenate([session_boundaries, [len(timestamps) - 1]])
 
-    # and fit the timestamps to clusters
-    labels = cluster_algo.fit_predict(timestamps)
-
-    # the resulting labels are arbitrary, so iterate and collect
-    #   all of the datetimes for each label
-    current_label, current_session_number = labels[0], 1
-    start_session = datetime.fromtimestamp(timestamps[0][0])
-    end_session = start_session
-
-    # now iterate through the labels and timestamps,
-    #   extracting each session
-    for label, timestamp in zip(labels, timestamps):
-        if label != current_label:
-            # we have a new label, so yield the current session
-            yield (current_session_number, start_session, end_session)
-
-            # and update session stats for the next one
-            current_session_number += 1
-            current_label = label
-            start_session = datetime.fromtimestamp(timestamp[0])
-            end_session = start_session
-        else:
-            # if the same label, then just update the end_session
-            #   for the new timestamp
-            end_session = datetime.fromtimestamp(timestamp[0])
-
-    # yield the final session
-    yield (current_session_number, start_session, end_session)
+    for session_number, (start, end) in enumerate(
+        zip(session_starts, session_ends), start=1
+    ):
+        yield (
+            session_number,
+            datetime.fromtimestamp(timestamps[start]),
+            datetime.fromtimestamp(timestamps[end]),
+        )
 
 
 def sessions_for_site(
@@ -146,6 +130,62 @@ def sessions_for_site(
     return cluster_sessions(dose_hst_datetimes)
 
 
+def sessions_for_sites(
+    connection: Connection, sit_set_ids: Iterable[int]
+) -> Dict[int, List[Tuple[int, datetime, datetime]]]:
+    """Determines the sessions for many sites (by SIT_SET_ID) at once
+
+    Equivalent to calling sessions_for_site for each site, however the
+    Dose_Hst.Tx_DtTm for all of the sites are retrieved within a single
+    query.
+
+    Parameters
+    ----------
+    connection : pymssql connection opened with pymedphys.mosaiq.connect
+
+    sit_set_ids : Iterable[int]
+        the SIT_SET_IDs for the sites of interest
+
+    Returns
+    -------
+    dictionary mapping each SIT_SET_ID to its list of session tuples,
+        same format as returned by cluster_sessions. Sites without any
+        Dose_Hst records map to an empty list.
+    """
+    sit_set_ids = list(sit_set_ids)
+
+    result = []
+    for placeholders, parameters in helpers.in_clause_batches(
+        sit_set_ids, "sit_set_id"
+    ):
+        result += api.execute(
+            connection,
+            f"""
+            SELECT
+                Site.SIT_SET_ID,
+                Tx_DtTm
+            FROM Dose_Hst
+            INNER JOIN
+                Site ON Site.SIT_ID = Dose_Hst.SIT_ID
+            WHERE
+                Site.SIT_SET_ID IN ({placeholders})
+            ORDER BY Site.SIT_SET_ID, Dose_Hst.Tx_DtTm
+            """,
+            parameters,
+        )
+
+    dose_hst_datetimes: Dict[int, List[datetime]] = {
+        sit_set_id: [] for sit_set_id in sit_set_ids
+    }
+    for sit_set_id, tx_datetime in result:
+        dose_hst_datetimes[sit_set_id].append(tx_datetime)
+
+    return {
+        sit_set_id: list(cluster_sessions(datetimes))
+        for sit_set_id, datetimes in dose_hst_datetimes.items()
+    }
+
+
 def session_offsets_for_site(
     connection: Connection, sit_set_id: int, interval=timedelta(hours=1)
 ) -> Iterator[Tuple[int, Optional["np.ndarray"]]]:
@@ -215,6 +255,98 @@ def session_offsets_for_site(
             yield (session_num, None)
 
 
+def session_offsets_for_sites(
+    connection: Connection, sit_set_ids: Iterable[int], interval=timedelta(hours=1)
+) -> Dict[int, List[Tuple[int, Optional["np.ndarray"]]]]:
+    """extract the session offsets for many sites at once
+
+    Equivalent to calling session_offsets_for_site for each site, however
+    only two queries are issued (one for the sessions and one for the
+    offsets) instead of one query per session. This allows session
+    offset analytics to be run across a whole department.
+
+    Parameters
+    ----------
+    connection : pymssql connection opened with pymedphys.mosaiq.connect
+
+    sit_set_ids : Iterable[int]
+        the SIT_SET_IDs for the sites of interest
+
+    interval : timedelta
+        the interval before the session to look for the offset
+        (Offset.Study_DtTm can precede the Dose_Hst records
+        for the session)
+
+    Returns
+    -------
+    dictionary mapping each SIT_SET_ID to a list of tuples,
+        same format as generated by session_offsets_for_site
+    """
+    sit_set_ids = list(sit_set_ids)
+    sessions = sessions_for_sites(connection, sit_set_ids)
+
+    result = []
+    for placeholders, parameters in helpers.in_clause_batches(
+        sit_set_ids, "sit_set_id"
+    ):
+        result += api.execute(
+            connection,
+            f"""
+            SELECT
+                Offset.SIT_SET_ID,
+                Study_DtTm,
+                Superior_Offset,
+                Anterior_Offset,
+                Lateral_Offset
+            FROM Offset
+            WHERE
+                Version = 0
+                AND Offset.Offset_State IN (1,2) -- active/complete offsets
+                AND Offset.Offset_Type IN (3,4) -- Portal/ThirdParty offsets
+                AND Offset.SIT_SET_ID IN ({placeholders})
+            ORDER BY Offset.SIT_SET_ID, Study_DtTm
+            """,
+            parameters,
+        )
+
+    offset_rows: Dict[int, list] = {sit_set_id: [] for sit_set_id in sit_set_ids}
+    for row in result:
+        offset_rows[row[0]].append(row[1:])
+
+    session_offsets: Dict[int, List[Tuple[int, Optional["np.ndarray"]]]] = {}
+    for sit_set_id, site_sessions in sessions.items():
+        rows = offset_rows[sit_set_id]
+        study_datetimes = np.array([row[0] for row in rows], dtype="datetime64[us]")
+        translations = np.array([row[1:4] for row in rows])
+
+        site_offsets: List[Tuple[int, Optional["np.ndarray"]]] = []
+        for session_num, start_session, end_session in site_sessions:
+            # match the minute resolution of the window used within
+            # session_offsets_for_site
+            window_start = np.datetime64(
+                (start_session - interval).replace(second=0, microsecond=0), "us"
+            )
+            window_end = np.datetime64(
+                end_session.replace(second=0, microsecond=0), "us"
+            )
+
+            # just take the first offset within the window, for now
+            first_after_start = np.searchsorted(
+                study_datetimes, window_start, side="right"
+            )
+            if (
+                first_after_start < len(study_datetimes)
+                and study_datetimes[first_after_start] < window_end
+            ):
+                site_offsets.append((session_num, translations[first_after_start]))
+            else:
+                site_offsets.append((session_num, None))
+
+        session_offsets[sit_set_id] = site_offsets
+
+    return session_offsets
+
+
 def mean_session_offset_for_site(
     connection: Connection, sit_set_id: int
 ) -> Optional["np.ndarray"]:
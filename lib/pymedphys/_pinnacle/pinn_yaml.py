@@ -38,43 +38,170 @@
 # SOFTWARE.
 
 
+import functools
 import re
 
+from pymedphys._imports import numpy as np
 from pymedphys._imports import yaml
 
+# Plain scalars which YAML would resolve to a decimal int or float. Any
+# other value is handed to YAML itself, so that the rarer forms (octal
+# ints, booleans, nulls, timestamps, escaped strings) resolve as before.
+INT_PATTERN = re.compile(r"[-+]?(?:0|[1-9][0-9]*)\Z")
+FLOAT_PATTERN = re.compile(r"[-+]?[0-9]+\.[0-9]*(?:[eE][-+][0-9]+)?\Z")
+
 
 def pinn_to_dict(filename):
-    result = None
+    """Read a Pinnacle text file, such as ``plan.Trial`` or ``Patient``,
+    into dictionaries and lists.
+
+    The file is parsed within a single pass over its lines. Objects
+    (``Name ={ ... };``) become dictionaries, objects whose name ends
+    with ``List`` or ``Array`` become lists, and assignments
+    (``Key = value;``) become entries with their value typed the same
+    as the YAML conversion this parser replaced. Objects holding bare
+    comma separated numbers, such as ``Points[] ={ ... };``, become a
+    one dimensional float array.
+
+    Parameters
+    ----------
+    filename : str or pathlib.Path
+        The Pinnacle text file to read.
+
+    Returns
+    -------
+    result : dict, list or None
+        The contents of the file. If the file contains several top
+        level objects of the same name, as a ``plan.Trial`` with more
+        than one trial does, a list of those objects is returned
+        instead. None is returned for a file without any content.
+    """
     with open(filename, encoding="ISO-8859-1", errors="ignore") as fp:
-        data = fp.readlines()
+        entries = list(_parse_entries(_content_lines(fp)))
+
+    if not entries:
+        return None
+
+    first_key = entries[0][0]
+    segments = [value for key, value in entries if key == first_key]
+
+    # Split data into segments if the first object appears more than once.
+    # Useful for plan.Trial files with more than one Trial
+    if len(segments) > 1:
+        return segments
+
+    return dict(entries)
+
+
+def _content_lines(fp):
+    """Yields the stripped lines of a Pinnacle file, skipping blank lines
+    and comments, and dropping any trailing semicolon."""
+    in_comment = False
+    for line in fp:
+        line = line.strip()
+
+        if in_comment or line.startswith("/*"):
+            in_comment = "*/" not in line
+            continue
+
+        if line.endswith(";"):
+            line = line[:-1]
+
+        if line:
+            yield line
+
+
+def _parse_entries(lines):
+    """Yields the ``(key, value)`` entries of an object until its closing
+    brace. Bare lines, such as those of a point array, are yielded with
+    a key of None.
+    """
+    for line in lines:
+        if line[0] == "}":
+            return
+
+        if line.endswith(" ={"):
+            key = line[:-3].rstrip()
+            yield key, _parse_object(key, lines)
+        elif " = " in line:
+            key, value = line.split(" = ", 1)
+            yield key.rstrip(), _parse_scalar(value.strip())
+        elif line.endswith(" ="):
+            yield line[:-2].rstrip(), None
+        else:
+            yield None, line
 
-        # Split data into smaller chunks, if first line appears more than one
-        # Useful for plan.Trial files with more than one Trial
-        first_line = data[0]
-        indices = [i for i, line in enumerate(data) if line == first_line]
 
-        for i, _ in enumerate(indices):
-            next_index = -1
+def _parse_object(name, lines):
+    entries = list(_parse_entries(lines))
 
-            if i + 1 < len(indices):
-                next_index = indices[i + 1]
+    if name.endswith(("Array", "List")):
+        return [_list_item(key, value) for key, value in entries]
 
-                # If there are multiple segments, return list, otherwise just the dict
-                if not isinstance(result, list):
-                    result = []
+    if not entries:
+        return None
 
-            split_data = data[indices[i] : next_index]
+    if entries[0][0] is None:
+        return _parse_points([line for key, line in entries if key is None])
 
-            if isinstance(result, list):
-                d = yaml.safe_load(convert_to_yaml(split_data))
-                result.append(d[list(d.keys())[0]])
-            else:
-                result = yaml.safe_load(convert_to_yaml(split_data))
+    return dict(entries)
 
-    return result
+
+def _list_item(key, value):
+    # Each item of a list is a dictionary containing the item's name as a
+    # key (with no value) alongside the item's own entries. Items named
+    # with a leading '#', such as the '#0' of a ControlPointList, are the
+    # item's entries alone.
+    if key is None:
+        return _parse_scalar(value)
+
+    if key.startswith("#"):
+        return value
+
+    if isinstance(value, dict):
+        return {key: None, **value}
+
+    return {key: value}
+
+
+def _parse_points(lines):
+    text = " ".join(lines)
+
+    try:
+        return np.array(text.replace(",", " ").split(), dtype=float)
+    except ValueError:
+        return _parse_scalar(text)
+
+
+def _parse_scalar(value):
+    if INT_PATTERN.match(value):
+        return int(value)
+
+    if FLOAT_PATTERN.match(value):
+        return float(value)
+
+    if (
+        len(value) > 1
+        and value[0] == value[-1] == '"'
+        and '"' not in value[1:-1]
+        and "\\" not in value
+    ):
+        return value[1:-1]
+
+    return _parse_yaml_scalar(value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_yaml_scalar(value):
+    return yaml.safe_load(value)
 
 
 def convert_to_yaml(data):
+    """Convert the lines of a Pinnacle text file to YAML.
+
+    This was the means by which :func:`pinn_to_dict` read Pinnacle files
+    and is kept for those reading the YAML directly.
+    """
     out = ""
     listIndents = []
     in_comment = False
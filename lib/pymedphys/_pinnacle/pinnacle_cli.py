@@ -38,13 +38,45 @@
 # SOFTWARE.
 
 
+import concurrent.futures
+import contextlib
+import json
 import logging
 import os
+import re
+import shutil
 import sys
 import tarfile
 import tempfile
+import traceback
 
 from .pinnacle import PinnacleExport
+from .pinnacle_plan import PinnaclePlan
+
+MODALITIES = ["CT", "RTSTRUCT", "RTDOSE", "RTPLAN"]
+
+# Exports of an image series, rather than of a plan's modality, are
+# identified by this prefix followed by the series UID
+IMAGE_ITEM_PREFIX = "IMAGE:"
+
+# The files read by the export. Those holding image pixel data and dose
+# are only needed when images or RTDOSE are exported.
+PLAN_FILES = {
+    "plan.Trial",
+    "plan.Points",
+    "plan.PatientSetup",
+    "plan.Pinnacle.Machines",
+}
+IMAGE_HEADER_PATTERN = re.compile(r"ImageSet_\d+\.(?:header|ImageInfo|ImageSet)")
+
+# Characters, of an MRN or patient path, replaced when naming a
+# patient's output directory
+UNSAFE_NAME_PATTERN = re.compile(r"[^A-Za-z0-9._-]+")
+IMAGE_DATA_PATTERN = re.compile(r"ImageSet_\d+\.(?:img|DICOM)")
+
+# Reject archive members which would be extracted outside of the
+# extraction directory, where this version of Python supports it
+EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
 
 
 def export_cli(args):
@@ -61,105 +93,485 @@ def export_cli(args):
     image_series = args.image
     uid_prefix = args.uid_prefix
     roiskip = args.roiskip
+    jobs = args.jobs
 
-    input_path = args.input_path
+    input_paths = args.input_path
     MRN_flag = args.mrn
 
     # Create a logger to std out for cli
+    logger = configure_logger(verbose)
+
+    # If no modality given, export all modalities
+    if len(modality) == 0:
+        modality = MODALITIES
+
+    if not list_available:
+        # We are exporting something, so make sure the output_directory
+        # was specified
+        if not output_directory:
+            logger.error("Specifiy an output directory with -o")
+            sys.exit()
+
+        if uid_prefix and not PinnaclePlan.is_prefix_valid(uid_prefix):
+            logger.error("UID Prefix supplied is invalid")
+            sys.exit()
+
+        logger.info("Will export modalities: %s", modality)
+
+    options = {
+        "modality": sorted(modality),
+        "plan": plan_name,
+        "trial": trial,
+        "image": image_series,
+        "uid_prefix": uid_prefix,
+        "roiskip": roiskip,
+    }
+    manifest = ExportManifest(args.manifest, options)
+
+    def is_needed(name):
+        if list_available:
+            return archive_member_is_needed(name, [], False)
+
+        return archive_member_is_needed(
+            name, modality, "CT" in modality or image_series
+        )
+
+    failed = False
+    patient_directory_names = set()
+    with contextlib.ExitStack() as stack:
+        executor = None
+        if jobs > 1:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(
+                    max_workers=jobs, initializer=configure_logger, initargs=(verbose,)
+                )
+            )
+            stack.callback(executor.shutdown, wait=True, cancel_futures=True)
+
+        # Exports yet to complete, along with the input that they are from
+        pending = {}
+        inputs_in_progress = []
+
+        def record_completed(completed_futures):
+            nonlocal failed
+            for future in completed_futures:
+                source, task = pending.pop(future)
+                error = future.result()
+                failed = _record_export(manifest, source, task, error, logger) or failed
+
+                source["outstanding"] -= 1
+                if source["outstanding"] == 0:
+                    _finish_input(manifest, source, logger)
+                    inputs_in_progress.remove(source)
+
+        for input_path in input_paths:
+            if manifest.is_exported(input_path):
+                logger.info("Already exported, skipping: %s", input_path)
+                continue
+
+            source = _open_input(input_path, is_needed, logger)
+            if source is None:
+                continue
+
+            if list_available:
+                for patient_path in source["patient_paths"]:
+                    _log_available(patient_path, logger)
+
+                _finish_input(manifest, source, logger, record=False)
+                continue
+
+            tasks = []
+            separate_patients = len(input_paths) > 1 or len(source["patient_paths"]) > 1
+            for patient_path in source["patient_paths"]:
+                patient = os.path.relpath(patient_path, source["root"])
+                patient_tasks = _patient_tasks(
+                    patient_path,
+                    patient,
+                    output_directory,
+                    options,
+                    separate_patients,
+                    MRN_flag,
+                    patient_directory_names,
+                    logger,
+                )
+                if patient_tasks is None:
+                    source["failed"] = True
+                    continue
+
+                tasks += [
+                    task
+                    for task in patient_tasks
+                    if not manifest.is_exported(input_path, patient, task["item"])
+                ]
+
+            source["outstanding"] = len(tasks)
+            if not tasks:
+                _finish_input(manifest, source, logger)
+                continue
+
+            inputs_in_progress.append(source)
+            for task in tasks:
+                if executor is None:
+                    error = _export_item_or_return_error(task)
+                    failed = (
+                        _record_export(manifest, source, task, error, logger) or failed
+                    )
+                else:
+                    pending[executor.submit(_export_item_or_return_error, task)] = (
+                        source,
+                        task,
+                    )
+
+            if executor is None:
+                _finish_input(manifest, source, logger)
+                inputs_in_progress.remove(source)
+
+            # Only extract the next archive once there are no more inputs
+            # being exported than there are processes to export them, so
+            # that extracted archives don't accumulate on disk
+            while len(inputs_in_progress) > jobs:
+                completed, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                record_completed(completed)
+
+        record_completed(concurrent.futures.as_completed(list(pending)))
+
+    if failed:
+        sys.exit(1)
+
+
+def configure_logger(verbose):
+    """Configure the logger of the cli, logging to std out.
+
+    This is also the initializer of each process exporting in parallel.
+    """
     log_level = logging.INFO
     logger = logging.getLogger(__name__)
     if verbose:
         log_level = logging.DEBUG
     logger.setLevel(log_level)
 
-    ch = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-    ch.setFormatter(formatter)
-    ch.setLevel(log_level)
-    logger.addHandler(ch)
+    if not logger.handlers:
+        ch = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+        ch.setFormatter(formatter)
+        ch.setLevel(log_level)
+        logger.addHandler(ch)
+
+    return logger
+
+
+def archive_member_is_needed(name, modality, export_images):
+    """Determine whether a member of a Pinnacle TAR archive is read when
+    exporting the given modalities.
+
+    Parameters
+    ----------
+    name : str
+        The name of the archive member.
+    modality : list of str
+        The modalities to be exported.
+    export_images : bool
+        Whether image series, the primary image of a plan included, are
+        to be exported.
+
+    Returns
+    -------
+    is_needed : bool
+        True if the member should be extracted.
+    """
+    # Need to filter out files containing ":" for Windows
+    if ":" in name:
+        return False
+
+    parts = name.split("/")
+    filename = parts[-1]
+
+    if (
+        filename == "Patient"
+        or filename in PLAN_FILES
+        or IMAGE_HEADER_PATTERN.fullmatch(filename)
+    ):
+        return True
+
+    if filename == "plan.roi":
+        return "RTSTRUCT" in modality
+
+    if filename.startswith("plan.Trial.binary."):
+        return "RTDOSE" in modality
+
+    # The pixel data of an image set, held either within an '.img' file
+    # or within a '.DICOM' directory of files
+    if any(IMAGE_DATA_PATTERN.fullmatch(part) for part in parts):
+        return bool(export_images)
+
+    return False
+
+
+def extract_archive(archive_path, extract_directory, is_needed):
+    """Extract the needed members of a TAR archive.
+
+    The archive is read as a stream, from start to end, extracting each
+    needed member as it is reached.
+
+    Parameters
+    ----------
+    archive_path : str
+        The TAR archive, which may be compressed.
+    extract_directory : str
+        The directory to extract the members to.
+    is_needed : callable
+        Given the name of an archive member, returns whether it should
+        be extracted.
+
+    Returns
+    -------
+    number_extracted : int
+        The number of members extracted.
+    """
+    number_extracted = 0
+    with tarfile.open(archive_path, "r|*") as tar:
+        for member in tar:
+            if member.isfile() and is_needed(member.name):
+                tar.extract(member, path=extract_directory, **EXTRACT_KWARGS)
+                number_extracted += 1
+
+    return number_extracted
+
+
+def find_patient_directories(path):
+    """Find the Pinnacle Patient directories (directories containing a
+    'Patient' file) within a directory.
+
+    Parameters
+    ----------
+    path : str
+        Either a Patient directory, or a directory containing Patient
+        directories at any depth.
+
+    Returns
+    -------
+    patient_directories : list of str
+        The Patient directories found, sorted by path.
+    """
+    if os.path.isfile(os.path.join(path, "Patient")):
+        return [path]
 
-    # If no modality given, export all modalities
-    if len(modality) == 0:
-        modality = ["CT", "RTSTRUCT", "RTDOSE", "RTPLAN"]
+    return sorted(root for root, _, files in os.walk(path) if "Patient" in files)
 
-    # If a TAR archive was supplied, extract it and determine the path
-    # to the patient directory
+
+class ExportManifest:
+    """A record of the exports completed by the cli, so that an export that
+    was interrupted can be resumed.
+
+    Each export is appended to the manifest file as a line of JSON as
+    soon as it completes. Exports recorded with different options, such
+    as a different plan or modalities, are not considered completed.
+
+    Parameters
+    ----------
+    path : str or None
+        The manifest file, which is created if it doesn't exist. If None,
+        nothing is recorded.
+    options : dict
+        The export options, recorded alongside each export.
+    """
+
+    def __init__(self, path, options):
+        self._path = path
+        self._options = options
+        self._exported = set()
+
+        if path is None or not os.path.exists(path):
+            return
+
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line left incomplete by an interrupted export
+                    continue
+
+                if record["options"] == options and record["status"] == "exported":
+                    self._exported.add(
+                        (record["input"], record.get("patient"), record.get("item"))
+                    )
+
+    def is_exported(self, input_path, patient=None, item=None):
+        """Whether an input, or an item of one of its patients, has already
+        been exported.
+
+        Parameters
+        ----------
+        input_path : str
+            The patient directory, directory of patients, or TAR archive.
+        patient : str, optional
+            The patient directory, relative to the input. If not given,
+            whether every patient of the input has been exported.
+        item : str, optional
+            The modality or image series exported.
+        """
+        return (os.path.abspath(input_path), patient, item) in self._exported
+
+    def record(self, status, input_path, patient=None, item=None, error=None):
+        """Append an export to the manifest.
+
+        Parameters
+        ----------
+        status : str
+            Either 'exported' or 'failed'.
+        input_path : str
+            The patient directory, directory of patients, or TAR archive.
+        patient : str, optional
+            The patient directory, relative to the input. Not given for
+            the record of the input as a whole.
+        item : str, optional
+            The modality or image series exported.
+        error : str, optional
+            The error of a failed export.
+        """
+        key = (os.path.abspath(input_path), patient, item)
+        if status == "exported":
+            self._exported.add(key)
+
+        if self._path is None:
+            return
+
+        record = {
+            "input": key[0],
+            "patient": patient,
+            "item": item,
+            "status": status,
+            "error": error,
+            "options": self._options,
+        }
+        with open(self._path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _open_input(input_path, is_needed, logger):
+    """Find the patients of an input, first extracting it if it's a TAR
+    archive."""
+    source = {
+        "input_path": input_path,
+        "root": input_path,
+        "temp_directory": None,
+        "failed": False,
+        "outstanding": 0,
+    }
+
+    # If a TAR archive was supplied, extract the members needed to export it
     if os.path.isfile(input_path) and tarfile.is_tarfile(input_path):
         tmp_dir = tempfile.mkdtemp()
+        source["root"] = source["temp_directory"] = tmp_dir
 
         logger.info("Extracting TAR archive to: %s", tmp_dir)
+        number_extracted = extract_archive(input_path, tmp_dir, is_needed)
+        logger.debug("Extracted %s files", number_extracted)
 
-        t = tarfile.open(input_path)
+    source["patient_paths"] = find_patient_directories(source["root"])
 
-        for m in t.getmembers():
-            # Need to filter out files containing ":" for Windows
-            if ":" not in m.name:
-                t.extract(m, path=tmp_dir)
+    if len(source["patient_paths"]) == 0:
+        logger.error("No Pinnacle Patient directories were found in: %s", input_path)
+        _finish_input(None, source, logger, record=False)
+        return None
 
-        input_path = tmp_dir
+    for patient_path in source["patient_paths"]:
+        logger.info("Using Patient directory: %s", patient_path)
 
-        # Walk directory with extracted archive, looking for directory
-        # with Patient file
-        pat_dirs = []
-        for root, _, files in os.walk(input_path):
-            if "Patient" in files:
-                pat_dirs.append(root)
+    return source
 
-        if len(pat_dirs) == 0:
-            logger.error(
-                "No Pinnacle Patient directories were found in the "
-                "supplied TAR archive"
-            )
-            sys.exit()
 
-        if len(pat_dirs) > 1:
-            logger.error(
-                "Multiple Pinnacle Patient directories were found in "
-                "the supplied TAR archive"
-            )
-            logger.error(
-                "The command line utility currently only support "
-                "parsing TAR archives containing one patient"
-            )
-            sys.exit()
+def _finish_input(manifest, source, logger, record=True):
+    if record and not source["failed"]:
+        manifest.record("exported", source["input_path"])
 
-        input_path = pat_dirs[0]
+    if source["temp_directory"] is not None:
+        logger.debug("Removing extracted archive: %s", source["temp_directory"])
+        shutil.rmtree(source["temp_directory"], ignore_errors=True)
 
-        logger.info("Using Patient directory: %s", input_path)
 
-    # Create Pinnacle object given input path
-    p = PinnacleExport(input_path, logger)
+def _log_available(patient_path, logger):
+    p = PinnacleExport(patient_path, logger)
 
-    if list_available:
-        logger.info("Plans and Trials:")
-        p.log_trial_names()
-        logger.info("Images:")
-        p.log_images()
-        sys.exit()
+    logger.info("Plans and Trials:")
+    p.log_trial_names()
+    logger.info("Images:")
+    p.log_images()
 
-    logger.info("Will export modalities: %s", modality)
 
-    # Check that the plan exists, if not select first plan
-    plans = p.plans
-    plan = None
+def _safe_name(name):
+    return UNSAFE_NAME_PATTERN.sub("_", name).strip("._")
+
 
-    for pl in plans:
+def patient_directory_name(mrn, patient, used_names):
+    """The name of the directory to which a patient is exported.
+
+    The MRN is used, with any characters other than letters, digits,
+    ``.``, ``_`` and ``-`` replaced, so that it can't name a directory
+    outside of the output directory. Should the MRN be empty, the
+    patient's path relative to its input is used instead, and should
+    the name already be within ``used_names``, for a differing patient
+    with the same MRN, that path is appended. The name returned is added
+    to ``used_names``.
+    """
+    name = _safe_name(mrn) or _safe_name(patient) or "patient"
+    if name.lower() in used_names:
+        name = f"{name}-{_safe_name(patient)}".rstrip("-")
+
+    unique_name = name
+    suffix = 1
+    while unique_name.lower() in used_names:
+        suffix += 1
+        unique_name = f"{name}-{suffix}"
+
+    used_names.add(unique_name.lower())
+
+    return unique_name
+
+
+def _patient_tasks(
+    patient_path,
+    patient,
+    output_directory,
+    options,
+    separate_patients,
+    MRN_flag,
+    patient_directory_names,
+    logger,
+):
+    """Determine the exports of a patient, each to be run by
+    :func:`export_item`. Returns None if the plan or trial to export can't
+    be found."""
+    p = PinnacleExport(patient_path, logger)
+
+    # Check that the plan exists, if not select first plan
+    plan_name = options["plan"]
+    plan_index = None
+    for i, pl in enumerate(p.plans):
         if pl.plan_info["PlanName"] == plan_name:
-            plan = pl
+            plan_index = i
 
-    if not plan:
+    if plan_index is None:
         if plan_name:
             logger.error("Plan not found (%s)", plan_name)
-            sys.exit()
+            return None
 
         # Select a default plan if user didn't pass in a plan name
-        plan = plans[0]
+        plan_index = 0
         logger.warning(
             "No plan name supplied, selecting first plan: %s",
-            plan.plan_info["PlanName"],
+            p.plans[0].plan_info["PlanName"],
         )
 
-    # Set the Trial if it was given
+    plan = p.plans[plan_index]
+
+    # Check the Trial if it was given
+    trial = options["trial"]
     if trial:
         try:
             plan.active_trial = trial
@@ -167,69 +579,140 @@ def export_cli(args):
             logger.error(
                 "No Trial: %s found in Plan: %s", trial, plan.plan_info["PlanName"]
             )
-            sys.exit()
-
-    # If we got up to here, we are exporting something, so make sure the
-    #  output_directory was specified
-    if not output_directory:
-        logger.error("Specifiy an output directory with -o")
-        sys.exit()
+            return None
+
+    # When exporting more than one patient, each is exported to its own
+    # directory
+    mrn = p.patient_info["MedicalRecordNumber"]
+    if separate_patients:
+        output_directory = os.path.join(
+            output_directory,
+            patient_directory_name(mrn, patient, patient_directory_names),
+        )
+    elif MRN_flag:
+        output_directory += "-" + patient_directory_name(
+            mrn, patient, patient_directory_names
+        )
 
-    if MRN_flag:
-        output_directory += "-" + p.patient_info["MedicalRecordNumber"]
     if not os.path.exists(output_directory):
         logger.info("Creating output directory: %s", output_directory)
-        os.makedirs(output_directory)
+        os.makedirs(output_directory, exist_ok=True)
 
-    if uid_prefix:
-        if not plan.is_prefix_valid(uid_prefix):
-            logger.error("UID Prefix supplied is invalid")
-            sys.exit()
-        plan.uid_prefix = uid_prefix
-
-    primary_image_exported = False
+    items = []
+    image_series_uids = []
+    image_series = options["image"]
     if image_series:
-        image_series_uids = []
-
         if image_series == "all":
             for image in p.images:
                 image_series_uids.append(image.image_header["series_UID"])
         else:
             image_series_uids.append(image_series)
 
-        for suid in image_series_uids:
-            logger.info("Exporting image with UID: %s", suid)
-            p.export_image(series_uid=suid, export_path=output_directory)
-
-            series_uid = plan.primary_image.image_header["series_UID"]
-            if plan.primary_image and series_uid == suid:
-                primary_image_exported = True
+        items += [IMAGE_ITEM_PREFIX + suid for suid in image_series_uids]
 
+    modality = options["modality"]
     if "CT" in modality:
-        if plan.primary_image:
-            logger.info(
-                "Exporting primary image for plan: %s", plan.plan_info["PlanName"]
-            )
-
-            if primary_image_exported:
-                logger.info("Primary image was already exported during this run")
-            else:
-                p.export_image(image=plan.primary_image, export_path=output_directory)
-        else:
+        if not plan.primary_image:
             logger.error(
                 "No primary image to export for plan: %s", plan.plan_info["PlanName"]
             )
+        elif plan.primary_image.image_header["series_UID"] in image_series_uids:
+            logger.info("Primary image will already be exported during this run")
+        else:
+            items.append("CT")
+
+    items += [m for m in ("RTSTRUCT", "RTPLAN", "RTDOSE") if m in modality]
+
+    return [
+        {
+            "patient_path": patient_path,
+            "plan_index": plan_index,
+            "trial": trial,
+            "uid_prefix": options["uid_prefix"],
+            "roiskip": options["roiskip"],
+            "output_directory": output_directory,
+            "item": item,
+        }
+        for item in items
+    ]
+
+
+def export_item(task):
+    """Export a single modality or image series of a patient.
+
+    Parameters
+    ----------
+    task : dict
+        The ``patient_path``, ``plan_index``, ``trial``, ``uid_prefix``,
+        ``roiskip``, ``output_directory`` and ``item`` of the export.
+    """
+    logger = logging.getLogger(__name__)
+    p = PinnacleExport(task["patient_path"], logger)
+
+    plan = p.plans[task["plan_index"]]
+    if task["trial"]:
+        plan.active_trial = task["trial"]
+    if task["uid_prefix"]:
+        plan.uid_prefix = task["uid_prefix"]
+
+    output_directory = task["output_directory"]
+    item = task["item"]
 
-    if "RTSTRUCT" in modality:
-        if roiskip:
+    if item.startswith(IMAGE_ITEM_PREFIX):
+        suid = item[len(IMAGE_ITEM_PREFIX) :]
+        logger.info("Exporting image with UID: %s", suid)
+        p.export_image(series_uid=suid, export_path=output_directory)
+
+    if item == "CT":
+        logger.info("Exporting primary image for plan: %s", plan.plan_info["PlanName"])
+        p.export_image(image=plan.primary_image, export_path=output_directory)
+
+    if item == "RTSTRUCT":
+        if task["roiskip"]:
             p.export_struct(
-                plan=plan, export_path=output_directory, skip_pattern=roiskip
+                plan=plan, export_path=output_directory, skip_pattern=task["roiskip"]
             )
         else:
             p.export_struct(plan=plan, export_path=output_directory)
 
-    if "RTPLAN" in modality:
+    if item == "RTPLAN":
         p.export_plan(plan=plan, export_path=output_directory)
 
-    if "RTDOSE" in modality:
+    if item == "RTDOSE":
         p.export_dose(plan=plan, export_path=output_directory)
+
+
+def _export_item_or_return_error(task):
+    try:
+        export_item(task)
+    except (
+        ArithmeticError,
+        AttributeError,
+        LookupError,
+        TypeError,
+        OSError,
+        ValueError,
+    ):
+        return traceback.format_exc()
+
+    return None
+
+
+def _record_export(manifest, source, task, error, logger):
+    """Record the outcome of an export, returning True if it failed."""
+    patient = os.path.relpath(task["patient_path"], source["root"])
+
+    if error is None:
+        manifest.record("exported", source["input_path"], patient, task["item"])
+        return False
+
+    logger.error(
+        "Unable to export %s of Patient directory: %s\n%s",
+        task["item"],
+        task["patient_path"],
+        error,
+    )
+    source["failed"] = True
+    manifest.record("failed", source["input_path"], patient, task["item"], error)
+
+    return True
@@ -38,15 +38,14 @@
 # SOFTWARE.
 
 
-import math
 import os
 import re
-import struct
 import time
 
 from pymedphys._imports import numpy as np
 from pymedphys._imports import pydicom
 
+from pymedphys import interpolate as pmp_interp
 from pymedphys._dicom.orientation import IMAGE_ORIENTATION_MAP
 
 from .constants import (
@@ -64,25 +63,22 @@ def trilinear_interpolation(idx, grid):
     Return trilinear interpolated value for a voxel with index idx within the grid
     """
 
-    int_idx = [math.floor(f) for f in idx]
-    frac_idx = [f % 1 for f in idx]
+    axes = [np.arange(size, dtype=np.float64) for size in grid.shape]
 
-    l1 = [[[0 for x in range(2)] for x in range(2)] for x in range(2)]
-    for x in range(0, 2):
-        for y in range(0, 2):
-            for z in range(0, 2):
-                l1[x][y][z] = grid[int_idx[0] + x, int_idx[1] + y, int_idx[2] + z]
+    return pmp_interp.interp(axes, grid, points_interp=np.array([idx], dtype=float))[0]
 
-    l2 = [[0 for x in range(2)] for x in range(2)]
-    for y in range(0, 2):
-        for z in range(0, 2):
-            l2[y][z] = l1[0][y][z] * (1 - frac_idx[0]) + l1[1][y][z] * frac_idx[0]
 
-    l3 = [0 for x in range(2)]
-    for z in range(0, 2):
-        l3[z] = l2[0][z] * (1 - frac_idx[1]) + l2[1][z] * frac_idx[1]
+def read_dose_grid(binary_file, dimensions):
+    """
+    Read the dose of a Pinnacle binary dose file, indexed by (z, y, x), with z
+    in the order of the frames of the RTDOSE
+    """
+
+    x_size, y_size, z_size = dimensions
+    values = np.fromfile(binary_file, dtype=">f4", count=x_size * y_size * z_size)
 
-    return l3[0] * (1 - frac_idx[2]) + l3[1] * frac_idx[2]
+    # The file is written with its slices in reverse order
+    return values.reshape(z_size, y_size, x_size)[::-1].astype(np.float64)
 
 
 def convert_dose(plan, export_path):
@@ -253,7 +249,13 @@ def convert_dose(plan, export_path):
     ds.GridFrameOffsetVector = grid_frame_offset_vector
 
     # Array in which to sum the dose values of all beams
-    summed_pixel_values = []
+    summed_dose = None
+
+    dimensions = (
+        trial_info["DoseGrid .Dimension .X"],
+        trial_info["DoseGrid .Dimension .Y"],
+        trial_info["DoseGrid .Dimension .Z"],
+    )
 
     # For each beam in the trial, convert the dose from the Pinnacle binary
     # file and sum together
@@ -309,13 +311,6 @@ def convert_dose(plan, export_path):
 
         # Read the dose into a grid, so that we can interpolate for the prescription
         # point and determine the MU for the grid
-        dose_grid = np.zeros(
-            (
-                trial_info["DoseGrid .Dimension .X"],
-                trial_info["DoseGrid .Dimension .Y"],
-                trial_info["DoseGrid .Dimension .Z"],
-            )
-        )
         spacing = [
             trial_info["DoseGrid .VoxelSize .X"] * 10,
             trial_info["DoseGrid .VoxelSize .Y"] * 10,
@@ -328,13 +323,7 @@ def convert_dose(plan, export_path):
         ]
 
         if os.path.isfile(binary_file):
-            with open(binary_file, "rb") as b:
-                for z in range(trial_info["DoseGrid .Dimension .Z"] - 1, -1, -1):
-                    for y in range(0, trial_info["DoseGrid .Dimension .Y"]):
-                        for x in range(0, trial_info["DoseGrid .Dimension .X"]):
-                            data_element = b.read(4)
-                            value = struct.unpack(">f", data_element)[0]
-                            dose_grid[x, y, z] = value
+            dose_grid = read_dose_grid(binary_file, dimensions)
         else:
             plan.logger.warning("Dose file not found")
             plan.logger.error("Skipping generating RTDOSE")
@@ -355,8 +344,9 @@ def convert_dose(plan, export_path):
 
         plan.logger.debug("Index of prescription point within grid: %s", idx)
 
-        # Trilinear interpolation of that point within the dose grid
-        cgy_mu = trilinear_interpolation(idx, dose_grid)
+        # Trilinear interpolation of that point within the dose grid, which is
+        # indexed by (z, y, x)
+        cgy_mu = trilinear_interpolation(idx[::-1], dose_grid)
         plan.logger.debug("cgy_mu: %s", cgy_mu)
 
         # Now that we have the cgy/mu value of the dose reference point, we can
@@ -364,72 +354,38 @@ def convert_dose(plan, export_path):
         beam_mu = (total_prescription / cgy_mu) / prescription["NumberOfFractions"]
         plan.logger.debug("Beam MU: %s", beam_mu)
 
-        pixel_data_list = []
-        for z in range(trial_info["DoseGrid .Dimension .Z"] - 1, -1, -1):
-            for y in range(0, trial_info["DoseGrid .Dimension .Y"]):
-                for x in range(0, trial_info["DoseGrid .Dimension .X"]):
-                    value = (
-                        float(prescription["NumberOfFractions"])
-                        * dose_grid[x, y, z]
-                        * beam_mu
-                        / 100
-                    )
-                    pixel_data_list.append(value)
-
-        ds.FrameIncrementPointer = ds.data_element("GridFrameOffsetVector").tag
-
-        main_pix_array = []
-        for h in range(0, trial_info["DoseGrid .Dimension .Z"]):
-            pixelsforframe = []
-            for k in range(
-                0,
-                trial_info["DoseGrid .Dimension .X"]
-                * trial_info["DoseGrid .Dimension .Y"],
-            ):
-                pixelsforframe.append(
-                    float(
-                        pixel_data_list[
-                            h
-                            * trial_info["DoseGrid .Dimension .Y"]
-                            * trial_info["DoseGrid .Dimension .X"]
-                            + k
-                        ]
-                    )
-                )
-
-            main_pix_array = main_pix_array + list(reversed(pixelsforframe))
-
-        main_pix_array = list(reversed(main_pix_array))
+        beam_dose = float(prescription["NumberOfFractions"]) * dose_grid * beam_mu / 100
 
         # Add the values from this beam to the summed values
-        if len(summed_pixel_values) == 0:
-            summed_pixel_values = main_pix_array
+        if summed_dose is None:
+            summed_dose = beam_dose
         else:
-            for i, values in enumerate(summed_pixel_values):
-                summed_pixel_values[i] = values + main_pix_array[i]
+            summed_dose += beam_dose
+
+    if summed_dose is None:
+        plan.logger.warning("No Beams had a valid prescription point.")
+        plan.logger.error("Skipping generating RTDOSE")
+        return
+
+    ds.FrameIncrementPointer = ds.data_element("GridFrameOffsetVector").tag
 
     # Compute the scaling factor
-    scale = max(summed_pixel_values) / 16384
+    scale = np.max(summed_dose) / 16384
     ds.DoseGridScaling = scale
     plan.logger.debug("Dose Grid Scaling: %s", ds.DoseGridScaling)
 
     # Scale by the scaling factor
-    pixelvaluelist = []
-    for _, element in enumerate(summed_pixel_values, 0):
-        if scale != 0:
-            element = round(element / scale)
-        else:
-            element = 0
-        pixelvaluelist.append(int(element))
-
-    # Set the PixelData
-    pixel_binary_block = struct.pack("%sh" % len(pixelvaluelist), *pixelvaluelist)
-    ds.PixelData = pixel_binary_block
+    if scale != 0:
+        pixel_values = np.round(summed_dose / scale).astype("<i2")
+    else:
+        pixel_values = np.zeros(summed_dose.shape, dtype="<i2")
 
     # If Feet first, flip the dose grid
     if patient_position in ("FFS", "FFP"):
-        arr = ds.pixel_array
-        ds.PixelData = np.flip(arr, axis=0).tostring()
+        pixel_values = np.flip(pixel_values, axis=0)
+
+    # Set the PixelData
+    ds.PixelData = pixel_values.tobytes()
 
     # Save the RTDose Dicom File
     output_file = os.path.join(export_path, RDfilename)
@@ -260,22 +260,11 @@ def convert_plan(plan, export_path):
             if y1 == "":
                 y1 = -cp["BottomJawPosition"] * 10
 
-            points = cp["MLCLeafPositions"]["RawData"]["Points[]"].split(",")
-            p_count = 0
-            leafpositions1 = []
-            leafpositions2 = []
-            for p in points:
-                leafpoint = float(p.strip())
-                if p_count % 2 == 0:
-                    leafpositions1.append(-leafpoint * 10)
-                else:
-                    leafpositions2.append(leafpoint * 10)
-                p_count += 1
-
-                if p_count == len(points):
-                    leafpositions1 = list(reversed(leafpositions1))
-                    leafpositions2 = list(reversed(leafpositions2))
-                    leafpositions = leafpositions1 + leafpositions2
+            # The leaf pairs are stored as X1, X2 for each leaf in turn
+            points = cp["MLCLeafPositions"]["RawData"]["Points[]"]
+            leafpositions1 = (-points[0::2] * 10)[::-1].tolist()
+            leafpositions2 = (points[1::2] * 10)[::-1].tolist()
+            leafpositions = leafpositions1 + leafpositions2
 
             gantryangle = cp["Gantry"]
             colangle = cp["Collimator"]
@@ -629,7 +618,7 @@ def convert_plan(plan, export_path):
                 ].NumberOfLeafJawPairs = "1"
                 ds.BeamSequence[beam_count - 1].BeamLimitingDeviceSequence[
                     2
-                ].NumberOfLeafJawPairs = p_count / 2
+                ].NumberOfLeafJawPairs = len(points) // 2
                 bounds = [
                     "-200",
                     "-190",
@@ -906,7 +895,7 @@ def convert_plan(plan, export_path):
                 ].NumberOfLeafJawPairs = "1"
                 ds.BeamSequence[beam_count - 1].BeamLimitingDeviceSequence[
                     2
-                ].NumberOfLeafJawPairs = p_count / 2
+                ].NumberOfLeafJawPairs = len(points) // 2
                 bounds = [
                     "-200",
                     "-190",
@@ -43,6 +43,7 @@ import random
 import re
 import time
 
+from pymedphys._imports import numpy as np
 from pymedphys._imports import pydicom
 
 from .constants import (
@@ -54,6 +55,18 @@ from .constants import (
     colors,
 )
 
+CT_IMAGE_STORAGE_UID = "1.2.840.10008.5.1.4.1.1.2"
+CONTOUR_DATA = 0x30060050
+
+# The scaling of Pinnacle ROI coordinates (cm) to DICOM patient
+# coordinates (mm) for each supported patient position
+CONTOUR_SCALE = {
+    "HFS": (10, -10, -10),
+    "HFP": (-10, 10, -10),
+    "FFP": (10, 10, 10),
+    "FFS": (-10, -10, 10),
+}
+
 
 # Determine which point to use for the iso center and set this value in
 # the plan object
@@ -122,6 +135,7 @@ def find_iso_center(plan):
 # Read points and insert them into the dicom dataset
 def read_points(ds, plan):
     plan.roi_count = 0
+    find_slice = slice_finder(plan.primary_image.image_info)
 
     for point in plan.points:
         plan.roi_count = plan.roi_count + 1
@@ -139,21 +153,8 @@ def read_points(ds, plan):
         contour.ContourImageSequence = pydicom.sequence.Sequence()
 
         contour_image = pydicom.dataset.Dataset()
-
-        closestvalue = abs(
-            float(plan.primary_image.image_info[0]["TablePosition"])
-            - float(refpoint[-1])
-        )
-        for s in plan.primary_image.image_info:
-            if (
-                abs(float(s["TablePosition"]) - (-float(refpoint[-1] / 10)))
-                <= closestvalue
-            ):
-                closestvalue = abs(
-                    float(s["TablePosition"]) - (-float(refpoint[-1] / 10))
-                )
-                contour_image.ReferencedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
-                contour_image.ReferencedSOPInstanceUID = s["InstanceUID"]
+        contour_image.ReferencedSOPClassUID = CT_IMAGE_STORAGE_UID
+        contour_image.ReferencedSOPInstanceUID = find_slice(-refpoint[-1] / 10)
 
         contour.ContourImageSequence.append(contour_image)
 
@@ -191,201 +192,237 @@ def read_points(ds, plan):
     return ds
 
 
-# This function reads the plan.roi file line by line. This file is somehow not structured like the others,
-# and isn't tab indented properly, so won't parse onto YAML.
-def read_roi(ds, plan, skip_pattern):
-    image_header = plan.primary_image.image_header
-
-    path_roi = os.path.join(plan.path, "plan.roi")
-    plan.logger.debug("Will skip ROIs matching pattern[%s]", skip_pattern)
-
+def slice_finder(image_info):
+    """Create a lookup of the image slice nearest to a table position.
+
+    Parameters
+    ----------
+    image_info : list of dict
+        The image info of the primary image, with the ``TablePosition``
+        (cm) and ``InstanceUID`` of each slice.
+
+    Returns
+    -------
+    find_slice : callable
+        Returns the ``InstanceUID`` of the slice nearest to a given table
+        position. Where slices are equally near, the last is returned.
+    """
+    table_positions = np.array([float(s["TablePosition"]) for s in image_info])
+    instance_uids = [s["InstanceUID"] for s in image_info]
+
+    # Contours are drawn upon the slices, so almost every lookup is of a
+    # table position that is within rounding of a slice
+    slices = {
+        round(position, 3): uid
+        for position, uid in zip(table_positions.tolist(), instance_uids)
+    }
+
+    def find_slice(table_position):
+        try:
+            return slices[round(table_position, 3)]
+        except KeyError:
+            distances = np.abs(table_positions[::-1] - table_position)
+            return instance_uids[-1 - np.argmin(distances)]
+
+    return find_slice
+
+
+def read_roi_file(path_roi, skip_pattern, logger):
+    """Stream the ROIs of a Pinnacle ``plan.roi`` file.
+
+    The file is read line by line, as it isn't indented consistently
+    enough to be parsed as the other Pinnacle files are. Each ROI is
+    yielded once its end is reached, so that only a single ROI is held
+    in memory at a time.
+
+    Parameters
+    ----------
+    path_roi : str
+        The path of the ``plan.roi`` file.
+    skip_pattern : str
+        A regular expression. ROIs whose name matches it are skipped
+        over without their points being parsed.
+    logger : logging.Logger
+        Logs each ROI which is skipped.
+
+    Yields
+    ------
+    roi : dict
+        The ``name``, ``color``, ``interpreted_type`` and ``volume`` of
+        the ROI, along with its ``curves``, each an array of shape
+        ``(number_of_points, 3)`` in Pinnacle coordinates (cm). Curves
+        without any points are omitted.
+    """
+    roi = None
     flag_skip_roi = False
+    point_lines = None
 
-    points = []
-    flag_points = (
-        False  # bool value to tell me if I want to read the line in as point values
-    )
-    plan.logger.debug("Reading ROI from: %s", path_roi)
-    first_points = []
     with open(path_roi) as f:
-        for _, line in enumerate(f, 1):
+        for line in f:
+            if point_lines is not None:
+                if "End of points for curve" in line:
+                    points = np.fromstring("".join(point_lines), sep=" ")
+                    if points.size:
+                        roi["curves"].append(points.reshape(-1, 3))
+
+                    point_lines = None
+                else:
+                    point_lines.append(line)
+
+                continue
+
             if flag_skip_roi:
                 # read til we hit end of ROI
-                if "}; // End of ROI" in line:
-                    flag_skip_roi = False
-
+                flag_skip_roi = "}; // End of ROI" not in line
                 continue
 
-            if (
-                "};  // End of points for curve" in line
-            ):  # this will tell me not to read in point values
-                # all points for current curve saved until now. Here is where I
-                # need to add them to dicom file
-                numfind = int(line.find("curve") + 5)
-                line = line[numfind : len(line)]
-                line = line.strip()
-                curvenum = int(line)
-
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    int(curvenum) - 1
-                ].NumberOfContourPoints = int(len(points) / 3)
-
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    curvenum - 1
-                ].ContourData = points
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    int(curvenum) - 1
-                ].ContourImageSequence = pydicom.sequence.Sequence()
-                contour_image = pydicom.dataset.Dataset()
-
-                closestvalue = abs(
-                    float(plan.primary_image.image_info[0]["TablePosition"])
-                    - float(points[-1])
-                )
-                for s in plan.primary_image.image_info:
-                    if (
-                        abs(float(s["TablePosition"]) - (-float(points[-1] / 10)))
-                        <= closestvalue
-                    ):
-                        closestvalue = abs(
-                            float(s["TablePosition"]) - (-float(points[-1] / 10))
-                        )
-                        contour_image.ReferencedSOPClassUID = (
-                            "1.2.840.10008.5.1.4.1.1.2"
-                        )
-                        contour_image.ReferencedSOPInstanceUID = s["InstanceUID"]
-
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    int(curvenum) - 1
-                ].ContourImageSequence.append(contour_image)
-
-                del points[:]
-                flag_points = False
-            if flag_points:
-                curr_points = line.split(" ")
-
-                if curr_points == first_points:
-                    # These points are the exact same as the first point, skip it!
-                    continue
+            if "Beginning of ROI" in line:
+                name = line[22:].rstrip()
 
-                if len(first_points) == 0:
-                    first_points = curr_points
-
-                if image_header["patient_position"] == "HFS":
-                    curr_points = [
-                        float(curr_points[0]) * 10,
-                        -float(curr_points[1]) * 10,
-                        -float(curr_points[2]) * 10,
-                    ]
-                elif image_header["patient_position"] == "HFP":
-                    curr_points = [
-                        -float(curr_points[0]) * 10,
-                        float(curr_points[1]) * 10,
-                        -float(curr_points[2]) * 10,
-                    ]
-                elif image_header["patient_position"] == "FFP":
-                    curr_points = [
-                        float(curr_points[0]) * 10,
-                        float(curr_points[1]) * 10,
-                        float(curr_points[2]) * 10,
-                    ]
-                elif image_header["patient_position"] == "FFS":
-                    curr_points = [
-                        -float(curr_points[0]) * 10,
-                        -float(curr_points[1]) * 10,
-                        float(curr_points[2]) * 10,
-                    ]
-
-                if len(points) == 3:
-                    points[0] = round(points[0], 5)
-                    points[1] = round(points[1], 5)
-                    points[2] = round(points[2], 5)
-
-                points = points + curr_points
-            if "Beginning of ROI" in line:  # Start of ROI
-                ROIName = line[22:].rstrip()
-                plan.logger.debug("Start of ROI [%s]", ROIName)
-
-                if re.match(skip_pattern, ROIName):
-                    plan.logger.info("Skipping ROI [%s]", ROIName)
+                if re.match(skip_pattern, name):
+                    logger.info("Skipping ROI [%s]", name)
                     flag_skip_roi = True
                     continue
 
-                plan.roi_count = (
-                    plan.roi_count + 1
-                )  # increment ROI_num because I've found a new ROI
-                roi_contour = pydicom.dataset.Dataset()
-                roi_contour.ReferencedROINumber = str(plan.roi_count)
-                ds.ROIContourSequence.append(roi_contour)
-                ds.StructureSetROISequence.append(roi_contour)
-                rt_roi_observations = pydicom.dataset.Dataset()
-                ds.RTROIObservationsSequence.append(rt_roi_observations)
-                ds.StructureSetROISequence[
-                    plan.roi_count - 1
-                ].ROINumber = plan.roi_count
-                ds.StructureSetROISequence[plan.roi_count - 1].ROIName = ROIName
-                ds.StructureSetROISequence[
-                    plan.roi_count - 1
-                ].ROIGenerationAlgorithm = "SEMIAUTOMATIC"
-                ds.StructureSetROISequence[
-                    plan.roi_count - 1
-                ].ReferencedFrameOfReferenceUID = plan.primary_image.image_info[0][
-                    "FrameUID"
-                ]
-                ds.ROIContourSequence[
-                    plan.roi_count - 1
-                ].ContourSequence = pydicom.sequence.Sequence()
-                roiinterpretedtype = "ORGAN"
-                plan.logger.info("Exporting ROI: %s", ROIName)
-            if "roiinterpretedtype:" in line:
-                roiinterpretedtype = line.split(" ")[-1].replace("\n", "")
-            if "color:" in line:
-                roi_color = line.split(" ")[-1].replace("\n", "")
-
-                try:
-                    ds.ROIContourSequence[plan.roi_count - 1].ROIDisplayColor = colors[
-                        roi_color
-                    ]
-                except KeyError:
-                    plan.logger.info("ROI Color not known: %s", roi_color)
-                    new_color = random.choice(list(colors))
-                    plan.logger.info("Instead, assigning color: %s", new_color)
-                    ds.ROIContourSequence[plan.roi_count - 1].ROIDisplayColor = colors[
-                        new_color
-                    ]
-
-            if "}; // End of ROI" in line:  # end of ROI found
-                ds.RTROIObservationsSequence[
-                    plan.roi_count - 1
-                ].ObservationNumber = plan.roi_count
-                ds.RTROIObservationsSequence[
-                    plan.roi_count - 1
-                ].ReferencedROINumber = plan.roi_count
-                ds.RTROIObservationsSequence[
-                    plan.roi_count - 1
-                ].RTROIInterpretedType = roiinterpretedtype
-                ds.RTROIObservationsSequence[plan.roi_count - 1].ROIInterpreter = ""
-                # add to ROI observation sequence
-            if "volume =" in line:
-                vol = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
-                ds.StructureSetROISequence[plan.roi_count - 1].ROIVolume = vol
-            if "//  Curve " in line:  # found a curve
-                first_points = []
-                curvenum = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
-                contour = pydicom.dataset.Dataset()
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence.append(
-                    contour
-                )
-            if "num_points =" in line:
-                npts = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    int(curvenum) - 1
-                ].ContourGeometricType = "CLOSED_PLANAR"
-                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
-                    int(curvenum) - 1
-                ].NumberOfContourPoints = npts
-            if "points=" in line:
-                flag_points = True
+                roi = {
+                    "name": name,
+                    "color": None,
+                    "interpreted_type": "ORGAN",
+                    "volume": None,
+                    "curves": [],
+                }
+            elif roi is None:
+                continue
+            elif "roiinterpretedtype:" in line:
+                roi["interpreted_type"] = line.split(" ")[-1].strip()
+            elif "color:" in line:
+                roi["color"] = line.split(" ")[-1].strip()
+            elif "volume =" in line:
+                roi["volume"] = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
+            elif "points=" in line:
+                point_lines = []
+            elif "}; // End of ROI" in line:
+                yield roi
+                roi = None
+
+
+def contour_data(curve, patient_position):
+    """Convert the points of a Pinnacle curve to DICOM contour data.
+
+    Parameters
+    ----------
+    curve : numpy.ndarray
+        The points of the curve in Pinnacle coordinates (cm), with shape
+        ``(number_of_points, 3)``.
+    patient_position : str
+        The patient position of the primary image.
+
+    Returns
+    -------
+    points : numpy.ndarray
+        The points in DICOM patient coordinates (mm), rounded to 5
+        decimal places so that each fits within a DICOM decimal string.
+        Pinnacle closes a curve by repeating its first point, and these
+        repeats are removed.
+    """
+    try:
+        scale = CONTOUR_SCALE[patient_position]
+    except KeyError as e:
+        raise ValueError(
+            f"Contours of a {patient_position} patient can't be exported"
+        ) from e
+
+    is_repeat = np.all(curve == curve[0], axis=1)
+    is_repeat[0] = False
+
+    return np.round(curve[~is_repeat] * scale, 5)
+
+
+def set_contour_data(contour, points):
+    """Set the Contour Data of a contour, encoded ready to be written.
+
+    Converting each coordinate to a pydicom ``DSfloat`` would otherwise
+    dominate the export of large contours. The contour's original
+    encoding is set to the implicit VR little endian of the exported
+    RTSTRUCT, so that pydicom writes the encoded value as is.
+
+    Parameters
+    ----------
+    contour : pydicom.dataset.Dataset
+        An item of a Contour Sequence.
+    points : numpy.ndarray
+        The contour points in DICOM patient coordinates (mm), as
+        returned by :func:`contour_data`.
+    """
+    value = "\\".join(map(repr, points.ravel().tolist())).encode()
+    if len(value) % 2:
+        value += b" "
+
+    contour[CONTOUR_DATA] = pydicom.dataelem.RawDataElement(
+        pydicom.tag.Tag(CONTOUR_DATA), "DS", len(value), value, 0, True, True
+    )
+    contour.set_original_encoding(True, True, "iso8859")
+
+
+def read_roi(ds, plan, skip_pattern):
+    image_header = plan.primary_image.image_header
+    image_info = plan.primary_image.image_info
+    find_slice = slice_finder(image_info)
+
+    path_roi = os.path.join(plan.path, "plan.roi")
+    plan.logger.debug("Will skip ROIs matching pattern[%s]", skip_pattern)
+    plan.logger.debug("Reading ROI from: %s", path_roi)
+
+    for roi in read_roi_file(path_roi, skip_pattern, plan.logger):
+        plan.roi_count = plan.roi_count + 1
+        plan.logger.info("Exporting ROI: %s", roi["name"])
+
+        roi_contour = pydicom.dataset.Dataset()
+        roi_contour.ReferencedROINumber = str(plan.roi_count)
+
+        roi_color = roi["color"]
+        if roi_color is not None:
+            if roi_color not in colors:
+                plan.logger.info("ROI Color not known: %s", roi_color)
+                roi_color = random.choice(list(colors))
+                plan.logger.info("Instead, assigning color: %s", roi_color)
+
+            roi_contour.ROIDisplayColor = colors[roi_color]
+
+        roi_contour.ContourSequence = pydicom.sequence.Sequence()
+        for curve in roi["curves"]:
+            points = contour_data(curve, image_header["patient_position"])
+
+            contour = pydicom.dataset.Dataset()
+            contour.ContourGeometricType = "CLOSED_PLANAR"
+            contour.NumberOfContourPoints = len(points)
+            set_contour_data(contour, points)
+
+            contour_image = pydicom.dataset.Dataset()
+            contour_image.ReferencedSOPClassUID = CT_IMAGE_STORAGE_UID
+            contour_image.ReferencedSOPInstanceUID = find_slice(-points[-1, 2] / 10)
+            contour.ContourImageSequence = pydicom.sequence.Sequence([contour_image])
+
+            roi_contour.ContourSequence.append(contour)
+
+        ds.ROIContourSequence.append(roi_contour)
+
+        structure_set_roi = pydicom.dataset.Dataset()
+        structure_set_roi.ROINumber = plan.roi_count
+        structure_set_roi.ROIName = roi["name"]
+        structure_set_roi.ROIGenerationAlgorithm = "SEMIAUTOMATIC"
+        structure_set_roi.ReferencedFrameOfReferenceUID = image_info[0]["FrameUID"]
+        if roi["volume"] is not None:
+            structure_set_roi.ROIVolume = roi["volume"]
+
+        ds.StructureSetROISequence.append(structure_set_roi)
+
+        rt_roi_observations = pydicom.dataset.Dataset()
+        rt_roi_observations.ObservationNumber = plan.roi_count
+        rt_roi_observations.ReferencedROINumber = plan.roi_count
+        rt_roi_observations.RTROIInterpretedType = roi["interpreted_type"]
+        rt_roi_observations.ROIInterpreter = ""
+        ds.RTROIObservationsSequence.append(rt_roi_observations)
 
     plan.logger.debug("patient pos: %s", image_header["patient_position"])
 
@@ -514,7 +551,7 @@ def convert_struct(plan, export_path, skip_pattern):
 
     for info in plan.primary_image.image_info:
         contour_image = pydicom.dataset.Dataset()
-        contour_image.ReferencedSOPClassUID = "1.2.840.10008.5.1.4.1.1.2"
+        contour_image.ReferencedSOPClassUID = CT_IMAGE_STORAGE_UID
         contour_image.ReferencedSOPInstanceUID = info["InstanceUID"]
         ds.ReferencedFrameOfReferenceSequence[0].RTReferencedStudySequence[
             0
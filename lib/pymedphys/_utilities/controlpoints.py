@@ -49,8 +49,23 @@ def remove_irrelevant_control_points(monitor_units, *args):
 
 
 def to_tuple(a):
+    if isinstance(a, np.ndarray) and a.ndim > 0:
+        # Converting via a nested list is substantially faster than
+        # iterating over the array one numpy scalar at a time.
+        return _nested_list_to_tuple(a.tolist(), a.ndim)
+
     # https://stackoverflow.com/a/10016613/3912576
     try:
         return tuple(to_tuple(i) for i in a)
     except TypeError:
         return a
+
+
+def _nested_list_to_tuple(a, depth):
+    if depth == 1:
+        return tuple(a)
+
+    if depth == 2:
+        return tuple(map(tuple, a))
+
+    return tuple(_nested_list_to_tuple(i, depth - 1) for i in a)
@@ -25,6 +25,7 @@ from .dicom import dicom_cli
 from .experimental import experimental_cli
 from .gui import gui_cli
 from .icom import icom_cli
+from .interpolate import interpolate_cli
 from .pinnacle import pinnacle_cli
 from .trf import trf_cli
 from .zenodo import zenodo_cli
@@ -49,6 +50,7 @@ def define_parser():
     dev_cli(subparsers)
     zenodo_cli(subparsers)
     icom_cli(subparsers)
+    interpolate_cli(subparsers)
     gui_cli(subparsers)
 
     # https://stackoverflow.com/a/20663028/3912576
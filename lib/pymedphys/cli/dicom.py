@@ -17,6 +17,7 @@
 from pymedphys._dicom.anonymise import anonymise_cli
 from pymedphys._dicom.connect.listen import listen_cli
 from pymedphys._dicom.connect.send import send_cli
+from pymedphys._dicom.dose import sum_doses_cli
 from pymedphys._dicom.header import (
     adjust_machine_name_cli,
     adjust_RED_by_structure_name_cli,
@@ -38,6 +39,7 @@ def set_up_dicom_cli(subparsers):
     adjust_RED_by_structure_name(dicom_subparsers)
     listen(dicom_subparsers)
     send(dicom_subparsers)
+    sum_doses(dicom_subparsers)
 
     return dicom_parser, dicom_subparsers
 
@@ -204,9 +206,7 @@ def anonymise(dicom_subparsers):
         "-p",
         "--keep_private_tags",
         action="store_true",
-        help=(
-            "Use this flag to preserve private tags in the " "anonymised DICOM files."
-        ),
+        help=("Use this flag to preserve private tags in the anonymised DICOM files."),
     )
 
     unknown_tags_group = parser.add_mutually_exclusive_group()
@@ -229,6 +229,26 @@ def anonymise(dicom_subparsers):
         ),
     )
 
+    parser.add_argument(
+        "-n",
+        "--n_workers",
+        type=int,
+        default=1,
+        help=(
+            "The number of processes across which to anonymise the "
+            "files of a directory. Defaults to 1."
+        ),
+    )
+
+    parser.add_argument(
+        "--defer_pixel_data",
+        action="store_true",
+        help=(
+            "Use this flag to copy the pixel data of each file "
+            "straight through to its anonymised copy."
+        ),
+    )
+
     parser.set_defaults(func=anonymise_cli)
 
     return parser
@@ -254,6 +274,14 @@ def listen(dicom_subparsers):
         type=str,
         help="The AE Title of this listen service",
     )
+    parser.add_argument(
+        "--raw_storage",
+        action="store_true",
+        help=(
+            "Use this flag to write received DICOM objects exactly as "
+            "they were sent, without decoding them."
+        ),
+    )
 
     parser.set_defaults(func=listen_cli)
 
@@ -274,4 +302,56 @@ def send(dicom_subparsers):
         type=str,
         help="The Called AE Title",
     )
+    parser.add_argument(
+        "-n",
+        "--n_associations",
+        default=1,
+        type=int,
+        help="The number of associations across which to concurrently send",
+    )
+    parser.add_argument(
+        "--original_transfer_syntax",
+        action="store_true",
+        help=(
+            "Use this flag to send files in their stored transfer syntax, "
+            "without transcoding, whenever the listener accepts it."
+        ),
+    )
     parser.set_defaults(func=send_cli)
+
+
+def sum_doses(dicom_subparsers):
+    parser = dicom_subparsers.add_parser(
+        "sum-doses",
+        help=(
+            "Sum the doses of DICOM RT Dose files, reading one dose at a "
+            "time. The first input file is used as the template for the "
+            "summed DICOM RT Dose file."
+        ),
+    )
+
+    parser.add_argument("output_file", type=str)
+    parser.add_argument("input_files", type=str, nargs="+")
+    parser.add_argument(
+        "-r",
+        "--resample",
+        action="store_true",
+        help=(
+            "Use this flag to interpolate any dose grids that don't "
+            "coincide with the grid of the first input file onto that grid."
+        ),
+    )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        help="Use this flag to accumulate the sum in single precision.",
+    )
+    parser.add_argument(
+        "--no_memmap",
+        action="store_true",
+        help=(
+            "Use this flag to read the pixel data of each file into "
+            "memory rather than memory mapping it."
+        ),
+    )
+    parser.set_defaults(func=sum_doses_cli)
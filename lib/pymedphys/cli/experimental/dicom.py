@@ -132,6 +132,17 @@ def pseudonymise(dicom_subparsers):
         ),
     )
 
+    parser.add_argument(
+        "-n",
+        "--n_workers",
+        type=int,
+        default=1,
+        help=(
+            "The number of processes across which to pseudonymise the "
+            "files of a directory. Defaults to 1."
+        ),
+    )
+
     parser.set_defaults(func=anonymise_with_pseudo_cli)
 
     return parser
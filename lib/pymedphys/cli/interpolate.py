@@ -0,0 +1,68 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compile the interpolation kernels into the numba cache ahead of their
+first use, such as at deploy time. Set ``NUMBA_CACHE_DIR`` to the same
+``--cache-dir`` in the processes that then interpolate.
+"""
+
+from pymedphys._interp.warmup import DEFAULT_DTYPES, DEFAULT_N_DIMS, warmup_cli
+
+
+def interpolate_cli(subparsers):
+    interpolate_parser = subparsers.add_parser(
+        "interpolate", help="Tools for the fast linear interpolation."
+    )
+    interpolate_subparsers = interpolate_parser.add_subparsers(dest="interpolate")
+
+    warmup(interpolate_subparsers)
+
+    return interpolate_parser
+
+
+def warmup(interpolate_subparsers):
+    parser = interpolate_subparsers.add_parser(
+        "warmup",
+        help=(
+            "Compile the interpolation kernels into the numba cache, such "
+            "as at deploy time, and report the cold start time this saves "
+            "later processes."
+        ),
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help=(
+            "Directory in which to cache the compiled kernels. Later "
+            "processes use it when NUMBA_CACHE_DIR is set to it. Defaults "
+            "to NUMBA_CACHE_DIR, or else numba's default cache."
+        ),
+    )
+    parser.add_argument(
+        "--dtype",
+        nargs="+",
+        choices=DEFAULT_DTYPES,
+        default=DEFAULT_DTYPES,
+        help="The dtypes of values for which to compile the kernels.",
+    )
+    parser.add_argument(
+        "--n-dims",
+        nargs="+",
+        type=int,
+        choices=DEFAULT_N_DIMS,
+        default=DEFAULT_N_DIMS,
+        help="The numbers of dimensions for which to compile the kernels.",
+    )
+
+    parser.set_defaults(func=warmup_cli)
@@ -39,10 +39,16 @@ def export_pinnacle(pinnacle_subparsers):
     parser.add_argument(
         "input_path",
         type=str,
+        nargs="+",
         help=(
             "Root Patient directory of raw Pinnacle data (directory "
-            "containing the 'Patient' file). Alternatively a TAR archive "
-            "can be supplied."
+            "containing the 'Patient' file). Alternatively a TAR archive, "
+            "or a directory, containing any number of Patient directories "
+            "can be supplied. More than one input path may be given. When "
+            "more than one patient is exported, each patient is exported "
+            "to a directory within the output directory named by their "
+            "MRN, or by their path within the input when the MRN is empty "
+            "or shared with another patient."
         ),
     )
 
@@ -121,4 +127,24 @@ def export_pinnacle(pinnacle_subparsers):
         ),
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help=(
+            "The number of processes across which to export the "
+            "patients, plans and modalities. Defaults to 1."
+        ),
+    )
+
+    parser.add_argument(
+        "--manifest",
+        help=(
+            "A file in which to record each completed export. If the "
+            "export is interrupted, rerunning it with the same manifest "
+            "skips everything that was already exported."
+        ),
+    )
+
     parser.set_defaults(func=export_cli)
@@ -29,6 +29,12 @@ SKIPPING_CONFIG = {
         "description": "mark test as using mosaiq db",
         "skip_otherwise": True,
     },
+    "benchmark": {
+        "options": ["--run-only-benchmark", "--benchmark"],
+        "help": "run the performance benchmarks",
+        "description": "mark test as a performance benchmark",
+        "skip_otherwise": True,
+    },
     "anthropic_key": {
         "options": ["--run-only-anthropic", "--anthropic"],
         "help": "run only the tests that use Anthropic API",
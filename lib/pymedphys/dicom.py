@@ -4,10 +4,13 @@
 # ruff: noqa: F401
 
 from ._dicom.anonymise import anonymise_dataset as anonymise
+from ._dicom.collection import DicomCollection
+from ._dicom.ct.volume import ct_volume
 from ._dicom.dose import (
     depth_dose,
     dicom_dose_interpolate,
     profile,
     zyx_and_dose_from_dataset,
 )
+from ._dicom.dvh import dvh_table
 from ._dicom.structure.merge import merge_contours
@@ -22,12 +22,15 @@ lower-level functions for specific dimensionalities.
 Key Features:
     - Fast linear interpolation for 1D, 2D, and 3D data
     - Support for both grid-based and point-based interpolation
+    - Chunked interpolation of grids and points that don't fit in memory
     - Numba-accelerated core interpolation functions
     - Input validation and error checking
     - Visualization tool for comparing original and interpolated data
 
 Main Functions:
     - :func:`interp`: High-level interface for linear interpolation
+    - :func:`interp_chunks`: Lazily interpolate an iterable of chunks of points
+    - :func:`warmup`: Compile, and cache, the interpolation kernels ahead of their first use
     - :func:`interp_linear_1d`, :func:`interp_linear_2d`, :func:`interp_linear_3d`: Dimension-specific interpolation
     - :func:`plot_interp_comparison_heatmap`: Visualize original vs interpolated data
 
@@ -64,8 +67,10 @@ For more detailed information, refer to the individual function docstrings.
 # ruff: noqa: F401
 from ._interp.interp import (
     interp,
+    interp_chunks,
     interp_linear_1d,
     interp_linear_2d,
     interp_linear_3d,
     plot_interp_comparison_heatmap,
 )
+from ._interp.warmup import warmup
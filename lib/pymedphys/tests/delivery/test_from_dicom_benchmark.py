@@ -0,0 +1,125 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of ``Delivery.from_dicom`` for the test RT plans and for a
+dual arc VMAT plan.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import pathlib
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+import pymedphys
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+HERE = pathlib.Path(__file__).parent
+TEST_PLAN_FILEPATHS = [
+    HERE.parent.joinpath("dicom", "data", "rtplan", "06MV_plan.dcm"),
+    HERE.parents[1].joinpath(
+        "_experimental", "serviceplans", "templates", "vmat_example.dcm"
+    ),
+]
+
+NUMBER_OF_ARCS = 2
+NUMBER_OF_CONTROL_POINTS = 360
+NUMBER_OF_LEAF_PAIRS = 80
+REPEATS = 5
+
+
+def _vmat_control_point(rng, index):
+    bank_a = rng.uniform(-50, 0, NUMBER_OF_LEAF_PAIRS).round(2)
+    bank_b = (bank_a + rng.uniform(0, 50, NUMBER_OF_LEAF_PAIRS)).round(2)
+
+    control_point = {
+        "ControlPointIndex": index,
+        "CumulativeMetersetWeight": index / (NUMBER_OF_CONTROL_POINTS - 1),
+        "GantryAngle": (180 + index * 358 / (NUMBER_OF_CONTROL_POINTS - 1)) % 360,
+        "BeamLimitingDevicePositionSequence": [
+            {"RTBeamLimitingDeviceType": "ASYMY", "LeafJawPositions": [-100, 100]},
+            {
+                "RTBeamLimitingDeviceType": "MLCX",
+                "LeafJawPositions": np.concatenate([bank_a, bank_b]).tolist(),
+            },
+        ],
+    }
+    if index == 0:
+        control_point["BeamLimitingDeviceAngle"] = 10
+
+    return control_point
+
+
+@pytest.fixture(name="vmat_plan", scope="module")
+def fixture_vmat_plan(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    leaf_pair_boundaries = np.linspace(-200, 200, NUMBER_OF_LEAF_PAIRS + 1).tolist()
+
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.481.5",
+            "SOPInstanceUID": pydicom.uid.generate_uid(),
+            "FractionGroupSequence": [
+                {
+                    "FractionGroupNumber": 1,
+                    "ReferencedBeamSequence": [
+                        {"ReferencedBeamNumber": i + 1, "BeamMeterset": 250}
+                        for i in range(NUMBER_OF_ARCS)
+                    ],
+                }
+            ],
+            "BeamSequence": [
+                {
+                    "BeamNumber": i + 1,
+                    "FinalCumulativeMetersetWeight": 1,
+                    "BeamLimitingDeviceSequence": [
+                        {"RTBeamLimitingDeviceType": "ASYMY"},
+                        {
+                            "RTBeamLimitingDeviceType": "MLCX",
+                            "NumberOfLeafJawPairs": NUMBER_OF_LEAF_PAIRS,
+                            "LeafPositionBoundaries": leaf_pair_boundaries,
+                        },
+                    ],
+                    "ControlPointSequence": [
+                        _vmat_control_point(rng, index)
+                        for index in range(NUMBER_OF_CONTROL_POINTS)
+                    ],
+                }
+                for i in range(NUMBER_OF_ARCS)
+            ],
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+
+    filepath = tmp_path_factory.mktemp("vmat") / "plan.dcm"
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+    return filepath
+
+
+@pytest.mark.benchmark
+def test_from_dicom_benchmark(vmat_plan):
+    durations = {}
+    for filepath in TEST_PLAN_FILEPATHS + [vmat_plan]:
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            pymedphys.Delivery.from_dicom(pydicom.dcmread(filepath, force=True))
+        durations[filepath.name] = (time.perf_counter() - start) / REPEATS
+
+    print("\nDelivery.from_dicom, including reading the file:")
+    for name, duration in durations.items():
+        print(f"  {name}: {duration * 1000:.1f} ms")
@@ -0,0 +1,115 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of ``Delivery.to_dicom`` and of building the control points
+of a 200 control point arc.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import io
+import pathlib
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+import pymedphys
+from pymedphys._dicom import rtplan
+
+HERE = pathlib.Path(__file__).parent
+TEMPLATE_FILEPATH = HERE.parents[1].joinpath(
+    "_experimental", "serviceplans", "templates", "vmat_example.dcm"
+)
+
+GANTRY_ANGLES = (90, -90)
+NUMBER_OF_CONTROL_POINTS = 200
+NUMBER_OF_LEAF_PAIRS = 80
+REPEATS = 5
+
+
+def _beam_delivery(rng, gantry):
+    bank_a = rng.uniform(-50, 0, (NUMBER_OF_CONTROL_POINTS, NUMBER_OF_LEAF_PAIRS))
+    bank_b = bank_a + rng.uniform(0, 50, bank_a.shape)
+
+    return pymedphys.Delivery(
+        np.linspace(0, 300, NUMBER_OF_CONTROL_POINTS),
+        gantry,
+        np.zeros(NUMBER_OF_CONTROL_POINTS),
+        np.stack([bank_b.round(1), -bank_a.round(1)], axis=-1),
+        np.tile([[80.0, 80.0]], (NUMBER_OF_CONTROL_POINTS, 1)),
+    )
+
+
+@pytest.fixture(name="template_and_delivery", scope="module")
+def fixture_template_and_delivery():
+    """A template with one static beam for each gantry angle, along with
+    a delivery of 200 control points for each beam.
+    """
+    template = pydicom.dcmread(TEMPLATE_FILEPATH, force=True)
+    for beam, gantry in zip(template.BeamSequence, GANTRY_ANGLES):
+        control_points = beam.ControlPointSequence
+        beam.ControlPointSequence = [control_points[0], control_points[-1]]
+        for control_point in beam.ControlPointSequence:
+            if "GantryAngle" in control_point:
+                control_point.GantryAngle = gantry % 360
+
+    rng = np.random.default_rng(0)
+    delivery = pymedphys.Delivery.combine(
+        *[
+            _beam_delivery(rng, np.full(NUMBER_OF_CONTROL_POINTS, gantry))
+            for gantry in GANTRY_ANGLES
+        ]
+    )
+
+    return template, delivery
+
+
+@pytest.mark.benchmark
+def test_to_dicom_benchmark(template_and_delivery):
+    template, delivery = template_and_delivery
+
+    rng = np.random.default_rng(1)
+    arc = _beam_delivery(
+        rng, np.linspace(-180, 180, NUMBER_OF_CONTROL_POINTS, endpoint=False)
+    )
+    arc_data = arc._coordinate_convert()  # pylint: disable = protected-access
+    control_points = template.BeamSequence[0].ControlPointSequence
+
+    durations = {}
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        rtplan.build_control_points(control_points[0], control_points[-1], arc_data)
+    durations["build_control_points, 200 control point arc"] = (
+        time.perf_counter() - start
+    ) / REPEATS
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        delivery.to_dicom(template)
+    durations["to_dicom, 2 beams of 200 control points"] = (
+        time.perf_counter() - start
+    ) / REPEATS
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        delivery.to_dicom(template, output=io.BytesIO())
+    durations["to_dicom, written to a file object"] = (
+        time.perf_counter() - start
+    ) / REPEATS
+
+    print("\nDelivery.to_dicom:")
+    for name, duration in durations.items():
+        print(f"  {name}: {duration * 1000:.1f} ms")
@@ -0,0 +1,113 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._dicom import create, rtplan
+
+
+def _control_point(cumulative_meterset_weight):
+    return create.dicom_dataset_from_dict(
+        {
+            "ControlPointIndex": 0,
+            "CumulativeMetersetWeight": cumulative_meterset_weight,
+            "GantryAngle": 0,
+            "BeamLimitingDevicePositionSequence": [
+                {"RTBeamLimitingDeviceType": "ASYMY", "LeafJawPositions": [0, 0]},
+                {"RTBeamLimitingDeviceType": "MLCX", "LeafJawPositions": [0] * 4},
+            ],
+            "ReferencedDoseReferenceSequence": [{"ReferencedDoseReferenceNumber": 1}],
+        }
+    )
+
+
+def _plan():
+    return create.dicom_dataset_from_dict(
+        {
+            "BeamSequence": [
+                {
+                    "BeamNumber": i + 1,
+                    "ControlPointSequence": [_control_point(0), _control_point(1)],
+                }
+                for i in range(2)
+            ]
+        }
+    )
+
+
+@pytest.mark.pydicom
+def test_build_control_points():
+    initial, subsequent = _control_point(0), _control_point(1)
+    original_initial, original_subsequent = copy.deepcopy((initial, subsequent))
+
+    data = {
+        "monitor_units": np.array([0, 50, 150]),
+        "gantry_angle": ["10.0", "20.0", "30.0"],
+        "gantry_movement": np.array(["CW", "CW", "NONE"]),
+        "collimator_angle": ["0.0"] * 3,
+        "collimator_movement": np.array(["NONE"] * 3),
+        "jaw": [["-10.0", "20.0"], ["-11.0", "21.0"], ["-12.0", "22.5"]],
+        "mlc": [["-1.0", "-2.0", "3.0", "4.0"]] * 3,
+    }
+
+    cps = rtplan.build_control_points(initial, subsequent, data)
+
+    assert initial == original_initial
+    assert subsequent == original_subsequent
+
+    assert [cp.ControlPointIndex for cp in cps] == [0, 1, 2]
+    assert [cp.CumulativeMetersetWeight for cp in cps] == [0, 0.333333, 1]
+    assert [cp["CumulativeMetersetWeight"].repval for cp in cps] == [
+        "'0.000000'",
+        "'0.333333'",
+        "'1.000000'",
+    ]
+    assert [cp.GantryAngle for cp in cps] == [10, 20, 30]
+    assert [cp.GantryRotationDirection for cp in cps] == ["CW", "CW", "NONE"]
+
+    jaws = [cp.BeamLimitingDevicePositionSequence[0].LeafJawPositions for cp in cps]
+    assert jaws == [[-10, 20], [-11, 21], [-12, 22.5]]
+    assert cps[0].BeamLimitingDevicePositionSequence[1].LeafJawPositions == [
+        -1,
+        -2,
+        3,
+        4,
+    ]
+
+    # The collimation is independent for each control point, whereas the
+    # remaining sequences are shared
+    assert (
+        cps[1].BeamLimitingDevicePositionSequence[0]
+        is not cps[2].BeamLimitingDevicePositionSequence[0]
+    )
+    assert (
+        cps[1].ReferencedDoseReferenceSequence is cps[2].ReferencedDoseReferenceSequence
+    )
+
+
+@pytest.mark.pydicom
+def test_copy_template_for_beam():
+    template = _plan()
+    original = copy.deepcopy(template)
+
+    created = rtplan.copy_template_for_beam(template, 1)
+    created.BeamSequence[1].BeamNumber = 3
+    rtplan.replace_beam_sequence(created, [_control_point(0)], 1)
+
+    assert template == original
+    assert created.BeamSequence[0].BeamNumber == 3
+    assert created.BeamSequence[0].NumberOfControlPoints == 1
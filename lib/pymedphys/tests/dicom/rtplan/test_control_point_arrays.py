@@ -0,0 +1,190 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pathlib
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+import pymedphys
+from pymedphys._dicom import create, rtplan
+from pymedphys._utilities.transforms import convert_IEC_angle_to_bipolar
+
+HERE = pathlib.Path(__file__).parents[1]
+DICOM_PLAN_FILEPATH = HERE.joinpath("data", "rtplan", "06MV_plan.dcm")
+
+NUMBER_OF_LEAF_PAIRS = 3
+
+
+def _vmat_plan():
+    """An arc whose later control points lean on the prior control
+    points for their collimator angle and beam limiting device positions.
+    """
+    leaf_pair_boundaries = np.linspace(-15, 15, NUMBER_OF_LEAF_PAIRS + 1).tolist()
+
+    return create.dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.481.5",
+            "SOPInstanceUID": "1.2.3.4",
+            "FractionGroupSequence": [
+                {
+                    "FractionGroupNumber": 1,
+                    "ReferencedBeamSequence": [
+                        {"ReferencedBeamNumber": 1, "BeamMeterset": 200}
+                    ],
+                }
+            ],
+            "BeamSequence": [
+                {
+                    "BeamNumber": 1,
+                    "FinalCumulativeMetersetWeight": 2,
+                    "BeamLimitingDeviceSequence": [
+                        {"RTBeamLimitingDeviceType": "ASYMY"},
+                        {
+                            "RTBeamLimitingDeviceType": "MLCX",
+                            "NumberOfLeafJawPairs": NUMBER_OF_LEAF_PAIRS,
+                            "LeafPositionBoundaries": leaf_pair_boundaries,
+                        },
+                    ],
+                    "ControlPointSequence": [
+                        {
+                            "CumulativeMetersetWeight": 0,
+                            "GantryAngle": 181,
+                            "BeamLimitingDeviceAngle": 10,
+                            "BeamLimitingDevicePositionSequence": [
+                                {
+                                    "RTBeamLimitingDeviceType": "ASYMY",
+                                    "LeafJawPositions": [-50, 60],
+                                },
+                                {
+                                    "RTBeamLimitingDeviceType": "MLCX",
+                                    "LeafJawPositions": [-1, -2, -3, 4, 5, 6],
+                                },
+                            ],
+                        },
+                        {
+                            "CumulativeMetersetWeight": 1,
+                            "GantryAngle": 90,
+                            "BeamLimitingDevicePositionSequence": [
+                                {
+                                    "RTBeamLimitingDeviceType": "ASYMY",
+                                    "LeafJawPositions": [-50, 60],
+                                },
+                                {
+                                    "RTBeamLimitingDeviceType": "MLCX",
+                                    "LeafJawPositions": [-7, -8, -9, 10, 11, 12],
+                                },
+                            ],
+                        },
+                        {"CumulativeMetersetWeight": 2, "GantryAngle": 0},
+                    ],
+                }
+            ],
+        }
+    )
+
+
+def _reread(ds, tmp_path):
+    """Write and read back a dataset so that its elements are the raw
+    bytes read from file, rather than already converted values.
+    """
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+
+    filepath = tmp_path / "plan.dcm"
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+    return pydicom.dcmread(filepath)
+
+
+def _leaning_on_prior(control_points, device_type):
+    sequences = rtplan.get_cp_attribute_leaning_on_prior(
+        control_points, "BeamLimitingDevicePositionSequence"
+    )
+
+    return np.array(rtplan.get_leaf_jaw_positions_for_type(sequences, device_type))
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("reread", [False, True])
+def test_control_point_arrays_lean_on_prior(tmp_path, reread):
+    ds = _vmat_plan()
+    if reread:
+        ds = _reread(ds, tmp_path)
+
+    control_points = ds.BeamSequence[0].ControlPointSequence
+    arrays = rtplan.get_control_point_arrays(
+        control_points, {"MLCX": 2 * NUMBER_OF_LEAF_PAIRS, "ASYMY": 2}
+    )
+
+    assert np.array_equal(arrays.cumulative_meterset_weight, [0, 1, 2])
+    assert np.array_equal(arrays.gantry_angle, [181, 90, 0])
+    assert np.array_equal(arrays.beam_limiting_device_angle, [10, 10, 10])
+
+    for device_type in ("MLCX", "ASYMY"):
+        assert np.array_equal(
+            arrays.leaf_jaw_positions[device_type],
+            _leaning_on_prior(control_points, device_type),
+        )
+
+
+@pytest.mark.pydicom
+def test_control_point_arrays_of_test_plan():
+    ds = pydicom.dcmread(DICOM_PLAN_FILEPATH, force=True)
+
+    for beam in ds.BeamSequence:
+        control_points = beam.ControlPointSequence
+        arrays = rtplan.get_control_point_arrays(
+            control_points, {"MLCX": 160, "ASYMY": 2}
+        )
+
+        assert np.array_equal(
+            arrays.gantry_angle,
+            np.array(
+                rtplan.get_cp_attribute_leaning_on_prior(control_points, "GantryAngle"),
+                dtype=float,
+            ),
+        )
+        for device_type in ("MLCX", "ASYMY"):
+            assert np.array_equal(
+                arrays.leaf_jaw_positions[device_type],
+                _leaning_on_prior(control_points, device_type),
+            )
+
+
+@pytest.mark.pydicom
+def test_control_point_arrays_require_each_collimator(tmp_path):
+    ds = _vmat_plan()
+    del ds.BeamSequence[0].ControlPointSequence[1].BeamLimitingDevicePositionSequence[0]
+
+    with pytest.raises(ValueError, match="exactly one item"):
+        rtplan.get_control_point_arrays(
+            ds.BeamSequence[0].ControlPointSequence,
+            {"MLCX": 2 * NUMBER_OF_LEAF_PAIRS, "ASYMY": 2},
+        )
+
+
+@pytest.mark.pydicom
+def test_delivery_from_dicom_control_point_arrays(tmp_path):
+    delivery = pymedphys.Delivery.from_dicom(_reread(_vmat_plan(), tmp_path))
+
+    assert delivery.monitor_units == (0, 100, 200)
+    assert np.array_equal(delivery.gantry, convert_IEC_angle_to_bipolar([181, 90, 0]))
+    assert delivery.collimator == (10, 10, 10)
+    assert delivery.jaw == ((60, 50),) * 3
+    assert delivery.mlc == (
+        ((6, 3), (5, 2), (4, 1)),
+        ((12, 9), (11, 8), (10, 7)),
+        ((12, 9), (11, 8), (10, 7)),
+    )
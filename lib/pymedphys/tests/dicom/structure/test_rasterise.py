@@ -0,0 +1,165 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pymedphys._imports import matplotlib
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._dicom.structure.rasterise import (
+    group_contours_by_plane,
+    rasterise_polygons,
+    rasterise_structure,
+)
+
+# Offset the grid so that no grid point lies on a polygon edge.
+X_AXIS = np.arange(-10, 10, 0.25) + 0.0123
+Y_AXIS = np.arange(-8, 8, 0.5) + 0.0171
+
+
+def _square(centre_x, centre_y, half_width):
+    x = centre_x + np.array([-1, -1, 1, 1]) * half_width
+    y = centre_y + np.array([-1, 1, 1, -1]) * half_width
+
+    return x, y
+
+
+def _matplotlib_mask(polygon, x_axis, y_axis):
+    xx, yy = np.meshgrid(x_axis, y_axis)
+    points = np.column_stack([xx.ravel(), yy.ravel()])
+    path = matplotlib.path.Path(np.column_stack(polygon))
+
+    return path.contains_points(points).reshape(xx.shape)
+
+
+def _structure_from_planes(polygons_by_z):
+    x_contours, y_contours, z_contours = [], [], []
+    for z, polygons in polygons_by_z.items():
+        for x, y in polygons:
+            x_contours.append(np.asarray(x, dtype=float))
+            y_contours.append(np.asarray(y, dtype=float))
+            z_contours.append(np.full(len(x), z, dtype=float))
+
+    return x_contours, y_contours, z_contours
+
+
+def test_star_polygon_matches_matplotlib():
+    angles = np.linspace(0, 2 * np.pi, 31, endpoint=False)
+    radii = np.where(np.arange(angles.size) % 2, 3, 7)
+    star = (radii * np.cos(angles), radii * np.sin(angles))
+
+    mask = rasterise_polygons([star], X_AXIS, Y_AXIS)
+
+    assert mask.any()
+    assert np.array_equal(mask, _matplotlib_mask(star, X_AXIS, Y_AXIS))
+
+
+def test_unsorted_axes():
+    square = _square(1, 1, 3)
+    reference = rasterise_polygons([square], X_AXIS, Y_AXIS)
+
+    mask = rasterise_polygons([square], X_AXIS[::-1], Y_AXIS[::-1])
+
+    assert np.array_equal(mask, reference[::-1, ::-1])
+
+
+def test_multiple_contours_and_holes():
+    outer = _square(-4, 0, 4)
+    hole = _square(-4, 0, 2)
+    separate = _square(6, 0, 2)
+
+    mask = rasterise_polygons([outer, hole, separate], X_AXIS, Y_AXIS)
+
+    expected = (
+        _matplotlib_mask(outer, X_AXIS, Y_AXIS)
+        & ~_matplotlib_mask(hole, X_AXIS, Y_AXIS)
+    ) | _matplotlib_mask(separate, X_AXIS, Y_AXIS)
+
+    assert np.array_equal(mask, expected)
+
+
+def test_group_contours_by_plane():
+    x, y, z = _structure_from_planes(
+        {2.0: [_square(0, 0, 1)], 0.0: [_square(0, 0, 1), _square(5, 5, 1)]}
+    )
+
+    planes = group_contours_by_plane(x, y, z)
+
+    assert list(planes.keys()) == [0.0, 2.0]
+    assert [len(polygons) for polygons in planes.values()] == [2, 1]
+
+    z[0][0] = 1.0
+    with pytest.raises(ValueError):
+        group_contours_by_plane(x, y, z)
+
+
+def test_misaligned_planes_are_interpolated():
+    x, y, z = _structure_from_planes({0.0: [_square(0, 0, 2)], 2.0: [_square(0, 0, 4)]})
+    x_axis = np.arange(-6, 6, 0.1) + 0.05
+    y_axis = np.arange(-6, 6, 0.1) + 0.05
+    z_axis = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, 3.0])
+
+    mask = rasterise_structure(x, y, z, x_axis, y_axis, z_axis)
+
+    assert not mask[0].any()
+    assert not mask[-1].any()
+
+    areas = mask.sum(axis=(1, 2)) * 0.1**2
+    assert np.allclose(areas[[1, 2, 3, 4]], [16, 25, 36, 64], rtol=0.05)
+
+    nearest = rasterise_structure(
+        x, y, z, x_axis, y_axis, z_axis, interpolation="nearest"
+    )
+    nearest_areas = nearest.sum(axis=(1, 2)) * 0.1**2
+    assert np.allclose(nearest_areas[[1, 2, 3, 4]], [16, 16, 64, 64], rtol=0.05)
+
+
+def test_gaps_between_planes():
+    square = _square(0, 0, 2)
+    x, y, z = _structure_from_planes(
+        {0.0: [square], 1.0: [square], 2.0: [square], 10.0: [square], 11.0: [square]}
+    )
+
+    # Every gap is interpolated across by default
+    mask = rasterise_structure(x, y, z, X_AXIS, Y_AXIS, [0.5, 5.0, 10.5])
+    assert mask.all(axis=0).any()
+    assert np.array_equal(mask[0], mask[1])
+    assert np.array_equal(mask[1], mask[2])
+
+    mask = rasterise_structure(x, y, z, X_AXIS, Y_AXIS, [0.5, 5.0, 10.5], max_gap=5)
+    assert mask[0].any()
+    assert not mask[1].any()
+    assert mask[2].any()
+
+
+def test_partial_volume_fractions():
+    # A unit square cube centred on the corner shared by four voxels
+    x, y, z = _structure_from_planes(
+        {-0.5: [_square(0, 0, 0.5)], 0.5: [_square(0, 0, 0.5)]}
+    )
+    axis = np.array([-0.5, 0.5])
+
+    fractions = rasterise_structure(x, y, z, axis, axis, [0.0], supersample=4)
+
+    assert fractions.dtype == np.float64
+    assert np.allclose(fractions, 0.25)
+
+    axis = np.arange(-3, 3.01, 1.0)
+    x, y, z = _structure_from_planes(
+        {z: [_square(0.2, -0.3, 1.7)] for z in np.arange(-3, 3.01, 1.0)}
+    )
+
+    fractions = rasterise_structure(x, y, z, axis, axis, [0.0], supersample=8)
+
+    assert np.all((fractions >= 0) & (fractions <= 1))
+    assert fractions.sum() == pytest.approx(3.4**2, rel=0.02)
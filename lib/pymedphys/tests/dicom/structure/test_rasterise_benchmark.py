@@ -0,0 +1,97 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of structure rasterisation for a body outline sized
+structure.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import matplotlib
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._dicom.structure.rasterise import rasterise_structure
+
+NUMBER_OF_PLANES = 80
+PLANE_SPACING = 2.5
+NUMBER_OF_VERTICES = 800
+
+
+def _body_outline():
+    x_contours, y_contours, z_contours = [], [], []
+    angles = np.linspace(0, 2 * np.pi, NUMBER_OF_VERTICES, endpoint=False)
+
+    for i in range(NUMBER_OF_PLANES):
+        z = i * PLANE_SPACING
+        wobble = 1 + 0.05 * np.sin(7 * angles + i / 10)
+        x_contours.append(220 * np.cos(angles) * wobble)
+        y_contours.append(150 * np.sin(angles) * wobble)
+        z_contours.append(np.full(NUMBER_OF_VERTICES, z))
+
+    return x_contours, y_contours, z_contours
+
+
+def _matplotlib_masks(x_contours, y_contours, x_axis, y_axis):
+    xx, yy = np.meshgrid(x_axis, y_axis)
+    points = np.column_stack([xx.ravel(), yy.ravel()])
+
+    return np.array(
+        [
+            matplotlib.path.Path(np.column_stack([x, y]))
+            .contains_points(points)
+            .reshape(xx.shape)
+            for x, y in zip(x_contours, y_contours)
+        ]
+    )
+
+
+@pytest.mark.benchmark
+def test_body_outline_rasterisation_benchmark():
+    x_contours, y_contours, z_contours = _body_outline()
+    x_axis = np.arange(-260, 260, 1.0) + 0.1
+    y_axis = np.arange(-180, 180, 1.0) + 0.1
+    z_axis = np.array([contour[0] for contour in z_contours])
+
+    # Compile outside of the timed region
+    rasterise_structure(
+        x_contours[:1], y_contours[:1], z_contours[:1], x_axis, y_axis, z_axis[:1]
+    )
+
+    start = time.perf_counter()
+    reference = _matplotlib_masks(x_contours, y_contours, x_axis, y_axis)
+    matplotlib_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    mask = rasterise_structure(
+        x_contours, y_contours, z_contours, x_axis, y_axis, z_axis
+    )
+    aligned_duration = time.perf_counter() - start
+
+    assert np.array_equal(mask, reference)
+
+    start = time.perf_counter()
+    rasterise_structure(
+        x_contours, y_contours, z_contours, x_axis, y_axis, z_axis + 1.0
+    )
+    interpolated_duration = time.perf_counter() - start
+
+    print(
+        f"\n{NUMBER_OF_PLANES} planes of {y_axis.size} x {x_axis.size}: "
+        f"matplotlib {matplotlib_duration:.3f} s, "
+        f"scanline {aligned_duration:.3f} s, "
+        f"scanline with interpolated planes {interpolated_duration:.3f} s"
+    )
@@ -20,6 +20,7 @@ from pymedphys._dicom.anonymise import (
     IDENTIFYING_KEYWORDS_FILEPATH,
     anonymise_directory,
     anonymise_file,
+    deferred,
     get_baseline_keyword_vr_dict,
     get_default_identifying_keywords,
     is_anonymised_dataset,
@@ -597,3 +598,115 @@ def test_tags_to_anonymise_in_dicom_dict_baseline(save_new_identifying_keywords=
         # "TemplateExtensionOrganizationUID",
         # "TransactionUID",
         # "UID",
+
+
+def _create_ct_file_with_nested_identifiers(filepath, sop_instance_uid):
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.2",
+            "SOPInstanceUID": sop_instance_uid,
+            "Modality": "CT",
+            "PatientName": "Smith^John",
+            "PatientID": "12345",
+            "StudyDate": "20200101",
+            "ReferencedSeriesSequence": [
+                {
+                    "SeriesInstanceUID": "1.2.3",
+                    "OperatorsName": "Nested^Name",
+                    "OverrideSequence": [{"PatientName": "Deep^Name"}],
+                }
+            ],
+            "Rows": 64,
+            "Columns": 64,
+            "BitsAllocated": 16,
+            "BitsStored": 16,
+            "HighBit": 15,
+            "PixelRepresentation": 1,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+            "PixelData": bytes(range(256)) * 32,
+        }
+    )
+    ds.add_new(0x00090010, "LO", "PRIVATE CREATOR")
+    ds.add_new(0x00091001, "LO", "Private value")
+    ds.ReferencedSeriesSequence[0].add_new(0x00091001, "LO", "Nested private")
+
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+    ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+
+    os.makedirs(dirname(filepath), exist_ok=True)
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+
+@pytest.mark.pydicom
+def test_anonymise_directory_in_parallel(tmp_path):
+    input_dirpath = tmp_path / "input"
+    for i in range(6):
+        _create_ct_file_with_nested_identifiers(
+            str(input_dirpath / f"series{i % 2}" / f"{i}.dcm"), f"1.2.3.4.{i}"
+        )
+
+    sequential = anonymise_directory(
+        input_dirpath, output_dirpath=tmp_path / "sequential"
+    )
+    parallel = anonymise_directory(
+        input_dirpath,
+        output_dirpath=tmp_path / "parallel",
+        n_workers=2,
+        defer_pixel_data=True,
+    )
+
+    assert len(sequential) == len(parallel) == 6
+    assert is_anonymised_directory(tmp_path / "sequential")
+
+    for sequential_filepath, parallel_filepath in zip(sequential, parallel):
+        assert basename(sequential_filepath) == basename(parallel_filepath)
+        with open(sequential_filepath, "rb") as a, open(parallel_filepath, "rb") as b:
+            assert a.read() == b.read()
+
+    ds_anon = pydicom.dcmread(parallel[0])
+    referenced_series = ds_anon.ReferencedSeriesSequence[0]
+    assert 0x00091001 not in referenced_series
+    assert referenced_series.OperatorsName == "ANONYMOUS^PATIENT"
+    assert referenced_series.OverrideSequence[0].PatientName == "ANONYMOUS^PATIENT"
+    assert ds_anon.PixelData == bytes(range(256)) * 32
+
+
+@pytest.mark.pydicom
+def test_anonymise_directory_with_truncated_pixel_data(tmp_path, monkeypatch):
+    input_dirpath = tmp_path / "input"
+    for i in range(2):
+        _create_ct_file_with_nested_identifiers(
+            str(input_dirpath / f"{i}.dcm"), f"1.2.3.4.{i}"
+        )
+
+    truncated_filepath = input_dirpath / "1.dcm"
+    read_header = deferred.read_header
+
+    def read_header_then_truncate(dicom_filepath, *args, **kwargs):
+        # The file is truncated after its header has been read, but
+        # before its pixel data has been copied.
+        header = read_header(dicom_filepath, *args, **kwargs)
+        if dicom_filepath == str(truncated_filepath):
+            data = truncated_filepath.read_bytes()
+            truncated_filepath.write_bytes(data[:-100])
+
+        return header
+
+    monkeypatch.setattr(deferred, "read_header", read_header_then_truncate)
+
+    output_dirpath = tmp_path / "output"
+    with pytest.raises(EOFError):
+        anonymise_directory(
+            input_dirpath,
+            output_dirpath=output_dirpath,
+            anonymise_filenames=False,
+            fail_fast=False,
+            defer_pixel_data=True,
+        )
+
+    assert [basename(filepath) for filepath in output_dirpath.iterdir()] == [
+        "0_Anonymised.dcm"
+    ]
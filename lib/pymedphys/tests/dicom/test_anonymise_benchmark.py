@@ -0,0 +1,91 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of directory anonymisation throughput for a CBCT sized
+series.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import io
+import os
+import time
+from contextlib import redirect_stdout
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._dicom.anonymise import anonymise_directory
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+NUMBER_OF_SLICES = 100
+SLICE_SHAPE = (1024, 1024)
+
+
+@pytest.fixture(name="series", scope="module")
+def fixture_series(tmp_path_factory):
+    dirpath = tmp_path_factory.mktemp("series")
+    rng = np.random.default_rng(0)
+
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.2",
+            "Modality": "CT",
+            "PatientName": "Smith^John",
+            "PatientID": "12345",
+            "StudyDate": "20200101",
+            "Rows": SLICE_SHAPE[0],
+            "Columns": SLICE_SHAPE[1],
+            "BitsAllocated": 16,
+            "BitsStored": 16,
+            "HighBit": 15,
+            "PixelRepresentation": 1,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+
+    for i in range(NUMBER_OF_SLICES):
+        ds.SOPInstanceUID = f"1.2.3.4.{i}"
+        ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+        ds.PixelData = rng.integers(-1000, 2000, SLICE_SHAPE, dtype="<i2").tobytes()
+        pydicom.dcmwrite(dirpath / f"{i}.dcm", ds, enforce_file_format=True)
+
+    size = sum(entry.stat().st_size for entry in os.scandir(dirpath))
+
+    return dirpath, size
+
+
+@pytest.mark.benchmark
+def test_anonymise_directory_benchmark(series, tmp_path):
+    dirpath, size = series
+
+    durations = {}
+    for label, options in [
+        ("full read", {}),
+        ("pixel data copied", {"defer_pixel_data": True}),
+    ]:
+        output_dirpath = tmp_path / label.replace(" ", "_")
+
+        start = time.perf_counter()
+        with redirect_stdout(io.StringIO()):
+            anonymise_directory(dirpath, output_dirpath=output_dirpath, **options)
+        durations[label] = time.perf_counter() - start
+
+    print(f"\nAnonymised {NUMBER_OF_SLICES} files, {size / 1e6:.0f} MB:")
+    for label, duration in durations.items():
+        print(f"  {label}: {duration:.2f} s, {size / 1e6 / duration:.0f} MB/s")
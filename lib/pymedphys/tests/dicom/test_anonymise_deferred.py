@@ -0,0 +1,161 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+from contextlib import redirect_stdout
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._dicom.anonymise import anonymise_file, deferred
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+
+def create_ct_file(filepath, transfer_syntax_uid, pixel_data, rows=64, columns=64):
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.2",
+            "SOPInstanceUID": "1.2.3.4",
+            "Modality": "CT",
+            "PatientName": "Smith^John",
+            "PatientID": "12345",
+            "ReferencedSeriesSequence": [{"OperatorsName": "Nested^Name"}],
+            "Rows": rows,
+            "Columns": columns,
+            "BitsAllocated": 16,
+            "BitsStored": 16,
+            "HighBit": 15,
+            "PixelRepresentation": 1,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+        }
+    )
+    ds.add_new(0x00090010, "LO", "PRIVATE CREATOR")
+    ds.add_new(0x00091001, "LO", "Private value")
+    ds.PixelData = pixel_data
+
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = transfer_syntax_uid
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+    ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+
+    if transfer_syntax_uid.is_encapsulated:
+        ds["PixelData"].VR = "OB"
+        ds["PixelData"].is_undefined_length = True
+
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+    return ds
+
+
+def _native_pixel_data(rows=64, columns=64):
+    rng = np.random.default_rng(0)
+
+    return rng.integers(-1000, 2000, (rows, columns)).astype("<i2").tobytes()
+
+
+def _anonymise_both_ways(tmp_path, filepath):
+    with redirect_stdout(io.StringIO()):
+        full = anonymise_file(filepath, output_filepath=str(tmp_path / "full" / "a"))
+        copied = anonymise_file(
+            filepath,
+            output_filepath=str(tmp_path / "copied" / "a"),
+            defer_pixel_data=True,
+        )
+
+    with open(full, "rb") as full_file, open(copied, "rb") as copied_file:
+        assert full_file.read() == copied_file.read()
+
+    return copied
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize(
+    "transfer_syntax_uid",
+    [pydicom.uid.ExplicitVRLittleEndian, pydicom.uid.ImplicitVRLittleEndian],
+)
+def test_deferred_anonymisation_is_identical(tmp_path, transfer_syntax_uid):
+    filepath = str(tmp_path / "ct.dcm")
+    pixel_data = _native_pixel_data()
+    create_ct_file(filepath, transfer_syntax_uid, pixel_data)
+
+    ds_header, extent = deferred.read_header(filepath)
+    assert "PixelData" not in ds_header
+    assert extent.offset + extent.length == os.path.getsize(filepath)
+    assert extent.length - len(pixel_data) in (8, 12)
+
+    anonymised = pydicom.dcmread(_anonymise_both_ways(tmp_path, filepath))
+    assert anonymised.PatientName == "ANONYMOUS^PATIENT"
+    assert 0x00091001 not in anonymised
+    assert anonymised.PixelData == pixel_data
+
+
+@pytest.mark.pydicom
+def test_deferred_anonymisation_of_encapsulated_pixel_data(tmp_path):
+    filepath = str(tmp_path / "ct.dcm")
+    frames = [b"\x01\x02" * 100, b"\x03\x04" * 51]
+    pixel_data = pydicom.encaps.encapsulate(frames)
+    create_ct_file(filepath, pydicom.uid.RLELossless, pixel_data)
+
+    _, extent = deferred.read_header(filepath)
+    assert extent.offset + extent.length == os.path.getsize(filepath)
+
+    anonymised = pydicom.dcmread(_anonymise_both_ways(tmp_path, filepath))
+    assert anonymised.PixelData == pixel_data
+
+
+@pytest.mark.pydicom
+def test_deflated_files_are_anonymised_in_full(tmp_path):
+    filepath = str(tmp_path / "ct.dcm")
+    pixel_data = _native_pixel_data()
+    create_ct_file(filepath, pydicom.uid.DeflatedExplicitVRLittleEndian, pixel_data)
+
+    _, extent = deferred.read_header(filepath)
+    assert extent is None
+
+    anonymised = pydicom.dcmread(_anonymise_both_ways(tmp_path, filepath))
+    assert anonymised.PatientName == "ANONYMOUS^PATIENT"
+    assert anonymised.PixelData == pixel_data
+
+
+@pytest.mark.pydicom
+def test_elements_after_pixel_data_are_anonymised(tmp_path):
+    filepath = str(tmp_path / "ct.dcm")
+    ds = create_ct_file(
+        filepath, pydicom.uid.ExplicitVRLittleEndian, _native_pixel_data()
+    )
+    ds.add_new(0x7FE10010, "LO", "PRIVATE CREATOR")
+    ds.add_new(0x7FE11001, "LO", "Private value after the pixel data")
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+    _, extent = deferred.read_header(filepath)
+    assert extent is None
+
+    anonymised = pydicom.dcmread(_anonymise_both_ways(tmp_path, filepath))
+    assert 0x7FE11001 not in anonymised
+
+
+@pytest.mark.pydicom
+def test_buffered_copy(tmp_path, monkeypatch):
+    filepath = str(tmp_path / "ct.dcm")
+    create_ct_file(filepath, pydicom.uid.ExplicitVRLittleEndian, _native_pixel_data())
+
+    def _unsupported_sendfile(*args, **kwargs):
+        raise OSError("sendfile is not supported")
+
+    monkeypatch.setattr(deferred, "_sendfile", _unsupported_sendfile)
+    monkeypatch.setattr(deferred, "COPY_BUFFER_SIZE", 1000)
+
+    _anonymise_both_ways(tmp_path, filepath)
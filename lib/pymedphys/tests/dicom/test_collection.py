@@ -0,0 +1,175 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._dicom.collection import DicomCollection
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+CT_IMAGE_STORAGE = "1.2.840.10008.5.1.4.1.1.2"
+RT_PLAN_STORAGE = "1.2.840.10008.5.1.4.1.1.481.5"
+
+
+def _write(filepath, ds):
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+    ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+
+def _write_ct_series(
+    directory,
+    series_instance_uid,
+    z_positions,
+    image_orientation_patient=(1, 0, 0, 0, 1, 0),
+):
+    for i, z in enumerate(z_positions):
+        if image_orientation_patient[:3] == (0, 1, 0):
+            # Sagittal slices, stacked along x
+            image_position_patient = [z, 0, 0]
+        else:
+            image_position_patient = [0, 0, z]
+
+        ds = dicom_dataset_from_dict(
+            {
+                "SOPClassUID": CT_IMAGE_STORAGE,
+                "SOPInstanceUID": pydicom.uid.generate_uid(),
+                "SeriesInstanceUID": series_instance_uid,
+                "PatientID": "12345",
+                "Modality": "CT",
+                "InstanceNumber": i + 1,
+                "ImagePositionPatient": image_position_patient,
+                "ImageOrientationPatient": list(image_orientation_patient),
+                "Rows": 4,
+                "Columns": 4,
+                "BitsAllocated": 16,
+                "BitsStored": 16,
+                "HighBit": 15,
+                "PixelRepresentation": 1,
+                "SamplesPerPixel": 1,
+                "PhotometricInterpretation": "MONOCHROME2",
+                "PixelData": np.full((4, 4), i, dtype="<i2").tobytes(),
+            }
+        )
+        _write(directory / "ct" / f"{i}.dcm", ds)
+
+
+def _write_plan(filepath, label, creation_date, patient_id="12345"):
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": RT_PLAN_STORAGE,
+            "SOPInstanceUID": pydicom.uid.generate_uid(),
+            "PatientID": patient_id,
+            "Modality": "RTPLAN",
+            "RTPlanLabel": label,
+            "InstanceCreationDate": creation_date,
+            "InstanceCreationTime": "120000",
+        }
+    )
+    _write(filepath, ds)
+
+
+@pytest.mark.pydicom
+def test_dicom_collection_queries(tmp_path):
+    directory = tmp_path / "export"
+    series_instance_uid = pydicom.uid.generate_uid()
+    z_positions = [10.0, -5.0, 2.5, 0.0]
+
+    _write_ct_series(directory, series_instance_uid, z_positions)
+    _write_plan(directory / "plans" / "old.dcm", "old", "20200101")
+    _write_plan(directory / "plans" / "new.dcm", "new", "20210101")
+    _write_plan(directory / "plans" / "other.dcm", "other", "20220101", "54321")
+    (directory / "not_dicom.dcm").write_text("Not a DICOM file")
+
+    collection = DicomCollection(directory, index_path=tmp_path / "index.sqlite")
+
+    latest = collection.latest("RTPLAN", patient_id="12345")
+    assert latest.rt_plan_label == "new"
+    assert latest.read().RTPlanLabel == "new"
+    assert collection.latest("RTPLAN", patient_id="00000") is None
+
+    ct_slices = collection.series(series_instance_uid)
+    assert [ct_slice.slice_position for ct_slice in ct_slices] == sorted(z_positions)
+    assert "PixelData" not in ct_slices[0].read()
+    assert np.all(ct_slices[0].pixel_array == z_positions.index(-5.0))
+
+    assert len(collection.files(modality=["CT", "RTPLAN"])) == 7
+    assert len(collection.files(path="not_dicom.dcm")) == 0
+
+    with pytest.raises(ValueError):
+        collection.files(not_a_column="value")
+
+    collection.close()
+
+
+@pytest.mark.pydicom
+def test_dicom_collection_sagittal_series(tmp_path):
+    directory = tmp_path / "export"
+    series_instance_uid = pydicom.uid.generate_uid()
+    x_positions = [10.0, -5.0, 2.5, 0.0]
+
+    _write_ct_series(
+        directory,
+        series_instance_uid,
+        x_positions,
+        image_orientation_patient=(0, 1, 0, 0, 0, -1),
+    )
+
+    collection = DicomCollection(directory, index_path=tmp_path / "index.sqlite")
+    ct_slices = collection.series(series_instance_uid)
+
+    # The normal of these sagittal slices points along -x
+    assert [ct_slice.slice_position for ct_slice in ct_slices] == sorted(
+        -x for x in x_positions
+    )
+    assert [ct_slice.read().ImagePositionPatient[0] for ct_slice in ct_slices] == (
+        sorted(x_positions, reverse=True)
+    )
+
+    collection.close()
+
+
+@pytest.mark.pydicom
+def test_dicom_collection_incremental_update(tmp_path):
+    directory = tmp_path / "export"
+    index_path = tmp_path / "index.sqlite"
+
+    _write_ct_series(directory, pydicom.uid.generate_uid(), [0.0, 1.0, 2.0])
+    _write_plan(directory / "plan.dcm", "first", "20200101")
+
+    collection = DicomCollection(directory, index_path=index_path, update=False)
+    assert collection.update() == (4, 0)
+    assert collection.update() == (0, 0)
+    collection.close()
+
+    # A new collection reuses the persisted index
+    collection = DicomCollection(directory, index_path=index_path, update=False)
+    assert collection.update() == (0, 0)
+
+    _write_plan(directory / "plan.dcm", "second", "20200101")
+    stat = os.stat(directory / "plan.dcm")
+    os.utime(directory / "plan.dcm", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    os.remove(directory / "ct" / "0.dcm")
+
+    assert collection.update() == (1, 1)
+    assert collection.latest("RTPLAN").rt_plan_label == "second"
+    assert len(collection.files(modality="CT")) == 2
+
+    collection.close()
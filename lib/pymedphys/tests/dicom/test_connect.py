@@ -396,3 +396,211 @@ def test_dicom_sender_cli(test_dataset):
         dcm_file = next(dcm_files)
         ds = pydicom.dcmread(dcm_file)
         check_dicom_agrees(ds, test_dataset)
+
+
+def _write_ct_series(directory, number_of_files, transfer_syntax_uid):
+    series_uid = pydicom.uid.generate_uid()
+    study_uid = pydicom.uid.generate_uid()
+
+    filepaths = []
+    for i in range(number_of_files):
+        sop_instance_uid = pydicom.uid.generate_uid()
+        ds = dicom_dataset_from_dict(
+            {
+                "SOPClassUID": pynetdicom.sop_class.CTImageStorage,
+                "SOPInstanceUID": sop_instance_uid,
+                "SeriesInstanceUID": series_uid,
+                "StudyInstanceUID": study_uid,
+                "PatientID": "987654321PyMedPhysID",
+                "Modality": "CT",
+                "InstanceNumber": i,
+                "Rows": 16,
+                "Columns": 16,
+                "BitsAllocated": 16,
+                "BitsStored": 16,
+                "HighBit": 15,
+                "PixelRepresentation": 1,
+                "SamplesPerPixel": 1,
+                "PhotometricInterpretation": "MONOCHROME2",
+                "PixelData": bytes(range(256)) * 2,
+            }
+        )
+        ds.file_meta = pydicom.dataset.FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = transfer_syntax_uid
+        ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+        ds.file_meta.MediaStorageSOPInstanceUID = sop_instance_uid
+
+        filepath = pathlib.Path(directory).joinpath(f"{i}.dcm")
+        pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("original_transfer_syntax", [False, True])
+def test_dicom_sender_concurrent_associations(
+    listener, test_dataset, tmp_path, original_transfer_syntax
+):
+    """Test sending a series, and a dataset, across several associations"""
+
+    filepaths = _write_ct_series(tmp_path, 7, pydicom.uid.ExplicitVRLittleEndian)
+    dicom_sender = DicomSender(host="127.0.0.1", port=TEST_PORT)
+
+    report = dicom_sender.send_with_report(
+        filepaths + [test_dataset],
+        n_associations=3,
+        original_transfer_syntax=original_transfer_syntax,
+    )
+
+    assert [result.dcm_file for result in report.results] == filepaths + [test_dataset]
+    assert all(result.status.Status == 0 for result in report.results)
+    assert all(result.latency > 0 for result in report.results)
+    assert report.n_bytes == sum(filepath.stat().st_size for filepath in filepaths)
+    assert report.throughput > 0
+
+    expected_transfer_syntax = (
+        pydicom.uid.ExplicitVRLittleEndian
+        if original_transfer_syntax
+        else pydicom.uid.ImplicitVRLittleEndian
+    )
+    for filepath in filepaths:
+        sent = pydicom.dcmread(filepath)
+        received = pydicom.dcmread(
+            hierarchical_dicom_storage_directory(
+                listener.storage_directory, sent
+            ).joinpath(f"CT.{sent.SOPInstanceUID}.dcm")
+        )
+        assert received.file_meta.TransferSyntaxUID == expected_transfer_syntax
+        assert received.PixelData == sent.PixelData
+
+    assert not pynetdicom._config.STORE_SEND_CHUNKED_DATASET
+
+    shutil.rmtree(listener.storage_directory)
+
+
+@pytest.mark.pydicom
+def test_dicom_sender_failures(listener, test_dataset, tmp_path, monkeypatch):
+    """Test that objects which could not be sent are reported in place,
+    without stopping the remaining objects being sent"""
+
+    filepaths = _write_ct_series(tmp_path, 3, pydicom.uid.ExplicitVRLittleEndian)
+
+    unreadable = filepaths[1]
+    dcmread = pydicom.dcmread
+
+    def dcmread_unreadable(fp, *args, **kwargs):
+        if fp == unreadable and not kwargs.get("stop_before_pixels"):
+            raise OSError("Unreadable")
+
+        return dcmread(fp, *args, **kwargs)
+
+    monkeypatch.setattr(pydicom, "dcmread", dcmread_unreadable)
+
+    # Not a SOP class for which the listener accepts a presentation context
+    unsupported = pydicom.Dataset()
+    unsupported.SOPClassUID = "1.2.3.4"
+    unsupported.SOPInstanceUID = pydicom.uid.generate_uid()
+
+    dicom_sender = DicomSender(host="127.0.0.1", port=TEST_PORT)
+    statuses = dicom_sender.send(
+        filepaths + [unsupported, test_dataset], n_associations=2
+    )
+
+    assert len(statuses) == 5
+    assert [status.get("Status") for status in statuses] == [0, None, 0, None, 0]
+
+
+@pytest.mark.pydicom
+def test_dicom_listener_raw_storage_series_complete(test_dataset, tmp_path):
+    """Test that raw storage writes the objects as sent and reports each
+    series once it is complete"""
+
+    completed = []
+    raw_listener = DicomListener(
+        port=TEST_PORT,
+        storage_directory=tmp_path.joinpath("receive"),
+        raw_storage=True,
+        on_series_complete=completed.append,
+        series_complete_delay=0.1,
+    )
+    raw_listener.start()
+
+    try:
+        send_directory = tmp_path.joinpath("send")
+        send_directory.mkdir()
+        filepaths = _write_ct_series(
+            send_directory, 9, pydicom.uid.ExplicitVRLittleEndian
+        )
+
+        dicom_sender = DicomSender(host="127.0.0.1", port=TEST_PORT)
+        statuses = dicom_sender.send(
+            filepaths + [test_dataset],
+            n_associations=3,
+            original_transfer_syntax=True,
+        )
+        assert [status.Status for status in statuses] == [0] * 10
+
+        events = [raw_listener.completed_series.get(timeout=10) for _ in range(2)]
+    finally:
+        raw_listener.stop()
+
+    assert sorted(events) == sorted(completed)
+    events = {event.series_instance_uid: event for event in events}
+
+    ct_series = events[pydicom.dcmread(filepaths[0]).SeriesInstanceUID]
+    assert len(ct_series.filepaths) == len(filepaths)
+    assert not ct_series.failed
+
+    for filepath in filepaths:
+        sent = pydicom.dcmread(filepath)
+        received_filepath = ct_series.directory.joinpath(
+            f"CT.{sent.SOPInstanceUID}.dcm"
+        )
+        assert received_filepath in ct_series.filepaths
+
+        _, sent_offset = pynetdicom.dsutils.split_dataset(filepath)
+        _, received_offset = pynetdicom.dsutils.split_dataset(received_filepath)
+        assert (
+            filepath.read_bytes()[sent_offset:]
+            == received_filepath.read_bytes()[received_offset:]
+        )
+
+    plan_series = events[test_dataset.SeriesInstanceUID]
+    assert len(plan_series.filepaths) == 1
+    check_dicom_agrees(pydicom.dcmread(plan_series.filepaths[0]), test_dataset)
+
+
+@pytest.mark.pydicom
+def test_dicom_listener_raw_storage_write_failure(test_dataset, tmp_path):
+    """Test that raw storage reports an object it could not write as
+    failed to the sender"""
+
+    # A file in place of the storage directory, within which nothing can
+    # be written
+    storage_directory = tmp_path.joinpath("receive")
+    storage_directory.touch()
+
+    raw_listener = DicomListener(
+        port=TEST_PORT,
+        storage_directory=storage_directory,
+        raw_storage=True,
+        series_complete_delay=0.1,
+    )
+    raw_listener.start()
+
+    try:
+        ae = pynetdicom.AE()
+        ae.add_requested_context(test_dataset.SOPClassUID)
+        assoc = ae.associate("127.0.0.1", TEST_PORT)
+        status = assoc.send_c_store(test_dataset)
+        assoc.release()
+
+        assert status.Status == 0xA700
+
+        event = raw_listener.completed_series.get(timeout=10)
+    finally:
+        raw_listener.stop()
+
+    assert not event.filepaths
+    assert len(event.failed) == 1
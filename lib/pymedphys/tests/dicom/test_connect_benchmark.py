@@ -0,0 +1,119 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Loopback benchmark of pushing a large CT series from ``DicomSender``
+into a ``DicomListener``.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import logging
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pynetdicom, pytest
+
+from pymedphys._dicom.connect.listen import DicomListener
+from pymedphys._dicom.connect.send import DicomSender
+from pymedphys._dicom.create import dicom_dataset_from_dict
+
+BENCHMARK_PORT = 9989
+
+NUMBER_OF_SLICES = 300
+SLICE_SHAPE = (512, 512)
+
+
+@pytest.fixture(name="series", scope="module")
+def fixture_series(tmp_path_factory):
+    dirpath = tmp_path_factory.mktemp("series")
+    rng = np.random.default_rng(0)
+
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPClassUID": pynetdicom.sop_class.CTImageStorage,
+            "SeriesInstanceUID": pydicom.uid.generate_uid(),
+            "StudyInstanceUID": pydicom.uid.generate_uid(),
+            "PatientID": "987654321PyMedPhysID",
+            "Modality": "CT",
+            "Rows": SLICE_SHAPE[0],
+            "Columns": SLICE_SHAPE[1],
+            "BitsAllocated": 16,
+            "BitsStored": 16,
+            "HighBit": 15,
+            "PixelRepresentation": 1,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+
+    filepaths = []
+    for i in range(NUMBER_OF_SLICES):
+        ds.SOPInstanceUID = pydicom.uid.generate_uid()
+        ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+        ds.PixelData = rng.integers(-1000, 2000, SLICE_SHAPE, dtype="<i2").tobytes()
+
+        filepath = dirpath / f"{i}.dcm"
+        pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+@pytest.mark.benchmark
+def test_loopback_benchmark(series, tmp_path):
+    logging.getLogger().setLevel(logging.WARNING)
+    size = sum(filepath.stat().st_size for filepath in series)
+
+    durations = {}
+    for label, listener_options, sender_options in [
+        ("decoded storage, one association", {}, {"n_associations": 1}),
+        ("raw storage, one association", {"raw_storage": True}, {"n_associations": 1}),
+        (
+            "raw storage, four associations",
+            {"raw_storage": True},
+            {"n_associations": 4},
+        ),
+        (
+            "raw storage, four associations, original transfer syntax",
+            {"raw_storage": True},
+            {"n_associations": 4, "original_transfer_syntax": True},
+        ),
+    ]:
+        listener = DicomListener(
+            port=BENCHMARK_PORT,
+            storage_directory=tmp_path / str(len(durations)),
+            series_complete_delay=0,
+            **listener_options,
+        )
+        listener.start()
+
+        try:
+            start = time.perf_counter()
+            report = DicomSender(port=BENCHMARK_PORT).send_with_report(
+                series, **sender_options
+            )
+            if listener.raw_storage:
+                listener.completed_series.get(timeout=600)
+            durations[label] = time.perf_counter() - start
+        finally:
+            listener.stop()
+
+        assert all(result.status.Status == 0 for result in report.results)
+
+    print(f"\nSent {NUMBER_OF_SLICES} files, {size / 1e6:.0f} MB:")
+    for label, duration in durations.items():
+        print(f"  {label}: {duration:.2f} s, {size / 1e6 / duration:.0f} MB/s")
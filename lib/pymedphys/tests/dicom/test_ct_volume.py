@@ -0,0 +1,133 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._dicom.create import dicom_dataset_from_dict
+from pymedphys._dicom.ct.extend import extend_volume
+from pymedphys._dicom.ct.volume import ct_volume
+
+ROWS = 3
+COLUMNS = 4
+
+
+def _write_ct_series(directory, z_positions, orientation=(1, 0, 0, 0, 1, 0)):
+    filepaths = []
+    for z in z_positions:
+        ds = dicom_dataset_from_dict(
+            {
+                "SOPClassUID": "1.2.840.10008.5.1.4.1.1.2",
+                "SOPInstanceUID": pydicom.uid.generate_uid(),
+                "Modality": "CT",
+                "ImagePositionPatient": [-10.0, -20.0, z],
+                "ImageOrientationPatient": list(orientation),
+                "PixelSpacing": [2.0, 1.0],
+                "RescaleSlope": 1,
+                "RescaleIntercept": -1024,
+                "Rows": ROWS,
+                "Columns": COLUMNS,
+                "BitsAllocated": 16,
+                "BitsStored": 16,
+                "HighBit": 15,
+                "PixelRepresentation": 0,
+                "SamplesPerPixel": 1,
+                "PhotometricInterpretation": "MONOCHROME2",
+                "PixelData": _stored_values(z).tobytes(),
+            }
+        )
+        ds.file_meta = pydicom.dataset.FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+
+        filepath = directory / f"{ds.SOPInstanceUID}.dcm"
+        pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+        filepaths.append(filepath)
+
+    return filepaths
+
+
+def _stored_values(z):
+    return (np.arange(ROWS * COLUMNS).reshape(ROWS, COLUMNS) + 1000 + z).astype("<u2")
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_ct_volume(tmp_path, n_workers):
+    z_positions = [6.0, 0.0, 9.0, 3.0]
+    filepaths = _write_ct_series(tmp_path, z_positions)
+
+    volume, (x, y, z) = ct_volume(filepaths, n_workers=n_workers)
+
+    assert volume.dtype == np.int16
+    assert volume.shape == (len(z_positions), ROWS, COLUMNS)
+    assert np.allclose(z, sorted(z_positions))
+    assert np.allclose(y, [-20, -18, -16])
+    assert np.allclose(x, [-10, -9, -8, -7])
+
+    for i, a_z in enumerate(sorted(z_positions)):
+        assert np.all(volume[i] == _stored_values(a_z).astype(int) - 1024)
+
+
+@pytest.mark.pydicom
+def test_ct_volume_memmap(tmp_path):
+    filepaths = _write_ct_series(tmp_path, [2.0, 0.0, 1.0])
+    memmap_path = tmp_path / "volume.dat"
+
+    volume, _ = ct_volume(filepaths, memmap_path=memmap_path)
+    in_memory, _ = ct_volume(filepaths)
+
+    assert isinstance(volume, np.memmap)
+    assert np.array_equal(volume, in_memory)
+
+    reloaded = np.memmap(memmap_path, dtype="int16", mode="r", shape=volume.shape)
+    assert np.array_equal(reloaded, in_memory)
+
+
+@pytest.mark.pydicom
+def test_ct_volume_requires_consistent_geometry(tmp_path):
+    filepaths = _write_ct_series(tmp_path, [0.0, 1.0])
+    filepaths += _write_ct_series(tmp_path, [2.0], orientation=(-1, 0, 0, 0, 1, 0))
+
+    with pytest.raises(ValueError):
+        ct_volume(filepaths)
+
+
+@pytest.mark.pydicom
+def test_ct_volume_values_outside_dtype(tmp_path):
+    # Stored values above the maximum of the default int16 dtype
+    z = 32000.0
+    filepaths = _write_ct_series(tmp_path, [z])
+
+    with pytest.raises(ValueError):
+        ct_volume(filepaths, rescale=False)
+
+    volume, _ = ct_volume(filepaths, rescale=False, dtype="uint16")
+    assert np.all(volume[0] == _stored_values(z))
+
+    volume, _ = ct_volume(filepaths)
+    assert np.all(volume[0] == _stored_values(z).astype(int) - 1024)
+
+
+@pytest.mark.pydicom
+def test_extend_volume(tmp_path):
+    filepaths = _write_ct_series(tmp_path, [1.0, 3.0, 5.0, 7.0])
+    volume, axes = ct_volume(filepaths)
+
+    extended, (x, y, z) = extend_volume(volume, axes, 3)
+
+    assert np.allclose(z, [-5, -3, -1, 1, 3, 5, 7, 9, 11, 13])
+    assert x is axes[0] and y is axes[1]
+    assert np.all(extended[:4] == volume[0])
+    assert np.all(extended[3:7] == volume)
+    assert np.all(extended[6:] == volume[-1])
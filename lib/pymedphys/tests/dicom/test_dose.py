@@ -21,7 +21,7 @@ from os.path import join as pjoin
 from zipfile import ZipFile
 
 from pymedphys._imports import numpy as np
-from pymedphys._imports import pydicom, pytest
+from pymedphys._imports import pydicom, pytest, scipy
 
 import pymedphys
 from pymedphys._data import download
@@ -201,3 +201,115 @@ def test_sum_doses_in_datasets():
         ds2.ImagePositionPatient = [-1, -1.1, -1]
         dose.sum_doses_in_datasets([ds1, ds2])
     ds2.ImagePositionPatient = [-1, -1, -1]
+
+
+def _write_dose(filepath, dose, image_position_patient=(-1.0, -1.0, -1.0)):
+    scaling = np.max(dose) / 2**31
+    ds = create.dicom_dataset_from_dict(
+        {
+            "SOPClassUID": "1.2.840.10008.5.1.4.1.1.481.2",
+            "SOPInstanceUID": pydicom.uid.generate_uid(),
+            "PatientID": "PMP",
+            "Modality": "RTDOSE",
+            "ImagePositionPatient": list(image_position_patient),
+            "ImageOrientationPatient": [1, 0, 0, 0, 1, 0],
+            "BitsAllocated": 32,
+            "BitsStored": 32,
+            "HighBit": 31,
+            "Rows": dose.shape[1],
+            "Columns": dose.shape[2],
+            "NumberOfFrames": dose.shape[0],
+            "PixelRepresentation": 0,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+            "PixelSpacing": [1.0, 1.0],
+            "GridFrameOffsetVector": list(range(dose.shape[0])),
+            "PixelData": np.round(dose / scaling).astype("<u4").tobytes(),
+            "DoseGridScaling": scaling,
+            "DoseSummationType": "PLAN",
+            "DoseType": "PHYSICAL",
+            "DoseUnits": "GY",
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+
+    pydicom.dcmwrite(filepath, ds, enforce_file_format=True)
+
+    return filepath
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("memmap", [True, False])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_sum_doses_in_files(tmp_path, memmap, dtype):
+    rng = np.random.default_rng(0)
+    doses = [rng.uniform(0, 2, (4, 20, 30)) for _ in range(3)]
+    filepaths = [
+        _write_dose(tmp_path / f"RD.{i}.dcm", dose) for i, dose in enumerate(doses)
+    ]
+
+    ds_summed = dose.sum_doses_in_files(filepaths, dtype=dtype, memmap=memmap)
+    assert ds_summed.DoseSummationType == "MULTI_PLAN"
+
+    pydicom.dcmwrite(tmp_path / "RD.summed.dcm", ds_summed)
+    ds_summed = pydicom.dcmread(tmp_path / "RD.summed.dcm")
+    assert np.allclose(dose.dose_from_dataset(ds_summed), np.sum(doses, axis=0))
+
+    # Binary file objects, as given by the Streamlit file uploader
+    with open(filepaths[0], "rb") as a, open(filepaths[1], "rb") as b:
+        ds_summed = dose.sum_doses_in_files([a, b], dtype=dtype, memmap=memmap)
+    assert np.allclose(dose.dose_from_dataset(ds_summed), doses[0] + doses[1])
+
+
+@pytest.mark.pydicom
+def test_sum_doses_in_files_resample(tmp_path):
+    z, y, x = np.meshgrid(np.arange(4), np.arange(5), np.arange(6), indexing="ij")
+    reference_dose = 10 + x + 2 * y + 3 * z
+    reference = _write_dose(tmp_path / "RD.reference.dcm", reference_dose)
+
+    # The same linear dose upon a grid shifted by half a voxel in x and
+    # y, so that its interpolation onto the reference grid is exact
+    shifted_dose = 10 + (x - 0.5) + 2 * (y - 0.5) + 3 * z
+    shifted = _write_dose(tmp_path / "RD.shifted.dcm", shifted_dose, (-1.5, -1.5, -1))
+
+    with pytest.raises(ValueError):
+        dose.sum_doses_in_files([reference, shifted])
+
+    ds_summed = dose.sum_doses_in_files([reference, shifted], resample=True)
+    dose_summed = dose.dose_from_dataset(ds_summed)
+
+    # The final row and column of the reference grid lie beyond the
+    # shifted grid, and so only contain the reference dose
+    assert np.allclose(dose_summed[:, :-1, :-1], 2 * reference_dose[:, :-1, :-1])
+    assert np.allclose(dose_summed[:, -1, :], reference_dose[:, -1, :])
+    assert np.allclose(dose_summed[:, :, -1], reference_dose[:, :, -1])
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("orientation_x", [1, -1])
+def test_dicom_dose_interpolate(tmp_path, orientation_x):
+    rng = np.random.default_rng(0)
+    ds = pydicom.dcmread(_write_dose(tmp_path / "RD.dcm", rng.uniform(0, 2, (4, 5, 6))))
+    ds.ImageOrientationPatient = [orientation_x, 0, 0, 0, 1, 0]
+
+    # Unevenly spaced frames
+    ds.GridFrameOffsetVector = [0, 1, 3, 4]
+
+    coords, dose_grid = dose.zyx_and_dose_from_dataset(ds)
+    interp_coords = [
+        np.linspace(axis.min(), axis.max(), size)[::-1]
+        for axis, size in zip(coords, (9, 3, 11))
+    ]
+
+    dose_interp = dose.dicom_dose_interpolate(interp_coords, ds)
+
+    expected = scipy.interpolate.RegularGridInterpolator(coords, dose_grid)(
+        tuple(np.meshgrid(*interp_coords, indexing="ij"))
+    )
+    assert np.allclose(dose_interp, expected)
+
+    with pytest.raises(ValueError):
+        dose.dicom_dose_interpolate(
+            [interp_coords[0] + 1, interp_coords[1], interp_coords[2]], ds
+        )
@@ -0,0 +1,169 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._dicom import dvh
+from pymedphys._dicom.create import dicom_dataset_from_dict
+from pymedphys._dicom.dose import dose_from_dataset, get_dose_grid_structure_mask
+
+X_AXIS = np.arange(-20, 20) + 0.5
+Y_AXIS = np.arange(-15, 15) + 0.5
+Z_AXIS = np.arange(10, dtype=float)
+
+DOSE_GRID_SCALING = 0.001
+
+
+def _square_contour(half_width, z):
+    x = np.array([-1, -1, 1, 1]) * half_width
+    y = np.array([-1, 1, 1, -1]) * half_width
+
+    return np.column_stack([x, y, np.full(4, z)]).ravel().tolist()
+
+
+def _structure_dataset(sop_instance_uid=None):
+    structures = {"box": 10, "small": 3}
+
+    header = {}
+    if sop_instance_uid is not None:
+        header["SOPInstanceUID"] = sop_instance_uid
+
+    return dicom_dataset_from_dict(
+        {
+            **header,
+            "StructureSetROISequence": [
+                {"ROINumber": number, "ROIName": name}
+                for number, name in enumerate([*structures, "empty"], start=1)
+            ],
+            "ROIContourSequence": [
+                {
+                    "ReferencedROINumber": number,
+                    "ContourSequence": [
+                        {"ContourData": _square_contour(half_width, z)}
+                        for z in Z_AXIS[2:8]
+                    ],
+                }
+                for number, half_width in enumerate(structures.values(), start=1)
+            ]
+            + [{"ReferencedROINumber": 3}],
+        }
+    )
+
+
+def _dose_dataset():
+    zz, yy, xx = np.meshgrid(Z_AXIS, Y_AXIS, X_AXIS, indexing="ij")
+    dose = 4 + 0.1 * xx + 0.05 * yy + 0.01 * zz
+
+    return dicom_dataset_from_dict(
+        {
+            "Modality": "RTDOSE",
+            "ImagePositionPatient": [X_AXIS[0], Y_AXIS[0], Z_AXIS[0]],
+            "ImageOrientationPatient": [1, 0, 0, 0, 1, 0],
+            "BitsAllocated": 32,
+            "BitsStored": 32,
+            "Rows": len(Y_AXIS),
+            "Columns": len(X_AXIS),
+            "NumberOfFrames": len(Z_AXIS),
+            "PixelRepresentation": 0,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+            "PixelSpacing": [1.0, 1.0],
+            "GridFrameOffsetVector": Z_AXIS.tolist(),
+            "PixelData": np.round(dose / DOSE_GRID_SCALING).astype(np.uint32).tobytes(),
+            "DoseGridScaling": DOSE_GRID_SCALING,
+            "DoseUnits": "GY",
+        }
+    )
+
+
+@pytest.mark.pydicom
+def test_dvh_table_matches_masked_dose():
+    structure_dataset = _structure_dataset()
+    dose_dataset = _dose_dataset()
+    dose = dose_from_dataset(dose_dataset)
+
+    table = dvh.dvh_table(
+        structure_dataset,
+        dose_dataset,
+        bin_width=0.1,
+        dose_at_volume=[50],
+        volume_at_dose=[4.0],
+    )
+
+    assert table.structures == ["box", "small", "empty"]
+    assert table.differential.shape == (3, table.dose.size)
+    assert np.allclose(table.differential.sum(axis=1), table.volume)
+    assert np.allclose(table.cumulative[:, 0], table.volume)
+    assert np.all(np.diff(table.cumulative, axis=1) <= 0)
+
+    for i, name in enumerate(["box", "small"]):
+        structure_dose = dose[
+            get_dose_grid_structure_mask(name, structure_dataset, dose_dataset)
+        ]
+
+        assert table.volume[i] == pytest.approx(structure_dose.size / 1000)
+        assert table.mean[i] == pytest.approx(structure_dose.mean())
+        assert table.minimum[i] == pytest.approx(structure_dose.min())
+        assert table.maximum[i] == pytest.approx(structure_dose.max())
+        assert table.dose_at_volume[i, 0] == pytest.approx(
+            np.median(structure_dose), abs=0.02
+        )
+        assert table.volume_at_dose[i, 0] == pytest.approx(
+            np.mean(structure_dose >= 4.0) * 100
+        )
+
+    assert table.volume[2] == 0
+    assert np.isnan(table.mean[2])
+    assert np.isnan(table.dose_at_volume[2, 0])
+
+
+@pytest.mark.pydicom
+def test_dvh_table_caches_masks(monkeypatch):
+    structure_dataset = _structure_dataset(sop_instance_uid="1.2.3.4")
+    dose_dataset = _dose_dataset()
+
+    dvh._mask_cache.clear()  # pylint: disable = protected-access
+    first = dvh.dvh_table(structure_dataset, dose_dataset, structures=["small"])
+
+    def _rasterise_structure(*args, **kwargs):
+        raise AssertionError("Expected the cached mask to be used")
+
+    monkeypatch.setattr(dvh, "rasterise_structure", _rasterise_structure)
+    second = dvh.dvh_table(structure_dataset, dose_dataset, structures=["small"])
+
+    assert np.array_equal(first.cumulative, second.cumulative)
+    assert np.array_equal(first.dose_at_volume, second.dose_at_volume)
+
+    uncached = _structure_dataset()
+    with pytest.raises(AssertionError):
+        dvh.dvh_table(uncached, dose_dataset, structures=["small"])
+
+
+@pytest.mark.pydicom
+def test_dvh_table_mask_cache_is_bounded(monkeypatch):
+    structure_dataset = _structure_dataset(sop_instance_uid="1.2.3.4")
+    dose_dataset = _dose_dataset()
+
+    dvh._mask_cache.clear()  # pylint: disable = protected-access
+    dvh.dvh_table(structure_dataset, dose_dataset, structures=["small"], supersample=2)
+    assert not dvh._mask_cache  # pylint: disable = protected-access
+
+    dvh.dvh_table(structure_dataset, dose_dataset, structures=["small"])
+    (packed,) = dvh._mask_cache.values()  # pylint: disable = protected-access
+    assert packed.dtype == np.uint8
+
+    monkeypatch.setattr(dvh, "MASK_CACHE_BYTES", packed.nbytes)
+    dvh.dvh_table(structure_dataset, dose_dataset)
+    assert len(dvh._mask_cache) == 1  # pylint: disable = protected-access
@@ -15,12 +15,14 @@
 
 from copy import deepcopy
 
-from pymedphys._imports import pytest
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
 
 from pymedphys._dicom import uid as _uid
 from pymedphys._dicom.create import dicom_dataset_from_dict
 from pymedphys._dicom.ct.extend import (
     _convert_datasets_to_deque,
+    _copy_dataset,
     _extend_datasets,
     _generate_uids,
 )
@@ -116,6 +118,37 @@ def test_extend_datasets():
     assert resulting_datasets_right == expected_datasets_right
 
 
+@pytest.mark.pydicom
+def test_copy_dataset_shares_pixel_data():
+    ds = dicom_dataset_from_dict(
+        {
+            "SOPInstanceUID": _uid.generate_uid(),
+            "Rows": 2,
+            "Columns": 2,
+            "BitsAllocated": 16,
+            "BitsStored": 16,
+            "HighBit": 15,
+            "PixelRepresentation": 0,
+            "SamplesPerPixel": 1,
+            "PhotometricInterpretation": "MONOCHROME2",
+            "PixelData": bytes(range(8)),
+        }
+    )
+    ds.file_meta = pydicom.dataset.FileMetaDataset()
+    ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+    pixel_array = ds.pixel_array
+
+    copied = _copy_dataset(ds)
+    assert copied == ds
+    assert copied.file_meta == ds.file_meta
+    assert copied.file_meta is not ds.file_meta
+    assert copied.PixelData is ds.PixelData
+    assert np.all(copied.pixel_array == pixel_array)
+
+    copied.SOPInstanceUID = _uid.generate_uid()
+    assert copied.SOPInstanceUID != ds.SOPInstanceUID
+
+
 def _make_datasets(series_instance_uid, sop_instance_uids, slice_locations):
     initial_datasets = [
         dicom_dataset_from_dict(
@@ -0,0 +1,103 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the batched deformability test against the per point
+spline fits it replaced.
+"""
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._electronfactors.core import (
+    _batched_calculate_deformability,
+    _single_calculate_deformability,
+    calculate_deformability,
+    convert2_ratio_perim_area,
+)
+
+
+def synthetic_insert_data(number_of_inserts, noise, rng):
+    """Return the width, perimeter/area and factor of a set of inserts."""
+    width = rng.uniform(3, 9, number_of_inserts)
+    length = width + rng.uniform(0, 5, number_of_inserts)
+    ratio_perim_area = convert2_ratio_perim_area(width, length)
+    factor = (
+        0.9
+        + 0.02 * width
+        - 0.001 * width**2
+        + 0.03 * ratio_perim_area
+        + rng.normal(0, noise, number_of_inserts)
+    )
+
+    return width, ratio_perim_area, factor
+
+
+def synthetic_mesh(step):
+    width, length = np.meshgrid(np.arange(2, 10, step), np.arange(2, 15, step))
+
+    return width, convert2_ratio_perim_area(width, length)
+
+
+def per_point_deformability(x_test, y_test, x_data, y_data, z_data):
+    return np.array(
+        [
+            _single_calculate_deformability(x, y, x_data, y_data, z_data)
+            for x, y in zip(np.ravel(x_test), np.ravel(y_test))
+        ]
+    ).reshape(np.shape(x_test))
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_batched_deformability_matches_spline_fits():
+    rng = np.random.default_rng(1)
+    data = synthetic_insert_data(25, 0.003, rng)
+    width, ratio_perim_area = synthetic_mesh(0.5)
+
+    deformability = calculate_deformability(width, ratio_perim_area, *data)
+    assert deformability.shape == width.shape
+    assert np.allclose(
+        deformability,
+        per_point_deformability(width, ratio_perim_area, *data),
+        atol=1e-8,
+    )
+
+    # Both valid and invalid prediction regions are present
+    assert np.any(deformability < 0.5)
+    assert np.any(deformability > 0.5)
+
+    row = calculate_deformability(width[3], ratio_perim_area[3], *data)
+    assert np.allclose(row, deformability[3])
+
+    single = calculate_deformability(width[3, 4], ratio_perim_area[3, 4], *data)
+    assert np.ndim(single) == 0
+    assert np.isclose(single, deformability[3, 4])
+
+
+@pytest.mark.filterwarnings("ignore")
+def test_deformability_falls_back_to_spline_fits():
+    rng = np.random.default_rng(2)
+
+    # Noise too large for the least squares polynomial to meet the
+    # smoothing condition of the spline.
+    data = synthetic_insert_data(25, 2, rng)
+    width, ratio_perim_area = synthetic_mesh(2)
+
+    assert _batched_calculate_deformability(width, ratio_perim_area, *data) is None
+    assert np.allclose(
+        calculate_deformability(width, ratio_perim_area, *data),
+        per_point_deformability(width, ratio_perim_area, *data),
+    )
+
+    # Too few inserts to determine the polynomial
+    assert _batched_calculate_deformability(3, 0.5, *[d[:5] for d in data]) is None
@@ -0,0 +1,61 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the deformability test over the mesh of an insert factor
+model, batched and point by point.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+import warnings
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._electronfactors.core import calculate_deformability
+
+from .test_deformability import (
+    per_point_deformability,
+    synthetic_insert_data,
+    synthetic_mesh,
+)
+
+MESH_STEP = 0.1
+
+
+@pytest.mark.benchmark
+def test_calculate_deformability_benchmark():
+    rng = np.random.default_rng(1)
+    data = synthetic_insert_data(25, 0.003, rng)
+    width, ratio_perim_area = synthetic_mesh(MESH_STEP)
+
+    # Exclude the one off import of scipy
+    calculate_deformability(width[0, 0], ratio_perim_area[0, 0], *data)
+
+    start = time.perf_counter()
+    calculate_deformability(width, ratio_perim_area, *data)
+    batched = time.perf_counter() - start
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        start = time.perf_counter()
+        per_point_deformability(width, ratio_perim_area, *data)
+        per_point = time.perf_counter() - start
+
+    print(
+        f"\nDeformability of a {'x'.join(str(n) for n in width.shape)} mesh:\n"
+        f"  batched: {batched * 1000:.1f} ms\n"
+        f"  point by point: {per_point * 1000:.0f} ms"
+    )
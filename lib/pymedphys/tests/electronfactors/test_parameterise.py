@@ -0,0 +1,92 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the parameterisation of inserts as equivalent ellipses."""
+
+from pymedphys._imports import numpy as np
+
+from pymedphys._electronfactors.core import (
+    DEFAULT_CIRCLE_PRECISION,
+    parameterise_insert,
+    parameterise_inserts,
+    search_for_centre_of_largest_bounded_circle,
+)
+
+
+def ellipse_insert(width, length, rotation, centre, number_of_points=200):
+    """Return the coordinates of an elliptical insert."""
+    t = np.linspace(0, 2 * np.pi, number_of_points, endpoint=False)
+    x = width / 2 * np.cos(t)
+    y = length / 2 * np.sin(t)
+
+    return (
+        x * np.cos(rotation) - y * np.sin(rotation) + centre[0],
+        x * np.sin(rotation) + y * np.cos(rotation) + centre[1],
+    )
+
+
+def test_parameterise_ellipse():
+    x, y = ellipse_insert(5, 8, np.pi / 6, (1, -2), number_of_points=2000)
+
+    width, length, circle_centre = parameterise_insert(x, y)
+
+    assert np.allclose(circle_centre, (1, -2), atol=0.01)
+    assert np.isclose(width, 5, atol=2 * DEFAULT_CIRCLE_PRECISION)
+    assert np.isclose(length, 8, atol=0.01)
+
+
+def test_largest_bounded_circle_of_l_shape():
+    # The largest bounded circle, of radius 2, fits within the 4 cm wide
+    # leg of the L, which is away from the L's centroid.
+    x = np.array([0, 10, 10, 4, 4, 0])
+    y = np.array([0, 0, 1, 1, 10, 10])
+
+    minima = []
+    circle_centre = search_for_centre_of_largest_bounded_circle(
+        x, y, callback=lambda centre, f, accept: minima.append(f)
+    )
+
+    assert 0 <= circle_centre[0] <= 4
+    assert 2 - DEFAULT_CIRCLE_PRECISION <= circle_centre[1] <= 8
+    assert np.isclose(minima, [-2], atol=DEFAULT_CIRCLE_PRECISION)
+
+    # The search is deterministic
+    assert np.array_equal(
+        circle_centre, search_for_centre_of_largest_bounded_circle(x, y)
+    )
+
+
+def test_parameterise_inserts():
+    rng = np.random.default_rng(0)
+    inserts = [
+        ellipse_insert(
+            rng.uniform(3, 6), rng.uniform(6, 10), rng.uniform(0, np.pi), (0, 0)
+        )
+        for _ in range(5)
+    ]
+    x, y = zip(*inserts)
+
+    width, length, circle_centre = parameterise_inserts(x, y)
+
+    assert width.shape == length.shape == (5,)
+    assert circle_centre.shape == (5, 2)
+
+    for i, (insert_x, insert_y) in enumerate(inserts):
+        expected_width, expected_length, expected_centre = parameterise_insert(
+            insert_x, insert_y
+        )
+
+        assert width[i] == expected_width
+        assert length[i] == expected_length
+        assert np.array_equal(circle_centre[i], expected_centre)
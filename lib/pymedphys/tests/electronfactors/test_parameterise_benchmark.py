@@ -0,0 +1,96 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the parameterisation of a library of inserts, by the
+pole of inaccessibility search and by the basinhopping search it
+replaced.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest, scipy, shapely
+
+from pymedphys._electronfactors.core import parameterise_inserts, shapely_insert
+
+from .test_parameterise import ellipse_insert
+
+NUMBER_OF_INSERTS = 300
+NUMBER_OF_BASINHOPPING_INSERTS = 3
+
+
+def _basinhopping_centre(x, y):
+    """The basinhopping search for the centre of the largest bounded
+    circle."""
+    insert = shapely_insert(x, y)
+    boundary = insert.boundary
+    centroid = insert.centroid
+
+    furthest_distance = np.hypot(
+        np.diff(insert.bounds[::2]), np.diff(insert.bounds[1::2])
+    )
+
+    def minimising_function(optimiser_input):
+        x, y = optimiser_input
+        point = shapely.geometry.Point(x, y)
+
+        if insert.contains(point):
+            edge_distance = point.distance(boundary)
+        else:
+            edge_distance = -point.distance(boundary)
+
+        return -edge_distance
+
+    output = scipy.optimize.basinhopping(
+        minimising_function,
+        np.squeeze(centroid.coords),
+        niter=200,
+        T=furthest_distance / 3,
+        stepsize=furthest_distance / 2,
+        niter_success=50,
+    )
+
+    return output.x
+
+
+@pytest.mark.benchmark
+def test_parameterise_inserts_benchmark():
+    rng = np.random.default_rng(0)
+    inserts = []
+    for _ in range(NUMBER_OF_INSERTS):
+        x, y = ellipse_insert(
+            rng.uniform(3, 8), rng.uniform(6, 12), rng.uniform(0, np.pi), (0, 0)
+        )
+
+        # Irregular, rather than elliptical, inserts
+        radial = 1 + 0.05 * np.sin(5 * np.arctan2(y, x) + rng.uniform(0, 2 * np.pi))
+        inserts.append((x * radial, y * radial))
+
+    start = time.perf_counter()
+    parameterise_inserts(*zip(*inserts))
+    pole_of_inaccessibility = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for x, y in inserts[:NUMBER_OF_BASINHOPPING_INSERTS]:
+        _basinhopping_centre(x, y)
+    basinhopping = (time.perf_counter() - start) / NUMBER_OF_BASINHOPPING_INSERTS
+
+    print(
+        f"\nParameterisation of {NUMBER_OF_INSERTS} inserts:\n"
+        f"  pole of inaccessibility: {pole_of_inaccessibility * 1000:.0f} ms\n"
+        f"  basinhopping: {basinhopping * NUMBER_OF_INSERTS:.0f} s "
+        f"(extrapolated from {NUMBER_OF_BASINHOPPING_INSERTS} inserts)"
+    )
@@ -7,7 +7,7 @@ from os.path import exists
 from os.path import join as pjoin
 from shutil import copyfile
 
-from pymedphys._imports import pydicom, pytest
+from pymedphys._imports import pydicom, pytest, toml
 
 import pymedphys._utilities.test as pmp_test_utils
 from pymedphys._dicom.anonymise import (
@@ -16,8 +16,10 @@ from pymedphys._dicom.anonymise import (
     is_anonymised_directory,
     is_anonymised_file,
 )
+from pymedphys._dicom.anonymise import api as anon_api
 from pymedphys._dicom.constants.core import DICOM_SOP_CLASS_NAMES_MODE_PREFIXES
 from pymedphys._dicom.utilities import remove_file
+from pymedphys._experimental.pseudonymisation import strategy
 from pymedphys.experimental import pseudonymisation as pseudonymisation_api
 from pymedphys.tests.dicom.test_anonymise import (
     dicom_dataset_from_dict,
@@ -41,6 +43,135 @@ def test_pseudonymise_file():
         )
 
 
+def _create_ct_series(dirpath, number_of_files=4):
+    for i in range(number_of_files):
+        ds = dicom_dataset_from_dict(
+            {
+                "SOPClassUID": "1.2.840.10008.5.1.4.1.1.2",
+                "SOPInstanceUID": f"1.2.3.4.{i}",
+                "StudyInstanceUID": "1.2.3.100",
+                "FrameOfReferenceUID": "1.2.3.200",
+                "Modality": "CT",
+                "PatientID": "ABC123",
+                "PatientName": "Smith^John",
+                "StudyDate": "20200101",
+                "ReferencedImageSequence": [
+                    {"ReferencedSOPInstanceUID": f"1.2.3.4.{(i + 1) % number_of_files}"}
+                ],
+            }
+        )
+        ds.file_meta = pydicom.dataset.FileMetaDataset()
+        ds.file_meta.TransferSyntaxUID = pydicom.uid.ExplicitVRLittleEndian
+        ds.file_meta.MediaStorageSOPClassUID = ds.SOPClassUID
+        ds.file_meta.MediaStorageSOPInstanceUID = ds.SOPInstanceUID
+        pydicom.dcmwrite(dirpath / f"{i}.dcm", ds, enforce_file_format=True)
+
+
+@pytest.mark.pydicom
+def test_pseudonyms_are_cached(monkeypatch):
+    strategy.clear_cached_pseudonyms()
+    uid = pydicom.uid.UID("1.2.3.4")
+    pseudo_uid = strategy.pseudonymisation_dispatch["UI"](uid)
+
+    def _unexpected_hash(*args, **kwargs):
+        raise AssertionError("Expected the cached pseudonym to be used")
+
+    monkeypatch.setattr(strategy.hashlib, "new", _unexpected_hash)
+    assert strategy.pseudonymisation_dispatch["UI"](uid) == pseudo_uid
+
+    # The snapshot of one process' pseudonyms seeds another's cache
+    cached_pseudonyms = strategy.get_cached_pseudonyms()
+    strategy.clear_cached_pseudonyms()
+    with pytest.raises(AssertionError):
+        strategy.pseudonymisation_dispatch["UI"](uid)
+
+    strategy.update_cached_pseudonyms(cached_pseudonyms)
+    assert strategy.pseudonymisation_dispatch["UI"](uid) == pseudo_uid
+
+    monkeypatch.undo()
+    monkeypatch.setattr(strategy, "PSEUDONYM_CACHE_SIZE", 2)
+    for value in ["1", "2", "3", 1, 1.0]:
+        strategy.pseudonymisation_dispatch["LO"](value)
+    assert len(strategy.get_cached_pseudonyms()) == 2
+
+    # Equal values with differing representations have differing pseudonyms
+    assert strategy.pseudonymisation_dispatch["LO"](1) != (
+        strategy.pseudonymisation_dispatch["LO"](1.0)
+    )
+
+    strategy.clear_cached_pseudonyms()
+
+
+@pytest.mark.pydicom
+def test_pseudonymise_directory_in_parallel(tmp_path):
+    input_directory = tmp_path / "input"
+    input_directory.mkdir()
+    _create_ct_series(input_directory)
+
+    outputs = {}
+    for n_workers in (1, 2):
+        strategy.clear_cached_pseudonyms()
+        output_directory = tmp_path / f"output_{n_workers}"
+        outputs[n_workers] = {
+            pathlib.Path(pseudo_file).name: pydicom.dcmread(pseudo_file)
+            for pseudo_file in pseudonymisation_api.pseudonymise(
+                input_directory, output_path=output_directory, n_workers=n_workers
+            )
+        }
+
+    assert outputs[1] == outputs[2]
+
+    pseudo_datasets = list(outputs[2].values())
+    sop_instance_uids = {ds.SOPInstanceUID for ds in pseudo_datasets}
+    assert len(sop_instance_uids) == len(pseudo_datasets)
+    assert "1.2.3.4.0" not in sop_instance_uids
+
+    for ds in pseudo_datasets:
+        assert ds.StudyInstanceUID == pseudo_datasets[0].StudyInstanceUID
+        assert ds.StudyInstanceUID != "1.2.3.100"
+        assert ds.PatientID == pseudo_datasets[0].PatientID
+        assert (
+            ds.ReferencedImageSequence[0].ReferencedSOPInstanceUID in sop_instance_uids
+        )
+
+
+@pytest.mark.pydicom
+def test_pseudonymise_directory_in_parallel_with_fresh_config(tmp_path, monkeypatch):
+    """Every worker process pseudonymises with the pepper and epoch jitter
+    of its parent, even when these are yet to be created."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    (tmp_path / "home").mkdir()
+    monkeypatch.setattr(anon_api, "ANONYMISE_DIRECTORY_CHUNKSIZE", 1)
+    strategy.clear_cached_pseudonyms()
+    strategy._get_pepper.cache_clear()  # pylint: disable = protected-access
+    strategy._get_epoch_jitter.cache_clear()  # pylint: disable = protected-access
+
+    input_directory = tmp_path / "input"
+    input_directory.mkdir()
+    _create_ct_series(input_directory, number_of_files=8)
+
+    pseudo_datasets = [
+        pydicom.dcmread(pseudo_file)
+        for pseudo_file in pseudonymisation_api.pseudonymise(
+            input_directory, output_path=tmp_path / "output", n_workers=2
+        )
+    ]
+
+    assert len({ds.StudyDate for ds in pseudo_datasets}) == 1
+    assert len({ds.PatientID for ds in pseudo_datasets}) == 1
+
+    pepper, epoch_jitter = strategy.get_secrets()
+    config = toml.loads((tmp_path / "home" / ".pymedphys" / "config.toml").read_text())
+    assert config["pseudo"] == {
+        "pepper": pepper.decode("ASCII"),
+        "epoch_jitter": epoch_jitter,
+    }
+
+    strategy._get_pepper.cache_clear()  # pylint: disable = protected-access
+    strategy._get_epoch_jitter.cache_clear()  # pylint: disable = protected-access
+    strategy.clear_cached_pseudonyms()
+
+
 def _assert_values_changed_and_not_hardcoded(test_file_path, pseudonymised_file_path):
     ds_input = pydicom.dcmread(test_file_path, force=True)
     ds_pseudo = pydicom.dcmread(pseudonymised_file_path, force=True)
@@ -210,3 +210,25 @@ def test_distance_0_gives_1_point():
     )
 
     assert len(x) == 1 & len(y) == 1 & len(z) == 1
+
+
+def test_integer_evaluation_dose():
+    """An integer evaluation dose gives the gamma of the same dose as floats."""
+    coords = (np.arange(21.0),)
+    reference = np.arange(21) + 0.5
+    evaluation = np.arange(21)
+
+    gamma_int = pymedphys.gamma(
+        coords, reference, coords, evaluation, 1, 1, lower_percent_dose_cutoff=0
+    )
+    gamma_float = pymedphys.gamma(
+        coords,
+        reference,
+        coords,
+        evaluation.astype(float),
+        1,
+        1,
+        lower_percent_dose_cutoff=0,
+    )
+
+    assert np.allclose(gamma_int, gamma_float, equal_nan=True)
@@ -200,3 +200,203 @@ def test_1d_vs_scipy(setup_interp):
     )
 
     assert np.allclose(values_interp, values_interp_linear_scipy)
+
+
+def _points_of_grid(axes):
+    mgrids = np.meshgrid(*axes, indexing="ij")
+    return np.column_stack([mgrid.ravel() for mgrid in mgrids])
+
+
+@pytest.mark.parametrize("n_dims", [1, 2, 3])
+def test_grid_matches_points(setup_interp, n_dims):
+    axes_known, values, axes_interp, _ = setup_interp
+    axes_known = axes_known[:n_dims]
+    values = values[(slice(None),) * n_dims + (0,) * (3 - n_dims)]
+
+    # Extend beyond the known axes to include extrapolated points
+    axes_interp = [
+        np.concatenate([[axis[0] - 1], axis, [axis[-1] + 0.5]])
+        for axis in axes_interp[:n_dims]
+    ]
+
+    values_interp = interp.interp(
+        axes_known,
+        values,
+        axes_interp=axes_interp,
+        keep_dims=True,
+        bounds_error=False,
+    )
+    assert values_interp.shape == tuple(axis.size for axis in axes_interp)
+
+    values_interp_points = interp.interp(
+        axes_known,
+        values,
+        points_interp=_points_of_grid(axes_interp),
+        bounds_error=False,
+    )
+    assert np.allclose(
+        values_interp.ravel(), values_interp_points, equal_nan=True, rtol=1e-12
+    )
+    assert np.all(np.isnan(values_interp[0]))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_chunked(setup_interp, chunk_size, tmp_path):
+    axes_known, values, axes_interp, values_interp = setup_interp
+
+    values_interp_chunked = interp.interp(
+        axes_known, values, axes_interp=axes_interp, chunk_size=chunk_size
+    )
+    assert np.allclose(values_interp_chunked, values_interp, rtol=1e-12)
+
+    # Interpolated values written to disk, one slab of the grid at a time
+    shape = tuple(axis.size for axis in axes_interp)
+    out = np.memmap(
+        tmp_path / "values_interp", dtype=np.float64, mode="w+", shape=shape
+    )
+    returned = interp.interp(
+        axes_known,
+        values,
+        axes_interp=axes_interp,
+        keep_dims=True,
+        chunk_size=chunk_size,
+        out=out,
+    )
+    assert returned is out
+    assert np.array_equal(np.asarray(out).ravel(), values_interp_chunked)
+
+    points_interp = _points_of_grid(axes_interp)
+    values_interp_points = interp.interp(
+        axes_known, values, points_interp=points_interp, chunk_size=chunk_size
+    )
+    assert np.allclose(values_interp_points, values_interp, rtol=1e-12)
+
+
+def test_out_must_match(setup_interp):
+    axes_known, values, axes_interp, _ = setup_interp
+
+    with pytest.raises(ValueError):
+        interp.interp(
+            axes_known,
+            values,
+            axes_interp=axes_interp,
+            out=np.empty(tuple(axis.size for axis in axes_interp)),
+        )
+
+    with pytest.raises(ValueError):
+        interp.interp(axes_known, values, axes_interp=axes_interp, chunk_size=0)
+
+
+def test_interp_chunks(setup_interp):
+    axes_known, values, axes_interp, values_interp = setup_interp
+    points_interp = _points_of_grid(axes_interp)
+
+    def points_interp_chunks():
+        for start in range(0, len(points_interp), 1000):
+            yield points_interp[start : start + 1000]
+
+    chunks = interp.interp_chunks(axes_known, values, points_interp_chunks())
+    assert np.allclose(np.concatenate(list(chunks)), values_interp, rtol=1e-12)
+
+    outside = points_interp_chunks()
+    with pytest.raises(ValueError):
+        for _ in interp.interp_chunks(
+            axes_known, values, (chunk - 100 for chunk in outside)
+        ):
+            pass
+
+
+def test_grid_unevenly_spaced():
+    rng = np.random.default_rng(0)
+    axes_known = (np.array([0, 1, 3, 4, 7.5]), np.linspace(-2, 2, 6), np.arange(4.0))
+    values = rng.random((5, 6, 4))
+    axes_interp = (np.linspace(0, 7.5, 23), np.linspace(-2, 2, 5), np.linspace(0, 3, 7))
+
+    values_interp = interp.interp(
+        axes_known, values, axes_interp=axes_interp, keep_dims=True
+    )
+    values_interp_linear_scipy = interp.interp_linear_scipy(
+        axes_known, values, axes_interp=axes_interp, keep_dims=True
+    )
+    assert np.allclose(values_interp, values_interp_linear_scipy)
+
+    values_interp_points = interp.interp(
+        axes_known, values, points_interp=_points_of_grid(axes_interp)
+    )
+    assert np.allclose(values_interp_points, values_interp.ravel())
+
+
+@pytest.mark.parametrize("n_dims", [1, 2, 3])
+def test_points_unevenly_spaced(n_dims):
+    rng = np.random.default_rng(1)
+    axes_known = tuple(
+        np.cumsum(rng.uniform(0.1, 2, size)) for size in (9, 7, 5)[:n_dims]
+    )
+    values = rng.random(tuple(len(axis) for axis in axes_known))
+    points_interp = np.column_stack(
+        [rng.uniform(axis[0], axis[-1], 200) for axis in axes_known]
+    )
+
+    values_interp = interp.interp(axes_known, values, points_interp=points_interp)
+    values_interp_linear_scipy = interp.interp_linear_scipy(
+        axes_known, values, points_interp=points_interp
+    )
+    assert np.allclose(values_interp, values_interp_linear_scipy)
+
+    with pytest.raises(ValueError):
+        interp.interp(
+            tuple(axis[::-1] for axis in axes_known),
+            values,
+            points_interp=points_interp,
+        )
+
+
+def test_float32(setup_interp):
+    axes_known, values, axes_interp, _ = setup_interp
+    points_interp = _points_of_grid(axes_interp)
+
+    values_interp = interp.interp(axes_known, values, points_interp=points_interp)
+    values_interp_float32 = interp.interp(
+        axes_known, values.astype(np.float32), points_interp=points_interp
+    )
+    assert values_interp_float32.dtype == np.float32
+    assert np.allclose(values_interp_float32, values_interp, rtol=1e-5)
+
+    values_interp_grid_float32 = interp.interp(
+        axes_known, values.astype(np.float32), axes_interp=axes_interp
+    )
+    assert values_interp_grid_float32.dtype == np.float32
+    assert np.allclose(values_interp_grid_float32, values_interp, rtol=1e-5)
+
+    assert (
+        interp.interp(axes_known, values.astype(int), axes_interp=axes_interp).dtype
+        == np.float64
+    )
+
+
+@pytest.mark.parametrize("skip_checks", [False, True])
+def test_integer_values(skip_checks):
+    axis_known = np.arange(5.0)
+    values = np.arange(5)
+    points_interp = np.array([[0.5], [2.7], [5.5]])
+
+    values_interp = interp.interp(
+        (axis_known,),
+        values,
+        points_interp=points_interp,
+        bounds_error=False,
+        extrap_fill_value=np.inf,
+        skip_checks=skip_checks,
+    )
+    assert values_interp.dtype == np.float64
+    assert np.allclose(values_interp, [0.5, 2.7, np.inf])
+
+    values_interp_grid = interp.interp(
+        (axis_known,),
+        values,
+        axes_interp=(points_interp[:, 0],),
+        bounds_error=False,
+        extrap_fill_value=np.inf,
+        skip_checks=skip_checks,
+    )
+    assert np.allclose(values_interp_grid, values_interp)
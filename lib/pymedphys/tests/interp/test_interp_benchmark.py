@@ -0,0 +1,92 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the resampling of a dose grid onto a CT resolution grid,
+by separable passes along the grid's axes and over the points of its
+meshgrid.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._interp import interp
+
+# A 2.5 mm dose grid resampled onto a 1 x 1 x 2 mm grid
+KNOWN_SHAPE = (160, 160, 120)
+INTERP_SHAPE = (400, 400, 150)
+REPEATS = 3
+
+
+def _time(function, repeats=REPEATS):
+    function()
+
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+@pytest.mark.benchmark
+def test_interp_grid_benchmark():
+    rng = np.random.default_rng(0)
+    axes_known = tuple(np.linspace(0, 400, n) for n in KNOWN_SHAPE)
+    values = rng.random(KNOWN_SHAPE)
+    axes_interp = tuple(np.linspace(1, 399, n) for n in INTERP_SHAPE)
+
+    def grid():
+        interp.interp(axes_known, values, axes_interp=axes_interp, keep_dims=True)
+
+    def downsampled_grid():
+        interp.interp(
+            axes_interp,
+            grid_values,
+            axes_interp=axes_known,
+            keep_dims=True,
+            bounds_error=False,
+        )
+
+    def chunked_grid():
+        interp.interp(
+            axes_known,
+            values,
+            axes_interp=axes_interp,
+            keep_dims=True,
+            chunk_size=2**20,
+        )
+
+    def meshgrid_points():
+        mgrids = np.meshgrid(*axes_interp, indexing="ij")
+        points_interp = np.column_stack([mgrid.ravel() for mgrid in mgrids])
+        interp.interp(axes_known, values, points_interp=points_interp)
+
+    grid_values = interp.interp(
+        axes_known, values, axes_interp=axes_interp, keep_dims=True
+    )
+    number_of_points = np.prod(INTERP_SHAPE)
+    print(
+        f"\nResampling {'x'.join(str(n) for n in KNOWN_SHAPE)} onto "
+        f"{'x'.join(str(n) for n in INTERP_SHAPE)}:\n"
+        f"  grid: {_time(grid) * 1000:.0f} ms\n"
+        f"  grid in chunks of 2**20 points: {_time(chunked_grid) * 1000:.0f} ms\n"
+        f"  meshgrid points: {_time(meshgrid_points) * 1000:.0f} ms, with "
+        f"{number_of_points * 24 / 2**20:.0f} MB of coordinates\n"
+        f"  grid, resampled back: {_time(downsampled_grid) * 1000:.0f} ms"
+    )
@@ -0,0 +1,52 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from pymedphys._imports import numba as nb, numpy as np, pytest
+
+from pymedphys._interp import interp, warmup
+
+
+@pytest.fixture
+def restore_cache_dir():
+    cache_dir = os.environ.get("NUMBA_CACHE_DIR")
+
+    yield
+
+    if cache_dir is None:
+        os.environ.pop("NUMBA_CACHE_DIR", None)
+    else:
+        os.environ["NUMBA_CACHE_DIR"] = cache_dir
+
+    nb.core.config.reload_config()
+    for factory in warmup.KERNEL_FACTORIES:
+        factory.cache_clear()
+
+
+def test_warmup_caches_within_cache_dir(tmp_path, restore_cache_dir):
+    duration = warmup.warmup(cache_dir=tmp_path, dtypes=["float32"], n_dims=[1])
+
+    assert duration > 0
+    assert os.environ["NUMBA_CACHE_DIR"] == str(tmp_path.resolve())
+    assert list(tmp_path.rglob("*.nbi"))
+    assert list(tmp_path.rglob("*.nbc"))
+
+    axis_known = np.linspace(0, 1, 3)
+    values = np.array([0, 1, 4], dtype=np.float32)
+    values_interp = interp.interp(
+        (axis_known,), values, points_interp=np.array([[0.25], [0.75]])
+    )
+    assert values_interp.dtype == np.float32
+    assert np.allclose(values_interp, [0.5, 2.5])
@@ -0,0 +1,42 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+from datetime import datetime, timedelta
+
+from pymedphys._mosaiq.sessions import cluster_sessions
+
+
+def test_cluster_sessions_splits_at_interval():
+    start = datetime(2021, 3, 1, 8)
+    tx_datetimes = [
+        start,
+        start + timedelta(minutes=10),
+        # a gap of exactly the interval starts a new session
+        start + timedelta(hours=3, minutes=10),
+        start + timedelta(hours=5),
+        start + timedelta(days=1),
+    ]
+
+    sessions = list(cluster_sessions(tx_datetimes))
+
+    assert sessions == [
+        (1, tx_datetimes[0], tx_datetimes[1]),
+        (2, tx_datetimes[2], tx_datetimes[3]),
+        (3, tx_datetimes[4], tx_datetimes[4]),
+    ]
+
+
+def test_cluster_sessions_empty():
+    assert not list(cluster_sessions([]))
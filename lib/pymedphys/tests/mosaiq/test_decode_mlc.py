@@ -0,0 +1,35 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import struct
+
+from pymedphys._imports import numpy as np
+
+from pymedphys._mosaiq.delivery import decode_msq_mlc
+
+
+def test_decode_msq_mlc():
+    rng = np.random.default_rng(42)
+    leaf_positions = rng.integers(-2000, 2000, size=(5, 80))
+
+    raw_bytes = [
+        struct.pack(f"<{len(control_point)}h", *control_point)
+        for control_point in leaf_positions
+    ]
+
+    decoded = decode_msq_mlc(raw_bytes)
+
+    assert decoded.shape == (5, 80, 1)
+    assert np.allclose(decoded[:, :, 0], leaf_positions / 100)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 
+from pymedphys._imports import numpy as np
 from pymedphys._imports import pytest
 
 from pymedphys._mosaiq.mock import generate, utilities
@@ -20,7 +21,9 @@ from pymedphys._mosaiq.sessions import (
     localization_offset_for_site,
     mean_session_offset_for_site,
     session_offsets_for_site,
+    session_offsets_for_sites,
     sessions_for_site,
+    sessions_for_sites,
 )
 
 
@@ -120,3 +123,27 @@ def test_session_offsets_for_site(connection):  # pylint: disable = unused-argum
     assert localization_offset[0] == -1.0
     assert localization_offset[1] == 0.0
     assert localization_offset[2] == 1.0
+
+
+@pytest.mark.mosaiqdb
+def test_sessions_for_sites(connection):
+    """checks the batched session queries match the per site queries"""
+    sit_set_ids = [1, 2, 3]
+
+    sessions = sessions_for_sites(connection, sit_set_ids)
+    session_offsets = session_offsets_for_sites(connection, sit_set_ids)
+
+    for sit_set_id in sit_set_ids:
+        assert sessions[sit_set_id] == list(sessions_for_site(connection, sit_set_id))
+
+        expected_offsets = list(session_offsets_for_site(connection, sit_set_id))
+        assert len(session_offsets[sit_set_id]) == len(expected_offsets)
+
+        for (session_num, offset), (expected_num, expected_offset) in zip(
+            session_offsets[sit_set_id], expected_offsets
+        ):
+            assert session_num == expected_num
+            if expected_offset is None:
+                assert offset is None
+            else:
+                assert np.allclose(offset, expected_offset)
@@ -0,0 +1,122 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmarks of the Mosaiq pipelines against a department sized mock.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._mosaiq import delivery, sessions
+from pymedphys._mosaiq.mock import generate, sqlite
+
+NUMBER_OF_DELIVERIES_TO_IDENTIFY = 500
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+
+    return time.perf_counter() - start, result
+
+
+@pytest.fixture(name="department", scope="module")
+def fixture_department():
+    connection = sqlite.SQLiteConnection()
+    duration, tables = _timed(generate.create_mock_department, connection=connection)
+    print(f"\nCreated the mock department in {duration:.2f} s")
+
+    return connection, tables
+
+
+@pytest.mark.benchmark
+def test_session_clustering_benchmark(department):
+    connection, tables = department
+    sit_set_ids = tables["Site"]["SIT_SET_ID"].tolist()
+
+    per_site_duration, per_site = _timed(
+        lambda: {
+            sit_set_id: list(sessions.sessions_for_site(connection, sit_set_id))
+            for sit_set_id in sit_set_ids
+        }
+    )
+    batched_duration, batched = _timed(
+        sessions.sessions_for_sites, connection, sit_set_ids
+    )
+    assert batched == per_site
+
+    offsets_duration, _ = _timed(
+        sessions.session_offsets_for_sites, connection, sit_set_ids
+    )
+
+    print(
+        f"\nSessions for {len(sit_set_ids)} sites: "
+        f"{per_site_duration:.3f} s per site, {batched_duration:.3f} s batched"
+        f"\nSession offsets for {len(sit_set_ids)} sites: "
+        f"{offsets_duration:.3f} s batched"
+    )
+
+
+@pytest.mark.benchmark
+def test_delivery_loading_benchmark(department):
+    connection, tables = department
+    field_ids = tables["TxField"].index.tolist()
+
+    per_field_duration, _ = _timed(
+        lambda: [
+            pymedphys.Delivery.from_mosaiq(connection, field_id)
+            for field_id in field_ids
+        ]
+    )
+    batched_duration, _ = _timed(
+        pymedphys.Delivery.from_mosaiq_many, connection, field_ids
+    )
+
+    print(
+        f"\nDeliveries for {len(field_ids)} fields: "
+        f"{per_field_duration:.3f} s per field, {batched_duration:.3f} s batched"
+    )
+
+
+@pytest.mark.benchmark
+def test_delivery_identification_benchmark(department):
+    connection, tables = department
+
+    deliveries = (
+        tables["TrackTreatment"]
+        .join(tables["TxField"], on="FLD_ID", rsuffix="_TxField")
+        .join(tables["Staff"], on="Machine_ID_Staff_ID")
+        .head(NUMBER_OF_DELIVERIES_TO_IDENTIFY)
+    )
+
+    def identify_all():
+        for _, row in deliveries.iterrows():
+            delivery.get_mosaiq_delivery_details(
+                connection,
+                row["Last_Name"],
+                row["Create_DtTm"].strftime("%Y-%m-%d %H:%M:%S"),
+                row["Field_Label"],
+                row["Field_Name"],
+            )
+
+    duration, _ = _timed(identify_all)
+
+    print(
+        f"\nIdentified {len(deliveries)} deliveries in {duration:.3f} s "
+        f"({duration / len(deliveries) * 1000:.2f} ms per delivery)"
+    )
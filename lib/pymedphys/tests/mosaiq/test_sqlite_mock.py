@@ -0,0 +1,186 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import datetime
+import subprocess
+import sys
+import textwrap
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pandas as pd
+from pymedphys._imports import pytest
+
+import pymedphys
+from pymedphys._mosaiq import delivery, sessions
+from pymedphys._mosaiq.mock import generate, sqlite
+
+NUMBER_OF_PATIENTS = 6
+FIELDS_PER_SITE = 3
+FRACTIONS = 5
+
+
+@pytest.fixture(name="connection", scope="module")
+def fixture_sqlite_department():
+    connection = sqlite.SQLiteConnection()
+    generate.create_mock_department(
+        connection=connection,
+        number_of_patients=NUMBER_OF_PATIENTS,
+        fields_per_site=FIELDS_PER_SITE,
+        control_points_per_field=20,
+        fractions=FRACTIONS,
+        number_of_machines=2,
+    )
+
+    return connection
+
+
+def test_translate_query():
+    query = """
+        SET TEXTSIZE 2147483647
+        SELECT TxFieldPoint.[Index] FROM TxFieldPoint
+        WHERE
+            TxFieldPoint.FLD_ID = %(field_id)s AND
+            Create_DtTm <= DATEADD(second, -%(buffer)d, %(delivery_time)s)
+        """
+
+    translated = sqlite.translate_query(query)
+
+    assert "SET TEXTSIZE" not in translated
+    assert "TxFieldPoint.FLD_ID = :field_id" in translated
+    assert "DATEADD('second', -:buffer, :delivery_time)" in translated
+
+
+def test_sessions(connection):
+    sit_set_ids = list(range(1, NUMBER_OF_PATIENTS + 1))
+    sessions_by_site = sessions.sessions_for_sites(connection, sit_set_ids)
+    offsets_by_site = sessions.session_offsets_for_sites(connection, sit_set_ids)
+
+    for sit_set_id in sit_set_ids:
+        site_sessions = list(sessions.sessions_for_site(connection, sit_set_id))
+        assert len(site_sessions) == FRACTIONS
+        assert sessions_by_site[sit_set_id] == site_sessions
+
+        site_offsets = list(sessions.session_offsets_for_site(connection, sit_set_id))
+        assert len(site_offsets) == FRACTIONS
+
+        for (session_num, offset), (expected_num, expected_offset) in zip(
+            offsets_by_site[sit_set_id], site_offsets
+        ):
+            assert session_num == expected_num
+            assert expected_offset is not None
+            assert np.allclose(offset, expected_offset)
+
+
+def test_delivery_loading(connection):
+    field_ids = list(range(1, NUMBER_OF_PATIENTS * FIELDS_PER_SITE + 1))
+    many_deliveries = pymedphys.Delivery.from_mosaiq_many(connection, field_ids)
+
+    for field_id, many_delivery in zip(field_ids, many_deliveries):
+        single_delivery = pymedphys.Delivery.from_mosaiq(connection, field_id)
+
+        for many_item, single_item in zip(many_delivery, single_delivery):
+            assert np.allclose(many_item, single_item)
+
+
+def test_delivery_identification(connection):
+    track_treatment = pymedphys.mosaiq.execute(
+        connection,
+        """
+        SELECT
+            TrackTreatment.FLD_ID,
+            TrackTreatment.Create_DtTm
+        FROM TrackTreatment
+        """,
+    )
+    field_id, create_datetime = track_treatment[0]
+
+    txfield = pymedphys.mosaiq.execute(
+        connection,
+        """
+        SELECT
+            TxField.Field_Label,
+            TxField.Field_Name,
+            Staff.Last_Name
+        FROM TxField, Staff
+        WHERE
+            Staff.Staff_ID = TxField.Machine_ID_Staff_ID AND
+            TxField.FLD_ID = %(field_id)s
+        """,
+        {"field_id": field_id},
+    )
+    field_label, field_name, machine = txfield[0]
+
+    delivery_details = delivery.get_mosaiq_delivery_details(
+        connection,
+        machine,
+        create_datetime.strftime("%Y-%m-%d %H:%M:%S"),
+        field_label,
+        field_name,
+    )
+
+    assert delivery_details.field_id == field_id
+    assert delivery_details.field_type == "VMAT"
+
+
+def test_original_mock_generator():
+    connection = sqlite.SQLiteConnection()
+
+    site_df = generate.create_mock_treatment_sites(connection=connection)
+    txfield_df = generate.create_mock_treatment_fields(site_df, connection=connection)
+    generate.create_mock_treatment_sessions(site_df, txfield_df, connection=connection)
+
+    assert len(list(sessions.sessions_for_site(connection, 1))) >= 3
+
+    localization_offset = sessions.localization_offset_for_site(connection, 1)
+    assert np.allclose(localization_offset, [-1.0, 0.0, 1.0])
+
+
+def test_sqlite3_module_state_is_unchanged():
+    """The mock converts datetimes for its own connections only, leaving
+    those of every other sqlite3 connection within the process alone."""
+    code = textwrap.dedent(
+        """
+        import sqlite3
+
+        adapters = dict(sqlite3.adapters)
+        converters = dict(sqlite3.converters)
+
+        from pymedphys._mosaiq.mock import sqlite
+
+        sqlite.SQLiteConnection()
+
+        assert sqlite3.adapters == adapters
+        assert sqlite3.converters == converters
+        """
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_datetimes_round_trip():
+    connection = sqlite.SQLiteConnection()
+    created = datetime.datetime(2021, 3, 1, 9, 30, 15)
+    connection.dataframe_to_sql(
+        pd.DataFrame({"Create_DtTm": [created, created + datetime.timedelta(days=1)]}),
+        "Dates",
+        index_label="DAT_ID",
+    )
+
+    results = pymedphys.mosaiq.execute(
+        connection,
+        "SELECT Create_DtTm FROM Dates WHERE Create_DtTm > %(after)s",
+        {"after": created},
+    )
+
+    assert results == [(created + datetime.timedelta(days=1),)]
@@ -113,6 +113,20 @@ def test_delivery_from_mosaiq(connection, trf_filepath, dicom_filepath):
     assert max_deviation < 3
 
 
+@pytest.mark.mosaiqdb
+def test_delivery_from_mosaiq_many(connection):
+    field_ids = helpers.get_patient_fields(connection, PATIENT_ID)["field_id"].tolist()
+
+    many_deliveries = pymedphys.Delivery.from_mosaiq_many(connection, field_ids)
+    assert len(many_deliveries) == len(field_ids)
+
+    for field_id, many_delivery in zip(field_ids, many_deliveries):
+        single_delivery = pymedphys.Delivery.from_mosaiq(connection, field_id)
+
+        for many_item, single_item in zip(many_delivery, single_delivery):
+            assert np.allclose(many_item, single_item)
+
+
 @pytest.mark.mosaiqdb
 def test_trf_identification(connection: pymedphys.mosaiq.Connection, trf_filepath):
     delivery_details = pymedphys.trf.identify(connection, trf_filepath, TIMEZONE)
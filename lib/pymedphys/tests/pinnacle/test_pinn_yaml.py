@@ -0,0 +1,238 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests of the Pinnacle text file parser against the YAML conversion
+that it replaced.
+"""
+
+import datetime
+import textwrap
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest, yaml
+
+from pymedphys._pinnacle.pinn_yaml import convert_to_yaml, pinn_to_dict
+
+
+def _yaml_pinn_to_dict(filename):
+    """The YAML based implementation of ``pinn_to_dict``."""
+    result = None
+    with open(filename, encoding="ISO-8859-1", errors="ignore") as fp:
+        data = fp.readlines()
+
+        first_line = data[0]
+        indices = [i for i, line in enumerate(data) if line == first_line]
+
+        for i, _ in enumerate(indices):
+            next_index = -1
+
+            if i + 1 < len(indices):
+                next_index = indices[i + 1]
+
+                if not isinstance(result, list):
+                    result = []
+
+            split_data = data[indices[i] : next_index]
+
+            if isinstance(result, list):
+                d = yaml.safe_load(convert_to_yaml(split_data))
+                result.append(d[list(d.keys())[0]])
+            else:
+                result = yaml.safe_load(convert_to_yaml(split_data))
+
+    return result
+
+
+def _assert_matches_yaml(parsed, expected):
+    """Point arrays, which the YAML conversion left as a string of comma
+    separated values, are compared by their values.
+    """
+    if isinstance(parsed, np.ndarray):
+        assert np.array_equal(
+            parsed, np.array(expected.split(","), dtype=float), equal_nan=True
+        )
+    elif isinstance(parsed, dict):
+        assert list(parsed.keys()) == list(expected.keys())
+        for key, value in parsed.items():
+            _assert_matches_yaml(value, expected[key])
+    elif isinstance(parsed, list):
+        assert len(parsed) == len(expected)
+        for item, expected_item in zip(parsed, expected):
+            _assert_matches_yaml(item, expected_item)
+    else:
+        assert type(parsed) is type(expected)
+        assert parsed == expected
+
+
+def _control_point(index, number_of_leaves, rng):
+    leaf_positions = np.round(rng.uniform(-5, 5, (number_of_leaves, 2)), 4)
+    points = ",\n".join(f"{x1},{x2}" for x1, x2 in leaf_positions)
+
+    return f"""#{index} ={{
+  Gantry = {rng.uniform(0, 360):.6f};
+  Collimator = 0;
+  Couch = 0;
+  Weight = {1 / (index + 1)};
+  WeightLocked = 0;
+  WedgeContext ={{
+    WedgeName = "No Wedge";
+    Orientation = NoWedge;
+    Angle = 0.;
+  }};
+  MLCLeafPositions ={{
+    RawData ={{
+      NumberOfDimensions = 2;
+      NumberOfPoints = {number_of_leaves};
+      Points[] ={{
+{textwrap.indent(points, " " * 8)}
+      }};
+    }};
+  }};
+}};
+"""
+
+
+def _beam(index, number_of_control_points, rng):
+    control_points = "".join(
+        _control_point(i, 60, rng) for i in range(number_of_control_points)
+    )
+
+    return f"""Beam ={{
+  Name = "Beam {index + 1}";
+  IsocenterName = "Iso";
+  PrescriptionName = "Rx";
+  DoseVolume = \\XDR:{index}\\;
+  MonitorUnitInfo ={{
+    PrescriptionDose = {rng.uniform(50, 100):.4f};
+    NormalizedDose = 1.5e-05;
+  }};
+  CPManager ={{
+    NumberOfControlPoints = {number_of_control_points};
+    ControlPointList ={{
+{textwrap.indent(control_points, " " * 6)}    }};
+  }};
+  Comment = ;
+}};
+"""
+
+
+def trial_text(name, number_of_beams, number_of_control_points, rng):
+    """The text of a ``plan.Trial`` trial with beams of MLC control
+    points, indented as Pinnacle indents it."""
+    beams = "".join(
+        _beam(i, number_of_control_points, rng) for i in range(number_of_beams)
+    )
+
+    return f"""Trial ={{
+  Name = "{name}";
+  PrescriptionList ={{
+    Prescription ={{
+      Name = "Rx";
+      NumberOfFractions = 25;
+    }};
+  }};
+  DoseGrid .VoxelSize .X = 0.4;
+  DoseGrid .Dimension .X = 93;
+  DoseGrid .Origin .X = -18.6;
+  IsComputed = yes;
+  FractionNumber = 007;
+  ObjectVersion ={{
+    WriteVersion = "Launch Pad: 16.0";
+    WriteTimeStamp = "2020-01-01 12:00:00";
+    LastModifiedTimeStamp = 2020-01-01;
+  }};
+  EmptyObject ={{
+  }};
+  BeamList ={{
+{textwrap.indent(beams, " " * 4)}  }};
+}};
+"""
+
+
+@pytest.mark.parametrize("number_of_trials", [1, 3])
+def test_pinn_to_dict(tmp_path, number_of_trials):
+    rng = np.random.default_rng(0)
+    filename = tmp_path / "plan.Trial"
+    filename.write_text(
+        "".join(trial_text(f"Trial_{i}", 2, 3, rng) for i in range(number_of_trials)),
+        encoding="ISO-8859-1",
+    )
+
+    parsed = pinn_to_dict(filename)
+    _assert_matches_yaml(parsed, _yaml_pinn_to_dict(filename))
+
+    trials = parsed if number_of_trials > 1 else [parsed["Trial"]]
+    assert len(trials) == number_of_trials
+
+    trial = trials[-1]
+    assert trial["Name"] == f"Trial_{number_of_trials - 1}"
+    assert trial["DoseGrid .Dimension .X"] == 93
+    assert trial["IsComputed"] is True
+    assert trial["FractionNumber"] == 7
+    assert trial["EmptyObject"] is None
+    assert trial["ObjectVersion"]["LastModifiedTimeStamp"] == datetime.date(2020, 1, 1)
+
+    beam = trial["BeamList"][1]
+    assert beam["Beam"] is None
+    assert beam["Name"] == "Beam 2"
+    assert beam["DoseVolume"] == "\\XDR:1\\"
+    assert beam["Comment"] is None
+    assert beam["MonitorUnitInfo"]["NormalizedDose"] == 1.5e-05
+
+    control_point = beam["CPManager"]["ControlPointList"][2]
+    assert control_point["Weight"] == 1 / 3
+    assert control_point["WedgeContext"]["Angle"] == 0.0
+
+    points = control_point["MLCLeafPositions"]["RawData"]["Points[]"]
+    assert points.dtype == np.float64
+    assert points.shape == (120,)
+
+
+def test_pinn_to_dict_comments_and_points(tmp_path):
+    filename = tmp_path / "plan.Points"
+    filename.write_text(
+        """/* A comment
+   spanning lines */
+Poi ={
+  Name = "Iso";
+  XCoord = -1.25;
+  Points[] ={
+    1,2.5,
+    -3e-2,4
+  };
+  Labels[] ={
+    a, b
+  };
+};
+Poi ={
+  Name = "Ref";
+  XCoord = 3;
+};
+"""
+    )
+
+    first, second = pinn_to_dict(filename)
+
+    assert first["Name"] == "Iso"
+    assert first["XCoord"] == -1.25
+    assert np.array_equal(first["Points[]"], [1, 2.5, -0.03, 4])
+    assert first["Labels[]"] == "a, b"
+    assert second == {"Name": "Ref", "XCoord": 3}
+
+
+def test_pinn_to_dict_empty_file(tmp_path):
+    filename = tmp_path / "plan.Points"
+    filename.write_text("")
+
+    assert pinn_to_dict(filename) is None
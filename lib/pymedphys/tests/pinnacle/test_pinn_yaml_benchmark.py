@@ -0,0 +1,67 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the reading of a ``plan.Trial`` of VMAT beams, by the
+native parser and by the YAML conversion it replaced.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pytest
+
+from pymedphys._pinnacle.pinn_yaml import pinn_to_dict
+
+from .test_pinn_yaml import _yaml_pinn_to_dict, trial_text
+
+NUMBER_OF_TRIALS = 2
+NUMBER_OF_BEAMS = 2
+NUMBER_OF_CONTROL_POINTS = 180
+REPEATS = 3
+
+
+def _time(function, filename, repeats):
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(filename)
+        durations.append(time.perf_counter() - start)
+
+    return min(durations)
+
+
+@pytest.mark.benchmark
+def test_pinn_to_dict_benchmark(tmp_path):
+    rng = np.random.default_rng(0)
+    filename = tmp_path / "plan.Trial"
+    filename.write_text(
+        "".join(
+            trial_text(f"Trial_{i}", NUMBER_OF_BEAMS, NUMBER_OF_CONTROL_POINTS, rng)
+            for i in range(NUMBER_OF_TRIALS)
+        ),
+        encoding="ISO-8859-1",
+    )
+
+    size = filename.stat().st_size / 2**20
+    native = _time(pinn_to_dict, filename, REPEATS)
+    converted = _time(_yaml_pinn_to_dict, filename, 1)
+
+    print(
+        f"\nplan.Trial of {size:.1f} MB, {NUMBER_OF_TRIALS} trials of "
+        f"{NUMBER_OF_BEAMS} beams with {NUMBER_OF_CONTROL_POINTS} control points:\n"
+        f"  native parser: {native * 1000:.0f} ms\n"
+        f"  YAML conversion: {converted * 1000:.0f} ms"
+    )
@@ -39,8 +39,10 @@
 
 # pylint: disable = redefined-outer-name
 
+import json
 import os
 import subprocess
+import tarfile
 import tempfile
 from pathlib import Path
 from zipfile import ZipFile
@@ -48,6 +50,8 @@ from zipfile import ZipFile
 from pymedphys._imports import pydicom, pytest
 
 from pymedphys._data import download
+from pymedphys._pinnacle import pinnacle_cli
+from pymedphys._pinnacle.pinnacle_cli import MODALITIES
 from pymedphys._utilities import test as pmp_test_utils
 
 working_path = tempfile.mkdtemp()
@@ -166,3 +170,185 @@ def test_pinnacle_cli_skip_roi(data):
     ds = pydicom.dcmread(os.path.join(output_path, rts_dcm))
     for roi in ds.StructureSetROISequence:
         assert not roi.ROIName == skip_roi_name
+
+
+def _pinnacle_command(*args):
+    return [str(pmp_test_utils.get_executable_even_when_embedded()), "-m"] + [
+        "pymedphys",
+        "pinnacle",
+        "export",
+        *args,
+    ]
+
+
+@pytest.mark.slow
+def test_pinnacle_cli_multiple_patient_archive(data, tmp_path):
+    archive_path = tmp_path / "patients.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as tar:
+        for pinn_dir in data.joinpath("Pt1").joinpath("Pinnacle").iterdir():
+            tar.add(pinn_dir, arcname=f"first/{pinn_dir.name}")
+            tar.add(pinn_dir, arcname=f"second/{pinn_dir.name}")
+
+    output_path = tmp_path / "output"
+    manifest_path = tmp_path / "manifest.jsonl"
+    command = _pinnacle_command(
+        "-o",
+        str(output_path),
+        "-m",
+        "RTSTRUCT",
+        "-m",
+        "RTPLAN",
+        "-j",
+        "2",
+        "--manifest",
+        str(manifest_path),
+        str(archive_path),
+    )
+    subprocess.check_call(command)
+
+    # Each copy of the patient is exported to its own directory, the
+    # second copy's directory also named for its path as the MRN is shared
+    patient_outputs = sorted(output_path.iterdir())
+    assert len(patient_outputs) == 2
+    assert patient_outputs[1].name.startswith(patient_outputs[0].name + "-second")
+    for patient_output in patient_outputs:
+        assert len(list(patient_output.iterdir())) == 2
+
+    records = [json.loads(line) for line in manifest_path.read_text().splitlines()]
+    assert [r["item"] for r in records].count("RTPLAN") == 2
+    assert records[-1]["patient"] is None
+    assert all(r["status"] == "exported" for r in records)
+
+    # Everything was recorded as exported, so nothing is exported again
+    cli_output = str(subprocess.check_output(command))
+    assert "Already exported, skipping" in cli_output
+    assert len(manifest_path.read_text().splitlines()) == len(records)
+
+
+def test_archive_member_is_needed():
+    needed = [
+        "Institution_1/Mount_0/Patient_1/Patient",
+        "Patient_1/ImageSet_0.header",
+        "Patient_1/ImageSet_0.ImageInfo",
+        "Patient_1/ImageSet_0.ImageSet",
+        "Patient_1/Plan_0/plan.Trial",
+        "Patient_1/Plan_0/plan.Points",
+        "Patient_1/Plan_0/plan.PatientSetup",
+        "Patient_1/Plan_0/plan.Pinnacle.Machines",
+    ]
+    not_needed = [
+        "Patient_1/Plan_0/plan.VolumeInfo",
+        "Patient_1/Plan_0/plan.Trial.binary.000:old",
+        "Patient_1/Institution",
+    ]
+
+    for name in needed:
+        assert pinnacle_cli.archive_member_is_needed(name, [], False)
+
+    for name in not_needed:
+        assert not pinnacle_cli.archive_member_is_needed(name, MODALITIES, True)
+
+    for name, modality in [
+        ("Patient_1/Plan_0/plan.roi", "RTSTRUCT"),
+        ("Patient_1/Plan_0/plan.Trial.binary.003", "RTDOSE"),
+    ]:
+        assert pinnacle_cli.archive_member_is_needed(name, [modality], False)
+        assert not pinnacle_cli.archive_member_is_needed(name, ["RTPLAN"], True)
+
+    for name in [
+        "Patient_1/ImageSet_0.img",
+        "Patient_1/ImageSet_0.DICOM/1.2.3.dcm",
+    ]:
+        assert pinnacle_cli.archive_member_is_needed(name, ["RTPLAN"], True)
+        assert not pinnacle_cli.archive_member_is_needed(name, MODALITIES, False)
+
+
+def test_patient_directory_name():
+    used_names = set()
+    names = [
+        pinnacle_cli.patient_directory_name(mrn, patient, used_names)
+        for mrn, patient in [
+            ("12345", "Institution_1/Mount_0/Patient_1"),
+            ("../..", "Institution_1/Mount_0/Patient_2"),
+            ("", "Institution_1/Mount_0/Patient_3"),
+            ("12345", "Institution_1/Mount_0/Patient_4"),
+            ("a/b", "Institution_1/Mount_0/Patient_5"),
+            ("a_b", "Institution_1/Mount_0/Patient_5"),
+            ("A_B", "Institution_1/Mount_0/Patient_5"),
+        ]
+    ]
+
+    assert names == [
+        "12345",
+        "Institution_1_Mount_0_Patient_2",
+        "Institution_1_Mount_0_Patient_3",
+        "12345-Institution_1_Mount_0_Patient_4",
+        "a_b",
+        "a_b-Institution_1_Mount_0_Patient_5",
+        "A_B-Institution_1_Mount_0_Patient_5-2",
+    ]
+    assert len({name.lower() for name in names}) == len(names)
+
+
+def test_extract_archive_and_find_patients(tmp_path):
+    source = tmp_path / "source"
+    for patient in ("Patient_1", "Patient_2"):
+        plan = source / "Institution_1" / patient / "Plan_0"
+        plan.mkdir(parents=True)
+        (plan.parent / "Patient").write_text("PatientID = 1;\n")
+        (plan.parent / "ImageSet_0.img").write_bytes(b"\x00" * 1024)
+        (plan / "plan.Trial").write_text("Trial ={\n};\n")
+        (plan / "plan.Trial.binary.000").write_bytes(b"\x00" * 1024)
+
+    archive_path = tmp_path / "patients.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as tar:
+        tar.add(source, arcname=".")
+
+    extracted = tmp_path / "extracted"
+    number_extracted = pinnacle_cli.extract_archive(
+        archive_path,
+        extracted,
+        lambda name: pinnacle_cli.archive_member_is_needed(name, ["RTDOSE"], False),
+    )
+    assert number_extracted == 6
+
+    patient_directories = pinnacle_cli.find_patient_directories(str(extracted))
+    assert [os.path.basename(d) for d in patient_directories] == [
+        "Patient_1",
+        "Patient_2",
+    ]
+    assert pinnacle_cli.find_patient_directories(patient_directories[0]) == [
+        patient_directories[0]
+    ]
+
+    for patient_directory in patient_directories:
+        assert sorted(os.listdir(patient_directory)) == ["Patient", "Plan_0"]
+
+
+def test_export_manifest(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    options = {"modality": ["RTPLAN"], "plan": None}
+
+    manifest = pinnacle_cli.ExportManifest(str(path), options)
+    manifest.record("exported", "a.tar", "Patient_1", "RTPLAN")
+    manifest.record("failed", "a.tar", "Patient_2", "RTPLAN", error="Traceback")
+    manifest.record("exported", "b.tar")
+
+    # A line left incomplete by an interrupted export
+    with open(path, "a") as f:
+        f.write('{"input": "c.tar", "pat')
+
+    resumed = pinnacle_cli.ExportManifest(str(path), options)
+    assert resumed.is_exported("a.tar", "Patient_1", "RTPLAN")
+    assert not resumed.is_exported("a.tar", "Patient_2", "RTPLAN")
+    assert not resumed.is_exported("a.tar")
+    assert resumed.is_exported(os.path.abspath("b.tar"))
+
+    other_options = pinnacle_cli.ExportManifest(
+        str(path), {"modality": ["RTDOSE"], "plan": None}
+    )
+    assert not other_options.is_exported("b.tar")
+
+    without_file = pinnacle_cli.ExportManifest(None, options)
+    without_file.record("exported", "a.tar")
+    assert without_file.is_exported("a.tar")
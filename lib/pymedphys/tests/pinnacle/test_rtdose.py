@@ -0,0 +1,316 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Regression tests of the Pinnacle RTDOSE export against the per voxel
+implementation that it replaced.
+"""
+
+import logging
+import math
+import os
+import re
+import struct
+import types
+from zipfile import ZipFile
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._data import download
+from pymedphys._dicom.orientation import IMAGE_ORIENTATION_MAP
+from pymedphys._pinnacle import rtdose
+from pymedphys._pinnacle.pinnacle_plan import PinnaclePlan
+from pymedphys.pinnacle import PinnacleExport
+
+NUMBER_OF_FRACTIONS = 25
+
+
+def _legacy_dose_grid(binary_file, dimensions):
+    x_size, y_size, z_size = dimensions
+    dose_grid = np.zeros((x_size, y_size, z_size))
+
+    with open(binary_file, "rb") as b:
+        for z in range(z_size - 1, -1, -1):
+            for y in range(0, y_size):
+                for x in range(0, x_size):
+                    dose_grid[x, y, z] = struct.unpack(">f", b.read(4))[0]
+
+    return dose_grid
+
+
+def _legacy_trilinear_interpolation(idx, grid):
+    int_idx = [math.floor(f) for f in idx]
+    frac_idx = [f % 1 for f in idx]
+
+    l1 = [[[0 for x in range(2)] for x in range(2)] for x in range(2)]
+    for x in range(0, 2):
+        for y in range(0, 2):
+            for z in range(0, 2):
+                l1[x][y][z] = grid[int_idx[0] + x, int_idx[1] + y, int_idx[2] + z]
+
+    l2 = [[0 for x in range(2)] for x in range(2)]
+    for y in range(0, 2):
+        for z in range(0, 2):
+            l2[y][z] = l1[0][y][z] * (1 - frac_idx[0]) + l1[1][y][z] * frac_idx[0]
+
+    l3 = [0 for x in range(2)]
+    for z in range(0, 2):
+        l3[z] = l2[0][z] * (1 - frac_idx[1]) + l2[1][z] * frac_idx[1]
+
+    return l3[0] * (1 - frac_idx[2]) + l3[1] * frac_idx[2]
+
+
+def _legacy_pixel_data(plan, exported_dose):
+    """The RTDOSE pixel data, as created by the per voxel implementation."""
+    trial_info = plan.trial_info
+    dimensions = [trial_info[f"DoseGrid .Dimension .{axis}"] for axis in "XYZ"]
+    spacing = [trial_info[f"DoseGrid .VoxelSize .{axis}"] * 10 for axis in "XYZ"]
+    origin = [float(value) for value in exported_dose.ImagePositionPatient]
+
+    orientation = IMAGE_ORIENTATION_MAP[plan.patient_position]
+    diagonal = [
+        orientation[0],
+        orientation[4],
+        np.cross(orientation[:3], orientation[3:])[2],
+    ]
+
+    summed_pixel_values = []
+    for beam in trial_info["BeamList"]:
+        binary_id = re.findall("\\d+", beam["DoseVolume"])[0]
+        binary_file = os.path.join(plan.path, f"plan.Trial.binary.{binary_id.zfill(3)}")
+        dose_grid = _legacy_dose_grid(binary_file, dimensions)
+
+        prescription = [
+            p
+            for p in trial_info["PrescriptionList"]
+            if p["Name"] == beam["PrescriptionName"]
+        ][0]
+        point = [p for p in plan.points if p["Name"] == beam["PrescriptionPointName"]][
+            0
+        ]
+        prescription_point = plan.convert_point(point)
+
+        idx = [
+            -(origin[i] - prescription_point[i]) / spacing[i] * diagonal[i]
+            for i in range(3)
+        ]
+        cgy_mu = _legacy_trilinear_interpolation(idx, dose_grid)
+
+        total_prescription = (
+            beam["MonitorUnitInfo"]["PrescriptionDose"]
+            * prescription["NumberOfFractions"]
+        )
+        beam_mu = (total_prescription / cgy_mu) / prescription["NumberOfFractions"]
+
+        pixel_data_list = []
+        for z in range(dimensions[2] - 1, -1, -1):
+            for y in range(0, dimensions[1]):
+                for x in range(0, dimensions[0]):
+                    pixel_data_list.append(
+                        float(prescription["NumberOfFractions"])
+                        * dose_grid[x, y, z]
+                        * beam_mu
+                        / 100
+                    )
+
+        frame_size = dimensions[0] * dimensions[1]
+        main_pix_array = []
+        for h in range(0, dimensions[2]):
+            frame = pixel_data_list[h * frame_size : (h + 1) * frame_size]
+            main_pix_array = main_pix_array + list(reversed(frame))
+
+        main_pix_array = list(reversed(main_pix_array))
+
+        if len(summed_pixel_values) == 0:
+            summed_pixel_values = main_pix_array
+        else:
+            for i, values in enumerate(summed_pixel_values):
+                summed_pixel_values[i] = values + main_pix_array[i]
+
+    scale = max(summed_pixel_values) / 16384
+    pixel_values = [int(round(element / scale)) for element in summed_pixel_values]
+    pixel_data = struct.pack("<%sh" % len(pixel_values), *pixel_values)
+
+    if plan.patient_position in ("FFS", "FFP"):
+        frames = np.frombuffer(pixel_data, dtype="<u2").reshape(
+            dimensions[2], dimensions[1], dimensions[0]
+        )
+        pixel_data = np.flip(frames, axis=0).tobytes()
+
+    return scale, pixel_data
+
+
+def synthetic_plan(path, dimensions, voxel_size, number_of_beams, patient_position):
+    """A stand in for a ``PinnaclePlan``, with enough of a trial for its
+    dose to be converted, and a smooth random binary dose for each beam.
+    """
+    rng = np.random.default_rng(0)
+    x_size, y_size, z_size = dimensions
+    grid_origin = (-0.5 * x_size * voxel_size, -0.4 * y_size * voxel_size, 1.0)
+
+    beams = []
+    for i in range(number_of_beams):
+        centre = rng.uniform(0.3, 0.7, 3) * np.array(dimensions)
+        x, y, z = np.meshgrid(*[np.arange(size) for size in dimensions], indexing="ij")
+        dose = np.exp(
+            -((x - centre[0]) ** 2 + (y - centre[1]) ** 2 + (z - centre[2]) ** 2)
+            / (0.1 * np.sum(np.square(dimensions)))
+        )
+
+        # Written with the slices reversed, followed by rows and then columns
+        dose.transpose(2, 1, 0)[::-1].astype(">f4").tofile(
+            os.path.join(path, f"plan.Trial.binary.{i:03d}")
+        )
+
+        beams.append(
+            {
+                "Name": f"Beam {i + 1}",
+                "DoseVolume": f"XDR:{i}",
+                "PrescriptionName": "Rx",
+                "PrescriptionPointName": "Point",
+                "MonitorUnitInfo": {"PrescriptionDose": 200 / number_of_beams},
+            }
+        )
+
+    trial_info = {
+        "ObjectVersion": {"WriteTimeStamp": "2020-01-01 12:00:00"},
+        "BeamList": beams,
+        "PrescriptionList": [{"Name": "Rx", "NumberOfFractions": NUMBER_OF_FRACTIONS}],
+    }
+    for axis, size, origin in zip("XYZ", dimensions, grid_origin):
+        trial_info[f"DoseGrid .Dimension .{axis}"] = size
+        trial_info[f"DoseGrid .VoxelSize .{axis}"] = voxel_size
+        trial_info[f"DoseGrid .Origin .{axis}"] = origin
+
+    # A prescription point within the grid, away from any voxel centre
+    point = {"Name": "Point"}
+    for axis, size, origin, fraction in zip(
+        "XYZ", dimensions, grid_origin, (0.37, 0.52, 0.45)
+    ):
+        point[f"{axis}Coord"] = origin + fraction * (size - 1) * voxel_size
+
+    plan = types.SimpleNamespace(
+        path=str(path),
+        logger=logging.getLogger(__name__),
+        patient_position=patient_position,
+        dose_inst_uid=pydicom.uid.generate_uid(),
+        plan_inst_uid=pydicom.uid.generate_uid(),
+        plan_info={
+            "ObjectVersion": {"WriteTimeStamp": "2020-01-01 12:00:00"},
+            "PinnacleVersionDescription": "Pinnacle 16.0",
+        },
+        trial_info=trial_info,
+        points=[point],
+        pinnacle=types.SimpleNamespace(
+            patient_info={
+                "RadiationOncologist": "",
+                "FullName": "Test^Patient",
+                "DOB": "19700101",
+                "MedicalRecordNumber": "12345",
+                "Gender": "Other",
+            }
+        ),
+        primary_image=types.SimpleNamespace(
+            image_info=[{"StudyInstanceUID": "1.2.3", "FrameUID": "1.2.3.4"}],
+            image={"StudyID": "1"},
+            image_header={"patient_position": patient_position},
+        ),
+    )
+    plan.convert_point = types.MethodType(PinnaclePlan.convert_point, plan)
+
+    return plan
+
+
+def export_dose(plan, export_path):
+    rtdose.convert_dose(plan, export_path)
+
+    (filename,) = [f for f in os.listdir(export_path) if f.startswith("RD")]
+
+    return pydicom.dcmread(os.path.join(export_path, filename))
+
+
+@pytest.mark.pydicom
+def test_read_dose_grid(tmp_path):
+    dimensions = (5, 4, 3)
+    binary_file = tmp_path / "plan.Trial.binary.000"
+    np.random.default_rng(0).uniform(0, 2, np.prod(dimensions)).astype(">f4").tofile(
+        binary_file
+    )
+
+    dose_grid = rtdose.read_dose_grid(binary_file, dimensions)
+    assert np.array_equal(
+        dose_grid, _legacy_dose_grid(binary_file, dimensions).transpose(2, 1, 0)
+    )
+
+    for idx in ([0.5, 1.25, 0.75], [3.9, 2.1, 1.0], [2, 1, 0.5]):
+        assert np.isclose(
+            rtdose.trilinear_interpolation(idx[::-1], dose_grid),
+            _legacy_trilinear_interpolation(idx, dose_grid.transpose(2, 1, 0)),
+        )
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("patient_position", ["HFS", "FFS"])
+def test_convert_dose(tmp_path, patient_position):
+    plan = synthetic_plan(tmp_path, (7, 6, 5), 0.4, 3, patient_position)
+    exported_dose = export_dose(plan, tmp_path)
+
+    scale, pixel_data = _legacy_pixel_data(plan, exported_dose)
+
+    assert np.isclose(exported_dose.DoseGridScaling, scale)
+    assert exported_dose.pixel_array.shape == (5, 6, 7)
+    assert np.array_equal(
+        exported_dose.pixel_array,
+        np.frombuffer(pixel_data, dtype="<u2").reshape(5, 6, 7),
+    )
+
+
+def _extract_test_data(filename, data_path):
+    zip_path = download.get_file_within_data_zip("pinnacle_test_data.zip", filename)
+    with ZipFile(zip_path, "r") as zip_ref:
+        zip_ref.extractall(data_path)
+
+    return data_path
+
+
+@pytest.mark.slow
+@pytest.mark.pydicom
+def test_convert_dose_of_test_archive(tmp_path):
+    data_path = _extract_test_data("pinnacle_16.0_test_data.zip", tmp_path / "16.0")
+    orientations_path = _extract_test_data(
+        "pinnacle_orientations_test_data.zip", tmp_path / "orientations"
+    )
+
+    plans = []
+    for d in os.listdir(data_path):
+        pinn_dir = os.path.join(data_path, d, "Pinnacle")
+        for pat_dir in os.listdir(pinn_dir):
+            plans.append(PinnacleExport(os.path.join(pinn_dir, pat_dir), None).plans[0])
+
+    orientation_pinn = PinnacleExport(
+        os.path.join(orientations_path, "pinnacle", "Patient_22902"), None
+    )
+    plans += orientation_pinn.plans[:4]
+
+    for i, plan in enumerate(plans):
+        export_path = tmp_path / "output" / str(i)
+        export_path.mkdir(parents=True)
+
+        exported_dose = export_dose(plan, export_path)
+        scale, pixel_data = _legacy_pixel_data(plan, exported_dose)
+
+        assert np.isclose(exported_dose.DoseGridScaling, scale)
+        assert np.array_equal(
+            exported_dose.pixel_array.ravel(), np.frombuffer(pixel_data, dtype="<u2")
+        )
@@ -0,0 +1,55 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the Pinnacle RTDOSE export of a five beam plan upon a
+4 mm dose grid.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import pytest
+
+from .test_rtdose import export_dose, synthetic_plan
+
+# A 40 x 30 x 32 cm dose grid with 4 mm voxels
+DIMENSIONS = (100, 75, 80)
+VOXEL_SIZE = 0.4
+NUMBER_OF_BEAMS = 5
+REPEATS = 3
+
+
+@pytest.mark.benchmark
+def test_convert_dose_benchmark(tmp_path):
+    plan = synthetic_plan(tmp_path, DIMENSIONS, VOXEL_SIZE, NUMBER_OF_BEAMS, "HFS")
+
+    # Exclude the one off compilation of the interpolation
+    (tmp_path / "warm_up").mkdir()
+    export_dose(plan, tmp_path / "warm_up")
+
+    durations = []
+    for i in range(REPEATS):
+        export_path = tmp_path / str(i)
+        export_path.mkdir()
+
+        start = time.perf_counter()
+        export_dose(plan, export_path)
+        durations.append(time.perf_counter() - start)
+
+    print(
+        f"\nPinnacle RTDOSE export, {NUMBER_OF_BEAMS} beams upon a "
+        f"{'x'.join(str(size) for size in DIMENSIONS)} grid: "
+        f"{min(durations) * 1000:.0f} ms"
+    )
@@ -0,0 +1,199 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""End to end test of the Pinnacle RTPLAN export of a trial read by the
+Pinnacle text file parser.
+"""
+
+import logging
+import os
+import types
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._pinnacle import rtplan
+from pymedphys._pinnacle.pinn_yaml import pinn_to_dict
+from pymedphys._pinnacle.pinnacle_plan import PinnaclePlan
+
+NUMBER_OF_LEAF_PAIRS = 60
+NUMBER_OF_CONTROL_POINTS = 3
+
+
+def _control_point(index, leaf_positions):
+    points = ",\n".join(f"        {x1},{x2}" for x1, x2 in leaf_positions)
+
+    return f"""      #{index} ={{
+        Gantry = {180 + 10 * index};
+        Collimator = 0;
+        Couch = 0;
+        Weight = {1 / NUMBER_OF_CONTROL_POINTS};
+        LeftJawPosition = 5;
+        RightJawPosition = 6;
+        TopJawPosition = 7;
+        BottomJawPosition = 8;
+        WedgeContext ={{
+          WedgeName = "No Wedge";
+          Orientation = NoWedge;
+          Angle = 0.;
+        }};
+        MLCLeafPositions ={{
+          RawData ={{
+            NumberOfDimensions = 2;
+            NumberOfPoints = {len(leaf_positions)};
+            Points[] ={{
+{points}
+            }};
+          }};
+        }};
+      }};
+"""
+
+
+def synthetic_trial(path, beam_type, leaf_positions):
+    """Write, and read with the Pinnacle parser, a ``plan.Trial`` of a
+    single beam whose control points have the given leaf positions."""
+    control_points = "".join(
+        _control_point(i, leaf_positions[i]) for i in range(NUMBER_OF_CONTROL_POINTS)
+    )
+    filename = path / "plan.Trial"
+    filename.write_text(
+        f"""Trial ={{
+  Name = "Trial_1";
+  PrescriptionList ={{
+    Prescription ={{
+      Name = "Rx";
+      NumberOfFractions = 25;
+    }};
+  }};
+  ObjectVersion ={{
+    WriteTimeStamp = "2020-01-01 12:00:00";
+  }};
+  BeamList ={{
+    Beam ={{
+      Name = "Beam 1";
+      FieldID = "1";
+      Modality = "Photons";
+      SetBeamType = "{beam_type}";
+      MachineNameAndVersion = "Linac: 2020-01-01 00:00:00";
+      MachineEnergyName = "6MV";
+      PrescriptionName = "Rx";
+      PrescriptionPointName = "Iso";
+      DoseRate = 600;
+      SSD = 90;
+      MonitorUnitInfo ={{
+        PrescriptionDose = 200;
+        NormalizedDose = 1;
+      }};
+      CPManager ={{
+        NumberOfControlPoints = {NUMBER_OF_CONTROL_POINTS};
+        GantryIsCCW = 0;
+        ControlPointList ={{
+{control_points}        }};
+      }};
+    }};
+  }};
+}};
+""",
+        encoding="ISO-8859-1",
+    )
+
+    return pinn_to_dict(filename)["Trial"]
+
+
+def synthetic_plan(path, trial_info):
+    """A stand in for a ``PinnaclePlan``, with enough of a plan for it to
+    be converted to an RTPLAN."""
+    plan = types.SimpleNamespace(
+        logger=logging.getLogger(__name__),
+        patient_position="HFS",
+        plan_inst_uid=pydicom.uid.generate_uid(),
+        struct_inst_uid=pydicom.uid.generate_uid(),
+        plan_info={
+            "ObjectVersion": {"WriteTimeStamp": "2020-01-01 12:00:00"},
+            "PinnacleVersionDescription": "Pinnacle 16.0",
+            "PlanName": "Plan",
+        },
+        trial_info=trial_info,
+        machine_info={
+            "Name": "Linac",
+            "VersionTimestamp": "2020-01-01 00:00:00",
+            "PhotonEnergyList": [
+                {
+                    "Name": "6MV",
+                    "PhysicsData": {"OutputFactor": {"DosePerMuAtCalibration": 0.01}},
+                }
+            ],
+        },
+        points=[{"Name": "Iso", "XCoord": 1.0, "YCoord": -2.0, "ZCoord": 3.0}],
+        iso_center=[10.0, 20.0, 30.0],
+        pinnacle=types.SimpleNamespace(
+            patient_info={
+                "RadiationOncologist": "",
+                "FullName": "Test^Patient",
+                "DOB": "19700101",
+                "MedicalRecordNumber": "12345",
+                "Gender": "Other",
+                "Comment": "",
+            }
+        ),
+        primary_image=types.SimpleNamespace(
+            image_info=[{"StudyInstanceUID": "1.2.3", "FrameUID": "1.2.3.4"}],
+            image={"StudyID": "1"},
+            image_header={"patient_position": "HFS"},
+        ),
+    )
+    plan.convert_point = types.MethodType(PinnaclePlan.convert_point, plan)
+
+    return plan
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("beam_type", ["Step & Shoot MLC", "Dynamic Arc"])
+def test_convert_plan(tmp_path, beam_type):
+    leaf_positions = np.round(
+        np.random.default_rng(0).uniform(
+            -5, 5, (NUMBER_OF_CONTROL_POINTS, NUMBER_OF_LEAF_PAIRS, 2)
+        ),
+        4,
+    )
+    trial_info = synthetic_trial(tmp_path, beam_type, leaf_positions)
+    plan = synthetic_plan(tmp_path, trial_info)
+
+    export_path = tmp_path / "export"
+    export_path.mkdir()
+    rtplan.convert_plan(plan, export_path)
+
+    (filename,) = os.listdir(export_path)
+    ds = pydicom.dcmread(export_path / filename)
+
+    (beam,) = ds.BeamSequence
+    mlc = beam.BeamLimitingDeviceSequence[2]
+    assert mlc.RTBeamLimitingDeviceType == "MLCX"
+    assert mlc.NumberOfLeafJawPairs == NUMBER_OF_LEAF_PAIRS
+
+    # Each control point that positions the MLC does so with the leaf
+    # positions of the last control point of the beam
+    expected = np.concatenate(
+        [-leaf_positions[-1, ::-1, 0] * 10, leaf_positions[-1, ::-1, 1] * 10]
+    )
+    mlc_positions = [
+        device.LeafJawPositions
+        for control_point in beam.ControlPointSequence
+        for device in control_point.BeamLimitingDevicePositionSequence
+        if device.RTBeamLimitingDeviceType == "MLCX"
+    ]
+    assert mlc_positions
+    for positions in mlc_positions:
+        assert np.allclose(positions, expected)
@@ -0,0 +1,472 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Regression tests of the Pinnacle RTSTRUCT ROI export against the line
+by line implementation that it replaced.
+"""
+
+import io
+import logging
+import os
+import random
+import re
+import types
+
+from pymedphys._imports import numpy as np
+from pymedphys._imports import pydicom, pytest
+
+from pymedphys._pinnacle import rtstruct
+from pymedphys._pinnacle.constants import colors
+
+# Slices every 3 mm, symmetric about zero so that they coincide with the
+# contours of every patient position
+TABLE_POSITIONS = np.round(np.arange(-33, 34) * 0.3, 1)
+
+
+def _legacy_read_roi(ds, plan, skip_pattern):
+    """The line by line implementation of ``read_roi``."""
+    image_header = plan.primary_image.image_header
+
+    path_roi = os.path.join(plan.path, "plan.roi")
+    plan.logger.debug("Will skip ROIs matching pattern[%s]", skip_pattern)
+
+    flag_skip_roi = False
+
+    points = []
+    flag_points = (
+        False  # bool value to tell me if I want to read the line in as point values
+    )
+    plan.logger.debug("Reading ROI from: %s", path_roi)
+    first_points = []
+    with open(path_roi) as f:
+        for _, line in enumerate(f, 1):
+            if flag_skip_roi:
+                # read til we hit end of ROI
+                if "}; // End of ROI" in line:
+                    flag_skip_roi = False
+
+                continue
+
+            if (
+                "};  // End of points for curve" in line
+            ):  # this will tell me not to read in point values
+                # all points for current curve saved until now. Here is where I
+                # need to add them to dicom file
+                numfind = int(line.find("curve") + 5)
+                line = line[numfind : len(line)]
+                line = line.strip()
+                curvenum = int(line)
+
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    int(curvenum) - 1
+                ].NumberOfContourPoints = int(len(points) / 3)
+
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    curvenum - 1
+                ].ContourData = points
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    int(curvenum) - 1
+                ].ContourImageSequence = pydicom.sequence.Sequence()
+                contour_image = pydicom.dataset.Dataset()
+
+                closestvalue = abs(
+                    float(plan.primary_image.image_info[0]["TablePosition"])
+                    - float(points[-1])
+                )
+                for s in plan.primary_image.image_info:
+                    if (
+                        abs(float(s["TablePosition"]) - (-float(points[-1] / 10)))
+                        <= closestvalue
+                    ):
+                        closestvalue = abs(
+                            float(s["TablePosition"]) - (-float(points[-1] / 10))
+                        )
+                        contour_image.ReferencedSOPClassUID = (
+                            "1.2.840.10008.5.1.4.1.1.2"
+                        )
+                        contour_image.ReferencedSOPInstanceUID = s["InstanceUID"]
+
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    int(curvenum) - 1
+                ].ContourImageSequence.append(contour_image)
+
+                del points[:]
+                flag_points = False
+            if flag_points:
+                curr_points = line.split(" ")
+
+                if curr_points == first_points:
+                    # These points are the exact same as the first point, skip it!
+                    continue
+
+                if len(first_points) == 0:
+                    first_points = curr_points
+
+                if image_header["patient_position"] == "HFS":
+                    curr_points = [
+                        float(curr_points[0]) * 10,
+                        -float(curr_points[1]) * 10,
+                        -float(curr_points[2]) * 10,
+                    ]
+                elif image_header["patient_position"] == "HFP":
+                    curr_points = [
+                        -float(curr_points[0]) * 10,
+                        float(curr_points[1]) * 10,
+                        -float(curr_points[2]) * 10,
+                    ]
+                elif image_header["patient_position"] == "FFP":
+                    curr_points = [
+                        float(curr_points[0]) * 10,
+                        float(curr_points[1]) * 10,
+                        float(curr_points[2]) * 10,
+                    ]
+                elif image_header["patient_position"] == "FFS":
+                    curr_points = [
+                        -float(curr_points[0]) * 10,
+                        -float(curr_points[1]) * 10,
+                        float(curr_points[2]) * 10,
+                    ]
+
+                if len(points) == 3:
+                    points[0] = round(points[0], 5)
+                    points[1] = round(points[1], 5)
+                    points[2] = round(points[2], 5)
+
+                points = points + curr_points
+            if "Beginning of ROI" in line:  # Start of ROI
+                ROIName = line[22:].rstrip()
+                plan.logger.debug("Start of ROI [%s]", ROIName)
+
+                if re.match(skip_pattern, ROIName):
+                    plan.logger.info("Skipping ROI [%s]", ROIName)
+                    flag_skip_roi = True
+                    continue
+
+                plan.roi_count = (
+                    plan.roi_count + 1
+                )  # increment ROI_num because I've found a new ROI
+                roi_contour = pydicom.dataset.Dataset()
+                roi_contour.ReferencedROINumber = str(plan.roi_count)
+                ds.ROIContourSequence.append(roi_contour)
+                ds.StructureSetROISequence.append(roi_contour)
+                rt_roi_observations = pydicom.dataset.Dataset()
+                ds.RTROIObservationsSequence.append(rt_roi_observations)
+                ds.StructureSetROISequence[
+                    plan.roi_count - 1
+                ].ROINumber = plan.roi_count
+                ds.StructureSetROISequence[plan.roi_count - 1].ROIName = ROIName
+                ds.StructureSetROISequence[
+                    plan.roi_count - 1
+                ].ROIGenerationAlgorithm = "SEMIAUTOMATIC"
+                ds.StructureSetROISequence[
+                    plan.roi_count - 1
+                ].ReferencedFrameOfReferenceUID = plan.primary_image.image_info[0][
+                    "FrameUID"
+                ]
+                ds.ROIContourSequence[
+                    plan.roi_count - 1
+                ].ContourSequence = pydicom.sequence.Sequence()
+                roiinterpretedtype = "ORGAN"
+                plan.logger.info("Exporting ROI: %s", ROIName)
+            if "roiinterpretedtype:" in line:
+                roiinterpretedtype = line.split(" ")[-1].replace("\n", "")
+            if "color:" in line:
+                roi_color = line.split(" ")[-1].replace("\n", "")
+
+                try:
+                    ds.ROIContourSequence[plan.roi_count - 1].ROIDisplayColor = colors[
+                        roi_color
+                    ]
+                except KeyError:
+                    plan.logger.info("ROI Color not known: %s", roi_color)
+                    new_color = random.choice(list(colors))
+                    plan.logger.info("Instead, assigning color: %s", new_color)
+                    ds.ROIContourSequence[plan.roi_count - 1].ROIDisplayColor = colors[
+                        new_color
+                    ]
+
+            if "}; // End of ROI" in line:  # end of ROI found
+                ds.RTROIObservationsSequence[
+                    plan.roi_count - 1
+                ].ObservationNumber = plan.roi_count
+                ds.RTROIObservationsSequence[
+                    plan.roi_count - 1
+                ].ReferencedROINumber = plan.roi_count
+                ds.RTROIObservationsSequence[
+                    plan.roi_count - 1
+                ].RTROIInterpretedType = roiinterpretedtype
+                ds.RTROIObservationsSequence[plan.roi_count - 1].ROIInterpreter = ""
+                # add to ROI observation sequence
+            if "volume =" in line:
+                vol = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
+                ds.StructureSetROISequence[plan.roi_count - 1].ROIVolume = vol
+            if "//  Curve " in line:  # found a curve
+                first_points = []
+                curvenum = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
+                contour = pydicom.dataset.Dataset()
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence.append(
+                    contour
+                )
+            if "num_points =" in line:
+                npts = re.findall(r"[-+]?\d*\.\d+|\d+", line)[0]
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    int(curvenum) - 1
+                ].ContourGeometricType = "CLOSED_PLANAR"
+                ds.ROIContourSequence[plan.roi_count - 1].ContourSequence[
+                    int(curvenum) - 1
+                ].NumberOfContourPoints = npts
+            if "points=" in line:
+                flag_points = True
+
+    plan.logger.debug("patient pos: %s", image_header["patient_position"])
+
+    return ds
+
+
+def _write_curve(f, roi_name, curve_number, number_of_curves, points):
+    f.write(
+        "//----------------------------------------------------\n"
+        f"//  ROI: {roi_name}\n"
+        f"//  Curve {curve_number} of {number_of_curves}\n"
+        "//----------------------------------------------------\n"
+        "               curve={\n"
+        "                       flags =       131092;\n"
+        "                       block_size =  32;\n"
+        f"                       num_points =  {len(points)};\n"
+        "                       points={\n"
+    )
+    for x, y, z in points:
+        f.write(f"{x:.4f} {y:.4f} {z:.4f}\n")
+    f.write(
+        f"                       }};  // End of points for curve {curve_number}\n"
+        f"                       }}; // End of curve {curve_number}\n"
+    )
+
+
+def write_roi_file(path, rois):
+    """Write a ``plan.roi`` file of ROIs, each a tuple of its name, color,
+    interpreted type and curves."""
+    with open(os.path.join(path, "plan.roi"), "w") as f:
+        f.write("// Region of Interest file\n\n")
+        for name, color, interpreted_type, curves in rois:
+            f.write(
+                "//-----------------------------------------------------\n"
+                f"//  Beginning of ROI: {name}\n"
+                "//-----------------------------------------------------\n\n"
+                " roi={\n"
+                f"           name: {name}\n"
+                f"           volume_name: {name}\n"
+                f"           color: {color}\n"
+                f"           roiinterpretedtype: {interpreted_type}\n"
+                f"           volume = {len(curves) * 1.5};\n"
+                f"  num_curve = {len(curves)};\n"
+            )
+            for i, curve in enumerate(curves):
+                _write_curve(f, name, i + 1, len(curves), curve)
+
+            f.write(f" }}; // End of ROI {name}\n")
+
+
+def synthetic_rois(number_of_rois, number_of_curves, points_per_curve):
+    """ROIs of elliptical curves upon consecutive slices, each closed by
+    repeating its first point."""
+    rng = np.random.default_rng(0)
+    color_names = list(colors)
+
+    rois = []
+    for i in range(number_of_rois):
+        first_slice = rng.integers(0, len(TABLE_POSITIONS) - number_of_curves)
+        angles = np.linspace(0, 2 * np.pi, points_per_curve, endpoint=False)
+
+        curves = []
+        for z in TABLE_POSITIONS[first_slice : first_slice + number_of_curves]:
+            radii = rng.uniform(2, 10, 2)
+            curve = np.column_stack(
+                [
+                    radii[0] * np.cos(angles),
+                    radii[1] * np.sin(angles) - 3,
+                    np.full_like(angles, z),
+                ]
+            )
+            curves.append(np.concatenate([curve, curve[:1]]))
+
+        interpreted_type = "EXTERNAL" if i == 0 else "ORGAN"
+        rois.append((f"ROI {i}", color_names[i], interpreted_type, curves))
+
+    return rois
+
+
+def synthetic_plan(path, patient_position):
+    """A stand in for a ``PinnaclePlan`` with enough of a primary image for
+    its ROIs to be exported."""
+    image_info = [
+        {
+            "TablePosition": str(position),
+            "InstanceUID": f"1.2.3.{i}",
+            "FrameUID": "1.2.3.4",
+        }
+        for i, position in enumerate(TABLE_POSITIONS)
+    ]
+
+    return types.SimpleNamespace(
+        path=str(path),
+        logger=logging.getLogger(__name__),
+        roi_count=0,
+        primary_image=types.SimpleNamespace(
+            image_info=image_info,
+            image_header={"patient_position": patient_position},
+        ),
+    )
+
+
+def empty_struct():
+    ds = pydicom.dataset.Dataset()
+    ds.ROIContourSequence = pydicom.sequence.Sequence()
+    ds.StructureSetROISequence = pydicom.sequence.Sequence()
+    ds.RTROIObservationsSequence = pydicom.sequence.Sequence()
+
+    return ds
+
+
+@pytest.mark.pydicom
+@pytest.mark.parametrize("patient_position", ["HFS", "HFP", "FFS", "FFP"])
+def test_read_roi(tmp_path, patient_position):
+    write_roi_file(tmp_path, synthetic_rois(4, 5, 30))
+    skip_pattern = "^ROI 2$"
+
+    plan = synthetic_plan(tmp_path, patient_position)
+    ds = rtstruct.read_roi(empty_struct(), plan, skip_pattern)
+    assert plan.roi_count == 3
+
+    legacy_plan = synthetic_plan(tmp_path, patient_position)
+    expected = _legacy_read_roi(empty_struct(), legacy_plan, skip_pattern)
+
+    assert len(ds.ROIContourSequence) == len(expected.ROIContourSequence) == 3
+
+    for roi_contour, expected_roi_contour in zip(
+        ds.ROIContourSequence, expected.ROIContourSequence
+    ):
+        assert (
+            roi_contour.ReferencedROINumber == expected_roi_contour.ReferencedROINumber
+        )
+        assert roi_contour.ROIDisplayColor == expected_roi_contour.ROIDisplayColor
+
+        assert len(roi_contour.ContourSequence) == 5
+        for contour, expected_contour in zip(
+            roi_contour.ContourSequence, expected_roi_contour.ContourSequence
+        ):
+            assert contour.ContourGeometricType == "CLOSED_PLANAR"
+            assert contour.NumberOfContourPoints == 30
+            assert (
+                contour.NumberOfContourPoints == expected_contour.NumberOfContourPoints
+            )
+            assert np.allclose(
+                contour.ContourData, expected_contour.ContourData, atol=1e-5
+            )
+
+            (contour_image,) = contour.ContourImageSequence
+            (expected_contour_image,) = expected_contour.ContourImageSequence
+            assert (
+                contour_image.ReferencedSOPInstanceUID
+                == expected_contour_image.ReferencedSOPInstanceUID
+            )
+
+    for structure_set_roi, expected_structure_set_roi in zip(
+        ds.StructureSetROISequence, expected.StructureSetROISequence
+    ):
+        for keyword in ("ROINumber", "ROIName", "ROIVolume", "ROIGenerationAlgorithm"):
+            assert structure_set_roi[keyword].value == (
+                expected_structure_set_roi[keyword].value
+            )
+
+        # The contours are held by the ROI Contour Sequence alone
+        assert "ContourSequence" not in structure_set_roi
+
+    for observation, expected_observation in zip(
+        ds.RTROIObservationsSequence, expected.RTROIObservationsSequence
+    ):
+        assert observation == expected_observation
+
+
+def test_read_roi_file(tmp_path):
+    rois = synthetic_rois(3, 2, 4)
+    rois[1][3].append(np.zeros((0, 3)))
+    write_roi_file(tmp_path, rois)
+
+    read_rois = list(
+        rtstruct.read_roi_file(
+            os.path.join(tmp_path, "plan.roi"), "^ROI 0$", logging.getLogger()
+        )
+    )
+
+    assert [roi["name"] for roi in read_rois] == ["ROI 1", "ROI 2"]
+    assert read_rois[0]["color"] == list(colors)[1]
+    assert read_rois[0]["interpreted_type"] == "ORGAN"
+    assert read_rois[0]["volume"] == "4.5"
+
+    # The curve without any points is omitted
+    assert len(read_rois[0]["curves"]) == 2
+    for curve, written in zip(read_rois[0]["curves"], rois[1][3]):
+        assert np.allclose(curve, written, atol=1e-4)
+
+
+def test_contour_data():
+    curve = np.array([[1.0, 2.0, 3.0], [1.5, 2.5, 3.0], [1.0, 2.0, 3.0]])
+
+    points = rtstruct.contour_data(curve, "HFS")
+    assert np.array_equal(points, [[10, -20, -30], [15, -25, -30]])
+
+    with pytest.raises(ValueError):
+        rtstruct.contour_data(curve, "HFDL")
+
+
+@pytest.mark.pydicom
+def test_set_contour_data():
+    points = np.round(np.random.default_rng(0).uniform(-300, 300, (1000, 3)), 5)
+    points[0, 0] = 1e-05
+
+    ds = empty_struct()
+    roi_contour = pydicom.dataset.Dataset()
+    contour = pydicom.dataset.Dataset()
+    rtstruct.set_contour_data(contour, points)
+    roi_contour.ContourSequence = pydicom.sequence.Sequence([contour])
+    ds.ROIContourSequence.append(roi_contour)
+
+    buffer = io.BytesIO()
+    pydicom.dcmwrite(buffer, ds, implicit_vr=True, little_endian=True)
+    buffer.seek(0)
+    written = pydicom.dcmread(buffer, force=True)
+
+    for contour_data in (
+        contour.ContourData,
+        written.ROIContourSequence[0].ContourSequence[0].ContourData,
+    ):
+        assert np.array_equal(contour_data, points.ravel())
+        assert all(len(str(value)) <= 16 for value in contour_data)
+
+
+def test_slice_finder():
+    image_info = [
+        {"TablePosition": str(position), "InstanceUID": str(i)}
+        for i, position in enumerate([-0.3, 0.0, 0.3, 0.6])
+    ]
+    find_slice = rtstruct.slice_finder(image_info)
+
+    assert find_slice(0.3) == "2"
+    assert find_slice(0.1 + 0.2) == "2"
+    assert find_slice(0.1) == "1"
+    assert find_slice(10) == "3"
+
+    # Equally near slices resolve to the last of them
+    assert find_slice(0.45) == "3"
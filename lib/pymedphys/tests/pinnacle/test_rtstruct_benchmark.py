@@ -0,0 +1,59 @@
+# Copyright (C) 2026 PyMedPhys Contributors
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark of the Pinnacle RTSTRUCT ROI export of a body contour of
+more than 100k points, by the streaming implementation and by the line
+by line implementation it replaced.
+
+Run with ``pytest --benchmark -s`` to see the timings.
+"""
+
+import time
+
+from pymedphys._imports import pytest
+
+from pymedphys._pinnacle import rtstruct
+
+from .test_rtstruct import (
+    _legacy_read_roi,
+    empty_struct,
+    synthetic_plan,
+    synthetic_rois,
+    write_roi_file,
+)
+
+NUMBER_OF_CURVES = 60
+POINTS_PER_CURVE = 2000
+
+
+def _time(read_roi, plan):
+    start = time.perf_counter()
+    read_roi(empty_struct(), plan, "^$")
+
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_read_roi_benchmark(tmp_path):
+    write_roi_file(tmp_path, synthetic_rois(1, NUMBER_OF_CURVES, POINTS_PER_CURVE))
+
+    streaming = _time(rtstruct.read_roi, synthetic_plan(tmp_path, "HFS"))
+    legacy = _time(_legacy_read_roi, synthetic_plan(tmp_path, "HFS"))
+
+    print(
+        f"\nPinnacle RTSTRUCT ROI export, {NUMBER_OF_CURVES} curves of "
+        f"{POINTS_PER_CURVE} points:\n"
+        f"  streaming: {streaming * 1000:.0f} ms\n"
+        f"  line by line: {legacy * 1000:.0f} ms"
+    )